@@ -0,0 +1,100 @@
+"""sales rollups by branch/day/status and product/day
+
+Revision ID: 20261019_0002
+Revises: 20260302_0001
+Create Date: 2026-10-19 09:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261019_0002"
+down_revision = "20260302_0001"
+branch_labels = None
+depends_on = None
+
+# Mismas reglas de redondeo que el dominio: subtotal por linea, impuesto sobre subtotal.
+_BACKFILL_BRANCH_DAY = """
+INSERT INTO sales_branch_day (
+    branch_id, day, status, order_count, subtotal, tax_total, shipping_cost, total
+)
+SELECT
+    branch_id,
+    day,
+    status,
+    COUNT(*),
+    SUM(subtotal),
+    SUM(tax_total),
+    SUM(shipping_cost),
+    SUM(subtotal + tax_total + shipping_cost)
+FROM (
+    SELECT
+        o.branch_id,
+        (o.created_at AT TIME ZONE 'UTC')::date AS day,
+        o.status,
+        o.shipping_cost,
+        lines.subtotal,
+        ROUND(lines.subtotal * o.tax_rate, 2) AS tax_total
+    FROM orders AS o
+    JOIN (
+        SELECT order_id, SUM(ROUND(unit_price * quantity, 2)) AS subtotal
+        FROM order_items
+        GROUP BY order_id
+    ) AS lines ON lines.order_id = o.order_id
+) AS per_order
+GROUP BY branch_id, day, status
+"""
+
+_BACKFILL_PRODUCT_DAY = """
+INSERT INTO sales_product_day (product_id, day, quantity, subtotal)
+SELECT
+    i.product_id,
+    (o.created_at AT TIME ZONE 'UTC')::date,
+    SUM(i.quantity),
+    SUM(ROUND(i.unit_price * i.quantity, 2))
+FROM order_items AS i
+JOIN orders AS o ON o.order_id = i.order_id
+WHERE o.status <> 'CANCELLED'
+GROUP BY i.product_id, (o.created_at AT TIME ZONE 'UTC')::date
+"""
+
+
+def upgrade() -> None:
+    """Crea rollups de ventas y los llena con las ordenes existentes."""
+    op.create_table(
+        "sales_branch_day",
+        sa.Column("branch_id", sa.String(length=100), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("subtotal", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("tax_total", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("shipping_cost", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("total", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint("branch_id", "day", "status"),
+    )
+    op.create_index("ix_sales_branch_day_day", "sales_branch_day", ["day"], unique=False)
+
+    op.create_table(
+        "sales_product_day",
+        sa.Column("product_id", sa.Uuid(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("subtotal", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint("product_id", "day"),
+    )
+    op.create_index("ix_sales_product_day_day", "sales_product_day", ["day"], unique=False)
+
+    op.execute(_BACKFILL_BRANCH_DAY)
+    op.execute(_BACKFILL_PRODUCT_DAY)
+
+
+def downgrade() -> None:
+    """Elimina rollups de ventas."""
+    op.drop_index("ix_sales_product_day_day", table_name="sales_product_day")
+    op.drop_table("sales_product_day")
+
+    op.drop_index("ix_sales_branch_day_day", table_name="sales_branch_day")
+    op.drop_table("sales_branch_day")
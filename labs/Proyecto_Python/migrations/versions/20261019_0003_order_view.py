@@ -0,0 +1,96 @@
+"""order_view read model fed by orders.v1
+
+Revision ID: 20261019_0003
+Revises: 20261019_0002
+Create Date: 2026-10-19 12:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261019_0003"
+down_revision = "20261019_0002"
+branch_labels = None
+depends_on = None
+
+# Importes como texto, igual que el payload de `orders.created.v1`.
+_BACKFILL_ORDER_VIEW = """
+INSERT INTO order_view (
+    order_id, customer_id, customer_email, branch_id, status, cancellation_reason,
+    item_count, items, shipping_cost, tax_rate, subtotal, tax_total, total
+)
+SELECT
+    o.order_id,
+    o.customer_id,
+    c.email,
+    o.branch_id,
+    o.status,
+    o.cancellation_reason,
+    lines.item_count,
+    lines.items,
+    o.shipping_cost,
+    o.tax_rate,
+    lines.subtotal,
+    ROUND(lines.subtotal * o.tax_rate, 2),
+    lines.subtotal + ROUND(lines.subtotal * o.tax_rate, 2) + o.shipping_cost
+FROM orders AS o
+JOIN customers AS c ON c.customer_id = o.customer_id
+JOIN (
+    SELECT
+        order_id,
+        COUNT(*) AS item_count,
+        SUM(ROUND(unit_price * quantity, 2)) AS subtotal,
+        json_agg(
+            json_build_object(
+                'product_id', product_id::text,
+                'product_name', product_name,
+                'unit_price', unit_price::text,
+                'quantity', quantity,
+                'subtotal', ROUND(unit_price * quantity, 2)::text
+            )
+            ORDER BY line_number
+        ) AS items
+    FROM order_items
+    GROUP BY order_id
+) AS lines ON lines.order_id = o.order_id
+"""
+
+
+def upgrade() -> None:
+    """Crea `order_view` y la llena con las ordenes existentes."""
+    op.create_table(
+        "order_view",
+        sa.Column("order_id", sa.Uuid(), nullable=False),
+        sa.Column("customer_id", sa.Uuid(), nullable=False),
+        sa.Column("customer_email", sa.String(length=320), nullable=False),
+        sa.Column("branch_id", sa.String(length=100), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("cancellation_reason", sa.String(length=255), nullable=True),
+        sa.Column("item_count", sa.Integer(), nullable=False),
+        sa.Column("items", sa.JSON(), nullable=False),
+        sa.Column("shipping_cost", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("tax_rate", sa.Numeric(precision=5, scale=4), nullable=False),
+        sa.Column("subtotal", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("tax_total", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("total", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column(
+            "projected_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("order_id"),
+    )
+    op.create_index("ix_order_view_status", "order_view", ["status"], unique=False)
+    op.create_index("ix_order_view_projected_at", "order_view", ["projected_at"], unique=False)
+
+    op.execute(_BACKFILL_ORDER_VIEW)
+
+
+def downgrade() -> None:
+    """Elimina el read model `order_view`."""
+    op.drop_index("ix_order_view_projected_at", table_name="order_view")
+    op.drop_index("ix_order_view_status", table_name="order_view")
+    op.drop_table("order_view")
@@ -0,0 +1,29 @@
+"""idempotency_keys.locked_until lease for in-progress reservations
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 20:00:00
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261019_0005"
+down_revision = "20261019_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Agrega la lease de las reservas en curso (NULL = lease vencida o respuesta guardada)."""
+    op.add_column(
+        "idempotency_keys",
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Quita la lease de las reservas."""
+    op.drop_column("idempotency_keys", "locked_until")
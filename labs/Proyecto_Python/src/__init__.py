@@ -3,4 +3,4 @@
 Este paquete agrupa las capas principales de la arquitectura.
 """
 
-__all__ = ["application", "domain", "etl", "infrastructure"]
\ No newline at end of file
+__all__ = ["application", "domain", "etl", "infrastructure", "loadtest"]
\ No newline at end of file
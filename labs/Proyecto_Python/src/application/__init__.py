@@ -3,4 +3,4 @@
 Aqui se implementaran puertos y casos de uso sin acoplar infraestructura concreta.
 """
 
-__all__ = ["customers", "errors", "orders", "ports", "products"]
+__all__ = ["customers", "errors", "orders", "ports", "products", "reports"]
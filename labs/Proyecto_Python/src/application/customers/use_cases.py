@@ -72,3 +72,7 @@ class ListCustomersUseCase:
         """Ejecuta consulta de listado de clientes."""
         customers = self._customer_repository.list()
         return [RegisterCustomerUseCase._to_dto(customer) for customer in customers]
+
+    def version(self) -> str:
+        """Version del listado para GET condicional, sin cargar clientes."""
+        return self._customer_repository.list_version()
@@ -33,6 +33,7 @@ class GetOrderQuery:
     """Consulta para obtener una orden por id."""
 
     order_id: UUID
+    from_read_model: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -40,6 +41,7 @@ class ListOrdersQuery:
     """Consulta para listar ordenes."""
 
     status: OrderStatus | None = None
+    from_read_model: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,7 +15,9 @@ from src.application.ports import (
     CustomerRepositoryPort,
     EventPublisherPort,
     OrderRepositoryPort,
+    OrderViewRepositoryPort,
     ProductRepositoryPort,
+    SalesRollupRepositoryPort,
     UnitOfWorkPort,
 )
 from src.domain.orders.entities import Order, OrderItem, OrderStatus
@@ -41,12 +43,14 @@ class CreateOrderUseCase:
         order_repository: OrderRepositoryPort,
         event_publisher: EventPublisherPort,
         unit_of_work: UnitOfWorkPort,
+        sales_rollup_repository: SalesRollupRepositoryPort | None = None,
     ) -> None:
         self._customer_repository = customer_repository
         self._product_repository = product_repository
         self._order_repository = order_repository
         self._event_publisher = event_publisher
         self._unit_of_work = unit_of_work
+        self._sales_rollup_repository = sales_rollup_repository
 
     def execute(self, command: CreateOrderCommand) -> OrderDTO:
         """Ejecuta el caso de uso de creacion de orden."""
@@ -69,6 +73,8 @@ class CreateOrderUseCase:
             )
 
             self._order_repository.add(order)
+            if self._sales_rollup_repository is not None:
+                self._sales_rollup_repository.record_order_created(order)
             self._event_publisher.publish(
                 event_name="orders.created.v1",
                 payload=self._build_created_event_payload(order),
@@ -104,42 +110,95 @@ class CreateOrderUseCase:
 
     @staticmethod
     def _build_created_event_payload(order: Order) -> dict[str, Any]:
-        """Serializa payload simple para evento de creacion."""
+        """Serializa payload de creacion con el estado completo para read models."""
         return {
             "order_id": str(order.order_id),
             "customer_id": str(order.customer.customer_id),
             "status": order.status.value,
             "total": str(order.total),
             "item_count": len(order.items),
+            # Campos agregados (compatibles con v1) para proyectar sin leer tablas.
+            "customer_email": order.customer.email,
+            "branch_id": order.branch_id,
+            "shipping_cost": str(order.shipping_cost),
+            "tax_rate": str(order.tax_rate),
+            "subtotal": str(order.subtotal),
+            "tax_total": str(order.tax_total),
+            "items": [
+                {
+                    "product_id": str(item.product_id),
+                    "product_name": item.product_name,
+                    "unit_price": str(item.unit_price),
+                    "quantity": item.quantity,
+                    "subtotal": str(item.subtotal),
+                }
+                for item in order.items
+            ],
         }
 
 
 class GetOrderUseCase:
     """Obtiene una orden por identificador."""
 
-    def __init__(self, order_repository: OrderRepositoryPort) -> None:
+    def __init__(
+        self,
+        order_repository: OrderRepositoryPort,
+        order_view_repository: OrderViewRepositoryPort | None = None,
+    ) -> None:
         self._order_repository = order_repository
+        self._order_view_repository = order_view_repository
 
     def execute(self, query: GetOrderQuery) -> OrderDTO:
         """Ejecuta consulta de detalle de orden."""
+        if query.from_read_model:
+            order_dto = _require_read_model(self._order_view_repository).get_by_id(query.order_id)
+            if order_dto is None:
+                raise ApplicationNotFoundError("No existe la orden solicitada en el read model.")
+            return order_dto
+
         order = self._order_repository.get_by_id(query.order_id)
         if order is None:
             raise ApplicationNotFoundError("No existe la orden solicitada.")
         return _to_order_dto(order)
 
+    def version(self, query: GetOrderQuery) -> str | None:
+        """Version de la orden para GET condicional; None si no aplica o no existe.
+
+        El read model es eventualmente consistente y no expone version: no se valida.
+        """
+        if query.from_read_model:
+            return None
+        return self._order_repository.get_version(query.order_id)
+
 
 class ListOrdersUseCase:
     """Lista ordenes con filtro opcional de estado."""
 
-    def __init__(self, order_repository: OrderRepositoryPort) -> None:
+    def __init__(
+        self,
+        order_repository: OrderRepositoryPort,
+        order_view_repository: OrderViewRepositoryPort | None = None,
+    ) -> None:
         self._order_repository = order_repository
+        self._order_view_repository = order_view_repository
 
     def execute(self, query: ListOrdersQuery) -> list[OrderDTO]:
         """Ejecuta consulta de listado de ordenes."""
+        if query.from_read_model:
+            return _require_read_model(self._order_view_repository).list(status=query.status)
         orders = self._order_repository.list(status=query.status)
         return [_to_order_dto(order) for order in orders]
 
 
+def _require_read_model(
+    order_view_repository: OrderViewRepositoryPort | None,
+) -> OrderViewRepositoryPort:
+    """Falla explicito si se pide el read model y no esta configurado."""
+    if order_view_repository is None:
+        raise ApplicationDependencyError("El read model de ordenes no esta configurado.")
+    return order_view_repository
+
+
 class UpdateOrderStatusUseCase:
     """Actualiza estado de ordenes y publica evento de cambio de estado."""
 
@@ -148,10 +207,12 @@ class UpdateOrderStatusUseCase:
         order_repository: OrderRepositoryPort,
         event_publisher: EventPublisherPort,
         unit_of_work: UnitOfWorkPort,
+        sales_rollup_repository: SalesRollupRepositoryPort | None = None,
     ) -> None:
         self._order_repository = order_repository
         self._event_publisher = event_publisher
         self._unit_of_work = unit_of_work
+        self._sales_rollup_repository = sales_rollup_repository
 
     def execute(self, command: UpdateOrderStatusCommand) -> OrderDTO:
         """Ejecuta el cambio de estado de una orden."""
@@ -159,15 +220,19 @@ class UpdateOrderStatusUseCase:
         if order is None:
             raise ApplicationNotFoundError("No existe la orden solicitada.")
 
+        previous_status = order.status
         try:
             self._apply_transition(order, command)
             self._order_repository.update(order)
+            if self._sales_rollup_repository is not None:
+                self._sales_rollup_repository.record_status_changed(order, previous_status)
             self._event_publisher.publish(
                 event_name="orders.status_changed.v1",
                 payload={
                     "order_id": str(order.order_id),
                     "status": order.status.value,
                     "cancellation_reason": order.cancellation_reason,
+                    "branch_id": order.branch_id,
                 },
             )
             self._unit_of_work.commit()
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID
 
 from src.domain.customers.entities import Customer
 from src.domain.orders.entities import Order, OrderStatus
 from src.domain.products.entities import Product
 
+if TYPE_CHECKING:
+    from src.application.orders.dto import OrderDTO
+
 
 class CustomerRepositoryPort(Protocol):
     """Contrato para almacenamiento de clientes."""
@@ -28,6 +32,9 @@ class CustomerRepositoryPort(Protocol):
     def list(self) -> list[Customer]:
         """Lista clientes ordenados para consulta operacional."""
 
+    def list_version(self) -> str:
+        """Version barata del listado (cambia al registrar un cliente), sin hidratar."""
+
 
 class ProductRepositoryPort(Protocol):
     """Contrato para almacenamiento de productos."""
@@ -44,6 +51,9 @@ class ProductRepositoryPort(Protocol):
     def list(self) -> list[Product]:
         """Lista productos ordenados para consulta operacional."""
 
+    def list_version(self) -> str:
+        """Version barata del listado (cambia al crear un producto), sin hidratar."""
+
 
 class OrderRepositoryPort(Protocol):
     """Contrato para almacenamiento de ordenes."""
@@ -60,6 +70,19 @@ class OrderRepositoryPort(Protocol):
     def list(self, status: OrderStatus | None = None) -> list[Order]:
         """Lista ordenes con filtro opcional de estado."""
 
+    def get_version(self, order_id: UUID) -> str | None:
+        """Version de una orden (cambia con cada actualizacion); None si no existe."""
+
+
+class OrderViewRepositoryPort(Protocol):
+    """Contrato de lectura del read model de ordenes (eventualmente consistente)."""
+
+    def get_by_id(self, order_id: UUID) -> OrderDTO | None:
+        """Busca la proyeccion de una orden."""
+
+    def list(self, status: OrderStatus | None = None) -> list[OrderDTO]:
+        """Lista proyecciones con filtro opcional de estado."""
+
 
 @dataclass(frozen=True, slots=True)
 class InvoiceRecord:
@@ -80,6 +103,61 @@ class InvoiceRepositoryPort(Protocol):
         """Busca registro de factura por orden."""
 
 
+@dataclass(frozen=True, slots=True)
+class BranchDaySales:
+    """Fila del rollup de ventas por sucursal, dia y estado."""
+
+    branch_id: str
+    day: date
+    status: OrderStatus
+    order_count: int
+    subtotal: Decimal
+    tax_total: Decimal
+    shipping_cost: Decimal
+    total: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class ProductDaySales:
+    """Fila del rollup de ventas por producto y dia (sin ordenes canceladas)."""
+
+    product_id: UUID
+    day: date
+    quantity: int
+    subtotal: Decimal
+
+
+class SalesRollupRepositoryPort(Protocol):
+    """Contrato para rollups de ventas mantenidos en la misma transaccion que la orden.
+
+    El dia de cada rollup es el de creacion de la orden (UTC); un cambio de
+    estado mueve los montos entre buckets de estado sin cambiar el dia.
+    """
+
+    def record_order_created(self, order: Order) -> None:
+        """Suma una orden nueva a los rollups."""
+
+    def record_status_changed(self, order: Order, previous_status: OrderStatus) -> None:
+        """Mueve una orden del bucket `previous_status` al estado actual."""
+
+    def list_branch_day_sales(
+        self,
+        date_from: date,
+        date_to: date,
+        branch_id: str | None = None,
+        status: OrderStatus | None = None,
+    ) -> list[BranchDaySales]:
+        """Lista rollups por sucursal/dia/estado en un rango inclusivo."""
+
+    def list_product_day_sales(
+        self,
+        date_from: date,
+        date_to: date,
+        product_id: UUID | None = None,
+    ) -> list[ProductDaySales]:
+        """Lista rollups por producto/dia en un rango inclusivo."""
+
+
 class EventPublisherPort(Protocol):
     """Contrato para publicar eventos de aplicacion."""
 
@@ -75,3 +75,7 @@ class ListProductsUseCase:
         """Ejecuta consulta de listado de productos."""
         products = self._product_repository.list()
         return [CreateProductUseCase._to_dto(product) for product in products]
+
+    def version(self) -> str:
+        """Version del listado para GET condicional, sin cargar productos."""
+        return self._product_repository.list_version()
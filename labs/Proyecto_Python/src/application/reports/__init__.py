@@ -0,0 +1,22 @@
+"""Casos de uso y DTOs para reportes de ventas."""
+
+from .dto import (
+    BranchDaySalesDTO,
+    ProductDaySalesDTO,
+    ProductSalesReportDTO,
+    ProductSalesReportQuery,
+    SalesReportDTO,
+    SalesReportQuery,
+)
+from .use_cases import GetProductSalesReportUseCase, GetSalesReportUseCase
+
+__all__ = [
+    "BranchDaySalesDTO",
+    "GetProductSalesReportUseCase",
+    "GetSalesReportUseCase",
+    "ProductDaySalesDTO",
+    "ProductSalesReportDTO",
+    "ProductSalesReportQuery",
+    "SalesReportDTO",
+    "SalesReportQuery",
+]
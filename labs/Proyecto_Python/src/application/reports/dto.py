@@ -0,0 +1,75 @@
+"""DTOs internos de aplicacion para reportes de ventas."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from src.domain.orders.entities import OrderStatus
+
+
+@dataclass(frozen=True, slots=True)
+class SalesReportQuery:
+    """Consulta de ventas por sucursal, dia y estado."""
+
+    date_from: date
+    date_to: date
+    branch_id: str | None = None
+    status: OrderStatus | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ProductSalesReportQuery:
+    """Consulta de ventas por producto y dia."""
+
+    date_from: date
+    date_to: date
+    product_id: UUID | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BranchDaySalesDTO:
+    """Ventas de una sucursal en un dia para un estado."""
+
+    branch_id: str
+    day: date
+    status: OrderStatus
+    order_count: int
+    subtotal: Decimal
+    tax_total: Decimal
+    shipping_cost: Decimal
+    total: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class SalesReportDTO:
+    """Reporte de ventas por sucursal con totales del rango."""
+
+    date_from: date
+    date_to: date
+    rows: tuple[BranchDaySalesDTO, ...]
+    order_count: int
+    total: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class ProductDaySalesDTO:
+    """Unidades e importe vendido de un producto en un dia."""
+
+    product_id: UUID
+    day: date
+    quantity: int
+    subtotal: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class ProductSalesReportDTO:
+    """Reporte de ventas por producto con totales del rango."""
+
+    date_from: date
+    date_to: date
+    rows: tuple[ProductDaySalesDTO, ...]
+    quantity: int
+    subtotal: Decimal
@@ -0,0 +1,97 @@
+"""Casos de uso de reportes de ventas sobre rollups precalculados."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from src.application.errors import ApplicationValidationError
+from src.application.ports import SalesRollupRepositoryPort
+
+from .dto import (
+    BranchDaySalesDTO,
+    ProductDaySalesDTO,
+    ProductSalesReportDTO,
+    ProductSalesReportQuery,
+    SalesReportDTO,
+    SalesReportQuery,
+)
+
+MAX_REPORT_DAYS = 366
+
+
+def _validate_range(date_from: date, date_to: date) -> None:
+    """Valida rango inclusivo y acotado para que la consulta siga siendo barata."""
+    if date_from > date_to:
+        raise ApplicationValidationError("date_from no puede ser posterior a date_to.")
+    if (date_to - date_from).days + 1 > MAX_REPORT_DAYS:
+        raise ApplicationValidationError(
+            f"El rango maximo del reporte es de {MAX_REPORT_DAYS} dias."
+        )
+
+
+class GetSalesReportUseCase:
+    """Ventas por sucursal, dia y estado leidas del rollup."""
+
+    def __init__(self, sales_rollup_repository: SalesRollupRepositoryPort) -> None:
+        self._sales_rollup_repository = sales_rollup_repository
+
+    def execute(self, query: SalesReportQuery) -> SalesReportDTO:
+        """Ejecuta consulta de ventas por sucursal."""
+        _validate_range(query.date_from, query.date_to)
+        rows = tuple(
+            BranchDaySalesDTO(
+                branch_id=row.branch_id,
+                day=row.day,
+                status=row.status,
+                order_count=row.order_count,
+                subtotal=row.subtotal,
+                tax_total=row.tax_total,
+                shipping_cost=row.shipping_cost,
+                total=row.total,
+            )
+            for row in self._sales_rollup_repository.list_branch_day_sales(
+                date_from=query.date_from,
+                date_to=query.date_to,
+                branch_id=query.branch_id,
+                status=query.status,
+            )
+        )
+        return SalesReportDTO(
+            date_from=query.date_from,
+            date_to=query.date_to,
+            rows=rows,
+            order_count=sum(row.order_count for row in rows),
+            total=sum((row.total for row in rows), start=Decimal("0")),
+        )
+
+
+class GetProductSalesReportUseCase:
+    """Ventas por producto y dia leidas del rollup."""
+
+    def __init__(self, sales_rollup_repository: SalesRollupRepositoryPort) -> None:
+        self._sales_rollup_repository = sales_rollup_repository
+
+    def execute(self, query: ProductSalesReportQuery) -> ProductSalesReportDTO:
+        """Ejecuta consulta de ventas por producto."""
+        _validate_range(query.date_from, query.date_to)
+        rows = tuple(
+            ProductDaySalesDTO(
+                product_id=row.product_id,
+                day=row.day,
+                quantity=row.quantity,
+                subtotal=row.subtotal,
+            )
+            for row in self._sales_rollup_repository.list_product_day_sales(
+                date_from=query.date_from,
+                date_to=query.date_to,
+                product_id=query.product_id,
+            )
+        )
+        return ProductSalesReportDTO(
+            date_from=query.date_from,
+            date_to=query.date_to,
+            rows=rows,
+            quantity=sum(row.quantity for row in rows),
+            subtotal=sum((row.subtotal for row in rows), start=Decimal("0")),
+        )
@@ -3,4 +3,20 @@
 Aqui viviran procesos de staging, dimensiones, hechos y validaciones analiticas.
 """
 
-__all__ = ["extract", "generate_seed", "load", "pipeline", "transform"]
+__all__ = [
+    "benchmark",
+    "binary_format",
+    "columnar",
+    "columnar_benchmark",
+    "extract",
+    "generate_seed",
+    "incremental",
+    "load",
+    "load_postgres",
+    "out_of_core",
+    "parallel",
+    "pipeline",
+    "star_schema",
+    "synthetic",
+    "transform",
+]
@@ -0,0 +1,368 @@
+"""Suite de benchmark del ETL: throughput y memoria pico por etapa.
+
+Cada tamaño es un objetivo de filas totales (todas las entidades del seed, no
+solo ordenes). Se traduce a ordenes sinteticas (ver `src.etl.synthetic`) con el
+promedio de filas que genera cada orden y se mide `extract_seed`,
+`transform_seed`, validacion (`validate_foreign_keys` + `validate_totals`) y
+`load_to_staging`:
+
+- Tiempo de pared y filas/s.
+- RSS pico por etapa (VmHWM se reinicia entre etapas en Linux).
+- Pico de `tracemalloc` en una segunda pasada opcional, para no distorsionar tiempos.
+
+Cada tamaño corre en un proceso nuevo para que el RSS no arrastre el tamaño anterior.
+El resultado es JSON estable (llaves ordenadas) para versionarlo y compararlo;
+cada tamaño reporta `target_rows`, las `orders` generadas y las `total_rows` reales.
+
+Uso:
+    poetry run python -m src.etl.benchmark --sizes 10000 100000 --output bench.json
+    poetry run python -m src.etl.benchmark --sizes 10000 --compare bench.json --threshold 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from src.etl.extract import extract_seed
+from src.etl.load import load_to_staging
+from src.etl.synthetic import SyntheticConfig, generate_synthetic_seed
+from src.etl.transform import (
+    TransformedSeed,
+    transform_seed,
+    validate_foreign_keys,
+    validate_totals,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows no tiene `resource`.
+    resource = None  # type: ignore[assignment]
+
+REPORT_VERSION = 2
+# Filas totales por corrida (clientes + productos + ordenes + items + facturas).
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_THRESHOLD = 0.10
+DATASET_MARKER = "_benchmark_dataset.json"
+
+
+@dataclass(frozen=True, slots=True)
+class StageResult:
+    """Metricas de una etapa para un tamaño de dataset."""
+
+    stage: str
+    wall_seconds: float
+    rows: int
+    rows_per_second: float
+    peak_rss_bytes: int | None
+    tracemalloc_peak_bytes: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SizeResult:
+    """Metricas de todas las etapas para un tamaño."""
+
+    target_rows: int
+    orders: int
+    total_rows: int
+    stages: tuple[StageResult, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    """Etapa que empeoro por encima del umbral contra el baseline."""
+
+    target_rows: int
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Cambio relativo (0.25 = 25% peor)."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def _reset_peak_rss() -> None:
+    """Reinicia el RSS pico del proceso (Linux >= 4.0); en otros SO no hace nada."""
+    with contextlib.suppress(OSError):
+        Path("/proc/self/clear_refs").write_text("5", encoding="ascii")
+
+
+def _peak_rss_bytes() -> int | None:
+    """RSS pico del proceso en bytes."""
+    try:
+        for line in Path("/proc/self/status").read_text(encoding="ascii").splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reporta bytes y Linux kilobytes.
+    return int(max_rss if sys.platform == "darwin" else max_rss * 1024)
+
+
+def _measure(function: Callable[[], Any]) -> tuple[Any, float, int | None]:
+    """Ejecuta una etapa y devuelve (resultado, segundos, RSS pico)."""
+    gc.collect()
+    _reset_peak_rss()
+    start_time = perf_counter()
+    result = function()
+    return result, perf_counter() - start_time, _peak_rss_bytes()
+
+
+def _traced_peak(function: Callable[[], Any]) -> tuple[Any, int]:
+    """Ejecuta una etapa con tracemalloc y devuelve (resultado, pico asignado)."""
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def orders_for_rows(target_rows: int, config: SyntheticConfig | None = None) -> int:
+    """Ordenes sinteticas que producen aproximadamente `target_rows` filas totales.
+
+    Cada orden aporta una fila de orden, una factura, `(1 + max_lines) / 2` items
+    en promedio y un cliente por cada 10 ordenes; el catalogo de productos es fijo.
+    """
+    config = config or SyntheticConfig()
+    rows_per_order = 2 + (1 + config.max_lines_per_order) / 2 + 0.1
+    return max(1, round((target_rows - config.products) / rows_per_order))
+
+
+def ensure_dataset(work_dir: Path, orders: int, seed: int = 42) -> Path:
+    """Genera (o reutiliza) el dataset sintetico de `orders` ordenes."""
+    seed_dir = work_dir / f"seed-{orders}"
+    marker = {"orders": orders, "seed": seed}
+    marker_path = seed_dir / DATASET_MARKER
+    if marker_path.exists() and json.loads(marker_path.read_text(encoding="utf-8")) == marker:
+        return seed_dir
+    generate_synthetic_seed(seed_dir, SyntheticConfig(orders=orders, seed=seed), workers=None)
+    marker_path.write_text(json.dumps(marker), encoding="utf-8")
+    return seed_dir
+
+
+def run_size(
+    seed_dir: Path, staging_dir: Path, target_rows: int, orders: int, trace_allocations: bool
+) -> SizeResult:
+    """Mide cada etapa del ETL sobre un dataset ya generado."""
+    stages: list[StageResult] = []
+
+    def record(stage: str, rows: int, seconds: float, rss: int | None, traced: int | None) -> None:
+        stages.append(
+            StageResult(
+                stage=stage,
+                wall_seconds=round(seconds, 4),
+                rows=rows,
+                rows_per_second=round(rows / seconds if seconds > 0 else float(rows), 1),
+                peak_rss_bytes=rss,
+                tracemalloc_peak_bytes=traced,
+            )
+        )
+
+    def extract_and_transform() -> tuple[int, TransformedSeed]:
+        # El lote crudo vive solo aqui: se libera antes de medir validate y load.
+        extracted, seconds, rss = _measure(lambda: extract_seed(seed_dir=seed_dir))
+        total_rows = sum(
+            len(rows)
+            for rows in (
+                extracted.customers,
+                extracted.products,
+                extracted.orders,
+                extracted.order_items,
+                extracted.invoices,
+            )
+        )
+        traced = (
+            _traced_peak(lambda: extract_seed(seed_dir=seed_dir))[1] if trace_allocations else None
+        )
+        record("extract", total_rows, seconds, rss, traced)
+
+        transformed, seconds, rss = _measure(lambda: transform_seed(batch=extracted))
+        traced = (
+            _traced_peak(lambda: transform_seed(batch=extracted))[1] if trace_allocations else None
+        )
+        record("transform", total_rows, seconds, rss, traced)
+        return total_rows, transformed
+
+    total_rows, transformed = extract_and_transform()
+
+    def validate() -> None:
+        # Los datasets sinteticos no tienen el mismo conteo por entidad: se omite
+        # `validate_record_counts` y se miden las reglas costosas.
+        validate_foreign_keys(transformed)
+        validate_totals(transformed)
+
+    _, seconds, rss = _measure(validate)
+    traced = _traced_peak(validate)[1] if trace_allocations else None
+    record("validate", total_rows, seconds, rss, traced)
+
+    def load() -> None:
+        load_to_staging(dataset=transformed, output_dir=staging_dir)
+
+    _, seconds, rss = _measure(load)
+    traced = _traced_peak(load)[1] if trace_allocations else None
+    record("load", total_rows, seconds, rss, traced)
+
+    return SizeResult(
+        target_rows=target_rows, orders=orders, total_rows=total_rows, stages=tuple(stages)
+    )
+
+
+def _git_commit() -> str | None:
+    """Commit actual, si el benchmark corre dentro de un repo git."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmark(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    work_dir: Path = Path("data/benchmark"),
+    trace_allocations_max_rows: int = 500_000,
+) -> dict[str, Any]:
+    """Ejecuta la suite para cada objetivo de filas totales en `sizes`.
+
+    tracemalloc multiplica el tiempo de ejecucion; solo se activa hasta
+    `trace_allocations_max_rows` filas.
+    """
+    results: list[SizeResult] = []
+    context = multiprocessing.get_context("spawn")
+    for target_rows in sizes:
+        orders = orders_for_rows(target_rows)
+        # El dataset se genera en el proceso padre (usa su propio pool de procesos).
+        seed_dir = ensure_dataset(work_dir, orders)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            future = executor.submit(
+                run_size,
+                seed_dir,
+                work_dir / f"staging-{orders}",
+                target_rows,
+                orders,
+                target_rows <= trace_allocations_max_rows,
+            )
+            results.append(future.result())
+
+    return {
+        "version": REPORT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Detecta etapas cuyo tiempo o RSS pico empeoro mas que `threshold`."""
+    if baseline.get("version") != current.get("version"):
+        raise ValueError(
+            f"Version de reporte distinta: baseline={baseline.get('version')} "
+            f"actual={current.get('version')}."
+        )
+    baseline_stages = {
+        (size["target_rows"], stage["stage"]): stage
+        for size in baseline["results"]
+        for stage in size["stages"]
+    }
+    regressions: list[Regression] = []
+    for size in current["results"]:
+        for stage in size["stages"]:
+            previous = baseline_stages.get((size["target_rows"], stage["stage"]))
+            if previous is None:
+                continue
+            for metric in ("wall_seconds", "peak_rss_bytes"):
+                before, after = previous.get(metric), stage.get(metric)
+                if before and after and after > before * (1 + threshold):
+                    regressions.append(
+                        Regression(
+                            target_rows=size["target_rows"],
+                            stage=stage["stage"],
+                            metric=metric,
+                            baseline=float(before),
+                            current=float(after),
+                        )
+                    )
+    return regressions
+
+
+def main() -> None:
+    """CLI de la suite de benchmark ETL."""
+    parser = argparse.ArgumentParser(description="Benchmark de etapas ETL.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Filas totales por corrida.",
+    )
+    parser.add_argument("--work-dir", type=Path, default=Path("data/benchmark"))
+    parser.add_argument("--output", type=Path, default=Path("data/benchmark/etl_benchmark.json"))
+    parser.add_argument("--trace-max-rows", type=int, default=500_000)
+    parser.add_argument("--compare", type=Path, default=None, help="Reporte baseline JSON.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        sizes=tuple(args.sizes),
+        work_dir=args.work_dir,
+        trace_allocations_max_rows=args.trace_max_rows,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    for size in report["results"]:
+        for stage in size["stages"]:
+            rss = stage["peak_rss_bytes"]
+            print(
+                f"BENCH rows={size['total_rows']} | orders={size['orders']} | "
+                f"stage={stage['stage']} | "
+                f"wall_s={stage['wall_seconds']:.3f} | rows_per_s={stage['rows_per_second']:.0f} | "
+                f"peak_rss_mb={(rss or 0) / 2**20:.1f}"
+            )
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_reports(baseline, report, threshold=args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION target_rows={regression.target_rows} | stage={regression.stage} | "
+                f"{regression.metric} {regression.baseline:.3f} -> {regression.current:.3f} "
+                f"(+{regression.ratio:.0%})"
+            )
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
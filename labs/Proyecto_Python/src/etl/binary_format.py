@@ -0,0 +1,356 @@
+"""Formato binario columnar para staging ETL.
+
+Cada tabla es un directorio autodescriptivo (`<entidad>.cols/`):
+
+- `schema.json`: version, filas y, por columna, tipo logico, escala, nulabilidad,
+  compresion y archivos fisicos. Al reescribir se borra primero y se escribe al
+  final: sin schema no hay tabla, y un corte a mitad no deja una tabla mezclada.
+- Un `.npy` por arreglo fisico. Sin compresion se abre con `mmap_mode="r"`;
+  con `zlib` se guarda como `.npy.zlib` y se descomprime a memoria al leer.
+
+Tipos logicos:
+
+- `uuid`: `S16` (16 bytes big-endian).
+- `decimal`: `int64` escalado (`scale` decimales; centavos con scale=2).
+- `int` / `bool`: `int64` / `bool`.
+- `text`: offsets `int64` (n + 1) + bytes UTF-8 `uint8`; nulos en mascara `valid`.
+- `timestamp`: mismo layout que `text` con ISO-8601 (conserva la zona horaria).
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import zlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, cast
+from uuid import UUID
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependencia opcional del formato binario.
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+FORMAT_NAME = "etl-columnar"
+FORMAT_VERSION = 1
+SCHEMA_FILE = "schema.json"
+TABLE_SUFFIX = ".cols"
+
+ColumnKind = Literal["uuid", "decimal", "int", "bool", "text", "timestamp"]
+Compression = Literal["none", "zlib"]
+
+# UUIDs aleatorios no comprimen y los numericos se prefieren mapeados en memoria.
+DEFAULT_COMPRESSION: dict[ColumnKind, Compression] = {
+    "uuid": "none",
+    "decimal": "none",
+    "int": "none",
+    "bool": "none",
+    "text": "zlib",
+    "timestamp": "zlib",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnSpec:
+    """Definicion logica de una columna."""
+
+    name: str
+    kind: ColumnKind
+    scale: int = 0
+    nullable: bool = False
+
+
+# Mismo orden de campos que las filas tipadas de `src.etl.transform`.
+TABLE_SCHEMAS: dict[str, tuple[ColumnSpec, ...]] = {
+    "customers": (
+        ColumnSpec("customer_id", "uuid"),
+        ColumnSpec("full_name", "text"),
+        ColumnSpec("email", "text"),
+    ),
+    "products": (
+        ColumnSpec("product_id", "uuid"),
+        ColumnSpec("sku", "text"),
+        ColumnSpec("name", "text"),
+        ColumnSpec("unit_price", "decimal", scale=2),
+        ColumnSpec("is_active", "bool"),
+    ),
+    "orders": (
+        ColumnSpec("order_id", "uuid"),
+        ColumnSpec("customer_id", "uuid"),
+        ColumnSpec("branch_id", "text"),
+        ColumnSpec("shipping_cost", "decimal", scale=2),
+        ColumnSpec("tax_rate", "decimal", scale=4),
+        ColumnSpec("status", "text"),
+        ColumnSpec("cancellation_reason", "text", nullable=True),
+        ColumnSpec("created_at", "timestamp", nullable=True),
+    ),
+    "order_items": (
+        ColumnSpec("order_id", "uuid"),
+        ColumnSpec("line_number", "int"),
+        ColumnSpec("product_id", "uuid"),
+        ColumnSpec("product_name", "text"),
+        ColumnSpec("unit_price", "decimal", scale=2),
+        ColumnSpec("quantity", "int"),
+    ),
+    "invoices": (
+        ColumnSpec("order_id", "uuid"),
+        ColumnSpec("external_invoice_id", "text"),
+        ColumnSpec("total_amount", "decimal", scale=2),
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TextColumn:
+    """Columna de texto variable: offsets de bytes + buffer UTF-8 + validez."""
+
+    offsets: NDArray[np.int64]
+    data: NDArray[np.uint8]
+    valid: NDArray[np.bool_] | None = None
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def to_list(self) -> list[str | None]:
+        """Decodifica la columna a strings de Python."""
+        raw = self.data.tobytes()
+        bounds = self.offsets.tolist()
+        values: list[str | None] = [
+            raw[start:end].decode("utf-8") for start, end in zip(bounds, bounds[1:], strict=False)
+        ]
+        if self.valid is not None:
+            for position in np.flatnonzero(~self.valid).tolist():
+                values[position] = None
+        return values
+
+
+Column = Any  # NDArray o TextColumn; numpy no siempre esta disponible para anotar.
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryTable:
+    """Tabla leida desde disco: columnas fisicas mas su schema logico."""
+
+    entity: str
+    rows: int
+    specs: tuple[ColumnSpec, ...]
+    columns: dict[str, Column]
+
+    def values(self, name: str) -> list[Any]:
+        """Valores Python (UUID, Decimal, int, bool, str) de una columna."""
+        spec = next(spec for spec in self.specs if spec.name == name)
+        return decode_column(spec, self.columns[name])
+
+
+def _require_numpy() -> None:
+    """Falla con mensaje claro si numpy no está instalado."""
+    if np is None:
+        raise RuntimeError(
+            "El staging binario requiere numpy instalado (poetry install --extras columnar)."
+        )
+
+
+def encode_column(spec: ColumnSpec, values: list[Any]) -> Column:
+    """Convierte valores Python de una columna a su representacion fisica."""
+    _require_numpy()
+    if spec.kind == "uuid":
+        return np.frombuffer(b"".join(value.bytes for value in values), dtype="S16").copy()
+    if spec.kind == "decimal":
+        return np.fromiter(
+            (int(value.scaleb(spec.scale)) for value in values), dtype=np.int64, count=len(values)
+        )
+    if spec.kind == "int":
+        return np.fromiter(values, dtype=np.int64, count=len(values))
+    if spec.kind == "bool":
+        return np.fromiter(values, dtype=np.bool_, count=len(values))
+    if spec.kind == "timestamp":
+        values = [None if value is None else value.isoformat() for value in values]
+
+    encoded = [b"" if value is None else value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    valid = None
+    if spec.nullable:
+        valid = np.fromiter(
+            (value is not None for value in values), dtype=np.bool_, count=len(values)
+        )
+    return TextColumn(
+        offsets=offsets,
+        data=np.frombuffer(b"".join(encoded), dtype=np.uint8).copy(),
+        valid=valid,
+    )
+
+
+def decode_column(spec: ColumnSpec, column: Column) -> list[Any]:
+    """Convierte una columna fisica a valores Python sin parsear texto."""
+    if spec.kind == "uuid":
+        raw = np.ascontiguousarray(column).tobytes()
+        return [UUID(bytes=raw[offset : offset + 16]) for offset in range(0, len(raw), 16)]
+    if spec.kind == "decimal":
+        return [Decimal(value).scaleb(-spec.scale) for value in column.tolist()]
+    if spec.kind in {"int", "bool"}:
+        return list(column.tolist())
+    if spec.kind == "timestamp":
+        return [
+            None if value is None else datetime.fromisoformat(value) for value in column.to_list()
+        ]
+    values: list[Any] = column.to_list()
+    return values
+
+
+def _save_array(directory: Path, stem: str, array: NDArray[Any], compression: Compression) -> str:
+    """Guarda un arreglo como `.npy` (o `.npy.zlib`) y devuelve el nombre de archivo.
+
+    Se escribe a un temporal y se reemplaza: un lector con el archivo previo mapeado
+    conserva su copia.
+    """
+    file_name = f"{stem}.npy" if compression == "none" else f"{stem}.npy.zlib"
+    temp_path = directory / f"{file_name}.tmp"
+    with temp_path.open("wb") as handle:
+        if compression == "none":
+            np.save(handle, array, allow_pickle=False)
+        else:
+            buffer = io.BytesIO()
+            np.save(buffer, array, allow_pickle=False)
+            handle.write(zlib.compress(buffer.getbuffer(), level=6))
+    os.replace(temp_path, directory / file_name)
+    return file_name
+
+
+def _load_array(path: Path, compression: Compression, mmap: bool) -> NDArray[Any]:
+    """Lee un arreglo; sin compresion puede mapearse en memoria."""
+    if compression == "none":
+        return cast(
+            "NDArray[Any]", np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        )
+    return cast(
+        "NDArray[Any]", np.load(io.BytesIO(zlib.decompress(path.read_bytes())), allow_pickle=False)
+    )
+
+
+def _remove_unlisted_files(directory: Path, listed: set[str]) -> None:
+    """Borra arreglos (y temporales) que el schema vigente ya no referencia."""
+    for path in directory.iterdir():
+        stale = path.name not in listed and path.name.endswith((".npy", ".npy.zlib", ".tmp"))
+        if stale and path.is_file():
+            path.unlink()
+
+
+def write_table(
+    directory: Path,
+    entity: str,
+    columns: Mapping[str, Column],
+    compression: Mapping[str, Compression] | None = None,
+) -> Path:
+    """Escribe una tabla columnar; `compression` sobreescribe la politica por columna."""
+    _require_numpy()
+    specs = TABLE_SCHEMAS[entity]
+    overrides = compression or {}
+    rows = len(columns[specs[0].name]) if specs else 0
+    for spec in specs:
+        if len(columns[spec.name]) != rows:
+            raise ValueError(
+                f"{entity}.{spec.name} tiene {len(columns[spec.name])} filas, se esperaban {rows}."
+            )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    schema_path = directory / SCHEMA_FILE
+    schema_path.unlink(missing_ok=True)
+    column_entries: list[dict[str, Any]] = []
+    for spec in specs:
+        column = columns[spec.name]
+        codec = overrides.get(spec.name, DEFAULT_COMPRESSION[spec.kind])
+        if isinstance(column, TextColumn):
+            files = {
+                "offsets": _save_array(directory, f"{spec.name}.offsets", column.offsets, codec),
+                "data": _save_array(directory, f"{spec.name}.data", column.data, codec),
+            }
+            if column.valid is not None:
+                files["valid"] = _save_array(directory, f"{spec.name}.valid", column.valid, codec)
+        else:
+            files = {"values": _save_array(directory, spec.name, column, codec)}
+        column_entries.append(
+            {
+                "name": spec.name,
+                "kind": spec.kind,
+                "scale": spec.scale,
+                "nullable": spec.nullable,
+                "compression": codec,
+                "files": files,
+            }
+        )
+
+    schema = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "entity": entity,
+        "rows": rows,
+        "columns": column_entries,
+    }
+    temp_path = directory / f"{SCHEMA_FILE}.tmp"
+    temp_path.write_text(json.dumps(schema, indent=2), encoding="utf-8")
+    os.replace(temp_path, schema_path)
+    _remove_unlisted_files(
+        directory, {name for entry in column_entries for name in entry["files"].values()}
+    )
+    return directory
+
+
+def read_table(directory: Path, mmap: bool = True) -> BinaryTable:
+    """Lee una tabla columnar; columnas sin compresion quedan mapeadas en memoria."""
+    _require_numpy()
+    schema_path = directory / SCHEMA_FILE
+    if not schema_path.exists():
+        raise FileNotFoundError(f"No existe el archivo requerido: {schema_path}")
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    if schema.get("format") != FORMAT_NAME or schema.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Formato columnar no soportado en {directory}.")
+
+    specs: list[ColumnSpec] = []
+    columns: dict[str, Column] = {}
+    for entry in schema["columns"]:
+        spec = ColumnSpec(
+            name=entry["name"],
+            kind=entry["kind"],
+            scale=int(entry["scale"]),
+            nullable=bool(entry["nullable"]),
+        )
+        specs.append(spec)
+        files = entry["files"]
+        codec = entry["compression"]
+        if spec.kind in {"text", "timestamp"}:
+            columns[spec.name] = TextColumn(
+                offsets=_load_array(directory / files["offsets"], codec, mmap),
+                data=_load_array(directory / files["data"], codec, mmap),
+                valid=(
+                    _load_array(directory / files["valid"], codec, mmap)
+                    if "valid" in files
+                    else None
+                ),
+            )
+        else:
+            columns[spec.name] = _load_array(directory / files["values"], codec, mmap)
+
+    return BinaryTable(
+        entity=schema["entity"],
+        rows=int(schema["rows"]),
+        specs=tuple(specs),
+        columns=columns,
+    )
+
+
+def encode_rows(entity: str, rows: Iterable[Any]) -> dict[str, Column]:
+    """Convierte filas tipadas (dataclasses) a columnas fisicas."""
+    materialized = list(rows)
+    return {
+        spec.name: encode_column(spec, [getattr(row, spec.name) for row in materialized])
+        for spec in TABLE_SCHEMAS[entity]
+    }
@@ -0,0 +1,478 @@
+"""Motor columnar (NumPy) de transformación y validación ETL.
+
+Alternativa al motor Decimal de `src.etl.transform`:
+
+- Montos como centavos `int64` y tasas como puntos base (1e-4) `int64`.
+- Identificadores como arreglos de 16 bytes (`S16`) ordenables.
+- Subtotales por orden con `np.add.reduceat` sobre items ordenados por `order_id`.
+- FKs con pertenencia sobre arreglos ordenados (`np.searchsorted`, ver `IdIndex`).
+
+Las reglas y mensajes replican a `validate_transformed_seed`, incluyendo el
+redondeo `ROUND_HALF_UP` y el orden en que se reporta el primer error.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import TYPE_CHECKING, Any, cast
+from uuid import UUID
+
+from src.etl.binary_format import TABLE_SCHEMAS, BinaryTable, Column, encode_column
+from src.etl.extract import SeedBatch
+from src.etl.transform import EtlValidationError, TransformedSeed, _as_optional_datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependencia opcional del motor columnar.
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+MONEY_SCALE = 2
+TAX_SCALE = 4
+TAX_RATE_ONE = 10**TAX_SCALE
+ID_DTYPE = "S16"
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarSeed:
+    """Dataset ETL en columnas tipadas (ids S16, montos en centavos)."""
+
+    customer_ids: NDArray[Any]
+    product_ids: NDArray[Any]
+    order_ids: NDArray[Any]
+    order_customer_ids: NDArray[Any]
+    order_shipping_cents: NDArray[np.int64]
+    order_tax_rate_bp: NDArray[np.int64]
+    item_order_ids: NDArray[Any]
+    item_product_ids: NDArray[Any]
+    item_unit_price_cents: NDArray[np.int64]
+    item_quantities: NDArray[np.int64]
+    invoice_order_ids: NDArray[Any]
+    invoice_total_cents: NDArray[np.int64]
+
+
+def _require_numpy() -> None:
+    """Falla con mensaje claro si numpy no está instalado."""
+    if np is None:
+        raise RuntimeError(
+            "El motor columnar requiere numpy instalado (poetry install --extras columnar)."
+        )
+
+
+def parse_scaled_int(value: str, scale: int) -> int:
+    """Convierte texto decimal a entero escalado con redondeo ROUND_HALF_UP.
+
+    Ejemplo: `parse_scaled_int("45.555", 2) == 4556`.
+    """
+    text = value.strip()
+    negative = text.startswith("-")
+    digits = text[1:] if text[:1] in {"-", "+"} else text
+    whole, _, fraction = digits.partition(".")
+    if (
+        (whole or fraction)
+        and (not whole or (whole.isascii() and whole.isdigit()))
+        and (not fraction or (fraction.isascii() and fraction.isdigit()))
+    ):
+        scaled: int = int(whole or "0") * 10**scale + int(fraction[:scale].ljust(scale, "0"))
+        if len(fraction) > scale and fraction[scale] >= "5":
+            scaled += 1
+        return -scaled if negative else scaled
+
+    # Formatos poco comunes (exponentes, etc.) pasan por Decimal como el motor base.
+    return int(Decimal(text).scaleb(scale).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def uuid_bytes(value: str) -> bytes:
+    """Convierte UUID textual a sus 16 bytes big-endian."""
+    text = value.strip()
+    if len(text) == 36:
+        raw = bytes.fromhex(text.replace("-", ""))
+        if len(raw) == 16:
+            return raw
+    return UUID(text).bytes
+
+
+def _id_column_from_text(values: list[str]) -> NDArray[Any]:
+    """Construye columna S16 desde UUIDs textuales.
+
+    El caso comun (UUID canonico de 36 chars) se decodifica con un solo `bytes.fromhex`.
+    """
+    if all(len(value) == 36 and value.count("-") == 4 for value in values):
+        with suppress(ValueError):
+            raw = bytes.fromhex("".join(values).replace("-", ""))
+            if len(raw) == 16 * len(values):
+                return np.frombuffer(raw, dtype=ID_DTYPE).copy()
+    return _id_column(uuid_bytes(value) for value in values)
+
+
+def _id_column(values: Iterable[bytes]) -> NDArray[Any]:
+    """Construye columna de ids de 16 bytes."""
+    return np.fromiter(values, dtype=ID_DTYPE)
+
+
+def _int_column(values: Iterable[int]) -> NDArray[np.int64]:
+    """Construye columna int64."""
+    return np.fromiter(values, dtype=np.int64)
+
+
+def _format_id(value: bytes) -> UUID:
+    """Recupera UUID desde un elemento S16 (numpy recorta nulos finales)."""
+    return UUID(bytes=bytes(value).ljust(16, b"\0"))
+
+
+def _format_cents(value: int) -> Decimal:
+    """Convierte centavos a Decimal con dos decimales."""
+    return Decimal(int(value)).scaleb(-MONEY_SCALE)
+
+
+def transform_seed_columnar(batch: SeedBatch) -> ColumnarSeed:
+    """Transforma CSV crudo a columnas sin construir objetos Decimal/UUID por fila."""
+    _require_numpy()
+
+    def ids(rows: list[dict[str, str]], field: str) -> NDArray[Any]:
+        return _id_column_from_text([row[field] for row in rows])
+
+    return ColumnarSeed(
+        customer_ids=ids(batch.customers, "customer_id"),
+        product_ids=ids(batch.products, "product_id"),
+        order_ids=ids(batch.orders, "order_id"),
+        order_customer_ids=ids(batch.orders, "customer_id"),
+        order_shipping_cents=_int_column(
+            parse_scaled_int(row["shipping_cost"], MONEY_SCALE) for row in batch.orders
+        ),
+        order_tax_rate_bp=_int_column(
+            parse_scaled_int(row["tax_rate"], TAX_SCALE) for row in batch.orders
+        ),
+        item_order_ids=ids(batch.order_items, "order_id"),
+        item_product_ids=ids(batch.order_items, "product_id"),
+        item_unit_price_cents=_int_column(
+            parse_scaled_int(row["unit_price"], MONEY_SCALE) for row in batch.order_items
+        ),
+        item_quantities=_int_column(int(row["quantity"]) for row in batch.order_items),
+        invoice_order_ids=ids(batch.invoices, "order_id"),
+        invoice_total_cents=_int_column(
+            parse_scaled_int(row["total_amount"], MONEY_SCALE) for row in batch.invoices
+        ),
+    )
+
+
+def columnar_from_transformed(dataset: TransformedSeed) -> ColumnarSeed:
+    """Convierte un dataset Decimal ya tipado a su forma columnar."""
+    _require_numpy()
+    return ColumnarSeed(
+        customer_ids=_id_column(row.customer_id.bytes for row in dataset.customers),
+        product_ids=_id_column(row.product_id.bytes for row in dataset.products),
+        order_ids=_id_column(row.order_id.bytes for row in dataset.orders),
+        order_customer_ids=_id_column(row.customer_id.bytes for row in dataset.orders),
+        order_shipping_cents=_int_column(
+            int(row.shipping_cost.scaleb(MONEY_SCALE)) for row in dataset.orders
+        ),
+        order_tax_rate_bp=_int_column(
+            int(row.tax_rate.scaleb(TAX_SCALE)) for row in dataset.orders
+        ),
+        item_order_ids=_id_column(row.order_id.bytes for row in dataset.order_items),
+        item_product_ids=_id_column(row.product_id.bytes for row in dataset.order_items),
+        item_unit_price_cents=_int_column(
+            int(row.unit_price.scaleb(MONEY_SCALE)) for row in dataset.order_items
+        ),
+        item_quantities=_int_column(row.quantity for row in dataset.order_items),
+        invoice_order_ids=_id_column(row.order_id.bytes for row in dataset.invoices),
+        invoice_total_cents=_int_column(
+            int(row.total_amount.scaleb(MONEY_SCALE)) for row in dataset.invoices
+        ),
+    )
+
+
+def columnar_from_binary(tables: dict[str, BinaryTable]) -> ColumnarSeed:
+    """Arma `ColumnarSeed` directo desde staging binario (columnas mapeadas, sin copias).
+
+    Los montos del staging ya estan escalados igual que en este motor.
+    """
+    _require_numpy()
+
+    def column(entity: str, name: str) -> NDArray[Any]:
+        return cast("NDArray[Any]", tables[entity].columns[name])
+
+    return ColumnarSeed(
+        customer_ids=column("customers", "customer_id"),
+        product_ids=column("products", "product_id"),
+        order_ids=column("orders", "order_id"),
+        order_customer_ids=column("orders", "customer_id"),
+        order_shipping_cents=column("orders", "shipping_cost"),
+        order_tax_rate_bp=column("orders", "tax_rate"),
+        item_order_ids=column("order_items", "order_id"),
+        item_product_ids=column("order_items", "product_id"),
+        item_unit_price_cents=column("order_items", "unit_price"),
+        item_quantities=column("order_items", "quantity"),
+        invoice_order_ids=column("invoices", "order_id"),
+        invoice_total_cents=column("invoices", "total_amount"),
+    )
+
+
+def _encode_values(entity: str, name: str, values: list[Any]) -> Column:
+    """Codifica valores Python con la especificacion de `TABLE_SCHEMAS`."""
+    spec = next(spec for spec in TABLE_SCHEMAS[entity] if spec.name == name)
+    return encode_column(spec, values)
+
+
+def binary_columns_from_batch(
+    batch: SeedBatch, dataset: ColumnarSeed
+) -> dict[str, dict[str, Column]]:
+    """Columnas del staging binario desde CSV crudo y su `ColumnarSeed` ya validado.
+
+    Ids y montos se reutilizan del motor columnar; solo el texto se normaliza por
+    fila. El resultado es el mismo que `encode_rows` sobre `transform_seed(batch)`,
+    sin construir objetos Decimal ni UUID.
+    """
+    _require_numpy()
+
+    def text(entity: str, name: str, rows: list[dict[str, str]]) -> Column:
+        return _encode_values(entity, name, [row[name].strip() for row in rows])
+
+    return {
+        "customers": {
+            "customer_id": dataset.customer_ids,
+            "full_name": text("customers", "full_name", batch.customers),
+            "email": _encode_values(
+                "customers", "email", [row["email"].strip().lower() for row in batch.customers]
+            ),
+        },
+        "products": {
+            "product_id": dataset.product_ids,
+            "sku": text("products", "sku", batch.products),
+            "name": text("products", "name", batch.products),
+            "unit_price": _int_column(
+                parse_scaled_int(row["unit_price"], MONEY_SCALE) for row in batch.products
+            ),
+            "is_active": np.fromiter(
+                (row["is_active"].strip().lower() == "true" for row in batch.products),
+                dtype=np.bool_,
+                count=len(batch.products),
+            ),
+        },
+        "orders": {
+            "order_id": dataset.order_ids,
+            "customer_id": dataset.order_customer_ids,
+            "branch_id": text("orders", "branch_id", batch.orders),
+            "shipping_cost": dataset.order_shipping_cents,
+            "tax_rate": dataset.order_tax_rate_bp,
+            "status": text("orders", "status", batch.orders),
+            "cancellation_reason": _encode_values(
+                "orders",
+                "cancellation_reason",
+                [row["cancellation_reason"].strip() or None for row in batch.orders],
+            ),
+            "created_at": _encode_values(
+                "orders",
+                "created_at",
+                [_as_optional_datetime(row.get("created_at") or "") for row in batch.orders],
+            ),
+        },
+        "order_items": {
+            "order_id": dataset.item_order_ids,
+            "line_number": _int_column(int(row["line_number"]) for row in batch.order_items),
+            "product_id": dataset.item_product_ids,
+            "product_name": text("order_items", "product_name", batch.order_items),
+            "unit_price": dataset.item_unit_price_cents,
+            "quantity": dataset.item_quantities,
+        },
+        "invoices": {
+            "order_id": dataset.invoice_order_ids,
+            "external_invoice_id": text("invoices", "external_invoice_id", batch.invoices),
+            "total_amount": dataset.invoice_total_cents,
+        },
+    }
+
+
+def _id_halves(ids: NDArray[Any]) -> tuple[NDArray[np.uint64], NDArray[np.uint64]]:
+    """Separa ids S16 en mitades alta/baja uint64 (orden big-endian)."""
+    pairs = np.ascontiguousarray(ids, dtype=ID_DTYPE).view(">u8").reshape(-1, 2)
+    return pairs[:, 0].astype(np.uint64), pairs[:, 1].astype(np.uint64)
+
+
+class IdIndex:
+    """Indice ordenado de ids unicos que traduce ids a codigos int64.
+
+    Ruta rapida: ordena solo por la mitad alta (uint64) y confirma la mitad baja.
+    Si dos ids distintos comparten mitad alta se usa la ruta exacta sobre S16.
+    """
+
+    __slots__ = ("_exact", "_hi", "_lo", "size")
+
+    def __init__(self, keys: NDArray[Any]) -> None:
+        hi, lo = _id_halves(keys)
+        order = np.argsort(hi)
+        hi, lo = hi[order], lo[order]
+        same_hi = hi[1:] == hi[:-1]
+        self._exact: NDArray[Any] | None = None
+        if np.any(same_hi & (lo[1:] != lo[:-1])):
+            self._exact = np.unique(keys)
+            self.size = int(self._exact.size)
+            return
+        first = np.r_[True, ~same_hi] if hi.size else np.zeros(0, dtype=np.bool_)
+        self._hi, self._lo = hi[first], lo[first]
+        self.size = int(self._hi.size)
+
+    def codes(self, values: NDArray[Any]) -> NDArray[np.int64]:
+        """Codigo de cada id (posicion en el indice) o -1 si no existe."""
+        codes = np.full(values.shape, -1, dtype=np.int64)
+        if self.size == 0 or values.size == 0:
+            return codes
+        if self._exact is not None:
+            positions = np.minimum(np.searchsorted(self._exact, values), self.size - 1)
+            found = self._exact[positions] == values
+            codes[found] = positions[found]
+            return codes
+
+        # Buscar agujas ya ordenadas evita fallos de cache de `searchsorted` aleatorio.
+        hi, lo = _id_halves(values)
+        order = np.argsort(hi)
+        hi, lo = hi[order], lo[order]
+        positions = np.minimum(np.searchsorted(self._hi, hi), self.size - 1)
+        found = (self._hi[positions] == hi) & (self._lo[positions] == lo)
+        codes[order[found]] = positions[found]
+        return codes
+
+
+def _first_index(mask: NDArray[np.bool_]) -> int | None:
+    """Indice del primer True o None."""
+    indexes = np.flatnonzero(mask)
+    if indexes.size == 0:
+        return None
+    return int(indexes[0])
+
+
+def validate_record_counts_columnar(dataset: ColumnarSeed, expected_count: int) -> None:
+    """Valida cantidad esperada de registros por entidad principal."""
+    if dataset.customer_ids.size != expected_count:
+        raise EtlValidationError("customers no cumple cantidad esperada.")
+    if dataset.product_ids.size != expected_count:
+        raise EtlValidationError("products no cumple cantidad esperada.")
+    if dataset.order_ids.size != expected_count:
+        raise EtlValidationError("orders no cumple cantidad esperada.")
+    if dataset.item_order_ids.size != expected_count:
+        raise EtlValidationError("order_items no cumple cantidad esperada.")
+    if dataset.invoice_order_ids.size != expected_count:
+        raise EtlValidationError("invoices no cumple cantidad esperada.")
+
+
+def validate_foreign_keys_columnar(dataset: ColumnarSeed) -> None:
+    """Valida FKs con pertenencia sobre arreglos ordenados."""
+    missing_customer = IdIndex(dataset.customer_ids).codes(dataset.order_customer_ids) < 0
+    index = _first_index(missing_customer)
+    if index is not None:
+        customer_id = _format_id(dataset.order_customer_ids[index])
+        raise EtlValidationError(f"FK invalida: customer_id {customer_id} no existe.")
+
+    order_index = IdIndex(dataset.order_ids)
+    missing_order = order_index.codes(dataset.item_order_ids) < 0
+    missing_product = IdIndex(dataset.product_ids).codes(dataset.item_product_ids) < 0
+    index = _first_index(missing_order | missing_product)
+    if index is not None:
+        if missing_order[index]:
+            order_id = _format_id(dataset.item_order_ids[index])
+            raise EtlValidationError(f"FK invalida: order_id {order_id} no existe.")
+        product_id = _format_id(dataset.item_product_ids[index])
+        raise EtlValidationError(f"FK invalida: product_id {product_id} no existe.")
+
+    index = _first_index(order_index.codes(dataset.invoice_order_ids) < 0)
+    if index is not None:
+        order_id = _format_id(dataset.invoice_order_ids[index])
+        raise EtlValidationError(f"FK invalida: invoice.order_id {order_id} no existe.")
+
+
+def _subtotals_by_code(
+    codes: NDArray[np.int64], line_cents: NDArray[np.int64], size: int
+) -> tuple[NDArray[np.bool_], NDArray[np.int64]]:
+    """Suma lineas por codigo de orden con `np.add.reduceat` sobre codigos ordenados."""
+    has_items = np.zeros(size, dtype=np.bool_)
+    subtotals = np.zeros(size, dtype=np.int64)
+    known = codes >= 0
+    if not np.any(known):
+        return has_items, subtotals
+    codes, line_cents = codes[known], line_cents[known]
+    sort_index = np.argsort(codes)
+    sorted_codes = codes[sort_index]
+    group_starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    group_codes = sorted_codes[group_starts]
+    has_items[group_codes] = True
+    subtotals[group_codes] = np.add.reduceat(line_cents[sort_index], group_starts)
+    return has_items, subtotals
+
+
+def _last_total_by_code(
+    codes: NDArray[np.int64], totals: NDArray[np.int64], size: int
+) -> tuple[NDArray[np.bool_], NDArray[np.int64]]:
+    """Indexa facturas por codigo de orden; ante duplicados gana la ultima (como un dict)."""
+    last_position = np.full(size, -1, dtype=np.int64)
+    known = np.flatnonzero(codes >= 0)
+    np.maximum.at(last_position, codes[known], known)
+    has_invoice = last_position >= 0
+    received = np.zeros(size, dtype=np.int64)
+    received[has_invoice] = totals[last_position[has_invoice]]
+    return has_invoice, received
+
+
+def validate_totals_columnar(dataset: ColumnarSeed) -> None:
+    """Valida coherencia de totales: items + impuestos + shipping = invoice."""
+    bad_quantity = dataset.item_quantities <= 0
+    bad_unit_price = dataset.item_unit_price_cents < 0
+    index = _first_index(bad_quantity | bad_unit_price)
+    if index is not None:
+        if bad_quantity[index]:
+            raise EtlValidationError("order_items.quantity debe ser mayor a 0.")
+        raise EtlValidationError("order_items.unit_price debe ser >= 0.")
+
+    order_index = IdIndex(dataset.order_ids)
+    order_codes = order_index.codes(dataset.order_ids)
+    line_cents = dataset.item_unit_price_cents * dataset.item_quantities
+    has_items, subtotals = _subtotals_by_code(
+        order_index.codes(dataset.item_order_ids), line_cents, order_index.size
+    )
+    has_invoice, received = _last_total_by_code(
+        order_index.codes(dataset.invoice_order_ids),
+        dataset.invoice_total_cents,
+        order_index.size,
+    )
+    has_items, subtotal = has_items[order_codes], subtotals[order_codes]
+    has_invoice, received_total = has_invoice[order_codes], received[order_codes]
+
+    # ROUND_HALF_UP sobre centavos * puntos base; los negativos se rechazan antes de usarse.
+    tax_total = (subtotal * dataset.order_tax_rate_bp + TAX_RATE_ONE // 2) // TAX_RATE_ONE
+    expected_total = subtotal + tax_total + dataset.order_shipping_cents
+
+    bad_shipping = dataset.order_shipping_cents < 0
+    bad_tax_rate = (dataset.order_tax_rate_bp < 0) | (dataset.order_tax_rate_bp > TAX_RATE_ONE)
+    bad_total = has_invoice & (received_total != expected_total)
+    index = _first_index(bad_shipping | bad_tax_rate | ~has_items | ~has_invoice | bad_total)
+    if index is None:
+        return
+
+    # Se respeta la prioridad de reglas del motor Decimal para la orden reportada.
+    order_id = _format_id(dataset.order_ids[index])
+    if bad_shipping[index]:
+        raise EtlValidationError("orders.shipping_cost debe ser >= 0.")
+    if bad_tax_rate[index]:
+        raise EtlValidationError("orders.tax_rate debe estar entre 0 y 1.")
+    if not has_items[index]:
+        raise EtlValidationError(f"La orden {order_id} no tiene items.")
+    if not has_invoice[index]:
+        raise EtlValidationError(f"La orden {order_id} no tiene factura asociada.")
+    raise EtlValidationError(
+        f"Total inconsistente para orden {order_id}: "
+        f"esperado {_format_cents(expected_total[index])}, "
+        f"recibido {_format_cents(received_total[index])}."
+    )
+
+
+def validate_columnar_seed(dataset: ColumnarSeed, expected_count: int = 20) -> None:
+    """Aplica todas las validaciones ETL sobre el dataset columnar."""
+    _require_numpy()
+    validate_record_counts_columnar(dataset, expected_count=expected_count)
+    validate_foreign_keys_columnar(dataset)
+    validate_totals_columnar(dataset)
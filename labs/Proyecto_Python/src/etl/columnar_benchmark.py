@@ -0,0 +1,97 @@
+"""Benchmark del motor columnar contra el motor Decimal del ETL.
+
+Uso:
+    poetry run python -m src.etl.columnar_benchmark --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from time import perf_counter
+
+from src.etl.columnar import (
+    ColumnarSeed,
+    transform_seed_columnar,
+    validate_foreign_keys_columnar,
+    validate_totals_columnar,
+)
+from src.etl.extract import SeedBatch
+from src.etl.generate_seed import build_seed_payload
+from src.etl.transform import (
+    TransformedSeed,
+    transform_seed,
+    validate_foreign_keys,
+    validate_totals,
+)
+
+
+def _timed[T](function: Callable[[], T]) -> tuple[T, float]:
+    """Ejecuta una funcion y devuelve (resultado, segundos)."""
+    start_time = perf_counter()
+    result = function()
+    return result, perf_counter() - start_time
+
+
+def _validate_decimal(transformed: TransformedSeed) -> None:
+    """Validaciones del motor Decimal."""
+    validate_foreign_keys(transformed)
+    validate_totals(transformed)
+
+
+def _validate_columnar(columnar: ColumnarSeed) -> None:
+    """Validaciones del motor columnar."""
+    validate_foreign_keys_columnar(columnar)
+    validate_totals_columnar(columnar)
+
+
+def run_benchmark(rows: int) -> dict[str, float]:
+    """Mide transform y validacion en ambos motores con `rows` ordenes.
+
+    Cada motor valida lo que el mismo transformo, igual que en `run_pipeline`.
+    """
+    payload = build_seed_payload(record_count=rows)
+    batch = SeedBatch(
+        customers=payload.customers,
+        products=payload.products,
+        orders=payload.orders,
+        order_items=payload.order_items,
+        invoices=payload.invoices,
+    )
+
+    transformed, decimal_transform_s = _timed(lambda: transform_seed(batch=batch))
+    columnar, columnar_transform_s = _timed(lambda: transform_seed_columnar(batch))
+    _, decimal_validate_s = _timed(lambda: _validate_decimal(transformed))
+    _, columnar_validate_s = _timed(lambda: _validate_columnar(columnar))
+    return {
+        "decimal_transform_s": decimal_transform_s,
+        "columnar_transform_s": columnar_transform_s,
+        "decimal_validate_s": decimal_validate_s,
+        "columnar_validate_s": columnar_validate_s,
+    }
+
+
+def main() -> None:
+    """CLI del benchmark columnar."""
+    parser = argparse.ArgumentParser(description="Benchmark motor Decimal vs columnar.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(rows=args.rows)
+    transform_speedup = results["decimal_transform_s"] / results["columnar_transform_s"]
+    validate_speedup = results["decimal_validate_s"] / results["columnar_validate_s"]
+    total_speedup = (results["decimal_transform_s"] + results["decimal_validate_s"]) / (
+        results["columnar_transform_s"] + results["columnar_validate_s"]
+    )
+    print(
+        f"BENCH rows={args.rows} | "
+        f"transform decimal={results['decimal_transform_s']:.3f}s "
+        f"columnar={results['columnar_transform_s']:.3f}s x{transform_speedup:.1f} | "
+        f"validate decimal={results['decimal_validate_s']:.3f}s "
+        f"columnar={results['columnar_validate_s']:.3f}s x{validate_speedup:.1f} | "
+        f"total x{total_speedup:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
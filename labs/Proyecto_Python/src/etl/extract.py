@@ -6,6 +6,16 @@ import csv
 from dataclasses import dataclass
 from pathlib import Path
 
+from src.etl.binary_format import TABLE_SCHEMAS, TABLE_SUFFIX, BinaryTable, read_table
+
+SEED_FILES: dict[str, str] = {
+    "customers": "customers.csv",
+    "products": "products.csv",
+    "orders": "orders.csv",
+    "order_items": "order_items.csv",
+    "invoices": "invoices.csv",
+}
+
 
 @dataclass(frozen=True, slots=True)
 class SeedBatch:
@@ -22,7 +32,7 @@ def read_csv_rows(path: Path) -> list[dict[str, str]]:
     """Lee un CSV y devuelve filas como diccionarios de strings."""
     if not path.exists():
         raise FileNotFoundError(f"No existe el archivo requerido: {path}")
-    with path.open("r", encoding="utf-8", newline="") as file:
+    with path.open("r", encoding="utf-8-sig", newline="") as file:
         reader = csv.DictReader(file)
         return [dict(row) for row in reader]
 
@@ -30,11 +40,11 @@ def read_csv_rows(path: Path) -> list[dict[str, str]]:
 def extract_seed(seed_dir: Path) -> SeedBatch:
     """Extrae lote de seeds desde el directorio objetivo."""
     # La extracción se mantiene desacoplada del dominio transaccional.
-    customers = read_csv_rows(seed_dir / "customers.csv")
-    products = read_csv_rows(seed_dir / "products.csv")
-    orders = read_csv_rows(seed_dir / "orders.csv")
-    order_items = read_csv_rows(seed_dir / "order_items.csv")
-    invoices = read_csv_rows(seed_dir / "invoices.csv")
+    customers = read_csv_rows(seed_dir / SEED_FILES["customers"])
+    products = read_csv_rows(seed_dir / SEED_FILES["products"])
+    orders = read_csv_rows(seed_dir / SEED_FILES["orders"])
+    order_items = read_csv_rows(seed_dir / SEED_FILES["order_items"])
+    invoices = read_csv_rows(seed_dir / SEED_FILES["invoices"])
     return SeedBatch(
         customers=customers,
         products=products,
@@ -42,3 +52,11 @@ def extract_seed(seed_dir: Path) -> SeedBatch:
         order_items=order_items,
         invoices=invoices,
     )
+
+
+def extract_binary_staging(staging_dir: Path, mmap: bool = True) -> dict[str, BinaryTable]:
+    """Lee staging binario columnar sin parsear texto (ver `src.etl.binary_format`)."""
+    return {
+        entity: read_table(staging_dir / f"{entity}{TABLE_SUFFIX}", mmap=mmap)
+        for entity in TABLE_SCHEMAS
+    }
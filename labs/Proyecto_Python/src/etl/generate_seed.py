@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import argparse
 import csv
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
 from uuid import NAMESPACE_DNS, UUID, uuid5
@@ -13,6 +15,7 @@ from src.etl.transform import transform_seed, validate_transformed_seed
 
 MONEY_QUANT = Decimal("0.01")
 TAX_QUANT = Decimal("0.0001")
+SEED_EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
 
 
 @dataclass(frozen=True, slots=True)
@@ -90,6 +93,7 @@ def build_seed_payload(record_count: int = 20) -> SeedPayload:
                 "tax_rate": _tax(tax_rate),
                 "status": "COMPLETED",
                 "cancellation_reason": "",
+                "created_at": (SEED_EPOCH + timedelta(hours=index * 7)).isoformat(),
             }
         )
         order_items.append(
@@ -153,9 +157,16 @@ def generate_and_validate(seed_dir: Path, record_count: int = 20) -> SeedPayload
 
 
 def main() -> None:
-    """CLI para generar seeds coherentes."""
+    """CLI para generar seeds coherentes.
+
+    Para volumenes grandes usar `src.etl.synthetic` (streaming y multi-proceso).
+    """
+    parser = argparse.ArgumentParser(description="Genera seeds CSV coherentes.")
+    parser.add_argument("--records", type=int, default=20)
+    args = parser.parse_args()
+
     seed_dir = Path("data/seed")
-    generate_and_validate(seed_dir=seed_dir, record_count=20)
+    generate_and_validate(seed_dir=seed_dir, record_count=args.records)
     print(f"Seeds generadas correctamente en {seed_dir}.")
 
 
@@ -0,0 +1,597 @@
+"""ETL incremental con huellas de contenido y watermarks.
+
+Cada corrida deja en `staging_dir`:
+
+- `_manifest.json`: por entidad sha256, tamaño, filas y watermark (byte offset
+  procesado), mas el tamaño de cada CSV staging escrito.
+- `_etl_index.sqlite`: indices compactos (ids en BLOB de 16 bytes y acumulados
+  por orden) para validar FKs y totales solo contra el delta.
+
+Reglas por archivo seed:
+
+- Mismo tamaño y hash: la entidad se omite.
+- Crecio y el prefijo conserva el hash previo: solo se procesan filas agregadas.
+- Cualquier otro cambio (o manifest/indice inconsistente): corrida completa.
+
+Se invoca desde `run_pipeline(..., incremental=True)` o `src.etl.pipeline --incremental`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any, Literal
+from uuid import UUID, uuid4
+
+from src.etl.extract import SEED_FILES
+from src.etl.load import STAGING_FILES, append_dict_rows, load_to_staging
+from src.etl.parallel import CsvChunk, read_chunk_rows
+from src.etl.transform import (
+    ENTITY_TRANSFORMS,
+    MONEY_QUANT,
+    EtlValidationError,
+    TransformedSeed,
+    validate_foreign_keys,
+    validate_record_counts,
+    validate_totals,
+)
+
+MANIFEST_FILE = "_manifest.json"
+INDEX_FILE = "_etl_index.sqlite"
+MANIFEST_VERSION = 1
+_HASH_BLOCK_BYTES = 1024 * 1024
+_SQLITE_BATCH = 500
+
+IncrementalMode = Literal["full", "incremental", "unchanged"]
+
+
+@dataclass(frozen=True, slots=True)
+class FileFingerprint:
+    """Huella de un CSV seed al momento de procesarlo."""
+
+    size: int
+    sha256: str
+    row_count: int
+    watermark_offset: int
+
+
+@dataclass(frozen=True, slots=True)
+class EtlManifest:
+    """Estado persistido de la ultima corrida ETL."""
+
+    run_id: str
+    processed_at: str
+    files: dict[str, FileFingerprint]
+    staging_sizes: dict[str, int]
+    version: int = MANIFEST_VERSION
+
+    def to_json(self) -> str:
+        """Serializa el manifest a JSON legible."""
+        return json.dumps(asdict(self), indent=2, sort_keys=True)
+
+    @classmethod
+    def from_json(cls, raw: str) -> EtlManifest:
+        """Reconstruye el manifest desde JSON."""
+        data = json.loads(raw)
+        return cls(
+            run_id=data["run_id"],
+            processed_at=data["processed_at"],
+            files={name: FileFingerprint(**value) for name, value in data["files"].items()},
+            staging_sizes={name: int(value) for name, value in data["staging_sizes"].items()},
+            version=int(data["version"]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalSummary:
+    """Resumen de una corrida incremental."""
+
+    seed_dir: Path
+    staging_dir: Path
+    mode: IncrementalMode
+    skipped_entities: tuple[str, ...]
+    delta_rows: dict[str, int] = field(default_factory=dict)
+
+
+class _FullRunRequired(Exception):
+    """Señal interna: el estado previo no permite procesar solo el delta."""
+
+
+@dataclass(slots=True)
+class _OrderState:
+    """Acumulados por orden guardados en el indice compacto."""
+
+    shipping_cost: Decimal
+    tax_rate: Decimal
+    subtotal: Decimal = Decimal("0")
+    item_count: int = 0
+    invoice_total: Decimal | None = None
+
+
+def _fingerprint(path: Path, prefix_size: int | None) -> tuple[str, int, str | None]:
+    """Calcula (sha256, tamaño, sha256 de los primeros `prefix_size` bytes) en una pasada."""
+    digest = hashlib.sha256()
+    prefix_digest: str | None = None
+    consumed = 0
+    with path.open("rb") as file:
+        if prefix_size is not None:
+            remaining = prefix_size
+            while remaining > 0:
+                block = file.read(min(_HASH_BLOCK_BYTES, remaining))
+                if not block:
+                    break
+                digest.update(block)
+                consumed += len(block)
+                remaining -= len(block)
+            if remaining == 0:
+                # hexdigest no finaliza el hash: se puede seguir actualizando.
+                prefix_digest = digest.hexdigest()
+        for block in iter(lambda: file.read(_HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+            consumed += len(block)
+    return digest.hexdigest(), consumed, prefix_digest
+
+
+def _read_header(path: Path) -> tuple[tuple[str, ...], int]:
+    """Devuelve encabezados y offset donde comienzan los datos."""
+    with path.open("rb") as file:
+        header_line = file.readline()
+        data_start = file.tell()
+    return tuple(next(csv.reader([header_line.decode("utf-8-sig")]), [])), data_start
+
+
+def _ends_with_newline(path: Path, size: int) -> bool:
+    """Indica si el byte `size - 1` es fin de linea (append seguro)."""
+    with path.open("rb") as file:
+        file.seek(size - 1)
+        return file.read(1) == b"\n"
+
+
+def _read_range(entity: str, path: Path, start: int | None, end: int) -> list[Any]:
+    """Lee y transforma filas del rango [start, end); start=None lee desde el encabezado."""
+    fieldnames, data_start = _read_header(path)
+    chunk = CsvChunk(
+        entity=entity,
+        path=path,
+        fieldnames=fieldnames,
+        start=data_start if start is None else start,
+        end=end,
+    )
+    return ENTITY_TRANSFORMS[entity](read_chunk_rows(chunk))
+
+
+def _batched(values: list[bytes]) -> Iterator[list[bytes]]:
+    """Parte una lista en lotes aptos para parametros SQLite."""
+    for start in range(0, len(values), _SQLITE_BATCH):
+        yield values[start : start + _SQLITE_BATCH]
+
+
+class _CompactIndex:
+    """Indices compactos de la corrida previa persistidos en SQLite."""
+
+    def __init__(self, path: Path) -> None:
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS customer_ids (id BLOB PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS product_ids (id BLOB PRIMARY KEY) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS order_state (
+                order_id BLOB PRIMARY KEY,
+                shipping_cost TEXT NOT NULL,
+                tax_rate TEXT NOT NULL,
+                subtotal TEXT NOT NULL,
+                item_count INTEGER NOT NULL,
+                invoice_total TEXT
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def close(self) -> None:
+        """Cierra la conexion SQLite."""
+        self._connection.close()
+
+    def run_id(self) -> str | None:
+        """Run id con el que se confirmo el indice por ultima vez."""
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'run_id'").fetchone()
+        return None if row is None else str(row[0])
+
+    def existing_ids(
+        self, table: Literal["customer_ids", "product_ids"], ids: set[UUID]
+    ) -> set[UUID]:
+        """Subconjunto de `ids` presente en la tabla indicada."""
+        found: set[UUID] = set()
+        for batch in _batched([value.bytes for value in ids]):
+            placeholders = ",".join("?" * len(batch))
+            rows = self._connection.execute(
+                f"SELECT id FROM {table} WHERE id IN ({placeholders})",
+                batch,
+            )
+            found.update(UUID(bytes=row[0]) for row in rows)
+        return found
+
+    def order_states(self, order_ids: set[UUID]) -> dict[UUID, _OrderState]:
+        """Estados acumulados de las ordenes solicitadas que ya existen."""
+        states: dict[UUID, _OrderState] = {}
+        for batch in _batched([value.bytes for value in order_ids]):
+            placeholders = ",".join("?" * len(batch))
+            rows = self._connection.execute(
+                "SELECT order_id, shipping_cost, tax_rate, subtotal, item_count, invoice_total "
+                f"FROM order_state WHERE order_id IN ({placeholders})",
+                batch,
+            )
+            for order_id, shipping, tax_rate, subtotal, item_count, invoice_total in rows:
+                states[UUID(bytes=order_id)] = _OrderState(
+                    shipping_cost=Decimal(shipping),
+                    tax_rate=Decimal(tax_rate),
+                    subtotal=Decimal(subtotal),
+                    item_count=int(item_count),
+                    invoice_total=None if invoice_total is None else Decimal(invoice_total),
+                )
+        return states
+
+    def apply(
+        self,
+        run_id: str,
+        customer_ids: Iterable[UUID],
+        product_ids: Iterable[UUID],
+        order_states: Mapping[UUID, _OrderState],
+        reset: bool = False,
+    ) -> None:
+        """Aplica el delta validado en una sola transaccion."""
+        with self._connection:
+            if reset:
+                for table in ("meta", "customer_ids", "product_ids", "order_state"):
+                    self._connection.execute(f"DELETE FROM {table}")
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO customer_ids (id) VALUES (?)",
+                ((value.bytes,) for value in customer_ids),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO product_ids (id) VALUES (?)",
+                ((value.bytes,) for value in product_ids),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO order_state "
+                "(order_id, shipping_cost, tax_rate, subtotal, item_count, invoice_total) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        order_id.bytes,
+                        str(state.shipping_cost),
+                        str(state.tax_rate),
+                        str(state.subtotal),
+                        state.item_count,
+                        None if state.invoice_total is None else str(state.invoice_total),
+                    )
+                    for order_id, state in order_states.items()
+                ),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('run_id', ?)", (run_id,)
+            )
+
+
+def read_manifest(staging_dir: Path) -> EtlManifest | None:
+    """Lee el manifest previo; None si no existe o es de otra version."""
+    path = staging_dir / MANIFEST_FILE
+    if not path.exists():
+        return None
+    manifest = EtlManifest.from_json(path.read_text(encoding="utf-8"))
+    if manifest.version != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def _write_manifest(staging_dir: Path, manifest: EtlManifest) -> None:
+    """Escribe el manifest de forma atomica (tmp + replace)."""
+    path = staging_dir / MANIFEST_FILE
+    temp_path = path.with_suffix(".json.tmp")
+    temp_path.write_text(manifest.to_json(), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def _collect_order_states(dataset: TransformedSeed) -> dict[UUID, _OrderState]:
+    """Construye acumulados por orden desde un dataset completo ya validado."""
+    states = {
+        order.order_id: _OrderState(shipping_cost=order.shipping_cost, tax_rate=order.tax_rate)
+        for order in dataset.orders
+    }
+    for item in dataset.order_items:
+        state = states[item.order_id]
+        state.subtotal += item.unit_price * Decimal(item.quantity)
+        state.item_count += 1
+    for invoice in dataset.invoices:
+        states[invoice.order_id].invoice_total = invoice.total_amount
+    return states
+
+
+def _validate_delta(delta: TransformedSeed, index: _CompactIndex) -> dict[UUID, _OrderState]:
+    """Valida FKs y totales del delta contra el indice previo.
+
+    Devuelve los estados por orden actualizados, listos para persistir.
+    """
+    delta_customers = {row.customer_id for row in delta.customers}
+    delta_products = {row.product_id for row in delta.products}
+    delta_orders = {row.order_id for row in delta.orders}
+
+    order_customers = {row.customer_id for row in delta.orders} - delta_customers
+    known_customers = delta_customers | index.existing_ids("customer_ids", order_customers)
+    for order in delta.orders:
+        if order.customer_id not in known_customers:
+            raise EtlValidationError(f"FK invalida: customer_id {order.customer_id} no existe.")
+
+    referenced_orders = {row.order_id for row in delta.order_items} | {
+        row.order_id for row in delta.invoices
+    }
+    states = index.order_states(referenced_orders | delta_orders)
+    item_products = {row.product_id for row in delta.order_items} - delta_products
+    known_products = delta_products | index.existing_ids("product_ids", item_products)
+    for item in delta.order_items:
+        if item.order_id not in delta_orders and item.order_id not in states:
+            raise EtlValidationError(f"FK invalida: order_id {item.order_id} no existe.")
+        if item.product_id not in known_products:
+            raise EtlValidationError(f"FK invalida: product_id {item.product_id} no existe.")
+    for invoice in delta.invoices:
+        if invoice.order_id not in delta_orders and invoice.order_id not in states:
+            raise EtlValidationError(f"FK invalida: invoice.order_id {invoice.order_id} no existe.")
+
+    for order in delta.orders:
+        previous = states.get(order.order_id)
+        states[order.order_id] = _OrderState(
+            shipping_cost=order.shipping_cost,
+            tax_rate=order.tax_rate,
+            subtotal=Decimal("0") if previous is None else previous.subtotal,
+            item_count=0 if previous is None else previous.item_count,
+            invoice_total=None if previous is None else previous.invoice_total,
+        )
+    for item in delta.order_items:
+        if item.quantity <= 0:
+            raise EtlValidationError("order_items.quantity debe ser mayor a 0.")
+        if item.unit_price < Decimal("0"):
+            raise EtlValidationError("order_items.unit_price debe ser >= 0.")
+        state = states[item.order_id]
+        state.subtotal += item.unit_price * Decimal(item.quantity)
+        state.item_count += 1
+    for invoice in delta.invoices:
+        states[invoice.order_id].invoice_total = invoice.total_amount
+
+    # Solo se revalidan ordenes tocadas por el delta, en orden de aparicion.
+    touched = dict.fromkeys(
+        [row.order_id for row in delta.orders]
+        + [row.order_id for row in delta.order_items]
+        + [row.order_id for row in delta.invoices]
+    )
+    for order_id in touched:
+        _validate_order_state(order_id, states[order_id])
+    return states
+
+
+def _validate_order_state(order_id: UUID, state: _OrderState) -> None:
+    """Reglas de `validate_totals` aplicadas a los acumulados de una orden."""
+    if state.shipping_cost < Decimal("0"):
+        raise EtlValidationError("orders.shipping_cost debe ser >= 0.")
+    if state.tax_rate < Decimal("0") or state.tax_rate > Decimal("1"):
+        raise EtlValidationError("orders.tax_rate debe estar entre 0 y 1.")
+    if state.item_count == 0:
+        raise EtlValidationError(f"La orden {order_id} no tiene items.")
+
+    subtotal = state.subtotal.quantize(MONEY_QUANT, rounding=ROUND_HALF_UP)
+    tax_total = (subtotal * state.tax_rate).quantize(MONEY_QUANT, rounding=ROUND_HALF_UP)
+    expected_total = (subtotal + tax_total + state.shipping_cost).quantize(
+        MONEY_QUANT, rounding=ROUND_HALF_UP
+    )
+    if state.invoice_total is None:
+        raise EtlValidationError(f"La orden {order_id} no tiene factura asociada.")
+    if state.invoice_total != expected_total:
+        raise EtlValidationError(
+            f"Total inconsistente para orden {order_id}: "
+            f"esperado {expected_total}, recibido {state.invoice_total}."
+        )
+
+
+def _staging_sizes(staging_dir: Path) -> dict[str, int]:
+    """Tamaño actual de cada CSV staging."""
+    return {
+        entity: (staging_dir / file_name).stat().st_size
+        for entity, file_name in STAGING_FILES.items()
+    }
+
+
+def _staging_consistent(staging_dir: Path, manifest: EtlManifest) -> bool:
+    """Verifica que cada CSV staging exista y tenga al menos lo registrado."""
+    for entity, file_name in STAGING_FILES.items():
+        path = staging_dir / file_name
+        if not path.exists() or path.stat().st_size < manifest.staging_sizes.get(entity, -1):
+            return False
+    return True
+
+
+def _new_manifest(files: dict[str, FileFingerprint], staging_dir: Path) -> EtlManifest:
+    """Construye manifest de una corrida recien confirmada."""
+    return EtlManifest(
+        run_id=str(uuid4()),
+        processed_at=datetime.now(UTC).isoformat(),
+        files=files,
+        staging_sizes=_staging_sizes(staging_dir),
+    )
+
+
+def _run_full(seed_dir: Path, staging_dir: Path, expected_count: int | None) -> IncrementalSummary:
+    """Corrida completa: reprocesa todo y reconstruye manifest + indices."""
+    rows: dict[str, list[Any]] = {}
+    files: dict[str, FileFingerprint] = {}
+    for entity, file_name in SEED_FILES.items():
+        path = seed_dir / file_name
+        if not path.exists():
+            raise FileNotFoundError(f"No existe el archivo requerido: {path}")
+        sha256, size, _ = _fingerprint(path, prefix_size=None)
+        rows[entity] = _read_range(entity, path, start=None, end=size)
+        files[entity] = FileFingerprint(
+            size=size, sha256=sha256, row_count=len(rows[entity]), watermark_offset=size
+        )
+
+    dataset = TransformedSeed(**rows)
+    if expected_count is not None:
+        validate_record_counts(dataset, expected_count=expected_count)
+    validate_foreign_keys(dataset)
+    validate_totals(dataset)
+    load_to_staging(dataset=dataset, output_dir=staging_dir)
+
+    manifest = _new_manifest(files, staging_dir)
+    with closing(_CompactIndex(staging_dir / INDEX_FILE)) as index:
+        index.apply(
+            run_id=manifest.run_id,
+            customer_ids=(row.customer_id for row in dataset.customers),
+            product_ids=(row.product_id for row in dataset.products),
+            order_states=_collect_order_states(dataset),
+            reset=True,
+        )
+    _write_manifest(staging_dir, manifest)
+    return IncrementalSummary(
+        seed_dir=seed_dir,
+        staging_dir=staging_dir,
+        mode="full",
+        skipped_entities=(),
+        delta_rows={entity: len(entity_rows) for entity, entity_rows in rows.items()},
+    )
+
+
+def _run_delta(
+    seed_dir: Path,
+    staging_dir: Path,
+    manifest: EtlManifest,
+    expected_count: int | None,
+) -> IncrementalSummary:
+    """Procesa solo entidades sin cambios o con filas agregadas al final."""
+    with closing(_CompactIndex(staging_dir / INDEX_FILE)) as index:
+        if index.run_id() != manifest.run_id:
+            # El indice y el manifest no se confirmaron juntos (corrida interrumpida).
+            raise _FullRunRequired
+
+        delta_rows: dict[str, list[Any]] = {}
+        files: dict[str, FileFingerprint] = {}
+        skipped: list[str] = []
+        for entity, file_name in SEED_FILES.items():
+            path = seed_dir / file_name
+            previous = manifest.files.get(entity)
+            if previous is None or not path.exists():
+                raise _FullRunRequired
+            sha256, size, prefix_sha256 = _fingerprint(path, prefix_size=previous.size)
+
+            if size == previous.size and sha256 == previous.sha256:
+                skipped.append(entity)
+                delta_rows[entity] = []
+                files[entity] = previous
+                continue
+            appended = (
+                size > previous.size
+                and prefix_sha256 == previous.sha256
+                and _ends_with_newline(path, previous.size)
+            )
+            if not appended:
+                raise _FullRunRequired
+
+            delta_rows[entity] = _read_range(entity, path, start=previous.size, end=size)
+            files[entity] = FileFingerprint(
+                size=size,
+                sha256=sha256,
+                row_count=previous.row_count + len(delta_rows[entity]),
+                watermark_offset=size,
+            )
+
+        if len(skipped) == len(SEED_FILES):
+            return IncrementalSummary(
+                seed_dir=seed_dir,
+                staging_dir=staging_dir,
+                mode="unchanged",
+                skipped_entities=tuple(skipped),
+                delta_rows={entity: 0 for entity in SEED_FILES},
+            )
+
+        if expected_count is not None:
+            for entity, fingerprint in files.items():
+                if fingerprint.row_count != expected_count:
+                    raise EtlValidationError(f"{entity} no cumple cantidad esperada.")
+
+        delta = TransformedSeed(**delta_rows)
+        order_states = _validate_delta(delta, index)
+
+        # Se trunca staging al tamaño confirmado para que reintentos no dupliquen filas.
+        for entity, file_name in STAGING_FILES.items():
+            with (staging_dir / file_name).open("r+b") as file:
+                file.truncate(manifest.staging_sizes[entity])
+            append_dict_rows(staging_dir / file_name, [asdict(row) for row in delta_rows[entity]])
+
+        new_manifest = _new_manifest(files, staging_dir)
+        index.apply(
+            run_id=new_manifest.run_id,
+            customer_ids=(row.customer_id for row in delta.customers),
+            product_ids=(row.product_id for row in delta.products),
+            order_states=order_states,
+        )
+    _write_manifest(staging_dir, new_manifest)
+    return IncrementalSummary(
+        seed_dir=seed_dir,
+        staging_dir=staging_dir,
+        mode="incremental",
+        skipped_entities=tuple(skipped),
+        delta_rows={entity: len(entity_rows) for entity, entity_rows in delta_rows.items()},
+    )
+
+
+def run_incremental_pipeline(
+    seed_dir: Path,
+    staging_dir: Path,
+    expected_count: int | None = None,
+) -> IncrementalSummary:
+    """Ejecuta el ETL procesando solo lo que cambio desde la corrida previa.
+
+    `expected_count`, si se indica, se compara contra el total acumulado por entidad.
+    """
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    manifest = read_manifest(staging_dir)
+    if (
+        manifest is None
+        or not (staging_dir / INDEX_FILE).exists()
+        or not _staging_consistent(staging_dir, manifest)
+    ):
+        return _run_full(seed_dir, staging_dir, expected_count)
+
+    try:
+        return _run_delta(seed_dir, staging_dir, manifest, expected_count)
+    except _FullRunRequired:
+        return _run_full(seed_dir, staging_dir, expected_count)
+
+
+def main() -> None:
+    """Punto de entrada CLI del ETL incremental."""
+    parser = argparse.ArgumentParser(description="ETL incremental de seeds CSV.")
+    parser.add_argument("--expected-count", type=int, default=None)
+    args = parser.parse_args()
+
+    summary = run_incremental_pipeline(
+        seed_dir=Path("data/seed"),
+        staging_dir=Path("data/staging"),
+        expected_count=args.expected_count,
+    )
+    print(
+        "ETL INCREMENTAL OK | "
+        f"mode={summary.mode} | "
+        f"skipped={','.join(summary.skipped_entities) or '-'} | "
+        + " | ".join(f"{entity}={count}" for entity, count in summary.delta_rows.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
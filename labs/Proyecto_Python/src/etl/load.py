@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Mapping, Sequence
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+from src.etl.binary_format import TABLE_SUFFIX, Column, Compression, encode_rows, write_table
+from src.etl.columnar import ColumnarSeed, binary_columns_from_batch
+from src.etl.extract import SeedBatch
 from src.etl.transform import TransformedSeed
 
+STAGING_FILES: dict[str, str] = {
+    "customers": "customers_staging.csv",
+    "products": "products_staging.csv",
+    "orders": "orders_staging.csv",
+    "order_items": "order_items_staging.csv",
+    "invoices": "invoices_staging.csv",
+}
+
 
 @dataclass(frozen=True, slots=True)
 class LoadResult:
@@ -30,13 +42,25 @@ def _write_dict_rows(path: Path, rows: list[dict[str, Any]]) -> None:
         writer.writerows(rows)
 
 
+def append_dict_rows(path: Path, rows: list[dict[str, Any]]) -> None:
+    """Agrega filas al final de un CSV staging; crea encabezado si el archivo no existe."""
+    if not rows:
+        return
+    if not path.exists():
+        _write_dict_rows(path, rows)
+        return
+    with path.open("a", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+        writer.writerows(rows)
+
+
 def load_to_staging(dataset: TransformedSeed, output_dir: Path) -> LoadResult:
     """Carga dataset validado a directorio staging en formato CSV."""
-    customers_path = output_dir / "customers_staging.csv"
-    products_path = output_dir / "products_staging.csv"
-    orders_path = output_dir / "orders_staging.csv"
-    order_items_path = output_dir / "order_items_staging.csv"
-    invoices_path = output_dir / "invoices_staging.csv"
+    customers_path = output_dir / STAGING_FILES["customers"]
+    products_path = output_dir / STAGING_FILES["products"]
+    orders_path = output_dir / STAGING_FILES["orders"]
+    order_items_path = output_dir / STAGING_FILES["order_items"]
+    invoices_path = output_dir / STAGING_FILES["invoices"]
 
     _write_dict_rows(customers_path, [asdict(row) for row in dataset.customers])
     _write_dict_rows(products_path, [asdict(row) for row in dataset.products])
@@ -54,3 +78,51 @@ def load_to_staging(dataset: TransformedSeed, output_dir: Path) -> LoadResult:
             invoices_path,
         ),
     )
+
+
+def load_to_binary_staging(
+    dataset: TransformedSeed,
+    output_dir: Path,
+    compression: Mapping[str, Compression] | None = None,
+) -> LoadResult:
+    """Carga dataset validado a staging binario columnar (`<entidad>.cols/`).
+
+    Ver `src.etl.binary_format`; `compression` sobreescribe la politica por columna.
+    """
+    tables: dict[str, Sequence[Any]] = {
+        "customers": dataset.customers,
+        "products": dataset.products,
+        "orders": dataset.orders,
+        "order_items": dataset.order_items,
+        "invoices": dataset.invoices,
+    }
+    columns = {entity: encode_rows(entity, rows) for entity, rows in tables.items()}
+    return _write_binary_tables(columns, output_dir, compression)
+
+
+def load_columnar_to_binary_staging(
+    batch: SeedBatch,
+    dataset: ColumnarSeed,
+    output_dir: Path,
+    compression: Mapping[str, Compression] | None = None,
+) -> LoadResult:
+    """Carga a staging binario desde el motor columnar, sin pasar por filas Decimal."""
+    return _write_binary_tables(binary_columns_from_batch(batch, dataset), output_dir, compression)
+
+
+def _write_binary_tables(
+    columns: dict[str, dict[str, Column]],
+    output_dir: Path,
+    compression: Mapping[str, Compression] | None,
+) -> LoadResult:
+    """Escribe un directorio `<entidad>.cols/` por entidad."""
+    written = tuple(
+        write_table(
+            output_dir / f"{entity}{TABLE_SUFFIX}",
+            entity,
+            entity_columns,
+            compression=compression,
+        )
+        for entity, entity_columns in columns.items()
+    )
+    return LoadResult(output_dir=output_dir, files_written=written)
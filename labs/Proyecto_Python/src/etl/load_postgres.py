@@ -0,0 +1,312 @@
+"""Carga directa del ETL a PostgreSQL con COPY binario (asyncpg).
+
+Evita el viaje CSV -> `seed_from_csv` -> INSERT fila por fila: las filas tipadas
+de `TransformedSeed` se envian con `copy_records_to_table` (protocolo binario).
+
+Modos:
+
+- Secuencial (default): una conexion y una transaccion; tablas en orden FK y
+  cada tabla en bloques de `chunk_size` filas.
+- Paralelo: tablas y bloques se copian por varias conexiones a tablas UNLOGGED
+  temporales sin indices; despues una sola transaccion mueve todo a las tablas
+  reales en orden FK. Una transaccion de PostgreSQL pertenece a una sola sesion,
+  por eso el COPY paralelo no puede escribir directo en las tablas finales.
+
+Las tablas destino deben aceptar los ids: un duplicado aborta toda la carga.
+Rollups y `order_view` se reconstruyen en la misma transaccion del traspaso.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import islice
+from operator import attrgetter
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+from uuid import uuid4
+
+import asyncpg  # type: ignore[import-untyped]
+
+from src.etl.extract import extract_seed
+from src.etl.transform import (
+    TransformedSeed,
+    transform_seed,
+    validate_foreign_keys,
+    validate_totals,
+)
+from src.infrastructure.db.read_models import rebuild_read_models
+from src.infrastructure.db.seed_from_csv import to_asyncpg_dsn
+from src.infrastructure.settings import InfrastructureSettings
+
+DEFAULT_CHUNK_SIZE = 50_000
+DEFAULT_MAX_CONNECTIONS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class PostgresTable:
+    """Mapeo entidad ETL -> tabla transaccional."""
+
+    entity: str
+    table: str
+    columns: tuple[str, ...]
+    # Columnas con `server_default=now()`: un None toma la hora de la carga.
+    now_defaults: tuple[str, ...] = ()
+
+
+# Orden FK: padres primero. Cada nivel solo depende de niveles anteriores.
+POSTGRES_LOAD_LEVELS: tuple[tuple[PostgresTable, ...], ...] = (
+    (
+        PostgresTable("customers", "customers", ("customer_id", "full_name", "email")),
+        PostgresTable(
+            "products", "products", ("product_id", "sku", "name", "unit_price", "is_active")
+        ),
+    ),
+    (
+        PostgresTable(
+            "orders",
+            "orders",
+            (
+                "order_id",
+                "customer_id",
+                "branch_id",
+                "shipping_cost",
+                "tax_rate",
+                "status",
+                "cancellation_reason",
+                "created_at",
+            ),
+            now_defaults=("created_at",),
+        ),
+    ),
+    (
+        PostgresTable(
+            "order_items",
+            "order_items",
+            ("order_id", "line_number", "product_id", "product_name", "unit_price", "quantity"),
+        ),
+        PostgresTable(
+            "invoices", "invoice_records", ("order_id", "external_invoice_id", "total_amount")
+        ),
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PostgresLoadResult:
+    """Resultado de la carga a PostgreSQL."""
+
+    rows_per_table: dict[str, int]
+    chunks: int
+    parallel: bool
+    wall_seconds: float
+
+
+def to_records(
+    table: PostgresTable, rows: Iterable[Any], loaded_at: datetime | None = None
+) -> Iterator[tuple[Any, ...]]:
+    """Convierte filas tipadas a tuplas en el orden de columnas de la tabla."""
+    getter = attrgetter(*table.columns)
+    positions = [table.columns.index(column) for column in table.now_defaults]
+    if not positions:
+        yield from (getter(row) for row in rows)
+        return
+    now = loaded_at or datetime.now(UTC)
+    for row in rows:
+        record = getter(row)
+        if any(record[position] is None for position in positions):
+            values = list(record)
+            for position in positions:
+                if values[position] is None:
+                    values[position] = now
+            record = tuple(values)
+        yield record
+
+
+def _chunks(records: Iterator[tuple[Any, ...]], chunk_size: int) -> Iterator[list[tuple[Any, ...]]]:
+    """Agrupa registros en bloques de tamaño fijo."""
+    while chunk := list(islice(records, chunk_size)):
+        yield chunk
+
+
+async def _copy_sequential(
+    connection: asyncpg.Connection,
+    dataset: TransformedSeed,
+    chunk_size: int,
+) -> tuple[dict[str, int], int]:
+    """COPY en orden FK dentro de la transaccion abierta de `connection`."""
+    rows_per_table: dict[str, int] = {}
+    chunk_count = 0
+    for level in POSTGRES_LOAD_LEVELS:
+        for table in level:
+            loaded = 0
+            for chunk in _chunks(to_records(table, getattr(dataset, table.entity)), chunk_size):
+                await connection.copy_records_to_table(
+                    table.table, records=chunk, columns=list(table.columns)
+                )
+                loaded += len(chunk)
+                chunk_count += 1
+            rows_per_table[table.table] = loaded
+    return rows_per_table, chunk_count
+
+
+async def _copy_parallel(
+    dsn: str,
+    dataset: TransformedSeed,
+    chunk_size: int,
+    max_connections: int,
+) -> tuple[dict[str, int], int]:
+    """COPY paralelo a tablas UNLOGGED y traspaso atomico en orden FK."""
+    suffix = uuid4().hex[:12]
+    tables = [table for level in POSTGRES_LOAD_LEVELS for table in level]
+    staging_names = {table.table: f"_etl_copy_{table.table}_{suffix}" for table in tables}
+
+    pool = await asyncpg.create_pool(dsn=dsn, min_size=1, max_size=max_connections)
+    try:
+        async with pool.acquire() as connection:
+            for table in tables:
+                await connection.execute(
+                    f'CREATE UNLOGGED TABLE "{staging_names[table.table]}" '
+                    f'(LIKE "{table.table}" INCLUDING DEFAULTS)'
+                )
+
+        async def copy_chunk(table: PostgresTable, chunk: list[tuple[Any, ...]]) -> int:
+            async with pool.acquire() as connection:
+                await connection.copy_records_to_table(
+                    staging_names[table.table], records=chunk, columns=list(table.columns)
+                )
+            return len(chunk)
+
+        # El semaforo acota bloques en memoria, no solo conexiones.
+        semaphore = asyncio.Semaphore(max_connections * 2)
+
+        async def bounded_copy(table: PostgresTable, chunk: list[tuple[Any, ...]]) -> int:
+            try:
+                return await copy_chunk(table, chunk)
+            finally:
+                semaphore.release()
+
+        failures: list[BaseException] = []
+
+        def record_failure(task: asyncio.Task[int]) -> None:
+            error = None if task.cancelled() else task.exception()
+            if error is not None:
+                failures.append(error)
+
+        chunks = (
+            (table, chunk)
+            for table in tables
+            for chunk in _chunks(to_records(table, getattr(dataset, table.entity)), chunk_size)
+        )
+        tasks: list[tuple[str, asyncio.Task[int]]] = []
+        try:
+            for table, chunk in chunks:
+                await semaphore.acquire()
+                if failures:
+                    break
+                task = asyncio.create_task(bounded_copy(table, chunk))
+                task.add_done_callback(record_failure)
+                tasks.append((table.table, task))
+            if tasks and not failures:
+                await asyncio.wait([task for _, task in tasks], return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Con un bloque fallido la carga se descarta: no tiene caso seguir copiando.
+            pending = [task for _, task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        if failures:
+            raise failures[0]
+        rows_per_table = {table.table: 0 for table in tables}
+        for table_name, task in tasks:
+            rows_per_table[table_name] += task.result()
+
+        async with pool.acquire() as connection, connection.transaction():
+            for level in POSTGRES_LOAD_LEVELS:
+                for table in level:
+                    column_list = ", ".join(f'"{column}"' for column in table.columns)
+                    await connection.execute(
+                        f'INSERT INTO "{table.table}" ({column_list}) '
+                        f'SELECT {column_list} FROM "{staging_names[table.table]}"'
+                    )
+            await rebuild_read_models(connection)
+        return rows_per_table, len(tasks)
+    finally:
+        async with pool.acquire() as connection:
+            for name in staging_names.values():
+                await connection.execute(f'DROP TABLE IF EXISTS "{name}"')
+        await pool.close()
+
+
+async def load_to_postgres(
+    dataset: TransformedSeed,
+    dsn: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel: bool = False,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> PostgresLoadResult:
+    """Carga un `TransformedSeed` validado a PostgreSQL con COPY binario."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser mayor a 0.")
+    if max_connections < 1:
+        raise ValueError("max_connections debe ser mayor o igual a 1.")
+
+    start_time = perf_counter()
+    if parallel and max_connections > 1:
+        rows_per_table, chunk_count = await _copy_parallel(
+            dsn, dataset, chunk_size, max_connections
+        )
+    else:
+        connection = await asyncpg.connect(dsn=dsn)
+        try:
+            async with connection.transaction():
+                rows_per_table, chunk_count = await _copy_sequential(
+                    connection, dataset, chunk_size
+                )
+                await rebuild_read_models(connection)
+        finally:
+            await connection.close()
+
+    return PostgresLoadResult(
+        rows_per_table=rows_per_table,
+        chunks=chunk_count,
+        parallel=parallel and max_connections > 1,
+        wall_seconds=perf_counter() - start_time,
+    )
+
+
+def main() -> None:
+    """CLI: extract + transform + validate de `data/seed` y COPY a PostgreSQL."""
+    parser = argparse.ArgumentParser(description="Carga ETL a PostgreSQL con COPY binario.")
+    parser.add_argument("--seed-dir", type=Path, default=Path("data/seed"))
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--parallel", action="store_true")
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS)
+    args = parser.parse_args()
+
+    dataset = transform_seed(extract_seed(args.seed_dir))
+    validate_foreign_keys(dataset)
+    validate_totals(dataset)
+    settings = InfrastructureSettings.from_env()
+    result = asyncio.run(
+        load_to_postgres(
+            dataset,
+            dsn=to_asyncpg_dsn(settings.database_url),
+            chunk_size=args.chunk_size,
+            parallel=args.parallel,
+            max_connections=args.max_connections,
+        )
+    )
+    print(
+        f"POSTGRES LOAD OK | parallel={result.parallel} | chunks={result.chunks} | "
+        f"wall_s={result.wall_seconds:.2f} | "
+        + " | ".join(f"{table}={count}" for table, count in result.rows_per_table.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
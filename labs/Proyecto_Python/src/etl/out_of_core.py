@@ -0,0 +1,341 @@
+"""Validacion ETL fuera de memoria con particionado hash en disco.
+
+1. Un solo recorrido en streaming de cada CSV reparte filas en N archivos spill
+   por familia de llave:
+
+   - `order`: orders, order_items e invoices por `order_id` (FK a orders y totales).
+   - `customer`: customers y orders por `customer_id` (FK de orders).
+   - `product`: products y order_items por `product_id` (FK de items).
+
+2. Cada particion se valida por separado, en paralelo entre procesos, con las
+   reglas de `src.etl.transform`. La memoria queda acotada por el tamaño de la
+   particion y no por el del dataset.
+3. Cada fila spill guarda su posicion original, asi que el error reportado es el
+   mismo que daria `validate_foreign_keys` + `validate_totals` en memoria.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from src.etl.extract import SEED_FILES
+from src.etl.parallel import resolve_workers
+from src.etl.transform import (
+    DEFAULT_SAMPLE_LIMIT,
+    ENTITY_TRANSFORMS,
+    RULE_INVOICE_ORDER_FK,
+    RULE_ITEM_ORDER_FK,
+    RULE_ITEM_PRODUCT_FK,
+    RULE_ITEM_QUANTITY,
+    RULE_ITEM_UNIT_PRICE,
+    RULE_ORDER_CUSTOMER_FK,
+    RULE_ORDER_SHIPPING,
+    RULE_ORDER_TAX_RATE,
+    RULE_ORDER_TOTAL,
+    RULE_ORDER_WITHOUT_INVOICE,
+    RULE_ORDER_WITHOUT_ITEMS,
+    RULE_RECORD_COUNT,
+    EtlValidationError,
+    EtlValidationReportError,
+    TransformedSeed,
+    ValidationIssue,
+    ValidationReport,
+    build_validation_report,
+    iter_foreign_key_issues,
+    iter_total_issues,
+    merge_validation_reports,
+)
+
+DEFAULT_PARTITIONS = 16
+
+# Familia -> entidad -> columna usada como llave de particion.
+PARTITION_FAMILIES: dict[str, dict[str, str]] = {
+    "order": {"orders": "order_id", "order_items": "order_id", "invoices": "order_id"},
+    "customer": {"customers": "customer_id", "orders": "customer_id"},
+    "product": {"products": "product_id", "order_items": "product_id"},
+}
+
+_FAMILY_FK_RULES: dict[str, frozenset[str]] = {
+    "order": frozenset({RULE_ITEM_ORDER_FK, RULE_INVOICE_ORDER_FK}),
+    "customer": frozenset({RULE_ORDER_CUSTOMER_FK}),
+    "product": frozenset({RULE_ITEM_PRODUCT_FK}),
+}
+
+# (fase, sub-orden) replica el orden de deteccion de la validacion en memoria.
+_ISSUE_PRIORITY: dict[str, tuple[int, int]] = {
+    RULE_ORDER_CUSTOMER_FK: (0, 0),
+    RULE_ITEM_ORDER_FK: (1, 0),
+    RULE_ITEM_PRODUCT_FK: (1, 1),
+    RULE_INVOICE_ORDER_FK: (2, 0),
+    RULE_ITEM_QUANTITY: (3, 0),
+    RULE_ITEM_UNIT_PRICE: (3, 1),
+    RULE_ORDER_SHIPPING: (4, 0),
+    RULE_ORDER_TAX_RATE: (4, 1),
+    RULE_ORDER_WITHOUT_ITEMS: (4, 2),
+    RULE_ORDER_WITHOUT_INVOICE: (4, 3),
+    RULE_ORDER_TOTAL: (4, 4),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionTask:
+    """Particion de una familia lista para validarse en un worker."""
+
+    family: str
+    partition: int
+    directory: Path
+    fieldnames: dict[str, tuple[str, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class OutOfCoreSummary:
+    """Resumen de una validacion fuera de memoria."""
+
+    partitions: int
+    workers: int
+    rows_per_entity: dict[str, int]
+    spill_bytes: int
+
+
+def issue_sort_key(issue: ValidationIssue) -> tuple[int, int, int]:
+    """Llave para ordenar violaciones como las detecta la validacion en memoria."""
+    phase, sub_order = _ISSUE_PRIORITY[issue.rule]
+    return phase, issue.row_index, sub_order
+
+
+def _partition_of(value: str, partitions: int) -> int:
+    """Particion de un UUID textual; normaliza igual que `UUID(...)` del transform."""
+    return UUID(value).int % partitions
+
+
+def _spill_entity(
+    seed_dir: Path,
+    spill_root: Path,
+    entity: str,
+    partitions: int,
+) -> tuple[tuple[str, ...], int]:
+    """Reparte un CSV entre las familias que lo usan; devuelve (encabezados, filas)."""
+    families = {
+        family: columns[entity]
+        for family, columns in PARTITION_FAMILIES.items()
+        if entity in columns
+    }
+    path = seed_dir / SEED_FILES[entity]
+    if not path.exists():
+        raise FileNotFoundError(f"No existe el archivo requerido: {path}")
+
+    with ExitStack() as stack:
+        source = stack.enter_context(path.open("r", encoding="utf-8-sig", newline=""))
+        reader = csv.reader(source)
+        fieldnames = tuple(next(reader, []))
+        key_positions = {family: fieldnames.index(column) for family, column in families.items()}
+        writers: dict[str, list[Any]] = {}
+        for family in families:
+            writers[family] = []
+            for partition in range(partitions):
+                directory = spill_root / family / f"part-{partition:04d}"
+                directory.mkdir(parents=True, exist_ok=True)
+                file = stack.enter_context(
+                    (directory / f"{entity}.csv").open("w", encoding="utf-8", newline="")
+                )
+                writers[family].append(csv.writer(file))
+
+        row_count = 0
+        for row_index, row in enumerate(reader):
+            # La posicion original viaja como primera columna del spill.
+            spill_row = [str(row_index), *row]
+            for family, position in key_positions.items():
+                writers[family][_partition_of(row[position], partitions)].writerow(spill_row)
+            row_count += 1
+    return fieldnames, row_count
+
+
+def _read_spill(
+    directory: Path, entity: str, fieldnames: tuple[str, ...]
+) -> tuple[list[Any], list[int]]:
+    """Lee un spill y devuelve (filas tipadas, posiciones originales)."""
+    path = directory / f"{entity}.csv"
+    if not path.exists():
+        return [], []
+    positions: list[int] = []
+    raw_rows: list[dict[str, str]] = []
+    with path.open("r", encoding="utf-8", newline="") as file:
+        for row in csv.reader(file):
+            positions.append(int(row[0]))
+            raw_rows.append(dict(zip(fieldnames, row[1:], strict=False)))
+    return ENTITY_TRANSFORMS[entity](raw_rows), positions
+
+
+def _global_issues(task: PartitionTask) -> Iterator[ValidationIssue]:
+    """Valida una particion y produce violaciones con posiciones globales."""
+    rows: dict[str, list[Any]] = {entity: [] for entity in SEED_FILES}
+    positions: dict[str, list[int]] = {}
+    for entity in PARTITION_FAMILIES[task.family]:
+        rows[entity], positions[entity] = _read_spill(
+            task.directory, entity, task.fieldnames[entity]
+        )
+    dataset = TransformedSeed(**rows)
+
+    streams = [iter_foreign_key_issues(dataset, rules=_FAMILY_FK_RULES[task.family])]
+    if task.family == "order":
+        streams.append(iter_total_issues(dataset))
+    for issue in chain.from_iterable(streams):
+        yield ValidationIssue(
+            rule=issue.rule,
+            entity=issue.entity,
+            row_index=positions[issue.entity][issue.row_index],
+            message=issue.message,
+        )
+
+
+def partition_issues(task: PartitionTask) -> list[ValidationIssue]:
+    """Worker fail-fast: primera violacion de la particion (o lista vacia).
+
+    Dentro de la particion el orden de deteccion ya respeta la prioridad global.
+    """
+    first = next(_global_issues(task), None)
+    return [] if first is None else [first]
+
+
+def partition_report(task: PartitionTask, sample_limit: int) -> ValidationReport:
+    """Worker collect-all: reporte acotado de una particion con posiciones globales."""
+    return build_validation_report(_global_issues(task), sample_limit=sample_limit)
+
+
+def spill_partitions(
+    seed_dir: Path, spill_root: Path, partitions: int
+) -> tuple[list[PartitionTask], dict[str, int]]:
+    """Fase de particionado: un recorrido por CSV, spill por familia y particion."""
+    fieldnames: dict[str, tuple[str, ...]] = {}
+    row_counts: dict[str, int] = {}
+    for entity in SEED_FILES:
+        fieldnames[entity], row_counts[entity] = _spill_entity(
+            seed_dir, spill_root, entity, partitions
+        )
+    tasks = [
+        PartitionTask(
+            family=family,
+            partition=partition,
+            directory=spill_root / family / f"part-{partition:04d}",
+            fieldnames=fieldnames,
+        )
+        for family in PARTITION_FAMILIES
+        for partition in range(partitions)
+    ]
+    return tasks, row_counts
+
+
+def _directory_bytes(directory: Path) -> int:
+    """Bytes ocupados por los archivos de un directorio (recursivo)."""
+    return sum(path.stat().st_size for path in directory.rglob("*") if path.is_file())
+
+
+def validate_out_of_core(
+    seed_dir: Path,
+    partitions: int = DEFAULT_PARTITIONS,
+    workers: int | None = None,
+    expected_count: int | None = None,
+    spill_dir: Path | None = None,
+    collect_all: bool = False,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+) -> OutOfCoreSummary:
+    """Valida FKs y totales sin cargar el dataset completo en memoria.
+
+    Lanza `EtlValidationError` con el mismo primer error que la validacion en memoria.
+    Con `collect_all=True` lanza `EtlValidationReportError` con todas las violaciones.
+    """
+    if partitions < 1:
+        raise ValueError("partitions debe ser mayor o igual a 1.")
+    resolved_workers = resolve_workers(workers)
+    spill_root = Path(tempfile.mkdtemp(prefix="etl-spill-", dir=spill_dir))
+    try:
+        tasks, row_counts = spill_partitions(seed_dir, spill_root, partitions)
+        count_issues = [
+            ValidationIssue(RULE_RECORD_COUNT, entity, -1, f"{entity} no cumple cantidad esperada.")
+            for entity, count in row_counts.items()
+            if expected_count is not None and count != expected_count
+        ]
+        if count_issues and not collect_all:
+            raise EtlValidationError(count_issues[0].message)
+        spill_bytes = _directory_bytes(spill_root)
+
+        if collect_all:
+            worker: Callable[[PartitionTask], Any] = partial(
+                partition_report, sample_limit=sample_limit
+            )
+        else:
+            worker = partition_issues
+        if resolved_workers == 1:
+            results = [worker(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=resolved_workers) as executor:
+                results = list(executor.map(worker, tasks))
+    finally:
+        shutil.rmtree(spill_root, ignore_errors=True)
+
+    if collect_all:
+        report = merge_validation_reports(
+            [build_validation_report(count_issues, sample_limit=sample_limit), *results],
+            sample_limit=sample_limit,
+        )
+        if not report.is_valid:
+            raise EtlValidationReportError(report)
+    else:
+        issues = [issue for partition in results for issue in partition]
+        if issues:
+            raise EtlValidationError(min(issues, key=issue_sort_key).message)
+    return OutOfCoreSummary(
+        partitions=partitions,
+        workers=resolved_workers,
+        rows_per_entity=row_counts,
+        spill_bytes=spill_bytes,
+    )
+
+
+def main() -> None:
+    """CLI de validacion fuera de memoria."""
+    parser = argparse.ArgumentParser(description="Validacion ETL con particionado en disco.")
+    parser.add_argument("--seed-dir", type=Path, default=Path("data/seed"))
+    parser.add_argument("--partitions", type=int, default=DEFAULT_PARTITIONS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--expected-count", type=int, default=None)
+    parser.add_argument("--spill-dir", type=Path, default=None)
+    parser.add_argument("--collect-all", action="store_true")
+    parser.add_argument("--sample-limit", type=int, default=DEFAULT_SAMPLE_LIMIT)
+    args = parser.parse_args()
+
+    try:
+        summary = validate_out_of_core(
+            seed_dir=args.seed_dir,
+            partitions=args.partitions,
+            workers=args.workers,
+            expected_count=args.expected_count,
+            spill_dir=args.spill_dir,
+            collect_all=args.collect_all,
+            sample_limit=args.sample_limit,
+        )
+    except EtlValidationReportError as error:
+        print(json.dumps(error.report.to_dict(), indent=2, ensure_ascii=False))
+        raise SystemExit(1) from error
+    print(
+        f"OUT-OF-CORE OK | partitions={summary.partitions} | workers={summary.workers} | "
+        f"spill_mb={summary.spill_bytes / 2**20:.1f} | "
+        + " | ".join(f"{entity}={count}" for entity, count in summary.rows_per_entity.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
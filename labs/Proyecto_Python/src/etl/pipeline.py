@@ -2,12 +2,46 @@
 
 from __future__ import annotations
 
+import argparse
+import json
 from dataclasses import dataclass
 from pathlib import Path
+from time import perf_counter
+from typing import Literal
 
-from src.etl.extract import extract_seed
-from src.etl.load import load_to_staging
-from src.etl.transform import transform_seed, validate_transformed_seed
+from src.etl.columnar import ColumnarSeed, transform_seed_columnar, validate_columnar_seed
+from src.etl.extract import SeedBatch, extract_seed
+from src.etl.incremental import IncrementalSummary, run_incremental_pipeline
+from src.etl.load import load_columnar_to_binary_staging, load_to_binary_staging, load_to_staging
+from src.etl.parallel import DEFAULT_CHUNK_BYTES, extract_transform_parallel, resolve_workers
+from src.etl.star_schema import StarSchemaSummary, build_star_schema
+from src.etl.transform import (
+    EtlValidationReportError,
+    TransformedSeed,
+    ValidationReport,
+    collect_validation_report,
+    transform_seed,
+    validate_transformed_seed,
+)
+
+ValidationEngine = Literal["decimal", "columnar"]
+StagingFormat = Literal["csv", "binary", "both"]
+
+
+@dataclass(frozen=True, slots=True)
+class StageTiming:
+    """Tiempo de pared y volumen procesado por una etapa del pipeline."""
+
+    stage: str
+    wall_seconds: float
+    rows: int
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput de la etapa en filas por segundo."""
+        if self.wall_seconds <= 0:
+            return float(self.rows)
+        return self.rows / self.wall_seconds
 
 
 @dataclass(frozen=True, slots=True)
@@ -17,32 +51,247 @@ class PipelineSummary:
     seed_dir: Path
     staging_dir: Path
     records_per_entity: int
+    workers: int = 1
+    stage_timings: tuple[StageTiming, ...] = ()
+    validation_report: ValidationReport | None = None
+    star_schema: StarSchemaSummary | None = None
+    incremental: IncrementalSummary | None = None
+
+
+def _row_count(dataset: SeedBatch | TransformedSeed) -> int:
+    """Total de filas de todas las entidades."""
+    return (
+        len(dataset.customers)
+        + len(dataset.products)
+        + len(dataset.orders)
+        + len(dataset.order_items)
+        + len(dataset.invoices)
+    )
+
+
+def _run_incremental(
+    seed_dir: Path,
+    staging_dir: Path,
+    expected_count: int,
+    validation_engine: ValidationEngine,
+    workers: int | None,
+    staging_format: StagingFormat,
+    collect_all: bool,
+    warehouse_dir: Path | None,
+) -> PipelineSummary:
+    """Ruta `incremental=True` de `run_pipeline`."""
+    unsupported = [
+        name
+        for name, enabled in (
+            ("validation_engine='columnar'", validation_engine != "decimal"),
+            ("workers > 1", resolve_workers(workers) != 1),
+            (f"staging_format='{staging_format}'", staging_format != "csv"),
+            ("collect_all", collect_all),
+            ("warehouse_dir", warehouse_dir is not None),
+        )
+        if enabled
+    ]
+    if unsupported:
+        raise ValueError(f"incremental=True no admite: {', '.join(unsupported)}.")
+    start_time = perf_counter()
+    summary = run_incremental_pipeline(seed_dir, staging_dir, expected_count=expected_count)
+    timing = StageTiming(
+        f"incremental_{summary.mode}",
+        perf_counter() - start_time,
+        sum(summary.delta_rows.values()),
+    )
+    return PipelineSummary(
+        seed_dir=seed_dir,
+        staging_dir=staging_dir,
+        records_per_entity=expected_count,
+        stage_timings=(timing,),
+        incremental=summary,
+    )
 
 
-def run_pipeline(seed_dir: Path, staging_dir: Path, expected_count: int = 20) -> PipelineSummary:
-    """Ejecuta pipeline ETL completo: extract -> transform -> validate -> load."""
-    extracted = extract_seed(seed_dir=seed_dir)
-    transformed = transform_seed(batch=extracted)
-    validate_transformed_seed(transformed, expected_count=expected_count)
-    load_to_staging(dataset=transformed, output_dir=staging_dir)
+def run_pipeline(
+    seed_dir: Path,
+    staging_dir: Path,
+    expected_count: int = 20,
+    validation_engine: ValidationEngine = "decimal",
+    workers: int | None = 1,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    staging_format: StagingFormat = "csv",
+    collect_all: bool = False,
+    warehouse_dir: Path | None = None,
+    incremental: bool = False,
+) -> PipelineSummary:
+    """Ejecuta pipeline ETL completo: extract -> transform -> validate -> load.
+
+    Con `validation_engine="columnar"` transform y validaciones corren sobre columnas
+    NumPy y el staging binario se escribe desde esas columnas; las filas Decimal solo
+    se construyen si hacen falta (staging CSV o `warehouse_dir`). Requiere `workers=1`.
+
+    Con `workers` > 1 (o None = todos los CPUs) extract + transform corren en un
+    pool de procesos por bloques de CSV (ver `src.etl.parallel`).
+
+    `staging_format` elige CSV, binario columnar (`src.etl.binary_format`) o ambos.
+
+    Con `collect_all=True` la validacion (reglas Decimal) no se detiene en el primer
+    error: lanza `EtlValidationReportError` con el reporte completo por regla.
+
+    Con `warehouse_dir` se actualiza ademas el modelo estrella (`src.etl.star_schema`).
+
+    Con `incremental=True` se delega en `src.etl.incremental`: solo se procesan
+    las filas agregadas desde la corrida previa sobre el mismo `staging_dir`.
+    Esa ruta escribe staging CSV con el motor Decimal en un proceso y no admite
+    las demas opciones.
+    """
+    if incremental:
+        return _run_incremental(
+            seed_dir,
+            staging_dir,
+            expected_count=expected_count,
+            validation_engine=validation_engine,
+            workers=workers,
+            staging_format=staging_format,
+            collect_all=collect_all,
+            warehouse_dir=warehouse_dir,
+        )
+    if collect_all and validation_engine != "decimal":
+        raise ValueError("collect_all solo esta disponible con validation_engine='decimal'.")
+    resolved_workers = resolve_workers(workers)
+    if validation_engine == "columnar" and resolved_workers != 1:
+        # Los workers devuelven filas Decimal; validarlas en columnas no ahorra nada.
+        raise ValueError("validation_engine='columnar' requiere workers=1.")
+    timings: list[StageTiming] = []
+
+    extracted: SeedBatch | None = None
+    columnar: ColumnarSeed | None = None
+    transformed: TransformedSeed | None = None
+    if resolved_workers == 1:
+        start_time = perf_counter()
+        extracted = extract_seed(seed_dir=seed_dir)
+        total_rows = _row_count(extracted)
+        timings.append(StageTiming("extract", perf_counter() - start_time, total_rows))
+
+        if validation_engine == "columnar":
+            start_time = perf_counter()
+            columnar = transform_seed_columnar(extracted)
+            timings.append(
+                StageTiming("transform_columnar", perf_counter() - start_time, total_rows)
+            )
+            start_time = perf_counter()
+            validate_columnar_seed(columnar, expected_count=expected_count)
+            timings.append(StageTiming("validate", perf_counter() - start_time, total_rows))
+        else:
+            start_time = perf_counter()
+            transformed = transform_seed(batch=extracted)
+            timings.append(StageTiming("transform", perf_counter() - start_time, total_rows))
+    else:
+        start_time = perf_counter()
+        transformed = extract_transform_parallel(
+            seed_dir=seed_dir,
+            workers=resolved_workers,
+            chunk_bytes=chunk_bytes,
+        )
+        total_rows = _row_count(transformed)
+        timings.append(StageTiming("extract_transform", perf_counter() - start_time, total_rows))
+
+    report: ValidationReport | None = None
+    if transformed is not None:
+        start_time = perf_counter()
+        if collect_all:
+            report = collect_validation_report(transformed, expected_count=expected_count)
+        else:
+            validate_transformed_seed(transformed, expected_count=expected_count)
+        timings.append(StageTiming("validate", perf_counter() - start_time, total_rows))
+        if report is not None and not report.is_valid:
+            raise EtlValidationReportError(report)
+
+    needs_rows = staging_format != "binary" or warehouse_dir is not None
+    if transformed is None and extracted is not None and needs_rows:
+        # Ruta columnar: CSV staging y modelo estrella todavia consumen filas tipadas.
+        start_time = perf_counter()
+        transformed = transform_seed(batch=extracted)
+        timings.append(StageTiming("transform", perf_counter() - start_time, total_rows))
+
+    if staging_format in {"csv", "both"} and transformed is not None:
+        start_time = perf_counter()
+        load_to_staging(dataset=transformed, output_dir=staging_dir)
+        timings.append(StageTiming("load", perf_counter() - start_time, total_rows))
+    if staging_format in {"binary", "both"}:
+        start_time = perf_counter()
+        if columnar is not None and extracted is not None:
+            load_columnar_to_binary_staging(extracted, columnar, output_dir=staging_dir)
+        elif transformed is not None:
+            load_to_binary_staging(dataset=transformed, output_dir=staging_dir)
+        timings.append(StageTiming("load_binary", perf_counter() - start_time, total_rows))
+
+    star_summary: StarSchemaSummary | None = None
+    if warehouse_dir is not None and transformed is not None:
+        start_time = perf_counter()
+        star_summary = build_star_schema(dataset=transformed, warehouse_dir=warehouse_dir)
+        timings.append(
+            StageTiming("star_schema", perf_counter() - start_time, star_summary.fact_rows_appended)
+        )
+
     return PipelineSummary(
         seed_dir=seed_dir,
         staging_dir=staging_dir,
         records_per_entity=expected_count,
+        workers=resolved_workers,
+        stage_timings=tuple(timings),
+        validation_report=report,
+        star_schema=star_summary,
     )
 
 
 def main() -> None:
     """Punto de entrada CLI del pipeline ETL."""
+    parser = argparse.ArgumentParser(description="Pipeline ETL de seeds CSV.")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos para extract+transform.")
+    parser.add_argument("--expected-count", type=int, default=20)
+    parser.add_argument("--validation-engine", choices=["decimal", "columnar"], default="decimal")
+    parser.add_argument("--staging-format", choices=["csv", "binary", "both"], default="csv")
+    parser.add_argument(
+        "--collect-all", action="store_true", help="Reporta todas las violaciones en JSON."
+    )
+    parser.add_argument(
+        "--warehouse-dir", type=Path, default=None, help="Construye dimensiones y hechos."
+    )
+    parser.add_argument(
+        "--incremental", action="store_true", help="Procesa solo lo agregado al seed."
+    )
+    args = parser.parse_args()
+
     seed_dir = Path("data/seed")
     staging_dir = Path("data/staging")
-    summary = run_pipeline(seed_dir=seed_dir, staging_dir=staging_dir, expected_count=20)
+    try:
+        summary = run_pipeline(
+            seed_dir=seed_dir,
+            staging_dir=staging_dir,
+            expected_count=args.expected_count,
+            validation_engine=args.validation_engine,
+            workers=args.workers,
+            staging_format=args.staging_format,
+            collect_all=args.collect_all,
+            warehouse_dir=args.warehouse_dir,
+            incremental=args.incremental,
+        )
+    except EtlValidationReportError as error:
+        print(json.dumps(error.report.to_dict(), indent=2, ensure_ascii=False))
+        raise SystemExit(1) from error
     print(
         "ETL OK | "
         f"seed_dir={summary.seed_dir} | "
         f"staging_dir={summary.staging_dir} | "
-        f"records_per_entity={summary.records_per_entity}"
+        f"records_per_entity={summary.records_per_entity} | "
+        f"workers={summary.workers}"
+        + (f" | incremental={summary.incremental.mode}" if summary.incremental else "")
     )
+    for timing in summary.stage_timings:
+        print(
+            f"  stage={timing.stage} | "
+            f"wall_s={timing.wall_seconds:.3f} | "
+            f"rows={timing.rows} | "
+            f"rows_per_s={timing.rows_per_second:.0f}"
+        )
 
 
 if __name__ == "__main__":
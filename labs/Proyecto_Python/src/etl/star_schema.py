@@ -0,0 +1,443 @@
+"""Modelo estrella de ventas construido desde el dataset transformado.
+
+Archivos en `warehouse_dir`:
+
+- `dim_customer.csv`, `dim_product.csv`, `dim_branch.csv`, `dim_date.csv`:
+  dimensiones SCD tipo 1 (se reescriben completas). Las llaves surrogadas son
+  estables: se leen de la dimension previa y solo los ids nuevos reciben llave.
+- `fact_order_line.csv`: una fila por item con subtotal, impuesto, envio y total
+  precalculados. Solo crece: se agregan las ordenes cuyo id aun no se cargo.
+- `_star_state.json`: ids de orden cargados, watermark `(created_at, order_id)`
+  de la orden mas reciente y tamaño del hecho.
+
+Reglas de montos por linea (la suma por orden coincide con la factura):
+
+- `subtotal = unit_price * quantity`.
+- El impuesto de la orden se calcula como en `validate_totals` y se reparte por
+  linea; el residuo de redondeo queda en la ultima linea.
+- El envio se reparte proporcional al subtotal, con el mismo criterio de residuo.
+
+El hecho es append-only: `status` es el de la orden al momento de cargarla.
+La carga se decide por `order_id`, no por fecha: una orden que llega tarde
+(`created_at` anterior al watermark) tambien se agrega, se cuenta en el resumen
+y se reporta con un warning. El watermark solo informa hasta donde llegan las
+fechas cargadas. Las ordenes sin `created_at` no tienen fecha de hecho: se
+omiten con un warning y se cuentan en el resumen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import os
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from src.etl.extract import extract_seed
+from src.etl.transform import (
+    MONEY_QUANT,
+    EtlValidationError,
+    OrderItemRow,
+    OrderRow,
+    TransformedSeed,
+    transform_seed,
+    validate_foreign_keys,
+    validate_totals,
+)
+
+logger = logging.getLogger("distrito_chilaquil.etl")
+
+STATE_FILE = "_star_state.json"
+STATE_VERSION = 2
+
+DIMENSION_HEADERS: dict[str, tuple[str, ...]] = {
+    "dim_customer": ("customer_key", "customer_id", "full_name", "email"),
+    "dim_product": ("product_key", "product_id", "sku", "name", "unit_price", "is_active"),
+    "dim_branch": ("branch_key", "branch_id"),
+    "dim_date": ("date_key", "date", "year", "quarter", "month", "day", "iso_week", "weekday"),
+}
+FACT_TABLE = "fact_order_line"
+FACT_HEADER: tuple[str, ...] = (
+    "order_id",
+    "line_number",
+    "date_key",
+    "customer_key",
+    "product_key",
+    "branch_key",
+    "status",
+    "quantity",
+    "unit_price",
+    "subtotal",
+    "tax",
+    "shipping",
+    "total",
+    "created_at",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FactWatermark:
+    """Ultima orden cargada al hecho, en orden `(created_at, order_id)`."""
+
+    created_at: datetime
+    order_id: UUID
+
+    def sort_key(self) -> tuple[datetime, str]:
+        """Llave comparable con `_order_sort_key`."""
+        return self.created_at, str(self.order_id)
+
+
+@dataclass(frozen=True, slots=True)
+class StarSchemaSummary:
+    """Resultado de construir el modelo estrella."""
+
+    warehouse_dir: Path
+    dimension_rows: dict[str, int]
+    fact_rows_appended: int
+    watermark: FactWatermark | None
+    undated_orders_skipped: int = 0
+    late_orders_loaded: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _StarState:
+    """Estado persistido entre corridas."""
+
+    watermark: FactWatermark | None
+    fact_size: int
+    loaded_order_ids: frozenset[UUID] = frozenset()
+
+
+def _order_sort_key(created_at: datetime, order: OrderRow) -> tuple[datetime, str]:
+    """Orden total de carga: fecha de creacion y desempate por id."""
+    return created_at, str(order.order_id)
+
+
+def date_key(value: date) -> int:
+    """Llave de fecha `yyyymmdd`."""
+    return value.year * 10_000 + value.month * 100 + value.day
+
+
+def _read_state(warehouse_dir: Path) -> _StarState | None:
+    """Lee el estado previo; None si no existe o es de otra version."""
+    path = warehouse_dir / STATE_FILE
+    if not path.exists():
+        return None
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if raw.get("version") != STATE_VERSION:
+        return None
+    watermark = raw.get("watermark")
+    return _StarState(
+        watermark=(
+            FactWatermark(
+                created_at=datetime.fromisoformat(watermark["created_at"]),
+                order_id=UUID(watermark["order_id"]),
+            )
+            if watermark
+            else None
+        ),
+        fact_size=int(raw["fact_size"]),
+        loaded_order_ids=frozenset(UUID(value) for value in raw["loaded_order_ids"]),
+    )
+
+
+def _write_state(warehouse_dir: Path, state: _StarState) -> None:
+    """Escribe el estado de forma atomica (tmp + replace)."""
+    payload: dict[str, Any] = {
+        "version": STATE_VERSION,
+        "fact_size": state.fact_size,
+        "loaded_order_ids": sorted(str(order_id) for order_id in state.loaded_order_ids),
+        "watermark": (
+            {
+                "created_at": state.watermark.created_at.isoformat(),
+                "order_id": str(state.watermark.order_id),
+            }
+            if state.watermark is not None
+            else None
+        ),
+    }
+    path = warehouse_dir / STATE_FILE
+    temp_path = path.with_suffix(".json.tmp")
+    temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def _read_dimension(path: Path) -> dict[str, dict[str, Any]]:
+    """Filas previas de una dimension indexadas por llave natural (segunda columna)."""
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return {}
+        return {row[1]: dict(zip(header, row, strict=True)) for row in reader if row}
+
+
+def _write_rows(path: Path, header: Iterable[str], rows: Iterable[Mapping[str, Any]]) -> int:
+    """Reescribe un CSV completo y devuelve las filas escritas."""
+    temp_path = path.with_suffix(".csv.tmp")
+    count = 0
+    with temp_path.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(header))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    os.replace(temp_path, path)
+    return count
+
+
+def _upsert_dimension(
+    warehouse_dir: Path,
+    name: str,
+    current: Mapping[str, dict[str, Any]],
+    natural_key: Callable[[str], int] | None = None,
+) -> tuple[dict[str, int], int]:
+    """SCD1: actualiza atributos, conserva llaves previas y asigna llaves a ids nuevos.
+
+    Los ids que ya no vienen en el dataset se conservan para que hechos
+    anteriores sigan resolviendo su llave. `natural_key` deriva la llave del id
+    (p. ej. `yyyymmdd` en `dim_date`) en vez de usar un consecutivo.
+    """
+    header = DIMENSION_HEADERS[name]
+    key_column, natural_column = header[0], header[1]
+    rows = _read_dimension(warehouse_dir / f"{name}.csv")
+    keys = {natural_id: int(row[key_column]) for natural_id, row in rows.items()}
+    next_key = max(keys.values(), default=0) + 1
+    # Ids nuevos en orden para que las llaves sean reproducibles.
+    for natural_id in sorted(current):
+        if natural_id not in keys:
+            if natural_key is not None:
+                keys[natural_id] = natural_key(natural_id)
+            else:
+                keys[natural_id] = next_key
+                next_key += 1
+        rows[natural_id] = {
+            key_column: keys[natural_id],
+            natural_column: natural_id,
+            **current[natural_id],
+        }
+    ordered = sorted(rows.values(), key=lambda row: int(row[key_column]))
+    written = _write_rows(warehouse_dir / f"{name}.csv", header, ordered)
+    return keys, written
+
+
+def _date_attributes(value: date) -> dict[str, Any]:
+    """Atributos calendario de `dim_date` (sin la llave natural)."""
+    iso_year, iso_week, iso_weekday = value.isocalendar()
+    return {
+        "year": value.year,
+        "quarter": (value.month - 1) // 3 + 1,
+        "month": value.month,
+        "day": value.day,
+        "iso_week": f"{iso_year}-W{iso_week:02d}",
+        "weekday": iso_weekday,
+    }
+
+
+def _allocate(total: Decimal, weights: list[Decimal]) -> list[Decimal]:
+    """Reparte `total` proporcional a `weights`; el residuo va a la ultima linea."""
+    weight_sum = sum(weights, start=Decimal("0"))
+    if weight_sum == 0:
+        return [Decimal("0.00")] * (len(weights) - 1) + [total]
+    shares = [
+        (total * weight / weight_sum).quantize(MONEY_QUANT, rounding=ROUND_HALF_UP)
+        for weight in weights[:-1]
+    ]
+    shares.append(total - sum(shares, start=Decimal("0")))
+    return shares
+
+
+def fact_lines(
+    order: OrderRow,
+    items: list[OrderItemRow],
+    customer_key: int,
+    product_keys: Mapping[str, int],
+    branch_key: int,
+) -> list[dict[str, Any]]:
+    """Filas del hecho de una orden; la suma de `total` es el total facturado."""
+    if order.created_at is None:
+        raise EtlValidationError(f"La orden {order.order_id} no tiene created_at.")
+    ordered_items = sorted(items, key=lambda item: item.line_number)
+    subtotals = [
+        (item.unit_price * Decimal(item.quantity)).quantize(MONEY_QUANT, rounding=ROUND_HALF_UP)
+        for item in ordered_items
+    ]
+    order_subtotal = sum(subtotals, start=Decimal("0"))
+    order_tax = (order_subtotal * order.tax_rate).quantize(MONEY_QUANT, rounding=ROUND_HALF_UP)
+    taxes = _allocate(order_tax, subtotals)
+    shipping = _allocate(order.shipping_cost, subtotals)
+    fact_date_key = date_key(order.created_at.date())
+    return [
+        {
+            "order_id": order.order_id,
+            "line_number": item.line_number,
+            "date_key": fact_date_key,
+            "customer_key": customer_key,
+            "product_key": product_keys[str(item.product_id)],
+            "branch_key": branch_key,
+            "status": order.status,
+            "quantity": item.quantity,
+            "unit_price": item.unit_price,
+            "subtotal": subtotal,
+            "tax": tax,
+            "shipping": shipping_share,
+            "total": subtotal + tax + shipping_share,
+            "created_at": order.created_at.isoformat(),
+        }
+        for item, subtotal, tax, shipping_share in zip(
+            ordered_items, subtotals, taxes, shipping, strict=True
+        )
+    ]
+
+
+def _prepare_fact_file(warehouse_dir: Path, state: _StarState | None) -> _StarState:
+    """Recorta el hecho al tamaño confirmado; sin estado consistente empieza de cero."""
+    fact_path = warehouse_dir / f"{FACT_TABLE}.csv"
+    if state is not None and fact_path.exists() and fact_path.stat().st_size >= state.fact_size:
+        # Una corrida interrumpida pudo dejar filas despues del ultimo estado escrito.
+        with fact_path.open("r+b") as file:
+            file.truncate(state.fact_size)
+        return state
+    fact_path.unlink(missing_ok=True)
+    return _StarState(watermark=None, fact_size=0)
+
+
+def build_star_schema(dataset: TransformedSeed, warehouse_dir: Path) -> StarSchemaSummary:
+    """Actualiza dimensiones y agrega al hecho las ordenes que aun no se cargaron.
+
+    Espera un dataset ya validado (FKs y totales); las ordenes sin `created_at`
+    se omiten del hecho y las que llegan tarde se cargan y se reportan.
+    """
+    warehouse_dir.mkdir(parents=True, exist_ok=True)
+    state = _prepare_fact_file(warehouse_dir, _read_state(warehouse_dir))
+    watermark_key = state.watermark.sort_key() if state.watermark is not None else None
+    dated = [(order.created_at, order) for order in dataset.orders if order.created_at is not None]
+    undated = len(dataset.orders) - len(dated)
+    if undated:
+        logger.warning("star_schema_undated_orders skipped=%s", undated)
+    pending = sorted(
+        (
+            (created_at, order)
+            for created_at, order in dated
+            if order.order_id not in state.loaded_order_ids
+        ),
+        key=lambda entry: _order_sort_key(*entry),
+    )
+    late = sum(
+        1
+        for created_at, order in pending
+        if watermark_key is not None and _order_sort_key(created_at, order) <= watermark_key
+    )
+    if late:
+        logger.warning("star_schema_late_orders loaded=%s", late)
+
+    dimension_rows: dict[str, int] = {}
+    customer_keys, dimension_rows["dim_customer"] = _upsert_dimension(
+        warehouse_dir,
+        "dim_customer",
+        {
+            str(customer.customer_id): {"full_name": customer.full_name, "email": customer.email}
+            for customer in dataset.customers
+        },
+    )
+    product_keys, dimension_rows["dim_product"] = _upsert_dimension(
+        warehouse_dir,
+        "dim_product",
+        {
+            str(product.product_id): {
+                "sku": product.sku,
+                "name": product.name,
+                "unit_price": product.unit_price,
+                "is_active": product.is_active,
+            }
+            for product in dataset.products
+        },
+    )
+    branch_keys, dimension_rows["dim_branch"] = _upsert_dimension(
+        warehouse_dir, "dim_branch", {order.branch_id: {} for order in dataset.orders}
+    )
+    order_dates = {created_at.date() for created_at, _ in pending}
+    _, dimension_rows["dim_date"] = _upsert_dimension(
+        warehouse_dir,
+        "dim_date",
+        {value.isoformat(): _date_attributes(value) for value in order_dates},
+        natural_key=lambda raw: date_key(date.fromisoformat(raw)),
+    )
+
+    items_by_order: dict[UUID, list[OrderItemRow]] = {}
+    for item in dataset.order_items:
+        items_by_order.setdefault(item.order_id, []).append(item)
+
+    fact_path = warehouse_dir / f"{FACT_TABLE}.csv"
+    appended = 0
+    with fact_path.open("a", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(FACT_HEADER))
+        if state.fact_size == 0:
+            writer.writeheader()
+        for _, order in pending:
+            rows = fact_lines(
+                order,
+                items_by_order.get(order.order_id, []),
+                customer_key=customer_keys[str(order.customer_id)],
+                product_keys=product_keys,
+                branch_key=branch_keys[order.branch_id],
+            )
+            writer.writerows(rows)
+            appended += len(rows)
+
+    watermark = state.watermark
+    if pending:
+        last_created_at, last_order = pending[-1]
+        if watermark_key is None or _order_sort_key(last_created_at, last_order) > watermark_key:
+            watermark = FactWatermark(created_at=last_created_at, order_id=last_order.order_id)
+    _write_state(
+        warehouse_dir,
+        _StarState(
+            watermark=watermark,
+            fact_size=fact_path.stat().st_size,
+            loaded_order_ids=state.loaded_order_ids | {order.order_id for _, order in pending},
+        ),
+    )
+
+    return StarSchemaSummary(
+        warehouse_dir=warehouse_dir,
+        dimension_rows=dimension_rows,
+        fact_rows_appended=appended,
+        watermark=watermark,
+        undated_orders_skipped=undated,
+        late_orders_loaded=late,
+    )
+
+
+def main() -> None:
+    """CLI: extract + transform + validate de un seed y construccion del modelo estrella."""
+    parser = argparse.ArgumentParser(description="Modelo estrella de ventas desde seeds CSV.")
+    parser.add_argument("--seed-dir", type=Path, default=Path("data/seed"))
+    parser.add_argument("--warehouse-dir", type=Path, default=Path("data/warehouse"))
+    args = parser.parse_args()
+
+    dataset = transform_seed(extract_seed(args.seed_dir))
+    validate_foreign_keys(dataset)
+    validate_totals(dataset)
+    summary = build_star_schema(dataset, args.warehouse_dir)
+    watermark = summary.watermark.created_at.isoformat() if summary.watermark else "-"
+    print(
+        f"STAR SCHEMA OK | warehouse_dir={summary.warehouse_dir} | "
+        f"fact_rows_appended={summary.fact_rows_appended} | watermark={watermark} | "
+        f"undated_orders_skipped={summary.undated_orders_skipped} | "
+        f"late_orders_loaded={summary.late_orders_loaded} | "
+        + " | ".join(f"{name}={count}" for name, count in summary.dimension_rows.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
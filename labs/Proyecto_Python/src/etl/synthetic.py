@@ -0,0 +1,396 @@
+"""Generador sintetico escalable de seeds CSV para benchmarks de carga y ETL.
+
+A diferencia de `generate_seed` (20 filas en memoria), aqui las filas se escriben
+en streaming por bloques, asi que soporta decenas de millones de ordenes:
+
+- Ordenes multi-linea con popularidad de productos tipo Zipf.
+- Todos los estados de `OrderStatus`; solo CANCELLED lleva `cancellation_reason`.
+- Varias sucursales y `created_at` uniforme dentro de un rango.
+- Determinista por `seed`: cada bloque usa su propio RNG, por lo que el resultado
+  no depende de cuantos procesos participen.
+
+Cada orden conserva exactamente una factura con total consistente, porque el
+ETL exige factura para toda orden.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import random
+import shutil
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from time import perf_counter
+
+from src.etl.extract import SEED_FILES
+from src.etl.parallel import resolve_workers
+
+BLOCK_SIZE = 10_000
+PARTS_DIR = ".parts"
+
+SEED_HEADERS: dict[str, tuple[str, ...]] = {
+    "customers": ("customer_id", "full_name", "email"),
+    "products": ("product_id", "sku", "name", "unit_price", "is_active"),
+    "orders": (
+        "order_id",
+        "customer_id",
+        "branch_id",
+        "shipping_cost",
+        "tax_rate",
+        "status",
+        "cancellation_reason",
+        "created_at",
+    ),
+    "order_items": (
+        "order_id",
+        "line_number",
+        "product_id",
+        "product_name",
+        "unit_price",
+        "quantity",
+    ),
+    "invoices": ("order_id", "external_invoice_id", "total_amount"),
+}
+
+CANCELLATION_REASONS: tuple[str, ...] = (
+    "Cliente cancelo el pedido",
+    "Pago rechazado",
+    "Producto sin inventario",
+    "Direccion de entrega invalida",
+    "Tiempo de entrega excedido",
+)
+
+_ENTITY_CODES = {"customers": 1, "products": 2, "orders": 3}
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticConfig:
+    """Parametros de volumen y distribuciones del generador."""
+
+    orders: int = 10_000
+    customers: int | None = None
+    products: int = 1_000
+    branches: tuple[str, ...] = (
+        "CDMX-CENTRO",
+        "GDL-CENTRO",
+        "MTY-CENTRO",
+        "PUE-CENTRO",
+        "QRO-CENTRO",
+    )
+    max_lines_per_order: int = 5
+    zipf_exponent: float = 1.1
+    status_weights: tuple[tuple[str, float], ...] = (
+        ("COMPLETED", 0.55),
+        ("SHIPPED", 0.15),
+        ("IN_PROGRESS", 0.10),
+        ("PENDING", 0.10),
+        ("CANCELLED", 0.10),
+    )
+    created_from: datetime = field(default_factory=lambda: datetime(2025, 1, 1, tzinfo=UTC))
+    created_to: datetime = field(default_factory=lambda: datetime(2026, 1, 1, tzinfo=UTC))
+    seed: int = 42
+
+    @property
+    def customer_count(self) -> int:
+        """Clientes a generar; por defecto uno por cada 10 ordenes."""
+        return self.customers if self.customers is not None else max(1, self.orders // 10)
+
+    def validate(self) -> None:
+        """Valida rangos basicos antes de lanzar procesos."""
+        if self.orders < 1 or self.products < 1 or self.customer_count < 1:
+            raise ValueError("orders, customers y products deben ser mayores a 0.")
+        if self.max_lines_per_order < 1:
+            raise ValueError("max_lines_per_order debe ser mayor a 0.")
+        if not self.branches:
+            raise ValueError("Se requiere al menos una sucursal.")
+        if self.created_to <= self.created_from:
+            raise ValueError("created_to debe ser posterior a created_from.")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticSummary:
+    """Resultado de una generacion sintetica."""
+
+    seed_dir: Path
+    rows_per_entity: dict[str, int]
+    workers: int
+    wall_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class _Task:
+    """Rango [start, end) de indices de una entidad raiz (customers/products/orders)."""
+
+    entity: str
+    block: int
+    start: int
+    end: int
+
+
+def synthetic_uuid(entity: str, seed: int, index: int) -> str:
+    """UUID v4-compatible determinista y barato (sin hashing) para `index`."""
+    return f"{seed & 0xFFFFFFFF:08x}-{_ENTITY_CODES[entity]:04x}-4000-8000-{index:012x}"
+
+
+def _product_price_cents(index: int) -> int:
+    """Precio estable por producto entre 20.00 y 519.50."""
+    return 2_000 + (index * 7_919 % 1_000) * 50
+
+
+def _format_cents(cents: int) -> str:
+    """Formatea centavos enteros como monto con dos decimales."""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+@lru_cache(maxsize=4)
+def _zipf_cum_weights(products: int, exponent: float) -> tuple[float, ...]:
+    """Pesos acumulados Zipf: el producto de rango k tiene peso 1 / k^s (cache por proceso)."""
+    return tuple(accumulate(1.0 / (rank**exponent) for rank in range(1, products + 1)))
+
+
+def _block_rng(config: SyntheticConfig, entity: str, block: int) -> random.Random:
+    """RNG independiente por bloque: mismo resultado con cualquier cantidad de procesos."""
+    return random.Random(f"{config.seed}:{entity}:{block}")
+
+
+def _customer_rows(config: SyntheticConfig, task: _Task) -> Iterator[tuple[str, ...]]:
+    """Filas de customers del rango de la tarea."""
+    for index in range(task.start, task.end):
+        yield (
+            synthetic_uuid("customers", config.seed, index),
+            f"Cliente Sintetico {index}",
+            f"cliente{index}@synthetic.local",
+        )
+
+
+def _product_rows(config: SyntheticConfig, task: _Task) -> Iterator[tuple[str, ...]]:
+    """Filas de products del rango de la tarea."""
+    for index in range(task.start, task.end):
+        yield (
+            synthetic_uuid("products", config.seed, index),
+            f"SKU-SYN-{index:07d}",
+            f"Producto Sintetico {index}",
+            _format_cents(_product_price_cents(index)),
+            "true",
+        )
+
+
+def _write_rows(path: Path, rows: Iterable[tuple[str, ...]]) -> int:
+    """Escribe filas sin encabezado y devuelve cuantas se escribieron."""
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _part_path(parts_dir: Path, entity: str, block: int) -> Path:
+    """Ruta del archivo parcial de una entidad para un bloque."""
+    return parts_dir / f"{entity}.{block:08d}.csv"
+
+
+def _generate_orders(config: SyntheticConfig, task: _Task, parts_dir: Path) -> dict[str, int]:
+    """Genera ordenes del bloque junto con sus items y facturas."""
+    rng = _block_rng(config, "orders", task.block)
+    cum_weights = _zipf_cum_weights(config.products, config.zipf_exponent)
+    total_weight = cum_weights[-1]
+    last_product = config.products - 1
+    statuses = [status for status, _ in config.status_weights]
+    status_cum = list(accumulate(weight for _, weight in config.status_weights))
+    from_ts = config.created_from.timestamp()
+    span = config.created_to.timestamp() - from_ts
+    customer_count = config.customer_count
+
+    orders: list[tuple[str, ...]] = []
+    items: list[tuple[str, ...]] = []
+    invoices: list[tuple[str, ...]] = []
+    for index in range(task.start, task.end):
+        order_id = synthetic_uuid("orders", config.seed, index)
+        status = statuses[
+            min(bisect_left(status_cum, rng.random() * status_cum[-1]), len(statuses) - 1)
+        ]
+        tax_bp = 1_600 if rng.random() < 0.9 else 800
+        shipping_cents = rng.choice((0, 4_900, 7_900, 9_900))
+        created_at = datetime.fromtimestamp(from_ts + rng.random() * span, UTC)
+
+        subtotal_cents = 0
+        line_count = rng.randint(1, config.max_lines_per_order)
+        for line_number in range(1, line_count + 1):
+            product = min(bisect_left(cum_weights, rng.random() * total_weight), last_product)
+            quantity = rng.choice((1, 1, 1, 2, 2, 3, 4, 5))
+            price_cents = _product_price_cents(product)
+            subtotal_cents += price_cents * quantity
+            items.append(
+                (
+                    order_id,
+                    str(line_number),
+                    synthetic_uuid("products", config.seed, product),
+                    f"Producto Sintetico {product}",
+                    _format_cents(price_cents),
+                    str(quantity),
+                )
+            )
+
+        # ROUND_HALF_UP en enteros: equivale al redondeo Decimal del ETL para montos >= 0.
+        tax_cents = (subtotal_cents * tax_bp + 5_000) // 10_000
+        orders.append(
+            (
+                order_id,
+                synthetic_uuid("customers", config.seed, rng.randrange(customer_count)),
+                rng.choice(config.branches),
+                _format_cents(shipping_cents),
+                f"0.{tax_bp:04d}",
+                status,
+                rng.choice(CANCELLATION_REASONS) if status == "CANCELLED" else "",
+                created_at.isoformat(timespec="seconds"),
+            )
+        )
+        invoices.append(
+            (
+                order_id,
+                f"INV-SYN-{index:010d}",
+                _format_cents(subtotal_cents + tax_cents + shipping_cents),
+            )
+        )
+
+    return {
+        "orders": _write_rows(_part_path(parts_dir, "orders", task.block), orders),
+        "order_items": _write_rows(_part_path(parts_dir, "order_items", task.block), items),
+        "invoices": _write_rows(_part_path(parts_dir, "invoices", task.block), invoices),
+    }
+
+
+def _run_task(config: SyntheticConfig, task: _Task, parts_dir: Path) -> dict[str, int]:
+    """Worker: genera un bloque y lo escribe como archivos parciales."""
+    if task.entity == "customers":
+        rows = _customer_rows(config, task)
+    elif task.entity == "products":
+        rows = _product_rows(config, task)
+    else:
+        return _generate_orders(config, task, parts_dir)
+    return {task.entity: _write_rows(_part_path(parts_dir, task.entity, task.block), rows)}
+
+
+def _plan_tasks(config: SyntheticConfig) -> list[_Task]:
+    """Divide cada entidad raiz en bloques de `BLOCK_SIZE` indices."""
+    totals = {
+        "customers": config.customer_count,
+        "products": config.products,
+        "orders": config.orders,
+    }
+    return [
+        _Task(entity=entity, block=block, start=start, end=min(start + BLOCK_SIZE, total))
+        for entity, total in totals.items()
+        for block, start in enumerate(range(0, total, BLOCK_SIZE))
+    ]
+
+
+def _concatenate_parts(seed_dir: Path, parts_dir: Path, tasks: list[_Task]) -> None:
+    """Une archivos parciales en orden de bloque, con un solo encabezado por CSV."""
+    blocks_by_entity: dict[str, list[int]] = {entity: [] for entity in SEED_FILES}
+    for task in tasks:
+        entities = (
+            ("orders", "order_items", "invoices") if task.entity == "orders" else (task.entity,)
+        )
+        for entity in entities:
+            blocks_by_entity[entity].append(task.block)
+
+    for entity, file_name in SEED_FILES.items():
+        with (seed_dir / file_name).open("w", encoding="utf-8", newline="") as output:
+            csv.writer(output).writerow(SEED_HEADERS[entity])
+            output.flush()
+            for block in sorted(blocks_by_entity[entity]):
+                with _part_path(parts_dir, entity, block).open(
+                    "r", encoding="utf-8", newline=""
+                ) as part:
+                    shutil.copyfileobj(part, output, length=1024 * 1024)
+
+
+def generate_synthetic_seed(
+    seed_dir: Path,
+    config: SyntheticConfig | None = None,
+    workers: int | None = None,
+) -> SyntheticSummary:
+    """Genera seeds CSV sinteticos en `seed_dir` repartiendo bloques entre procesos."""
+    resolved_config = config or SyntheticConfig()
+    resolved_config.validate()
+    resolved_workers = resolve_workers(workers)
+    parts_dir = seed_dir / PARTS_DIR
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    parts_dir.mkdir(parents=True)
+
+    start_time = perf_counter()
+    tasks = _plan_tasks(resolved_config)
+    counts = dict.fromkeys(SEED_FILES, 0)
+    if resolved_workers == 1:
+        results = [_run_task(resolved_config, task, parts_dir) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=resolved_workers) as executor:
+            futures = [
+                executor.submit(_run_task, resolved_config, task, parts_dir) for task in tasks
+            ]
+            results = [future.result() for future in futures]
+    for result in results:
+        for entity, count in result.items():
+            counts[entity] += count
+
+    _concatenate_parts(seed_dir, parts_dir, tasks)
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return SyntheticSummary(
+        seed_dir=seed_dir,
+        rows_per_entity=counts,
+        workers=resolved_workers,
+        wall_seconds=perf_counter() - start_time,
+    )
+
+
+def main() -> None:
+    """CLI del generador sintetico."""
+    defaults = SyntheticConfig()
+    parser = argparse.ArgumentParser(description="Generador sintetico de seeds para benchmarks.")
+    parser.add_argument("--orders", type=int, default=defaults.orders)
+    parser.add_argument("--customers", type=int, default=None)
+    parser.add_argument("--products", type=int, default=defaults.products)
+    parser.add_argument("--branches", default=",".join(defaults.branches))
+    parser.add_argument("--max-lines", type=int, default=defaults.max_lines_per_order)
+    parser.add_argument("--zipf", type=float, default=defaults.zipf_exponent)
+    parser.add_argument(
+        "--created-from", type=datetime.fromisoformat, default=defaults.created_from
+    )
+    parser.add_argument("--created-to", type=datetime.fromisoformat, default=defaults.created_to)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", type=Path, default=Path("data/seed"))
+    args = parser.parse_args()
+
+    config = SyntheticConfig(
+        orders=args.orders,
+        customers=args.customers,
+        products=args.products,
+        branches=tuple(branch.strip() for branch in args.branches.split(",") if branch.strip()),
+        max_lines_per_order=args.max_lines,
+        zipf_exponent=args.zipf,
+        created_from=args.created_from,
+        created_to=args.created_to,
+        seed=args.seed,
+    )
+    summary = generate_synthetic_seed(seed_dir=args.output, config=config, workers=args.workers)
+    print(
+        f"SYNTHETIC OK | seed_dir={summary.seed_dir} | workers={summary.workers} | "
+        f"wall_s={summary.wall_seconds:.2f} | "
+        + " | ".join(f"{entity}={count}" for entity, count in summary.rows_per_entity.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from decimal import ROUND_HALF_UP, Decimal
+from itertools import chain
+from typing import Any
 from uuid import UUID
 
+from src.etl.binary_format import BinaryTable
 from src.etl.extract import SeedBatch
 
 MONEY_QUANT = Decimal("0.01")
@@ -47,6 +52,7 @@ class OrderRow:
     tax_rate: Decimal
     status: str
     cancellation_reason: str | None
+    created_at: datetime | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -99,17 +105,30 @@ def _as_optional_text(value: str) -> str | None:
     return clean_value
 
 
-def transform_seed(batch: SeedBatch) -> TransformedSeed:
-    """Transforma CSV crudo a registros tipados."""
-    customers = [
+def _as_optional_datetime(value: str) -> datetime | None:
+    """Convierte ISO-8601 opcional a datetime; sin zona horaria se asume UTC."""
+    clean_value = value.strip()
+    if not clean_value:
+        return None
+    parsed = datetime.fromisoformat(clean_value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def transform_customers(rows: list[dict[str, str]]) -> list[CustomerRow]:
+    """Transforma filas crudas de customers."""
+    return [
         CustomerRow(
             customer_id=UUID(row["customer_id"]),
             full_name=row["full_name"].strip(),
             email=row["email"].strip().lower(),
         )
-        for row in batch.customers
+        for row in rows
     ]
-    products = [
+
+
+def transform_products(rows: list[dict[str, str]]) -> list[ProductRow]:
+    """Transforma filas crudas de products."""
+    return [
         ProductRow(
             product_id=UUID(row["product_id"]),
             sku=row["sku"].strip(),
@@ -117,9 +136,13 @@ def transform_seed(batch: SeedBatch) -> TransformedSeed:
             unit_price=_as_decimal(row["unit_price"]),
             is_active=row["is_active"].strip().lower() == "true",
         )
-        for row in batch.products
+        for row in rows
     ]
-    orders = [
+
+
+def transform_orders(rows: list[dict[str, str]]) -> list[OrderRow]:
+    """Transforma filas crudas de orders."""
+    return [
         OrderRow(
             order_id=UUID(row["order_id"]),
             customer_id=UUID(row["customer_id"]),
@@ -128,10 +151,15 @@ def transform_seed(batch: SeedBatch) -> TransformedSeed:
             tax_rate=_as_tax_rate(row["tax_rate"]),
             status=row["status"].strip(),
             cancellation_reason=_as_optional_text(row["cancellation_reason"]),
+            created_at=_as_optional_datetime(row.get("created_at") or ""),
         )
-        for row in batch.orders
+        for row in rows
     ]
-    order_items = [
+
+
+def transform_order_items(rows: list[dict[str, str]]) -> list[OrderItemRow]:
+    """Transforma filas crudas de order_items."""
+    return [
         OrderItemRow(
             order_id=UUID(row["order_id"]),
             line_number=int(row["line_number"]),
@@ -140,81 +168,270 @@ def transform_seed(batch: SeedBatch) -> TransformedSeed:
             unit_price=_as_decimal(row["unit_price"]),
             quantity=int(row["quantity"]),
         )
-        for row in batch.order_items
+        for row in rows
     ]
-    invoices = [
+
+
+def transform_invoices(rows: list[dict[str, str]]) -> list[InvoiceRow]:
+    """Transforma filas crudas de invoices."""
+    return [
         InvoiceRow(
             order_id=UUID(row["order_id"]),
             external_invoice_id=row["external_invoice_id"].strip(),
             total_amount=_as_decimal(row["total_amount"]),
         )
-        for row in batch.invoices
+        for row in rows
     ]
 
+
+ENTITY_TRANSFORMS: dict[str, Callable[[list[dict[str, str]]], list[Any]]] = {
+    "customers": transform_customers,
+    "products": transform_products,
+    "orders": transform_orders,
+    "order_items": transform_order_items,
+    "invoices": transform_invoices,
+}
+
+
+def transform_seed(batch: SeedBatch) -> TransformedSeed:
+    """Transforma CSV crudo a registros tipados."""
     return TransformedSeed(
-        customers=customers,
-        products=products,
-        orders=orders,
-        order_items=order_items,
-        invoices=invoices,
+        customers=transform_customers(batch.customers),
+        products=transform_products(batch.products),
+        orders=transform_orders(batch.orders),
+        order_items=transform_order_items(batch.order_items),
+        invoices=transform_invoices(batch.invoices),
     )
 
 
-def validate_record_counts(dataset: TransformedSeed, expected_count: int) -> None:
-    """Valida cantidad esperada de registros por entidad principal."""
-    if len(dataset.customers) != expected_count:
-        raise EtlValidationError("customers no cumple cantidad esperada.")
-    if len(dataset.products) != expected_count:
-        raise EtlValidationError("products no cumple cantidad esperada.")
-    if len(dataset.orders) != expected_count:
-        raise EtlValidationError("orders no cumple cantidad esperada.")
-    if len(dataset.order_items) != expected_count:
-        raise EtlValidationError("order_items no cumple cantidad esperada.")
-    if len(dataset.invoices) != expected_count:
-        raise EtlValidationError("invoices no cumple cantidad esperada.")
+def transform_binary_tables(tables: dict[str, BinaryTable]) -> TransformedSeed:
+    """Reconstruye filas tipadas desde staging binario (sin parsear UUID/Decimal)."""
+    row_types: dict[str, Callable[..., Any]] = {
+        "customers": CustomerRow,
+        "products": ProductRow,
+        "orders": OrderRow,
+        "order_items": OrderItemRow,
+        "invoices": InvoiceRow,
+    }
+    rows: dict[str, list[Any]] = {}
+    for entity, row_type in row_types.items():
+        table = tables[entity]
+        # Las columnas del schema siguen el orden de campos de cada fila tipada.
+        columns = [table.values(spec.name) for spec in table.specs]
+        rows[entity] = [row_type(*values) for values in zip(*columns, strict=True)]
+    return TransformedSeed(**rows)
+
+
+RULE_RECORD_COUNT = "record_count"
+RULE_ORDER_CUSTOMER_FK = "fk.orders.customer_id"
+RULE_ITEM_ORDER_FK = "fk.order_items.order_id"
+RULE_ITEM_PRODUCT_FK = "fk.order_items.product_id"
+RULE_INVOICE_ORDER_FK = "fk.invoices.order_id"
+RULE_ITEM_QUANTITY = "order_items.quantity"
+RULE_ITEM_UNIT_PRICE = "order_items.unit_price"
+RULE_ORDER_SHIPPING = "orders.shipping_cost"
+RULE_ORDER_TAX_RATE = "orders.tax_rate"
+RULE_ORDER_WITHOUT_ITEMS = "orders.items"
+RULE_ORDER_WITHOUT_INVOICE = "orders.invoice"
+RULE_ORDER_TOTAL = "orders.total"
+
+DEFAULT_SAMPLE_LIMIT = 20
+
+# Orden en que las reglas se evaluan (y se listan en los reportes).
+_RULE_ORDER: tuple[str, ...] = (
+    RULE_RECORD_COUNT,
+    RULE_ORDER_CUSTOMER_FK,
+    RULE_ITEM_ORDER_FK,
+    RULE_ITEM_PRODUCT_FK,
+    RULE_INVOICE_ORDER_FK,
+    RULE_ITEM_QUANTITY,
+    RULE_ITEM_UNIT_PRICE,
+    RULE_ORDER_SHIPPING,
+    RULE_ORDER_TAX_RATE,
+    RULE_ORDER_WITHOUT_ITEMS,
+    RULE_ORDER_WITHOUT_INVOICE,
+    RULE_ORDER_TOTAL,
+)
+
+FOREIGN_KEY_RULES = frozenset(
+    {RULE_ORDER_CUSTOMER_FK, RULE_ITEM_ORDER_FK, RULE_ITEM_PRODUCT_FK, RULE_INVOICE_ORDER_FK}
+)
+TOTAL_RULES = frozenset(
+    {
+        RULE_ITEM_QUANTITY,
+        RULE_ITEM_UNIT_PRICE,
+        RULE_ORDER_SHIPPING,
+        RULE_ORDER_TAX_RATE,
+        RULE_ORDER_WITHOUT_ITEMS,
+        RULE_ORDER_WITHOUT_INVOICE,
+        RULE_ORDER_TOTAL,
+    }
+)
 
 
-def validate_foreign_keys(dataset: TransformedSeed) -> None:
-    """Valida consistencia referencial básica entre tablas CSV."""
-    customer_ids = {row.customer_id for row in dataset.customers}
-    product_ids = {row.product_id for row in dataset.products}
-    order_ids = {row.order_id for row in dataset.orders}
+@dataclass(frozen=True, slots=True)
+class ValidationIssue:
+    """Violacion de una regla ETL.
 
-    for order in dataset.orders:
-        if order.customer_id not in customer_ids:
-            raise EtlValidationError(f"FK invalida: customer_id {order.customer_id} no existe.")
+    `row_index` es la posicion en la lista de `entity` (-1 si la regla aplica a
+    la entidad completa, como el conteo de registros).
+    """
 
-    for item in dataset.order_items:
-        if item.order_id not in order_ids:
-            raise EtlValidationError(f"FK invalida: order_id {item.order_id} no existe.")
-        if item.product_id not in product_ids:
-            raise EtlValidationError(f"FK invalida: product_id {item.product_id} no existe.")
+    rule: str
+    entity: str
+    row_index: int
+    message: str
 
-    for invoice in dataset.invoices:
-        if invoice.order_id not in order_ids:
-            raise EtlValidationError(f"FK invalida: invoice.order_id {invoice.order_id} no existe.")
 
+@dataclass(frozen=True, slots=True)
+class RuleSummary:
+    """Conteo total de una regla y muestras acotadas de sus violaciones."""
 
-def validate_totals(dataset: TransformedSeed) -> None:
-    """Valida coherencia de totales: items + impuestos + shipping = invoice."""
+    rule: str
+    count: int
+    samples: tuple[ValidationIssue, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationReport:
+    """Reporte collect-all: todas las reglas violadas con conteos y muestras."""
+
+    rules: tuple[RuleSummary, ...]
+
+    @property
+    def is_valid(self) -> bool:
+        """True si no hubo ninguna violacion."""
+        return not self.rules
+
+    @property
+    def total_issues(self) -> int:
+        """Cantidad total de violaciones, incluidas las que no quedaron como muestra."""
+        return sum(summary.count for summary in self.rules)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Representacion serializable a JSON."""
+        return {
+            "valid": self.is_valid,
+            "total_issues": self.total_issues,
+            "rules": {
+                summary.rule: {
+                    "count": summary.count,
+                    "samples": [
+                        {
+                            "entity": issue.entity,
+                            "row_index": issue.row_index,
+                            "message": issue.message,
+                        }
+                        for issue in summary.samples
+                    ],
+                }
+                for summary in self.rules
+            },
+        }
+
+
+class EtlValidationReportError(EtlValidationError):
+    """Validacion collect-all fallida; el reporte completo viaja en `report`."""
+
+    def __init__(self, report: ValidationReport) -> None:
+        rules = ", ".join(f"{summary.rule}={summary.count}" for summary in report.rules)
+        super().__init__(f"{report.total_issues} violaciones ETL ({rules}).")
+        self.report = report
+
+
+def iter_record_count_issues(
+    dataset: TransformedSeed, expected_count: int
+) -> Iterator[ValidationIssue]:
+    """Produce una violacion por entidad cuyo conteo difiere del esperado."""
+    for entity in ("customers", "products", "orders", "order_items", "invoices"):
+        if len(getattr(dataset, entity)) != expected_count:
+            yield ValidationIssue(
+                RULE_RECORD_COUNT, entity, -1, f"{entity} no cumple cantidad esperada."
+            )
+
+
+def iter_foreign_key_issues(
+    dataset: TransformedSeed, rules: frozenset[str] = FOREIGN_KEY_RULES
+) -> Iterator[ValidationIssue]:
+    """Recorre FKs y produce cada violacion en el orden en que se detecta."""
+    customer_ids = {row.customer_id for row in dataset.customers}
+    product_ids = {row.product_id for row in dataset.products}
+    order_ids = {row.order_id for row in dataset.orders}
+
+    if RULE_ORDER_CUSTOMER_FK in rules:
+        for index, order in enumerate(dataset.orders):
+            if order.customer_id not in customer_ids:
+                yield ValidationIssue(
+                    RULE_ORDER_CUSTOMER_FK,
+                    "orders",
+                    index,
+                    f"FK invalida: customer_id {order.customer_id} no existe.",
+                )
+
+    check_order = RULE_ITEM_ORDER_FK in rules
+    check_product = RULE_ITEM_PRODUCT_FK in rules
+    if check_order or check_product:
+        for index, item in enumerate(dataset.order_items):
+            if check_order and item.order_id not in order_ids:
+                yield ValidationIssue(
+                    RULE_ITEM_ORDER_FK,
+                    "order_items",
+                    index,
+                    f"FK invalida: order_id {item.order_id} no existe.",
+                )
+            if check_product and item.product_id not in product_ids:
+                yield ValidationIssue(
+                    RULE_ITEM_PRODUCT_FK,
+                    "order_items",
+                    index,
+                    f"FK invalida: product_id {item.product_id} no existe.",
+                )
+
+    if RULE_INVOICE_ORDER_FK in rules:
+        for index, invoice in enumerate(dataset.invoices):
+            if invoice.order_id not in order_ids:
+                yield ValidationIssue(
+                    RULE_INVOICE_ORDER_FK,
+                    "invoices",
+                    index,
+                    f"FK invalida: invoice.order_id {invoice.order_id} no existe.",
+                )
+
+
+def iter_total_issues(dataset: TransformedSeed) -> Iterator[ValidationIssue]:
+    """Recorre reglas de montos y totales; produce cada violacion detectada."""
     items_by_order: dict[UUID, list[OrderItemRow]] = {}
-    for item in dataset.order_items:
+    for index, item in enumerate(dataset.order_items):
         if item.quantity <= 0:
-            raise EtlValidationError("order_items.quantity debe ser mayor a 0.")
+            yield ValidationIssue(
+                RULE_ITEM_QUANTITY, "order_items", index, "order_items.quantity debe ser mayor a 0."
+            )
         if item.unit_price < Decimal("0"):
-            raise EtlValidationError("order_items.unit_price debe ser >= 0.")
+            yield ValidationIssue(
+                RULE_ITEM_UNIT_PRICE, "order_items", index, "order_items.unit_price debe ser >= 0."
+            )
         items_by_order.setdefault(item.order_id, []).append(item)
 
     invoices_by_order = {invoice.order_id: invoice for invoice in dataset.invoices}
-    for order in dataset.orders:
+    for index, order in enumerate(dataset.orders):
         if order.shipping_cost < Decimal("0"):
-            raise EtlValidationError("orders.shipping_cost debe ser >= 0.")
+            yield ValidationIssue(
+                RULE_ORDER_SHIPPING, "orders", index, "orders.shipping_cost debe ser >= 0."
+            )
         if order.tax_rate < Decimal("0") or order.tax_rate > Decimal("1"):
-            raise EtlValidationError("orders.tax_rate debe estar entre 0 y 1.")
+            yield ValidationIssue(
+                RULE_ORDER_TAX_RATE, "orders", index, "orders.tax_rate debe estar entre 0 y 1."
+            )
 
         order_items = items_by_order.get(order.order_id, [])
         if not order_items:
-            raise EtlValidationError(f"La orden {order.order_id} no tiene items.")
+            yield ValidationIssue(
+                RULE_ORDER_WITHOUT_ITEMS,
+                "orders",
+                index,
+                f"La orden {order.order_id} no tiene items.",
+            )
+            continue
 
         subtotal = sum(
             (item.unit_price * Decimal(item.quantity) for item in order_items),
@@ -227,14 +444,100 @@ def validate_totals(dataset: TransformedSeed) -> None:
 
         invoice = invoices_by_order.get(order.order_id)
         if invoice is None:
-            raise EtlValidationError(f"La orden {order.order_id} no tiene factura asociada.")
-        if invoice.total_amount != expected_total:
-            raise EtlValidationError(
+            yield ValidationIssue(
+                RULE_ORDER_WITHOUT_INVOICE,
+                "orders",
+                index,
+                f"La orden {order.order_id} no tiene factura asociada.",
+            )
+        elif invoice.total_amount != expected_total:
+            yield ValidationIssue(
+                RULE_ORDER_TOTAL,
+                "orders",
+                index,
                 f"Total inconsistente para orden {order.order_id}: "
-                f"esperado {expected_total}, recibido {invoice.total_amount}."
+                f"esperado {expected_total}, recibido {invoice.total_amount}.",
             )
 
 
+def _raise_first(issues: Iterator[ValidationIssue]) -> None:
+    """Modo fail-fast: convierte la primera violacion en `EtlValidationError`."""
+    issue = next(issues, None)
+    if issue is not None:
+        raise EtlValidationError(issue.message)
+
+
+def build_validation_report(
+    issues: Iterable[ValidationIssue], sample_limit: int = DEFAULT_SAMPLE_LIMIT
+) -> ValidationReport:
+    """Consume violaciones en una pasada: cuenta todas y guarda hasta `sample_limit` por regla."""
+    counts: dict[str, int] = {}
+    samples: dict[str, list[ValidationIssue]] = {}
+    for issue in issues:
+        counts[issue.rule] = counts.get(issue.rule, 0) + 1
+        rule_samples = samples.setdefault(issue.rule, [])
+        if len(rule_samples) < sample_limit:
+            rule_samples.append(issue)
+    return ValidationReport(
+        rules=tuple(
+            RuleSummary(rule=rule, count=counts[rule], samples=tuple(samples[rule]))
+            for rule in sorted(counts, key=_RULE_ORDER.index)
+        )
+    )
+
+
+def merge_validation_reports(
+    reports: Iterable[ValidationReport], sample_limit: int = DEFAULT_SAMPLE_LIMIT
+) -> ValidationReport:
+    """Une reportes parciales (ej. particiones); las muestras quedan en orden de fila."""
+    counts: dict[str, int] = {}
+    samples: dict[str, list[ValidationIssue]] = {}
+    for report in reports:
+        for summary in report.rules:
+            counts[summary.rule] = counts.get(summary.rule, 0) + summary.count
+            samples.setdefault(summary.rule, []).extend(summary.samples)
+    return ValidationReport(
+        rules=tuple(
+            RuleSummary(
+                rule=rule,
+                count=counts[rule],
+                samples=tuple(
+                    sorted(samples[rule], key=lambda issue: issue.row_index)[:sample_limit]
+                ),
+            )
+            for rule in sorted(counts, key=_RULE_ORDER.index)
+        )
+    )
+
+
+def collect_validation_report(
+    dataset: TransformedSeed,
+    expected_count: int | None = None,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+) -> ValidationReport:
+    """Modo collect-all: aplica todas las reglas y acumula cada violacion."""
+    issues: list[Iterator[ValidationIssue]] = []
+    if expected_count is not None:
+        issues.append(iter_record_count_issues(dataset, expected_count))
+    issues.extend([iter_foreign_key_issues(dataset), iter_total_issues(dataset)])
+    return build_validation_report(chain.from_iterable(issues), sample_limit=sample_limit)
+
+
+def validate_record_counts(dataset: TransformedSeed, expected_count: int) -> None:
+    """Valida cantidad esperada de registros por entidad principal."""
+    _raise_first(iter_record_count_issues(dataset, expected_count))
+
+
+def validate_foreign_keys(dataset: TransformedSeed) -> None:
+    """Valida consistencia referencial básica entre tablas CSV."""
+    _raise_first(iter_foreign_key_issues(dataset))
+
+
+def validate_totals(dataset: TransformedSeed) -> None:
+    """Valida coherencia de totales: items + impuestos + shipping = invoice."""
+    _raise_first(iter_total_issues(dataset))
+
+
 def validate_transformed_seed(dataset: TransformedSeed, expected_count: int = 20) -> None:
     """Aplica todas las validaciones ETL del dataset."""
     validate_record_counts(dataset, expected_count=expected_count)
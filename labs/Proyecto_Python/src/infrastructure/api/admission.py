@@ -0,0 +1,216 @@
+"""Control de admision por grupo de rutas con load shedding (`ADMISSION_CONTROL_ENABLED`).
+
+Cuando la DB se alenta, los routers sincronos se apilan en el threadpool y todos
+los requests expiran juntos. Este middleware limita cuantos requests de cada
+grupo corren a la vez:
+
+- `health`: `/health*`, con cupo propio y sin fila; nunca espera detras de
+  lecturas o escrituras, asi las probes siguen respondiendo en una sobrecarga.
+- `writes`: POST/PUT/PATCH/DELETE.
+- `reads`: el resto.
+
+Si el grupo esta lleno el request espera en una fila acotada hasta
+`ADMISSION_QUEUE_TIMEOUT_MS`. Si la fila esta llena o vence el plazo, se responde
+503 con `Retry-After` de inmediato, sin tocar el threadpool ni la DB.
+
+La suma de cupos debe quedar por debajo de los 40 workers del threadpool de
+Starlette. Todo corre en el loop de uvicorn, por eso no hacen falta locks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Literal
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
+
+from src.infrastructure.api.schemas.common import ErrorDetail, ErrorResponse
+from src.infrastructure.settings import InfrastructureSettings
+
+RouteGroup = Literal["health", "writes", "reads"]
+ShedReason = Literal["queue_full", "deadline"]
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class AdmissionRejectedError(Exception):
+    """El request no consiguio cupo; se responde 503."""
+
+    def __init__(self, group: RouteGroup, reason: ShedReason) -> None:
+        super().__init__(f"Grupo {group} saturado ({reason}).")
+        self.group = group
+        self.reason = reason
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionGroupStats:
+    """Contadores de un grupo de rutas."""
+
+    group: RouteGroup
+    max_concurrent: int
+    max_queue: int
+    active: int
+    queued: int
+    max_queued: int
+    admitted: int
+    shed_queue_full: int
+    shed_deadline: int
+    max_queue_wait_ms: float
+
+
+class AdmissionLimiter:
+    """Cupo de concurrencia con fila FIFO acotada y plazo de espera."""
+
+    def __init__(
+        self,
+        group: RouteGroup,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+    ) -> None:
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent debe ser mayor a 0.")
+        self.group = group
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._max_queued = 0
+        self._admitted = 0
+        self._shed: dict[ShedReason, int] = {"queue_full": 0, "deadline": 0}
+        self._max_queue_wait = 0.0
+
+    async def acquire(self) -> None:
+        """Toma un cupo o levanta `AdmissionRejectedError`."""
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self._admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self._shed["queue_full"] += 1
+            raise AdmissionRejectedError(self.group, "queue_full")
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._max_queued = max(self._max_queued, len(self._waiters))
+        queued_at = perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout_seconds)
+        except TimeoutError:
+            # Si el cupo llego justo al vencer el plazo, se usa en vez de perderlo.
+            if not waiter.done():
+                self._waiters.remove(waiter)
+                waiter.cancel()
+                self._shed["deadline"] += 1
+                raise AdmissionRejectedError(self.group, "deadline") from None
+        except BaseException:
+            # Cancelado (cliente desconectado): devuelve el cupo si ya se lo habian pasado.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        self._max_queue_wait = max(self._max_queue_wait, perf_counter() - queued_at)
+        self._admitted += 1
+
+    def release(self) -> None:
+        """Libera un cupo; si hay fila, se lo pasa directo al primero."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def snapshot(self) -> AdmissionGroupStats:
+        """Contadores actuales del grupo."""
+        return AdmissionGroupStats(
+            group=self.group,
+            max_concurrent=self.max_concurrent,
+            max_queue=self.max_queue,
+            active=self._active,
+            queued=len(self._waiters),
+            max_queued=self._max_queued,
+            admitted=self._admitted,
+            shed_queue_full=self._shed["queue_full"],
+            shed_deadline=self._shed["deadline"],
+            max_queue_wait_ms=round(self._max_queue_wait * 1000, 2),
+        )
+
+
+class AdmissionController:
+    """Un `AdmissionLimiter` por grupo de rutas."""
+
+    def __init__(
+        self, limiters: dict[RouteGroup, AdmissionLimiter], retry_after_seconds: int
+    ) -> None:
+        self.limiters = limiters
+        self.retry_after_seconds = retry_after_seconds
+
+    @staticmethod
+    def classify(method: str, path: str) -> RouteGroup:
+        """Grupo de rutas de un request."""
+        if path == "/health" or path.startswith("/health/"):
+            return "health"
+        return "writes" if method in _WRITE_METHODS else "reads"
+
+    def snapshot(self) -> tuple[AdmissionGroupStats, ...]:
+        """Contadores de todos los grupos."""
+        return tuple(limiter.snapshot() for limiter in self.limiters.values())
+
+
+def build_admission_controller(settings: InfrastructureSettings) -> AdmissionController | None:
+    """Controlador segun settings, o None si esta deshabilitado."""
+    if not settings.admission_control_enabled:
+        return None
+    timeout = settings.admission_queue_timeout_ms / 1000
+    return AdmissionController(
+        limiters={
+            "health": AdmissionLimiter("health", settings.admission_health_concurrency, 0, 0),
+            "writes": AdmissionLimiter(
+                "writes",
+                settings.admission_write_concurrency,
+                settings.admission_queue_size,
+                timeout,
+            ),
+            "reads": AdmissionLimiter(
+                "reads",
+                settings.admission_read_concurrency,
+                settings.admission_queue_size,
+                timeout,
+            ),
+        },
+        retry_after_seconds=settings.admission_retry_after_seconds,
+    )
+
+
+def register_admission_control_middleware(app: FastAPI, controller: AdmissionController) -> None:
+    """Registra el middleware de admision (debe quedar dentro del de logging)."""
+
+    @app.middleware("http")
+    async def admission_control_middleware(
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        # El preflight CORS no llega a un router; no consume cupo.
+        if request.method == "OPTIONS":
+            return await call_next(request)
+        limiter = controller.limiters[controller.classify(request.method, request.url.path)]
+        try:
+            await limiter.acquire()
+        except AdmissionRejectedError as exc:
+            payload = ErrorResponse(error=ErrorDetail(code="overloaded", message=str(exc)))
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content=payload.model_dump(),
+                headers={"Retry-After": str(controller.retry_after_seconds)},
+            )
+        try:
+            return await call_next(request)
+        finally:
+            limiter.release()
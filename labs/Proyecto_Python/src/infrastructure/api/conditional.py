@@ -0,0 +1,47 @@
+"""GET condicional con ETag fuerte (`If-None-Match` -> 304).
+
+La version sale de una consulta barata del repositorio (conteo, `max(created_at)`
+o `updated_at` y estado), antes de hidratar entidades o serializar; si coincide
+con `If-None-Match` se responde 304 sin body.
+
+`Cache-Control: no-cache` deja guardar la respuesta pero obliga a revalidarla en
+cada `fetch`, asi la UI aprovecha el 304 sin cambios.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response, status
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(version: str) -> str:
+    """ETag fuerte y opaco a partir de la version del recurso."""
+    return f'"{hashlib.blake2b(version.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def matches_if_none_match(if_none_match: str | None, etag: str) -> bool:
+    """Comparacion debil de `If-None-Match` (RFC 9110): ignora el prefijo `W/`."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Respuesta 304 con los mismos validadores que la 200."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_validators(response: Response, etag: str) -> None:
+    """Agrega ETag y politica de revalidacion a una respuesta 200."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -20,18 +20,40 @@ from src.application.ports import (
     CustomerRepositoryPort,
     EventPublisherPort,
     OrderRepositoryPort,
+    OrderViewRepositoryPort,
     ProductRepositoryPort,
+    SalesRollupRepositoryPort,
     UnitOfWorkPort,
 )
 from src.application.products.use_cases import CreateProductUseCase, ListProductsUseCase
-from src.infrastructure.common.async_runner import run_sync
+from src.application.reports.use_cases import (
+    GetProductSalesReportUseCase,
+    GetSalesReportUseCase,
+)
+from src.infrastructure.api.runtime_monitor import RuntimeMonitor
+from src.infrastructure.api.sampling_profiler import SamplingProfiler
+from src.infrastructure.common.tracing import traced
+from src.infrastructure.db.idempotency import IdempotencyStore
+from src.infrastructure.db.in_memory import (
+    InMemoryCustomerRepository,
+    InMemoryOrderRepository,
+    InMemoryOrderViewRepository,
+    InMemoryProductRepository,
+    InMemorySalesRollupRepository,
+    InMemoryStore,
+    InMemoryUnitOfWork,
+)
 from src.infrastructure.db.repositories import (
     SqlAlchemyCustomerRepository,
     SqlAlchemyOrderRepository,
+    SqlAlchemyOrderViewRepository,
     SqlAlchemyProductRepository,
+    SqlAlchemySalesRollupRepository,
 )
+from src.infrastructure.db.slow_queries import SlowQueryLog
 from src.infrastructure.db.unit_of_work import SqlAlchemyUnitOfWork
-from src.infrastructure.events.kafka_publisher import AIOKafkaEventPublisher
+from src.infrastructure.events.in_memory_broker import InMemoryBroker
+from src.infrastructure.events.order_view_projector import OrderViewConsumer
 from src.infrastructure.settings import InfrastructureSettings
 
 
@@ -42,7 +64,14 @@ class ApiContainer:
     settings: InfrastructureSettings
     engine: AsyncEngine
     session_factory: async_sessionmaker[AsyncSession]
-    event_publisher: AIOKafkaEventPublisher
+    event_publisher: EventPublisherPort
+    order_view_consumer: OrderViewConsumer | None = None
+    event_broker: InMemoryBroker | None = None
+    memory_store: InMemoryStore | None = None
+    slow_query_log: SlowQueryLog | None = None
+    runtime_monitor: RuntimeMonitor | None = None
+    profiler: SamplingProfiler | None = None
+    idempotency_store: IdempotencyStore | None = None
 
 
 def get_container(request: Request) -> ApiContainer:
@@ -50,46 +79,78 @@ def get_container(request: Request) -> ApiContainer:
     return cast(ApiContainer, request.app.state.container)
 
 
-def get_db_session(
+PersistenceUnit = SqlAlchemyUnitOfWork | InMemoryUnitOfWork
+
+
+def get_persistence_unit(
     container: Annotated[ApiContainer, Depends(get_container)],
-) -> Generator[AsyncSession, None, None]:
-    """Abre/cierra sesion SQLAlchemy por request.
+) -> Generator[PersistenceUnit, None, None]:
+    """Abre/cierra la unidad de trabajo del request segun `PERSISTENCE_BACKEND`.
 
     La dependencia es sincrona para ser compatible con puertos sincronos actuales.
+    FastAPI la resuelve una vez por request: repositorios y UnitOfWork comparten sesion.
     """
-    session = container.session_factory()
+    unit: PersistenceUnit
+    if container.memory_store is not None:
+        unit = InMemoryUnitOfWork(container.memory_store)
+    else:
+        unit = SqlAlchemyUnitOfWork(container.session_factory())
     try:
-        yield session
+        yield unit
     finally:
-        run_sync(session.close())
+        unit.close()
 
 
 def get_customer_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    unit: Annotated[PersistenceUnit, Depends(get_persistence_unit)],
 ) -> CustomerRepositoryPort:
     """Entrega repositorio concreto de clientes."""
-    return SqlAlchemyCustomerRepository(session)
+    if isinstance(unit, InMemoryUnitOfWork):
+        return traced(InMemoryCustomerRepository(unit))
+    return traced(SqlAlchemyCustomerRepository(unit.session))
 
 
 def get_product_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    unit: Annotated[PersistenceUnit, Depends(get_persistence_unit)],
 ) -> ProductRepositoryPort:
     """Entrega repositorio concreto de productos."""
-    return SqlAlchemyProductRepository(session)
+    if isinstance(unit, InMemoryUnitOfWork):
+        return traced(InMemoryProductRepository(unit))
+    return traced(SqlAlchemyProductRepository(unit.session))
 
 
 def get_order_repository(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    unit: Annotated[PersistenceUnit, Depends(get_persistence_unit)],
 ) -> OrderRepositoryPort:
     """Entrega repositorio concreto de ordenes."""
-    return SqlAlchemyOrderRepository(session)
+    if isinstance(unit, InMemoryUnitOfWork):
+        return traced(InMemoryOrderRepository(unit))
+    return traced(SqlAlchemyOrderRepository(unit.session))
+
+
+def get_order_view_repository(
+    unit: Annotated[PersistenceUnit, Depends(get_persistence_unit)],
+) -> OrderViewRepositoryPort:
+    """Entrega repositorio de lectura del read model de ordenes."""
+    if isinstance(unit, InMemoryUnitOfWork):
+        return traced(InMemoryOrderViewRepository(unit.store))
+    return traced(SqlAlchemyOrderViewRepository(unit.session))
+
+
+def get_sales_rollup_repository(
+    unit: Annotated[PersistenceUnit, Depends(get_persistence_unit)],
+) -> SalesRollupRepositoryPort:
+    """Entrega repositorio concreto de rollups de ventas."""
+    if isinstance(unit, InMemoryUnitOfWork):
+        return traced(InMemorySalesRollupRepository(unit))
+    return traced(SqlAlchemySalesRollupRepository(unit.session))
 
 
 def get_unit_of_work(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    unit: Annotated[PersistenceUnit, Depends(get_persistence_unit)],
 ) -> UnitOfWorkPort:
     """Entrega UnitOfWork concreto."""
-    return SqlAlchemyUnitOfWork(session)
+    return traced(unit)
 
 
 def get_event_publisher(
@@ -99,14 +160,23 @@ def get_event_publisher(
     return container.event_publisher
 
 
+def get_idempotency_store(
+    container: Annotated[ApiContainer, Depends(get_container)],
+) -> IdempotencyStore | None:
+    """Entrega el almacen de `Idempotency-Key` (None si el contenedor no lo trae)."""
+    return container.idempotency_store
+
+
 def get_register_customer_use_case(
     customer_repository: Annotated[CustomerRepositoryPort, Depends(get_customer_repository)],
     unit_of_work: Annotated[UnitOfWorkPort, Depends(get_unit_of_work)],
 ) -> RegisterCustomerUseCase:
     """Construye caso de uso RegisterCustomer."""
-    return RegisterCustomerUseCase(
-        customer_repository=customer_repository,
-        unit_of_work=unit_of_work,
+    return traced(
+        RegisterCustomerUseCase(
+            customer_repository=customer_repository,
+            unit_of_work=unit_of_work,
+        )
     )
 
 
@@ -114,7 +184,7 @@ def get_list_customers_use_case(
     customer_repository: Annotated[CustomerRepositoryPort, Depends(get_customer_repository)],
 ) -> ListCustomersUseCase:
     """Construye caso de uso ListCustomers."""
-    return ListCustomersUseCase(customer_repository=customer_repository)
+    return traced(ListCustomersUseCase(customer_repository=customer_repository))
 
 
 def get_create_product_use_case(
@@ -122,9 +192,11 @@ def get_create_product_use_case(
     unit_of_work: Annotated[UnitOfWorkPort, Depends(get_unit_of_work)],
 ) -> CreateProductUseCase:
     """Construye caso de uso CreateProduct."""
-    return CreateProductUseCase(
-        product_repository=product_repository,
-        unit_of_work=unit_of_work,
+    return traced(
+        CreateProductUseCase(
+            product_repository=product_repository,
+            unit_of_work=unit_of_work,
+        )
     )
 
 
@@ -132,7 +204,7 @@ def get_list_products_use_case(
     product_repository: Annotated[ProductRepositoryPort, Depends(get_product_repository)],
 ) -> ListProductsUseCase:
     """Construye caso de uso ListProducts."""
-    return ListProductsUseCase(product_repository=product_repository)
+    return traced(ListProductsUseCase(product_repository=product_repository))
 
 
 def get_create_order_use_case(
@@ -141,39 +213,81 @@ def get_create_order_use_case(
     order_repository: Annotated[OrderRepositoryPort, Depends(get_order_repository)],
     event_publisher: Annotated[EventPublisherPort, Depends(get_event_publisher)],
     unit_of_work: Annotated[UnitOfWorkPort, Depends(get_unit_of_work)],
+    sales_rollup_repository: Annotated[
+        SalesRollupRepositoryPort, Depends(get_sales_rollup_repository)
+    ],
 ) -> CreateOrderUseCase:
     """Construye caso de uso CreateOrder."""
-    return CreateOrderUseCase(
-        customer_repository=customer_repository,
-        product_repository=product_repository,
-        order_repository=order_repository,
-        event_publisher=event_publisher,
-        unit_of_work=unit_of_work,
+    return traced(
+        CreateOrderUseCase(
+            customer_repository=customer_repository,
+            product_repository=product_repository,
+            order_repository=order_repository,
+            event_publisher=event_publisher,
+            unit_of_work=unit_of_work,
+            sales_rollup_repository=sales_rollup_repository,
+        )
     )
 
 
 def get_get_order_use_case(
     order_repository: Annotated[OrderRepositoryPort, Depends(get_order_repository)],
+    order_view_repository: Annotated[OrderViewRepositoryPort, Depends(get_order_view_repository)],
 ) -> GetOrderUseCase:
     """Construye caso de uso GetOrder."""
-    return GetOrderUseCase(order_repository=order_repository)
+    return traced(
+        GetOrderUseCase(
+            order_repository=order_repository,
+            order_view_repository=order_view_repository,
+        )
+    )
 
 
 def get_list_orders_use_case(
     order_repository: Annotated[OrderRepositoryPort, Depends(get_order_repository)],
+    order_view_repository: Annotated[OrderViewRepositoryPort, Depends(get_order_view_repository)],
 ) -> ListOrdersUseCase:
     """Construye caso de uso ListOrders."""
-    return ListOrdersUseCase(order_repository=order_repository)
+    return traced(
+        ListOrdersUseCase(
+            order_repository=order_repository,
+            order_view_repository=order_view_repository,
+        )
+    )
 
 
 def get_update_order_status_use_case(
     order_repository: Annotated[OrderRepositoryPort, Depends(get_order_repository)],
     event_publisher: Annotated[EventPublisherPort, Depends(get_event_publisher)],
     unit_of_work: Annotated[UnitOfWorkPort, Depends(get_unit_of_work)],
+    sales_rollup_repository: Annotated[
+        SalesRollupRepositoryPort, Depends(get_sales_rollup_repository)
+    ],
 ) -> UpdateOrderStatusUseCase:
     """Construye caso de uso UpdateOrderStatus."""
-    return UpdateOrderStatusUseCase(
-        order_repository=order_repository,
-        event_publisher=event_publisher,
-        unit_of_work=unit_of_work,
+    return traced(
+        UpdateOrderStatusUseCase(
+            order_repository=order_repository,
+            event_publisher=event_publisher,
+            unit_of_work=unit_of_work,
+            sales_rollup_repository=sales_rollup_repository,
+        )
     )
+
+
+def get_sales_report_use_case(
+    sales_rollup_repository: Annotated[
+        SalesRollupRepositoryPort, Depends(get_sales_rollup_repository)
+    ],
+) -> GetSalesReportUseCase:
+    """Construye caso de uso GetSalesReport."""
+    return traced(GetSalesReportUseCase(sales_rollup_repository=sales_rollup_repository))
+
+
+def get_product_sales_report_use_case(
+    sales_rollup_repository: Annotated[
+        SalesRollupRepositoryPort, Depends(get_sales_rollup_repository)
+    ],
+) -> GetProductSalesReportUseCase:
+    """Construye caso de uso GetProductSalesReport."""
+    return traced(GetProductSalesReportUseCase(sales_rollup_repository=sales_rollup_repository))
@@ -0,0 +1,80 @@
+"""Soporte HTTP de `Idempotency-Key` para endpoints que crean recursos.
+
+Un cliente que reintenta tras un timeout manda la misma llave; si el primer
+intento ya termino, se devuelve la respuesta guardada (con el header
+`Idempotent-Replayed: true`) sin volver a correr el caso de uso ni publicar
+eventos. Respuestas de error:
+
+- 409 si el primer intento con esa llave sigue en curso.
+- 422 si la llave se reusa con un body distinto.
+
+Solo se guardan respuestas exitosas: si el caso de uso falla, la llave se libera
+y el reintento vuelve a ejecutarlo.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from src.infrastructure.api.schemas.common import ErrorDetail, ErrorResponse
+from src.infrastructure.db.idempotency import IdempotencyStore
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+def request_fingerprint(payload: BaseModel) -> str:
+    """Hash del body ya validado (ignora espacios y orden de llaves del JSON original)."""
+    return hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def _error(http_status: int, code: str, message: str) -> JSONResponse:
+    payload = ErrorResponse(error=ErrorDetail(code=code, message=message))
+    return JSONResponse(status_code=http_status, content=payload.model_dump())
+
+
+def run_idempotent[T: BaseModel](
+    store: IdempotencyStore | None,
+    scope: str,
+    key: str | None,
+    payload: BaseModel,
+    status_code: int,
+    handler: Callable[[], T],
+) -> T | Response:
+    """Ejecuta `handler` una sola vez por (`scope`, `key`); sin llave lo ejecuta siempre."""
+    if store is None or key is None:
+        return handler()
+    request_hash = request_fingerprint(payload)
+    existing = store.reserve(scope, key, request_hash)
+    if existing is not None:
+        if existing.request_hash != request_hash:
+            return _error(
+                status.HTTP_422_UNPROCESSABLE_CONTENT,
+                "idempotency_key_reused",
+                "La Idempotency-Key ya se uso con un body distinto.",
+            )
+        if existing.status_code is None or existing.response_body is None:
+            return _error(
+                status.HTTP_409_CONFLICT,
+                "idempotency_key_in_progress",
+                "Hay un request en curso con la misma Idempotency-Key.",
+            )
+        return Response(
+            content=existing.response_body,
+            status_code=existing.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"},
+        )
+    try:
+        result = handler()
+    except BaseException:
+        store.release(scope, key)
+        raise
+    store.complete(scope, key, status_code, result.model_dump_json())
+    return result
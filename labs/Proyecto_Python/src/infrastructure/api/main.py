@@ -2,30 +2,75 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import cast
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.application.ports import EventPublisherPort
+from src.infrastructure.api.admission import (
+    build_admission_controller,
+    register_admission_control_middleware,
+)
 from src.infrastructure.api.dependencies import ApiContainer
 from src.infrastructure.api.errors import register_exception_handlers
 from src.infrastructure.api.observability import (
     configure_logging,
+    configure_tracing,
     register_request_logging_middleware,
 )
 from src.infrastructure.api.routers import (
+    admin_router,
     customers_router,
     health_router,
     orders_router,
     products_router,
+    reports_router,
+)
+from src.infrastructure.api.runtime_monitor import build_runtime_monitor
+from src.infrastructure.api.sampling_profiler import build_sampling_profiler
+from src.infrastructure.common.async_runner import run_in_background
+from src.infrastructure.common.tracing import get_tracer
+from src.infrastructure.db.idempotency import (
+    IdempotencyStore,
+    InMemoryIdempotencyStore,
+    SqlAlchemyIdempotencyStore,
+)
+from src.infrastructure.db.in_memory import InMemoryStore
+from src.infrastructure.db.session import (
+    build_async_engine,
+    build_session_factory,
+    create_sqlite_schema,
+)
+from src.infrastructure.db.slow_queries import build_slow_query_log, install_slow_query_log
+from src.infrastructure.events.in_memory_broker import (
+    InMemoryBroker,
+    InMemoryEventPublisher,
+    build_in_memory_broker,
 )
-from src.infrastructure.db.session import build_async_engine, build_session_factory
 from src.infrastructure.events.kafka_publisher import AIOKafkaEventPublisher
+from src.infrastructure.events.order_view_projector import build_order_view_consumer
+from src.infrastructure.events.serialization import build_event_codec
 from src.infrastructure.settings import InfrastructureSettings
 
 
+def _build_event_publisher(
+    settings: InfrastructureSettings, event_broker: InMemoryBroker | None
+) -> EventPublisherPort:
+    """Kafka real o broker en proceso segun `EVENT_BROKER`."""
+    if event_broker is None:
+        return AIOKafkaEventPublisher(settings=settings)
+    return InMemoryEventPublisher(
+        event_broker,
+        topic=settings.kafka_topic_orders,
+        codec=build_event_codec(settings),
+        key_strategy=settings.kafka_partition_key,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Inicializa y libera recursos de infraestructura."""
@@ -36,24 +81,72 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         return
 
     settings = cast(InfrastructureSettings, app.state.settings)
+    # Con `memory` el engine no se usa; crearlo no abre conexiones.
     engine = build_async_engine(settings)
     session_factory = build_session_factory(engine)
-    event_publisher = AIOKafkaEventPublisher(settings=settings)
+    if settings.persistence_backend == "sqlite":
+        # El esquema se crea en el loop de `run_sync`, donde viviran las conexiones.
+        await asyncio.wrap_future(run_in_background(create_sqlite_schema(engine)))
+    memory_store = InMemoryStore() if settings.persistence_backend == "memory" else None
+    slow_query_log = build_slow_query_log(settings) if memory_store is None else None
+    if slow_query_log is not None:
+        install_slow_query_log(engine, slow_query_log)
+    event_broker = build_in_memory_broker(settings) if settings.event_broker == "memory" else None
+    event_publisher = _build_event_publisher(settings, event_broker)
+    idempotency_store: IdempotencyStore = (
+        InMemoryIdempotencyStore(
+            settings.idempotency_ttl_seconds, settings.idempotency_lease_seconds
+        )
+        if memory_store is not None
+        else SqlAlchemyIdempotencyStore(
+            session_factory, settings.idempotency_ttl_seconds, settings.idempotency_lease_seconds
+        )
+    )
+    runtime_monitor = build_runtime_monitor(settings)
+    if runtime_monitor is not None:
+        await runtime_monitor.start()
+    # El read model en memoria se proyecta al leer; el consumidor solo aplica a SQL.
+    order_view_consumer = (
+        build_order_view_consumer(settings, session_factory, event_broker)
+        if settings.order_view_consumer_enabled and memory_store is None
+        else None
+    )
 
     app.state.container = ApiContainer(
         settings=settings,
         engine=engine,
         session_factory=session_factory,
         event_publisher=event_publisher,
+        order_view_consumer=order_view_consumer,
+        event_broker=event_broker,
+        memory_store=memory_store,
+        slow_query_log=slow_query_log,
+        runtime_monitor=runtime_monitor,
+        profiler=build_sampling_profiler(settings),
+        idempotency_store=idempotency_store,
+    )
+    # El consumidor corre en el loop de `run_sync`, donde viven las conexiones del engine.
+    consumer_future = (
+        run_in_background(order_view_consumer.run()) if order_view_consumer is not None else None
     )
     yield
+    if runtime_monitor is not None:
+        await runtime_monitor.stop()
+    if order_view_consumer is not None and consumer_future is not None:
+        order_view_consumer.stop()
+        with suppress(Exception):
+            await asyncio.wait_for(asyncio.wrap_future(consumer_future), timeout=5)
     await engine.dispose()
+    tracer = get_tracer()
+    if tracer is not None:
+        await asyncio.to_thread(tracer.exporter.flush)
 
 
 def create_app(settings: InfrastructureSettings | None = None) -> FastAPI:
     """Construye la aplicacion FastAPI con routers y handlers."""
     resolved_settings = settings or InfrastructureSettings.from_env()
     configure_logging(resolved_settings.log_level)
+    configure_tracing(resolved_settings)
 
     app = FastAPI(
         title="Distrito Chilaquil API",
@@ -70,12 +163,19 @@ def create_app(settings: InfrastructureSettings | None = None) -> FastAPI:
     )
     app.state.settings = resolved_settings
     register_exception_handlers(app)
+    # Se registra antes que el de logging para quedar adentro: los 503 tambien se loggean.
+    admission_controller = build_admission_controller(resolved_settings)
+    app.state.admission_controller = admission_controller
+    if admission_controller is not None:
+        register_admission_control_middleware(app, admission_controller)
     register_request_logging_middleware(app, request_id_header=resolved_settings.request_id_header)
 
     app.include_router(health_router)
     app.include_router(customers_router)
     app.include_router(products_router)
     app.include_router(orders_router)
+    app.include_router(reports_router)
+    app.include_router(admin_router)
 
     return app
 
@@ -1,14 +1,46 @@
-"""Observabilidad minima para trazabilidad de requests HTTP."""
+"""Observabilidad minima para trazabilidad de requests HTTP.
+
+Cada respuesta lleva `Server-Timing` con queries y tiempo de DB, publicacion de
+eventos (`kafka`), serializacion de eventos y espera en cola de `run_sync`; los
+mismos valores van en el log `request_completed`. Los componentes pueden
+solaparse (la DB corre dentro de `run_sync`), no suman el total `app`.
+"""
 
 from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from pathlib import Path
 from time import perf_counter
 from uuid import uuid4
 
 from fastapi import FastAPI, Request, Response
 
+from src.infrastructure.common.request_context import (
+    bind_request_id,
+    bind_request_route,
+    reset_request_id,
+    reset_request_route,
+)
+from src.infrastructure.common.request_metrics import (
+    RequestMetrics,
+    bind_request_metrics,
+    reset_request_metrics,
+)
+from src.infrastructure.common.tracing import (
+    InMemoryTraceCollector,
+    JsonlFileTraceExporter,
+    Span,
+    TraceExporterPort,
+    TraceParent,
+    Tracer,
+    configure_tracer,
+    format_traceparent,
+    get_tracer,
+)
+from src.infrastructure.settings import InfrastructureSettings
+
 
 def configure_logging(log_level: str) -> None:
     """Configura logging base del servicio con formato uniforme."""
@@ -19,6 +51,21 @@ def configure_logging(log_level: str) -> None:
     )
 
 
+def configure_tracing(settings: InfrastructureSettings) -> Tracer | None:
+    """Configura el tracer global; el wiring envuelve dependencias con `traced()`."""
+    if not settings.tracing_enabled:
+        configure_tracer(None)
+        return None
+    exporter: TraceExporterPort
+    if settings.tracing_exporter == "file":
+        exporter = JsonlFileTraceExporter(Path(settings.tracing_file_path), settings.service_name)
+    else:
+        exporter = InMemoryTraceCollector(settings.tracing_memory_capacity)
+    tracer = Tracer(exporter, sample_rate=settings.tracing_sample_rate)
+    configure_tracer(tracer)
+    return tracer
+
+
 def register_request_logging_middleware(app: FastAPI, request_id_header: str) -> None:
     """Registra middleware para loggear cada request y propagar request id."""
     logger = logging.getLogger("distrito_chilaquil.api")
@@ -29,33 +76,82 @@ def register_request_logging_middleware(app: FastAPI, request_id_header: str) ->
         call_next: Callable[[Request], Awaitable[Response]],
     ) -> Response:
         request_id = request.headers.get(request_id_header) or str(uuid4())
+        request_id_token = bind_request_id(request_id)
+        metrics = RequestMetrics()
+        metrics_token = bind_request_metrics(metrics)
         start_time = perf_counter()
         method = request.method
         path = request.url.path
-
-        try:
-            response = await call_next(request)
-        except Exception:
-            duration_ms = round((perf_counter() - start_time) * 1000, 2)
-            # Comentario para junior: se deja evidencia de excepcion con contexto tecnico.
-            logger.exception(
-                "request_failed method=%s path=%s status=%s duration_ms=%s request_id=%s",
-                method,
-                path,
-                500,
-                duration_ms,
-                request_id,
+        route_token = bind_request_route(f"{method} {path}")
+        tracer = get_tracer()
+        trace_scope = (
+            tracer.start_trace(
+                f"{method} {path}",
+                attributes={
+                    "http.request.method": method,
+                    "url.path": path,
+                    "request.id": request_id,
+                },
+                parent=TraceParent.parse(request.headers.get("traceparent")),
             )
-            raise
+            if tracer is not None
+            else nullcontext(None)
+        )
+
+        with trace_scope as span:
+            try:
+                response = await call_next(request)
+            except Exception:
+                duration_ms = round((perf_counter() - start_time) * 1000, 2)
+                # Comentario para junior: se deja evidencia de excepcion con contexto tecnico.
+                logger.exception(
+                    "request_failed method=%s path=%s status=%s duration_ms=%s request_id=%s",
+                    method,
+                    path,
+                    500,
+                    duration_ms,
+                    request_id,
+                )
+                raise
+            finally:
+                reset_request_route(route_token)
+                reset_request_metrics(metrics_token)
+                reset_request_id(request_id_token)
+            if span is not None:
+                _finish_server_span(span, request, response)
 
-        duration_ms = round((perf_counter() - start_time) * 1000, 2)
+        elapsed_seconds = perf_counter() - start_time
+        duration_ms = round(elapsed_seconds * 1000, 2)
         response.headers[request_id_header] = request_id
+        response.headers["Server-Timing"] = metrics.server_timing(elapsed_seconds)
+        if span is not None:
+            response.headers["traceparent"] = format_traceparent(span)
         logger.info(
-            "request_completed method=%s path=%s status=%s duration_ms=%s request_id=%s",
+            "request_completed method=%s path=%s status=%s duration_ms=%s request_id=%s "
+            "db_queries=%s db_ms=%s kafka_ms=%s serialization_ms=%s run_sync_wait_ms=%s "
+            "trace_id=%s",
             method,
             path,
             response.status_code,
             duration_ms,
             request_id,
+            metrics.db_queries,
+            metrics.milliseconds("db"),
+            metrics.milliseconds("kafka"),
+            metrics.milliseconds("serialization"),
+            metrics.milliseconds("run_sync_wait"),
+            span.trace_id if span is not None else None,
         )
         return response
+
+
+def _finish_server_span(span: Span, request: Request, response: Response) -> None:
+    """Nombra el span con la plantilla de ruta (`/orders/{order_id}`) y el status."""
+    route = request.scope.get("route")
+    route_path = getattr(route, "path", None)
+    if route_path is not None:
+        span.name = f"{request.method} {route_path}"
+        span.set_attribute("http.route", route_path)
+    span.set_attribute("http.response.status_code", response.status_code)
+    if response.status_code >= 500:
+        span.status = "ERROR"
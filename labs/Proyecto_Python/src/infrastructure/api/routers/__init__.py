@@ -1,8 +1,17 @@
 """Coleccion de routers API."""
 
+from .admin import router as admin_router
 from .customers import router as customers_router
 from .health import router as health_router
 from .orders import router as orders_router
 from .products import router as products_router
+from .reports import router as reports_router
 
-__all__ = ["customers_router", "health_router", "orders_router", "products_router"]
+__all__ = [
+    "admin_router",
+    "customers_router",
+    "health_router",
+    "orders_router",
+    "products_router",
+    "reports_router",
+]
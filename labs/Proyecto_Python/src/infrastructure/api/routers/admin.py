@@ -0,0 +1,132 @@
+"""Router administrativo de diagnostico (queries lentas, trazas y profiler).
+
+Todas las rutas exigen el header `X-Admin-Token`; sin `ADMIN_TOKEN` configurado
+responden 404.
+"""
+
+from __future__ import annotations
+
+import secrets
+from typing import Annotated, Literal, cast
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import PlainTextResponse
+
+from src.infrastructure.api.dependencies import ApiContainer
+from src.infrastructure.api.sampling_profiler import ProfilerBusyError
+from src.infrastructure.api.schemas.admin import (
+    ProfileResponse,
+    SlowQueryLogResponse,
+    SlowQueryResponse,
+    TraceListResponse,
+    TraceResponse,
+)
+from src.infrastructure.common.tracing import InMemoryTraceCollector, get_tracer
+from src.infrastructure.db.slow_queries import SlowQueryLog
+from src.infrastructure.settings import InfrastructureSettings
+
+
+def require_admin_token(
+    request: Request,
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Valida el token admin; sin `ADMIN_TOKEN` las rutas admin no existen."""
+    settings = cast(InfrastructureSettings, request.app.state.settings)
+    if settings.admin_token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    # compare_digest evita filtrar el token por tiempos de respuesta.
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Token admin invalido.")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+def _slow_query_log(request: Request) -> SlowQueryLog | None:
+    container = cast(ApiContainer | None, getattr(request.app.state, "container", None))
+    return container.slow_query_log if container is not None else None
+
+
+@router.get("/slow-queries", response_model=SlowQueryLogResponse)
+def list_slow_queries(request: Request) -> SlowQueryLogResponse:
+    """Queries lentas recientes con parametros, ruta y plan muestreado."""
+    slow_log = _slow_query_log(request)
+    if slow_log is None:
+        return SlowQueryLogResponse(enabled=False)
+    return SlowQueryLogResponse(
+        enabled=True,
+        threshold_ms=slow_log.threshold_ms,
+        explain_sample_rate=slow_log.explain_sample_rate,
+        entries=[SlowQueryResponse.from_entry(entry) for entry in slow_log.snapshot()],
+    )
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(request: Request) -> Response:
+    """Vacia el log (util antes de reproducir un caso)."""
+    slow_log = _slow_query_log(request)
+    if slow_log is not None:
+        slow_log.clear()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/traces", response_model=TraceListResponse)
+def list_traces(
+    limit: Annotated[int, Query(ge=1, le=200)] = 20,
+) -> TraceListResponse:
+    """Trazas recientes del collector en memoria (`TRACING_EXPORTER=memory`)."""
+    tracer = get_tracer()
+    if tracer is None:
+        return TraceListResponse(enabled=False)
+    exporter = type(tracer.exporter).__name__
+    if not isinstance(tracer.exporter, InMemoryTraceCollector):
+        # Con exporter de archivo las trazas se leen del JSONL, no desde aqui.
+        return TraceListResponse(enabled=True, exporter=exporter, sample_rate=tracer.sample_rate)
+    return TraceListResponse(
+        enabled=True,
+        exporter=exporter,
+        sample_rate=tracer.sample_rate,
+        traces=[TraceResponse.from_spans(spans) for spans in tracer.exporter.snapshot()[:limit]],
+    )
+
+
+@router.delete("/traces", status_code=status.HTTP_204_NO_CONTENT)
+def clear_traces() -> Response:
+    """Vacia el collector en memoria."""
+    tracer = get_tracer()
+    if tracer is not None and isinstance(tracer.exporter, InMemoryTraceCollector):
+        tracer.exporter.clear()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/profile", response_model=None)
+def profile(
+    request: Request,
+    seconds: Annotated[float, Query(gt=0)] = 5.0,
+    rate_hz: Annotated[float | None, Query(gt=0)] = None,
+    output: Annotated[Literal["collapsed", "json"], Query(alias="format")] = "collapsed",
+    include_idle: bool = False,
+) -> PlainTextResponse | ProfileResponse:
+    """Muestrea los stacks de todos los threads durante `seconds`.
+
+    `format=collapsed` (default) se pasa directo a `flamegraph.pl` o speedscope.
+    Corre en un worker del threadpool, que queda ocupado durante la captura.
+    """
+    container = cast(ApiContainer | None, getattr(request.app.state, "container", None))
+    profiler = container.profiler if container is not None else None
+    if profiler is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiler deshabilitado.")
+    settings = cast(InfrastructureSettings, request.app.state.settings)
+    try:
+        result = profiler.profile(
+            seconds, rate_hz or settings.profiler_default_rate_hz, include_idle=include_idle
+        )
+    except ProfilerBusyError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)
+        ) from exc
+    if output == "json":
+        return ProfileResponse.from_result(result)
+    return PlainTextResponse(result.collapsed())
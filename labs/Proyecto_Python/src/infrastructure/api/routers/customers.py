@@ -4,10 +4,16 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 
 from src.application.customers.dto import RegisterCustomerCommand
 from src.application.customers.use_cases import ListCustomersUseCase, RegisterCustomerUseCase
+from src.infrastructure.api.conditional import (
+    build_etag,
+    matches_if_none_match,
+    not_modified,
+    set_validators,
+)
 from src.infrastructure.api.dependencies import (
     get_list_customers_use_case,
     get_register_customer_use_case,
@@ -19,10 +25,16 @@ router = APIRouter(prefix="/customers", tags=["customers"])
 
 @router.get("", response_model=list[CustomerResponse], status_code=status.HTTP_200_OK)
 def list_customers(
+    response: Response,
     use_case: Annotated[ListCustomersUseCase, Depends(get_list_customers_use_case)],
-) -> list[CustomerResponse]:
-    """Lista clientes registrados."""
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> list[CustomerResponse] | Response:
+    """Lista clientes registrados; 304 si `If-None-Match` sigue vigente."""
+    etag = build_etag(use_case.version())
+    if matches_if_none_match(if_none_match, etag):
+        return not_modified(etag)
     customers = use_case.execute()
+    set_validators(response, etag)
     return [CustomerResponse.from_dto(customer) for customer in customers]
 
 
@@ -4,16 +4,24 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+from pathlib import Path
 from typing import Literal, cast
 
 import asyncpg  # type: ignore[import-untyped]
 from fastapi import APIRouter, Request
 
+from src.infrastructure.api.admission import AdmissionController
 from src.infrastructure.api.dependencies import ApiContainer
 from src.infrastructure.api.schemas.health import (
+    AdmissionControlResponse,
+    AdmissionGroupResponse,
     HealthCheckDetail,
     HealthReadinessResponse,
     HealthResponse,
+    LoopLagResponse,
+    OrderViewConsumerResponse,
+    RuntimeMonitorResponse,
+    ThreadPoolResponse,
 )
 from src.infrastructure.settings import InfrastructureSettings
 
@@ -50,12 +58,12 @@ async def get_readiness(request: Request) -> HealthReadinessResponse:
         )
 
     database_check = await _check_database(
-        database_url=settings.database_url,
+        settings=settings,
         timeout_seconds=settings.healthcheck_timeout_seconds,
     )
     kafka_check = await _check_kafka(
         bootstrap_servers=settings.kafka_bootstrap_servers,
-        kafka_enabled=settings.kafka_enabled,
+        kafka_enabled=settings.kafka_enabled and settings.event_broker == "kafka",
         timeout_seconds=settings.healthcheck_timeout_seconds,
     )
     checks = {
@@ -69,6 +77,93 @@ async def get_readiness(request: Request) -> HealthReadinessResponse:
     )
 
 
+@router.get("/order-view", response_model=OrderViewConsumerResponse)
+def get_order_view_consumer(request: Request) -> OrderViewConsumerResponse:
+    """Lag y contadores del consumidor del read model, si corre en este proceso."""
+    container = cast(ApiContainer | None, getattr(request.app.state, "container", None))
+    consumer = container.order_view_consumer if container is not None else None
+    if consumer is None:
+        return OrderViewConsumerResponse(enabled=False)
+    stats = consumer.snapshot()
+    return OrderViewConsumerResponse(
+        enabled=True,
+        running=stats.running,
+        lag=stats.lag,
+        batches=stats.batches,
+        applied_events=stats.applied_events,
+        ignored_events=stats.ignored_events,
+        last_batch_at=stats.last_batch_at,
+        last_error=stats.last_error,
+    )
+
+
+@router.get("/runtime", response_model=RuntimeMonitorResponse)
+def get_runtime_monitor(request: Request) -> RuntimeMonitorResponse:
+    """Lag de los event loops y uso del threadpool, si `RUNTIME_MONITOR_ENABLED`."""
+    container = cast(ApiContainer | None, getattr(request.app.state, "container", None))
+    monitor = container.runtime_monitor if container is not None else None
+    if monitor is None:
+        return RuntimeMonitorResponse(enabled=False)
+    stats = monitor.snapshot()
+    pool = stats.threadpool
+    return RuntimeMonitorResponse(
+        enabled=True,
+        interval_ms=stats.interval_ms,
+        stall_threshold_ms=stats.stall_threshold_ms,
+        loops=[
+            LoopLagResponse(
+                name=loop.name,
+                samples=loop.samples,
+                last_lag_ms=loop.last_lag_ms,
+                max_lag_ms=loop.max_lag_ms,
+                stalls=loop.stalls,
+                blocked_ms=loop.blocked_ms,
+            )
+            for loop in stats.loops
+        ],
+        threadpool=(
+            ThreadPoolResponse(
+                total_workers=pool.total_workers,
+                active_workers=pool.active_workers,
+                queued=pool.queued,
+                max_queued=pool.max_queued,
+                saturated_samples=pool.saturated_samples,
+            )
+            if pool is not None
+            else None
+        ),
+    )
+
+
+@router.get("/admission", response_model=AdmissionControlResponse)
+def get_admission_control(request: Request) -> AdmissionControlResponse:
+    """Requests activos, en fila y rechazados por grupo, si `ADMISSION_CONTROL_ENABLED`."""
+    controller = cast(
+        AdmissionController | None, getattr(request.app.state, "admission_controller", None)
+    )
+    if controller is None:
+        return AdmissionControlResponse(enabled=False)
+    return AdmissionControlResponse(
+        enabled=True,
+        retry_after_seconds=controller.retry_after_seconds,
+        groups=[
+            AdmissionGroupResponse(
+                group=stats.group,
+                max_concurrent=stats.max_concurrent,
+                max_queue=stats.max_queue,
+                active=stats.active,
+                queued=stats.queued,
+                max_queued=stats.max_queued,
+                admitted=stats.admitted,
+                shed_queue_full=stats.shed_queue_full,
+                shed_deadline=stats.shed_deadline,
+                max_queue_wait_ms=stats.max_queue_wait_ms,
+            )
+            for stats in controller.snapshot()
+        ],
+    )
+
+
 def _resolve_settings(request: Request) -> InfrastructureSettings:
     """Obtiene settings pre-cargados en la app o usa defaults de entorno."""
     settings = getattr(request.app.state, "settings", None)
@@ -89,9 +184,19 @@ def _resolve_overall_status(
     return "degraded"
 
 
-async def _check_database(database_url: str, timeout_seconds: float) -> HealthCheckDetail:
+async def _check_database(
+    settings: InfrastructureSettings, timeout_seconds: float
+) -> HealthCheckDetail:
     """Verifica conectividad DB con una consulta minima por conexion dedicada."""
-    asyncpg_url = database_url.replace("postgresql+asyncpg://", "postgresql://")
+    if settings.persistence_backend == "memory":
+        return HealthCheckDetail(status="disabled", detail="Persistencia en memoria (sin DB).")
+    if settings.persistence_backend == "sqlite":
+        if await asyncio.to_thread(Path(settings.sqlite_path).is_file):
+            return HealthCheckDetail(status="ok", detail=f"SQLite en {settings.sqlite_path}.")
+        return HealthCheckDetail(
+            status="error", detail=f"No existe el archivo SQLite {settings.sqlite_path}."
+        )
+    asyncpg_url = settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
     connection: asyncpg.Connection | None = None
     try:
         async with asyncio.timeout(timeout_seconds):
@@ -113,7 +218,9 @@ async def _check_kafka(
 ) -> HealthCheckDetail:
     """Verifica conectividad TCP basica contra el primer bootstrap server."""
     if not kafka_enabled:
-        return HealthCheckDetail(status="disabled", detail="Kafka deshabilitado por configuracion.")
+        return HealthCheckDetail(
+            status="disabled", detail="Kafka deshabilitado (KAFKA_ENABLED o EVENT_BROKER=memory)."
+        )
 
     first_server = bootstrap_servers.split(",")[0].strip()
     host, separator, raw_port = first_server.partition(":")
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 
 from src.application.orders.dto import (
     CreateOrderCommand,
@@ -20,18 +20,27 @@ from src.application.orders.use_cases import (
     ListOrdersUseCase,
     UpdateOrderStatusUseCase,
 )
+from src.infrastructure.api.conditional import (
+    build_etag,
+    matches_if_none_match,
+    not_modified,
+    set_validators,
+)
 from src.infrastructure.api.dependencies import (
     get_create_order_use_case,
     get_get_order_use_case,
+    get_idempotency_store,
     get_list_orders_use_case,
     get_update_order_status_use_case,
 )
+from src.infrastructure.api.idempotency import MAX_KEY_LENGTH, run_idempotent
 from src.infrastructure.api.schemas.orders import (
     CreateOrderRequest,
     OrderResponse,
     OrderStatusEnum,
     UpdateOrderStatusRequest,
 )
+from src.infrastructure.db.idempotency import IdempotencyStore
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
@@ -40,8 +49,15 @@ router = APIRouter(prefix="/orders", tags=["orders"])
 def create_order(
     request: CreateOrderRequest,
     use_case: Annotated[CreateOrderUseCase, Depends(get_create_order_use_case)],
-) -> OrderResponse:
-    """Crea una orden."""
+    idempotency_store: Annotated[IdempotencyStore | None, Depends(get_idempotency_store)],
+    idempotency_key: Annotated[
+        str | None, Header(alias="Idempotency-Key", min_length=1, max_length=MAX_KEY_LENGTH)
+    ] = None,
+) -> OrderResponse | Response:
+    """Crea una orden.
+
+    Con `Idempotency-Key`, un reintento devuelve la respuesta original sin crear otra orden.
+    """
     command = CreateOrderCommand(
         customer_id=request.customer_id,
         branch_id=request.branch_id,
@@ -52,17 +68,36 @@ def create_order(
         shipping_cost=request.shipping_cost,
         tax_rate=request.tax_rate,
     )
-    order_dto = use_case.execute(command)
-    return OrderResponse.from_dto(order_dto)
+    return run_idempotent(
+        idempotency_store,
+        scope="POST /orders",
+        key=idempotency_key,
+        payload=request,
+        status_code=status.HTTP_201_CREATED,
+        handler=lambda: OrderResponse.from_dto(use_case.execute(command)),
+    )
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
 def get_order(
     order_id: UUID,
+    response: Response,
     use_case: Annotated[GetOrderUseCase, Depends(get_get_order_use_case)],
-) -> OrderResponse:
-    """Consulta una orden por id."""
-    order_dto = use_case.execute(GetOrderQuery(order_id=order_id))
+    read_model: bool = False,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> OrderResponse | Response:
+    """Consulta una orden por id; `read_model=true` lee la proyeccion `order_view`.
+
+    Sobre la tabla transaccional responde con ETag y 304 si `If-None-Match` sigue vigente.
+    """
+    query = GetOrderQuery(order_id=order_id, from_read_model=read_model)
+    version = use_case.version(query)
+    etag = build_etag(version) if version is not None else None
+    if etag is not None and matches_if_none_match(if_none_match, etag):
+        return not_modified(etag)
+    order_dto = use_case.execute(query)
+    if etag is not None:
+        set_validators(response, etag)
     return OrderResponse.from_dto(order_dto)
 
 
@@ -70,10 +105,14 @@ def get_order(
 def list_orders(
     use_case: Annotated[ListOrdersUseCase, Depends(get_list_orders_use_case)],
     status_filter: Annotated[OrderStatusEnum | None, Query(alias="status")] = None,
+    read_model: bool = False,
 ) -> list[OrderResponse]:
-    """Lista ordenes con filtro opcional por estado."""
+    """Lista ordenes con filtro opcional por estado.
+
+    Con `read_model=true` se lee `order_view` (eventualmente consistente, sin joins).
+    """
     status = status_filter.to_domain() if status_filter is not None else None
-    order_dtos = use_case.execute(ListOrdersQuery(status=status))
+    order_dtos = use_case.execute(ListOrdersQuery(status=status, from_read_model=read_model))
     return [OrderResponse.from_dto(order_dto) for order_dto in order_dtos]
 
 
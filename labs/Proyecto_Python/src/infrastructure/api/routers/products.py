@@ -4,10 +4,16 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Header, Response, status
 
 from src.application.products.dto import CreateProductCommand
 from src.application.products.use_cases import CreateProductUseCase, ListProductsUseCase
+from src.infrastructure.api.conditional import (
+    build_etag,
+    matches_if_none_match,
+    not_modified,
+    set_validators,
+)
 from src.infrastructure.api.dependencies import (
     get_create_product_use_case,
     get_list_products_use_case,
@@ -19,10 +25,16 @@ router = APIRouter(prefix="/products", tags=["products"])
 
 @router.get("", response_model=list[ProductResponse], status_code=status.HTTP_200_OK)
 def list_products(
+    response: Response,
     use_case: Annotated[ListProductsUseCase, Depends(get_list_products_use_case)],
-) -> list[ProductResponse]:
-    """Lista productos disponibles en catalogo."""
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> list[ProductResponse] | Response:
+    """Lista productos disponibles en catalogo; 304 si `If-None-Match` sigue vigente."""
+    etag = build_etag(use_case.version())
+    if matches_if_none_match(if_none_match, etag):
+        return not_modified(etag)
     products = use_case.execute()
+    set_validators(response, etag)
     return [ProductResponse.from_dto(product) for product in products]
 
 
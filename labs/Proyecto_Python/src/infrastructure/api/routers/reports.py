@@ -0,0 +1,60 @@
+"""Router HTTP de reportes de ventas (lee rollups, no recorre ordenes)."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from src.application.reports.dto import ProductSalesReportQuery, SalesReportQuery
+from src.application.reports.use_cases import (
+    GetProductSalesReportUseCase,
+    GetSalesReportUseCase,
+)
+from src.infrastructure.api.dependencies import (
+    get_product_sales_report_use_case,
+    get_sales_report_use_case,
+)
+from src.infrastructure.api.schemas.orders import OrderStatusEnum
+from src.infrastructure.api.schemas.reports import (
+    ProductSalesReportResponse,
+    SalesReportResponse,
+)
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+@router.get("/sales", response_model=SalesReportResponse)
+def get_sales_report(
+    use_case: Annotated[GetSalesReportUseCase, Depends(get_sales_report_use_case)],
+    date_from: date,
+    date_to: date,
+    branch_id: str | None = None,
+    status_filter: Annotated[OrderStatusEnum | None, Query(alias="status")] = None,
+) -> SalesReportResponse:
+    """Ventas por sucursal, dia de creacion y estado en un rango inclusivo."""
+    report = use_case.execute(
+        SalesReportQuery(
+            date_from=date_from,
+            date_to=date_to,
+            branch_id=branch_id,
+            status=status_filter.to_domain() if status_filter is not None else None,
+        )
+    )
+    return SalesReportResponse.from_dto(report)
+
+
+@router.get("/sales/products", response_model=ProductSalesReportResponse)
+def get_product_sales_report(
+    use_case: Annotated[GetProductSalesReportUseCase, Depends(get_product_sales_report_use_case)],
+    date_from: date,
+    date_to: date,
+    product_id: UUID | None = None,
+) -> ProductSalesReportResponse:
+    """Unidades e importe por producto y dia, sin ordenes canceladas."""
+    report = use_case.execute(
+        ProductSalesReportQuery(date_from=date_from, date_to=date_to, product_id=product_id)
+    )
+    return ProductSalesReportResponse.from_dto(report)
@@ -0,0 +1,217 @@
+"""Monitor de lag de event loops y saturacion del threadpool (`RUNTIME_MONITOR_ENABLED`).
+
+Un pico de latencia puede venir de tres lugares distintos:
+
+- El loop de uvicorn bloqueado (codigo sincrono dentro de un `async def`).
+- El loop `dc-async-runner` bloqueado; todos los `run_sync` esperan en su cola.
+- El threadpool de Starlette agotado: los routers sincronos hacen fila por un worker.
+
+En cada loop corre una tarea que duerme `interval` y mide cuanto tarde desperto
+(lag de agenda). En el loop de uvicorn ademas se lee el `CapacityLimiter` de
+anyio: workers ocupados, total y tareas esperando. Un thread watchdog revisa el
+ultimo latido de cada loop; si un loop lleva mas de `stall_threshold_ms` sin
+latir, registra un warning con el stack del thread que lo tiene bloqueado.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from concurrent.futures import Future
+from dataclasses import dataclass
+from time import perf_counter
+
+import anyio.to_thread
+
+from src.infrastructure.common.async_runner import run_in_background
+from src.infrastructure.settings import InfrastructureSettings
+
+_STACK_LIMIT = 30
+
+logger = logging.getLogger("distrito_chilaquil.runtime")
+
+
+@dataclass(frozen=True, slots=True)
+class LoopLagStats:
+    """Lag de agenda observado en un event loop."""
+
+    name: str
+    samples: int
+    last_lag_ms: float
+    max_lag_ms: float
+    stalls: int
+    blocked_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadPoolStats:
+    """Uso del threadpool de los routers sincronos (limiter por defecto de anyio)."""
+
+    total_workers: int
+    active_workers: int
+    queued: int
+    max_queued: int
+    saturated_samples: int
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeStats:
+    """Foto del monitor para `GET /health/runtime`."""
+
+    interval_ms: float
+    stall_threshold_ms: float
+    loops: tuple[LoopLagStats, ...]
+    threadpool: ThreadPoolStats | None
+
+
+class _LoopProbe:
+    """Latido y lag de un loop; lo escribe el loop y lo lee el watchdog."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.thread_id: int | None = None
+        self.last_beat = perf_counter()
+        self.samples = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.stall_reported = False
+        self.lock = threading.Lock()
+
+    def beat(self, lag: float) -> None:
+        with self.lock:
+            self.last_beat = perf_counter()
+            self.samples += 1
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.stall_reported = False
+
+    def snapshot(self) -> LoopLagStats:
+        with self.lock:
+            return LoopLagStats(
+                name=self.name,
+                samples=self.samples,
+                last_lag_ms=round(self.last_lag * 1000, 2),
+                max_lag_ms=round(self.max_lag * 1000, 2),
+                stalls=self.stalls,
+                blocked_ms=round((perf_counter() - self.last_beat) * 1000, 2),
+            )
+
+
+class RuntimeMonitor:
+    """Mide lag del loop de uvicorn y de `dc-async-runner`, y el threadpool de Starlette."""
+
+    def __init__(self, interval_seconds: float = 0.1, stall_threshold_ms: float = 250.0) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds debe ser mayor a 0.")
+        self.interval_seconds = interval_seconds
+        self.stall_threshold_ms = stall_threshold_ms
+        self._probes = (_LoopProbe("uvicorn"), _LoopProbe("dc-async-runner"))
+        self._stopping = threading.Event()
+        self._api_task: asyncio.Task[None] | None = None
+        self._runner_future: Future[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._pool_lock = threading.Lock()
+        self._pool: ThreadPoolStats | None = None
+
+    async def start(self) -> None:
+        """Arranca las sondas; se llama desde el lifespan (loop de uvicorn)."""
+        self._stopping.clear()
+        api_probe, runner_probe = self._probes
+        self._api_task = asyncio.create_task(self._probe_loop(api_probe, sample_pool=True))
+        self._runner_future = run_in_background(self._probe_loop(runner_probe, sample_pool=False))
+        self._watchdog = threading.Thread(
+            target=self._watch, name="dc-runtime-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Detiene sondas y watchdog."""
+        self._stopping.set()
+        if self._api_task is not None:
+            self._api_task.cancel()
+            await asyncio.gather(self._api_task, return_exceptions=True)
+        if self._runner_future is not None:
+            self._runner_future.cancel()
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join, self.interval_seconds * 2)
+
+    def snapshot(self) -> RuntimeStats:
+        """Estado actual de loops y threadpool."""
+        with self._pool_lock:
+            pool = self._pool
+        return RuntimeStats(
+            interval_ms=round(self.interval_seconds * 1000, 2),
+            stall_threshold_ms=self.stall_threshold_ms,
+            loops=tuple(probe.snapshot() for probe in self._probes),
+            threadpool=pool,
+        )
+
+    async def _probe_loop(self, probe: _LoopProbe, sample_pool: bool) -> None:
+        probe.thread_id = threading.get_ident()
+        probe.beat(0.0)
+        while not self._stopping.is_set():
+            expected = perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            probe.beat(max(0.0, perf_counter() - expected))
+            if sample_pool:
+                self._sample_threadpool()
+
+    def _sample_threadpool(self) -> None:
+        # El limiter es por loop: solo tiene sentido leerlo desde el loop de uvicorn.
+        statistics = anyio.to_thread.current_default_thread_limiter().statistics()
+        total = int(statistics.total_tokens)
+        queued = statistics.tasks_waiting
+        saturated = statistics.borrowed_tokens >= total and queued > 0
+        with self._pool_lock:
+            previous = self._pool
+            self._pool = ThreadPoolStats(
+                total_workers=total,
+                active_workers=statistics.borrowed_tokens,
+                queued=queued,
+                max_queued=max(queued, previous.max_queued if previous else 0),
+                saturated_samples=(previous.saturated_samples if previous else 0) + saturated,
+            )
+        was_saturated = previous is not None and previous.queued > 0
+        if saturated and not was_saturated:
+            logger.warning(
+                "threadpool_saturated active_workers=%s total_workers=%s queued=%s",
+                statistics.borrowed_tokens,
+                total,
+                queued,
+            )
+
+    def _watch(self) -> None:
+        while not self._stopping.wait(self.interval_seconds):
+            for probe in self._probes:
+                self._check_stall(probe)
+
+    def _check_stall(self, probe: _LoopProbe) -> None:
+        with probe.lock:
+            blocked_ms = (perf_counter() - probe.last_beat) * 1000
+            if probe.thread_id is None or probe.stall_reported:
+                return
+            if blocked_ms < self.stall_threshold_ms:
+                return
+            probe.stall_reported = True
+            probe.stalls += 1
+            thread_id = probe.thread_id
+        # Un aviso por bloqueo: `stall_reported` se limpia en el siguiente latido.
+        frame = sys._current_frames().get(thread_id)
+        stack = "".join(traceback.format_stack(frame, limit=_STACK_LIMIT)) if frame else ""
+        logger.warning(
+            "event_loop_blocked loop=%s blocked_ms=%.1f\n%s", probe.name, blocked_ms, stack
+        )
+
+
+def build_runtime_monitor(settings: InfrastructureSettings) -> RuntimeMonitor | None:
+    """Monitor segun settings, o None si esta deshabilitado."""
+    if not settings.runtime_monitor_enabled:
+        return None
+    return RuntimeMonitor(
+        interval_seconds=settings.runtime_monitor_interval_ms / 1000,
+        stall_threshold_ms=settings.loop_stall_threshold_ms,
+    )
@@ -0,0 +1,130 @@
+"""Profiler estadistico bajo demanda (`GET /admin/profile`).
+
+Toma muestras de todos los threads con `sys._current_frames()` a la frecuencia
+pedida durante N segundos y agrupa los stacks en formato "collapsed"
+(`thread;func (archivo:linea);... conteo`), el que leen `flamegraph.pl`,
+speedscope e inferno. Sirve cuando no se puede adjuntar py-spy al contenedor.
+
+Fuera de una captura no cuesta nada; frecuencia y duracion tienen tope y solo
+corre una captura a la vez.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import PurePath
+from time import perf_counter, sleep
+from types import FrameType
+
+from src.infrastructure.settings import InfrastructureSettings
+
+# Un thread cuyo frame mas profundo esta en estos modulos esta esperando, no trabajando.
+_IDLE_MODULES = frozenset({"threading.py", "selectors.py", "queue.py"})
+_MAX_DEPTH = 128
+
+
+class ProfilerBusyError(RuntimeError):
+    """Ya hay una captura en curso."""
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileResult:
+    """Stacks agregados de una captura."""
+
+    duration_seconds: float
+    rate_hz: float
+    samples: int
+    threads: int
+    stacks: dict[str, int]
+
+    def collapsed(self) -> str:
+        """Texto collapsed: una linea `stack conteo`, de mayor a menor conteo."""
+        ordered = sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in ordered)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({PurePath(code.co_filename).name}:{frame.f_lineno})"
+
+
+def _collapse(thread_name: str, frame: FrameType) -> str:
+    labels: list[str] = []
+    current: FrameType | None = frame
+    while current is not None and len(labels) < _MAX_DEPTH:
+        labels.append(_frame_label(current))
+        current = current.f_back
+    labels.append(thread_name)
+    # `;` separa frames en el formato collapsed; se quita de los nombres por si acaso.
+    return ";".join(label.replace(";", ",") for label in reversed(labels))
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return PurePath(frame.f_code.co_filename).name in _IDLE_MODULES
+
+
+class SamplingProfiler:
+    """Muestreador de stacks de todos los threads del proceso."""
+
+    def __init__(self, max_seconds: float = 30.0, max_rate_hz: float = 1000.0) -> None:
+        self.max_seconds = max_seconds
+        self.max_rate_hz = max_rate_hz
+        self._running = threading.Lock()
+
+    def profile(self, seconds: float, rate_hz: float, include_idle: bool = False) -> ProfileResult:
+        """Captura bloqueante en el thread que llama (que se excluye de las muestras)."""
+        if not 0 < seconds <= self.max_seconds:
+            raise ValueError(f"seconds debe estar entre 0 y {self.max_seconds}.")
+        if not 0 < rate_hz <= self.max_rate_hz:
+            raise ValueError(f"rate_hz debe estar entre 0 y {self.max_rate_hz}.")
+        if not self._running.acquire(blocking=False):
+            raise ProfilerBusyError("Ya hay una captura de profiler en curso.")
+        try:
+            return self._sample(seconds, rate_hz, include_idle)
+        finally:
+            self._running.release()
+
+    def _sample(self, seconds: float, rate_hz: float, include_idle: bool) -> ProfileResult:
+        own_thread = threading.get_ident()
+        interval = 1 / rate_hz
+        stacks: Counter[str] = Counter()
+        seen_threads: set[int] = set()
+        samples = 0
+        started = perf_counter()
+        deadline = started + seconds
+        next_tick = started
+        while next_tick < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread or (not include_idle and _is_idle(frame)):
+                    continue
+                seen_threads.add(thread_id)
+                stacks[_collapse(names.get(thread_id, f"thread-{thread_id}"), frame)] += 1
+            samples += 1
+            next_tick += interval
+            delay = next_tick - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            else:
+                # Si el muestreo se atrasa, no intenta recuperar muestras perdidas.
+                next_tick = perf_counter()
+        return ProfileResult(
+            duration_seconds=round(perf_counter() - started, 3),
+            rate_hz=rate_hz,
+            samples=samples,
+            threads=len(seen_threads),
+            stacks=dict(stacks),
+        )
+
+
+def build_sampling_profiler(settings: InfrastructureSettings) -> SamplingProfiler | None:
+    """Profiler segun settings, o None si esta deshabilitado."""
+    if not settings.profiler_enabled:
+        return None
+    return SamplingProfiler(
+        max_seconds=settings.profiler_max_seconds,
+        max_rate_hz=settings.profiler_max_rate_hz,
+    )
@@ -1,8 +1,27 @@
 """Exports de schemas HTTP."""
 
+from .admin import (
+    ProfileResponse,
+    ProfileStackResponse,
+    SlowQueryLogResponse,
+    SlowQueryResponse,
+    SpanResponse,
+    TraceListResponse,
+    TraceResponse,
+)
 from .common import ErrorDetail, ErrorResponse
 from .customers import CustomerResponse, RegisterCustomerRequest
-from .health import HealthCheckDetail, HealthReadinessResponse, HealthResponse
+from .health import (
+    AdmissionControlResponse,
+    AdmissionGroupResponse,
+    HealthCheckDetail,
+    HealthReadinessResponse,
+    HealthResponse,
+    LoopLagResponse,
+    OrderViewConsumerResponse,
+    RuntimeMonitorResponse,
+    ThreadPoolResponse,
+)
 from .orders import (
     CreateOrderItemRequest,
     CreateOrderRequest,
@@ -12,8 +31,17 @@ from .orders import (
     UpdateOrderStatusRequest,
 )
 from .products import CreateProductRequest, ProductResponse
+from .reports import (
+    BranchDaySalesResponse,
+    ProductDaySalesResponse,
+    ProductSalesReportResponse,
+    SalesReportResponse,
+)
 
 __all__ = [
+    "AdmissionControlResponse",
+    "AdmissionGroupResponse",
+    "BranchDaySalesResponse",
     "CreateOrderItemRequest",
     "CreateOrderRequest",
     "CreateProductRequest",
@@ -23,10 +51,24 @@ __all__ = [
     "HealthCheckDetail",
     "HealthReadinessResponse",
     "HealthResponse",
+    "LoopLagResponse",
     "OrderItemResponse",
     "OrderResponse",
     "OrderStatusEnum",
+    "OrderViewConsumerResponse",
+    "ProductDaySalesResponse",
+    "ProfileResponse",
+    "ProfileStackResponse",
     "ProductResponse",
+    "ProductSalesReportResponse",
     "RegisterCustomerRequest",
+    "RuntimeMonitorResponse",
+    "SalesReportResponse",
+    "SlowQueryLogResponse",
+    "SlowQueryResponse",
+    "SpanResponse",
+    "ThreadPoolResponse",
+    "TraceListResponse",
+    "TraceResponse",
     "UpdateOrderStatusRequest",
 ]
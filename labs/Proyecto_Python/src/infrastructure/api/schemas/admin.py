@@ -0,0 +1,138 @@
+"""Schemas de endpoints administrativos de diagnostico."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from src.infrastructure.api.sampling_profiler import ProfileResult
+from src.infrastructure.common.tracing import Span
+from src.infrastructure.db.slow_queries import SlowQuery
+
+from .common import ApiBaseModel
+
+
+class SlowQueryResponse(ApiBaseModel):
+    """Query lenta capturada, con plan si fue muestreada."""
+
+    statement: str
+    parameters: str
+    duration_ms: float
+    captured_at: datetime
+    route: str | None = None
+    request_id: str | None = None
+    executemany: bool = False
+    plan: str | None = None
+    plan_error: str | None = None
+
+    @classmethod
+    def from_entry(cls, entry: SlowQuery) -> SlowQueryResponse:
+        """Mapea una entrada del anillo a respuesta HTTP."""
+        return cls(
+            statement=entry.statement,
+            parameters=entry.parameters,
+            duration_ms=entry.duration_ms,
+            captured_at=entry.captured_at,
+            route=entry.route,
+            request_id=entry.request_id,
+            executemany=entry.executemany,
+            plan=entry.plan,
+            plan_error=entry.plan_error,
+        )
+
+
+class SlowQueryLogResponse(ApiBaseModel):
+    """Contenido del log de queries lentas, de la mas reciente a la mas vieja."""
+
+    enabled: bool
+    threshold_ms: float | None = None
+    explain_sample_rate: float | None = None
+    entries: list[SlowQueryResponse] = []
+
+
+class SpanResponse(ApiBaseModel):
+    """Span de una traza (campos del modelo OTel)."""
+
+    name: str
+    span_id: str
+    parent_span_id: str | None = None
+    kind: str
+    start_time: datetime
+    duration_ms: float
+    status: str
+    status_message: str | None = None
+    attributes: dict[str, str | int | float | bool] = {}
+
+    @classmethod
+    def from_span(cls, span: Span) -> SpanResponse:
+        """Mapea un span terminado a respuesta HTTP."""
+        return cls(
+            name=span.name,
+            span_id=span.span_id,
+            parent_span_id=span.parent_span_id,
+            kind=span.kind,
+            start_time=datetime.fromtimestamp(span.start_time_unix_nano / 1e9, UTC),
+            duration_ms=span.duration_ms,
+            status=span.status,
+            status_message=span.status_message,
+            attributes=dict(span.attributes),
+        )
+
+
+class TraceResponse(ApiBaseModel):
+    """Traza completa; `spans` en orden de inicio."""
+
+    trace_id: str
+    root_name: str
+    duration_ms: float
+    spans: list[SpanResponse]
+
+    @classmethod
+    def from_spans(cls, spans: Sequence[Span]) -> TraceResponse:
+        """Arma la traza a partir de los spans exportados (el raiz termina al final)."""
+        root = spans[-1]
+        ordered = sorted(spans, key=lambda span: span.start_time_unix_nano)
+        return cls(
+            trace_id=root.trace_id,
+            root_name=root.name,
+            duration_ms=root.duration_ms,
+            spans=[SpanResponse.from_span(span) for span in ordered],
+        )
+
+
+class TraceListResponse(ApiBaseModel):
+    """Trazas recientes del collector en memoria, de la mas reciente a la mas vieja."""
+
+    enabled: bool
+    exporter: str | None = None
+    sample_rate: float | None = None
+    traces: list[TraceResponse] = []
+
+
+class ProfileStackResponse(ApiBaseModel):
+    """Stack collapsed (`thread;frame;...`) y cuantas muestras cayeron en el."""
+
+    stack: str
+    count: int
+
+
+class ProfileResponse(ApiBaseModel):
+    """Captura del profiler, de stack mas frecuente a menos."""
+
+    duration_seconds: float
+    rate_hz: float
+    samples: int
+    threads: int
+    stacks: list[ProfileStackResponse]
+
+    @classmethod
+    def from_result(cls, result: ProfileResult) -> ProfileResponse:
+        """Mapea el resultado del profiler a respuesta HTTP."""
+        ordered = sorted(result.stacks.items(), key=lambda item: item[1], reverse=True)
+        return cls(
+            duration_seconds=result.duration_seconds,
+            rate_hz=result.rate_hz,
+            samples=result.samples,
+            threads=result.threads,
+            stacks=[ProfileStackResponse(stack=stack, count=count) for stack, count in ordered],
+        )
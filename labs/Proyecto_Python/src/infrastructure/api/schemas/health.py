@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Literal
 
 from .common import ApiBaseModel
@@ -27,3 +28,70 @@ class HealthReadinessResponse(ApiBaseModel):
     status: Literal["ok", "degraded", "error"]
     service: str
     checks: dict[str, HealthCheckDetail]
+
+
+class OrderViewConsumerResponse(ApiBaseModel):
+    """Estado del consumidor que alimenta el read model `order_view`."""
+
+    enabled: bool
+    running: bool = False
+    lag: int | None = None
+    batches: int = 0
+    applied_events: int = 0
+    ignored_events: int = 0
+    last_batch_at: datetime | None = None
+    last_error: str | None = None
+
+
+class LoopLagResponse(ApiBaseModel):
+    """Lag de agenda de un event loop."""
+
+    name: str
+    samples: int
+    last_lag_ms: float
+    max_lag_ms: float
+    stalls: int
+    blocked_ms: float
+
+
+class ThreadPoolResponse(ApiBaseModel):
+    """Workers del threadpool de routers sincronos y su fila."""
+
+    total_workers: int
+    active_workers: int
+    queued: int
+    max_queued: int
+    saturated_samples: int
+
+
+class RuntimeMonitorResponse(ApiBaseModel):
+    """Estado del monitor de loops y threadpool."""
+
+    enabled: bool
+    interval_ms: float | None = None
+    stall_threshold_ms: float | None = None
+    loops: list[LoopLagResponse] = []
+    threadpool: ThreadPoolResponse | None = None
+
+
+class AdmissionGroupResponse(ApiBaseModel):
+    """Cupo, fila y requests rechazados de un grupo de rutas."""
+
+    group: str
+    max_concurrent: int
+    max_queue: int
+    active: int
+    queued: int
+    max_queued: int
+    admitted: int
+    shed_queue_full: int
+    shed_deadline: int
+    max_queue_wait_ms: float
+
+
+class AdmissionControlResponse(ApiBaseModel):
+    """Estado del control de admision."""
+
+    enabled: bool
+    retry_after_seconds: int | None = None
+    groups: list[AdmissionGroupResponse] = []
@@ -0,0 +1,105 @@
+"""Schemas API para reportes de ventas."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from src.application.reports.dto import (
+    BranchDaySalesDTO,
+    ProductDaySalesDTO,
+    ProductSalesReportDTO,
+    SalesReportDTO,
+)
+
+from .common import ApiBaseModel
+from .orders import OrderStatusEnum
+
+
+class BranchDaySalesResponse(ApiBaseModel):
+    """Ventas de una sucursal en un dia para un estado."""
+
+    branch_id: str
+    day: date
+    status: OrderStatusEnum
+    order_count: int
+    subtotal: Decimal
+    tax_total: Decimal
+    shipping_cost: Decimal
+    total: Decimal
+
+    @classmethod
+    def from_dto(cls, dto: BranchDaySalesDTO) -> BranchDaySalesResponse:
+        """Mapea DTO de fila a response."""
+        return cls(
+            branch_id=dto.branch_id,
+            day=dto.day,
+            status=OrderStatusEnum(dto.status.value),
+            order_count=dto.order_count,
+            subtotal=dto.subtotal,
+            tax_total=dto.tax_total,
+            shipping_cost=dto.shipping_cost,
+            total=dto.total,
+        )
+
+
+class SalesReportResponse(ApiBaseModel):
+    """Respuesta HTTP del reporte de ventas por sucursal."""
+
+    date_from: date
+    date_to: date
+    order_count: int
+    total: Decimal
+    rows: tuple[BranchDaySalesResponse, ...]
+
+    @classmethod
+    def from_dto(cls, dto: SalesReportDTO) -> SalesReportResponse:
+        """Mapea DTO de reporte a response."""
+        return cls(
+            date_from=dto.date_from,
+            date_to=dto.date_to,
+            order_count=dto.order_count,
+            total=dto.total,
+            rows=tuple(BranchDaySalesResponse.from_dto(row) for row in dto.rows),
+        )
+
+
+class ProductDaySalesResponse(ApiBaseModel):
+    """Unidades e importe de un producto en un dia."""
+
+    product_id: UUID
+    day: date
+    quantity: int
+    subtotal: Decimal
+
+    @classmethod
+    def from_dto(cls, dto: ProductDaySalesDTO) -> ProductDaySalesResponse:
+        """Mapea DTO de fila a response."""
+        return cls(
+            product_id=dto.product_id,
+            day=dto.day,
+            quantity=dto.quantity,
+            subtotal=dto.subtotal,
+        )
+
+
+class ProductSalesReportResponse(ApiBaseModel):
+    """Respuesta HTTP del reporte de ventas por producto."""
+
+    date_from: date
+    date_to: date
+    quantity: int
+    subtotal: Decimal
+    rows: tuple[ProductDaySalesResponse, ...]
+
+    @classmethod
+    def from_dto(cls, dto: ProductSalesReportDTO) -> ProductSalesReportResponse:
+        """Mapea DTO de reporte a response."""
+        return cls(
+            date_from=dto.date_from,
+            date_to=dto.date_to,
+            quantity=dto.quantity,
+            subtotal=dto.subtotal,
+            rows=tuple(ProductDaySalesResponse.from_dto(row) for row in dto.rows),
+        )
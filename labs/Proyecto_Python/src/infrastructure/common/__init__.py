@@ -1,5 +1,64 @@
 """Utilidades compartidas de infraestructura."""
 
-from .async_runner import run_sync
+from .async_runner import run_in_background, run_sync
+from .request_context import (
+    bind_request_id,
+    bind_request_route,
+    get_request_id,
+    get_request_route,
+    reset_request_id,
+    reset_request_route,
+)
+from .request_metrics import (
+    RequestMetrics,
+    bind_request_metrics,
+    get_request_metrics,
+    record_query,
+    record_timing,
+    reset_request_metrics,
+    timed,
+)
+from .tracing import (
+    InMemoryTraceCollector,
+    JsonlFileTraceExporter,
+    Span,
+    TraceExporterPort,
+    TraceParent,
+    Tracer,
+    configure_tracer,
+    current_span,
+    format_traceparent,
+    get_tracer,
+    start_span,
+    traced,
+)
 
-__all__ = ["run_sync"]
+__all__ = [
+    "InMemoryTraceCollector",
+    "JsonlFileTraceExporter",
+    "RequestMetrics",
+    "Span",
+    "TraceExporterPort",
+    "TraceParent",
+    "Tracer",
+    "bind_request_id",
+    "bind_request_route",
+    "bind_request_metrics",
+    "configure_tracer",
+    "current_span",
+    "format_traceparent",
+    "get_request_id",
+    "get_request_route",
+    "get_request_metrics",
+    "get_tracer",
+    "record_query",
+    "record_timing",
+    "reset_request_id",
+    "reset_request_route",
+    "reset_request_metrics",
+    "run_in_background",
+    "run_sync",
+    "start_span",
+    "timed",
+    "traced",
+]
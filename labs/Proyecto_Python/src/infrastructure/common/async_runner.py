@@ -6,8 +6,12 @@ import asyncio
 from collections.abc import Awaitable
 from concurrent.futures import Future
 from threading import Event, Lock, Thread
+from time import perf_counter
 from typing import TypeVar
 
+from .request_metrics import record_timing
+from .tracing import start_span
+
 T = TypeVar("T")
 
 
@@ -65,9 +69,12 @@ class _BackgroundEventLoopRunner:
 
     def run(self, awaitable: Awaitable[T]) -> T:
         """Ejecuta una corrutina en el loop de fondo y espera resultado."""
+        return self.submit(awaitable).result()
+
+    def submit(self, awaitable: Awaitable[T]) -> Future[T]:
+        """Agenda una corrutina en el loop de fondo sin esperar su resultado."""
         loop = self._get_loop()
-        future: Future[T] = asyncio.run_coroutine_threadsafe(_as_coroutine(awaitable), loop)
-        return future.result()
+        return asyncio.run_coroutine_threadsafe(_as_coroutine(awaitable), loop)
 
 
 _BACKGROUND_RUNNER = _BackgroundEventLoopRunner()
@@ -83,7 +90,8 @@ def run_sync(awaitable: Awaitable[T]) -> T:
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        return _BACKGROUND_RUNNER.run(awaitable)
+        with start_span("run_sync"):
+            return _BACKGROUND_RUNNER.run(_record_wait(awaitable, perf_counter()))
 
     raise RuntimeError(
         "No se puede ejecutar adaptador sincrono con event loop activo. "
@@ -91,6 +99,21 @@ def run_sync(awaitable: Awaitable[T]) -> T:
     )
 
 
+def run_in_background[T](awaitable: Awaitable[T]) -> Future[T]:
+    """Agenda una corrutina de larga duracion en el loop de fondo.
+
+    A diferencia de `run_sync` se puede llamar desde un event loop activo: tareas
+    como consumidores deben compartir el loop donde viven las conexiones del engine.
+    """
+    return _BACKGROUND_RUNNER.submit(awaitable)
+
+
+async def _record_wait[T](awaitable: Awaitable[T], submitted_at: float) -> T:
+    """Registra cuanto espero la corrutina en cola antes de correr en el loop de fondo."""
+    record_timing("run_sync_wait", perf_counter() - submitted_at)
+    return await awaitable
+
+
 async def _as_coroutine(awaitable: Awaitable[T]) -> T:
     """Convierte Awaitable generico en corrutina para asyncio.run."""
     return await awaitable
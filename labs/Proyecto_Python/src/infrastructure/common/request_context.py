@@ -0,0 +1,42 @@
+"""Contexto del request en curso (request id y ruta) visible desde adaptadores.
+
+Starlette copia el contexto al threadpool de endpoints sincronos, asi el
+publicador de eventos lee el request id sin recibirlo por parametro.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+
+_request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+_request_route: ContextVar[str | None] = ContextVar("request_route", default=None)
+
+
+def get_request_id() -> str | None:
+    """Request id del request actual, o None fuera de un request HTTP."""
+    return _request_id.get()
+
+
+def bind_request_id(request_id: str) -> Token[str | None]:
+    """Fija el request id del contexto actual; devuelve token para `reset_request_id`."""
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: Token[str | None]) -> None:
+    """Restaura el valor previo al `bind_request_id` correspondiente."""
+    _request_id.reset(token)
+
+
+def get_request_route() -> str | None:
+    """`METODO /path` del request actual, o None fuera de un request HTTP."""
+    return _request_route.get()
+
+
+def bind_request_route(route: str) -> Token[str | None]:
+    """Fija la ruta del contexto actual; devuelve token para `reset_request_route`."""
+    return _request_route.set(route)
+
+
+def reset_request_route(token: Token[str | None]) -> None:
+    """Restaura el valor previo al `bind_request_route` correspondiente."""
+    _request_route.reset(token)
@@ -0,0 +1,98 @@
+"""Tiempos por request (DB, Kafka, serializacion, espera de `run_sync`).
+
+Igual que el request id, las metricas viajan en un `ContextVar`. El middleware
+fija un `RequestMetrics` nuevo por request y los adaptadores suman sobre el mismo
+objeto aunque corran en el threadpool o en el loop de `run_sync` (asyncio copia
+el contexto del thread que agenda la corrutina). Fuera de un request no hay
+metricas y todo es no-op.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Literal
+
+TimingName = Literal["db", "kafka", "serialization", "run_sync_wait"]
+
+# Nombre en `Server-Timing` (sin guion bajo, por convencion del header).
+_SERVER_TIMING_NAMES: dict[TimingName, str] = {
+    "kafka": "kafka",
+    "serialization": "serialization",
+    "run_sync_wait": "run-sync-wait",
+}
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """Acumulado de un request; segundos por componente y numero de queries."""
+
+    db_queries: int = 0
+    seconds: dict[TimingName, float] = field(default_factory=dict)
+
+    def add(self, name: TimingName, seconds: float) -> None:
+        """Suma tiempo a un componente."""
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def milliseconds(self, name: TimingName) -> float:
+        """Tiempo acumulado del componente en milisegundos."""
+        return round(self.seconds.get(name, 0.0) * 1000, 2)
+
+    def server_timing(self, total_seconds: float | None = None) -> str:
+        """Valor del header `Server-Timing` (componentes con tiempo y total `app`)."""
+        # `db` siempre va: "queries=0" tambien es informacion util.
+        entries = [f'db;dur={self.milliseconds("db")};desc="queries={self.db_queries}"']
+        entries.extend(
+            f"{header_name};dur={self.milliseconds(name)}"
+            for name, header_name in _SERVER_TIMING_NAMES.items()
+            if name in self.seconds
+        )
+        if total_seconds is not None:
+            entries.append(f"app;dur={round(total_seconds * 1000, 2)}")
+        return ", ".join(entries)
+
+
+_request_metrics: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def get_request_metrics() -> RequestMetrics | None:
+    """Metricas del request actual, o None fuera de un request HTTP."""
+    return _request_metrics.get()
+
+
+def bind_request_metrics(metrics: RequestMetrics) -> Token[RequestMetrics | None]:
+    """Fija las metricas del contexto actual; devuelve token para `reset_request_metrics`."""
+    return _request_metrics.set(metrics)
+
+
+def reset_request_metrics(token: Token[RequestMetrics | None]) -> None:
+    """Restaura el valor previo al `bind_request_metrics` correspondiente."""
+    _request_metrics.reset(token)
+
+
+def record_timing(name: TimingName, seconds: float) -> None:
+    """Suma tiempo al request actual si existe."""
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.add(name, seconds)
+
+
+def record_query(seconds: float) -> None:
+    """Cuenta una query y su duracion en el request actual si existe."""
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.db_queries += 1
+        metrics.add("db", seconds)
+
+
+@contextmanager
+def timed(name: TimingName) -> Iterator[None]:
+    """Mide el bloque y lo suma al componente `name` del request actual."""
+    start_time = perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, perf_counter() - start_time)
@@ -0,0 +1,392 @@
+"""Trazas ligeras en proceso con el modelo de datos de OpenTelemetry.
+
+Un request muestreado abre un span raiz (SERVER) en el middleware; los spans
+hijos (casos de uso, repositorios, `run_sync`, publish) cuelgan del span activo
+que viaja en un `ContextVar`, igual que el request id. Sin span activo los hijos
+son no-op, asi que fuera de un request muestreado el costo es leer el ContextVar.
+
+Ids y campos siguen OTel (trace id de 16 bytes, span id de 8, kind, status,
+atributos, tiempos en nanosegundos epoch) y el export usa la forma JSON de OTLP,
+asi un collector o Jaeger puede leer los archivos. Se acepta y se propaga
+`traceparent` (W3C) para unirse a trazas de otros servicios.
+
+La traza se exporta al cerrar el span raiz; un hijo que termine despues se
+descarta. Casos de uso, repositorios y UnitOfWork se instrumentan con `traced()`
+en el wiring de dependencias.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import queue
+import random
+import re
+import secrets
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import time_ns
+from typing import Any, Literal, Protocol, cast
+
+SpanKind = Literal["INTERNAL", "SERVER", "CLIENT", "PRODUCER", "CONSUMER"]
+SpanStatus = Literal["UNSET", "OK", "ERROR"]
+AttributeValue = str | int | float | bool
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+logger = logging.getLogger("distrito_chilaquil.tracing")
+
+
+@dataclass(slots=True)
+class Span:
+    """Span con los campos del modelo OTel."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    kind: SpanKind
+    start_time_unix_nano: int
+    end_time_unix_nano: int | None = None
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    status: SpanStatus = "UNSET"
+    status_message: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duracion en milisegundos (0 si el span no ha terminado)."""
+        if self.end_time_unix_nano is None:
+            return 0.0
+        return round((self.end_time_unix_nano - self.start_time_unix_nano) / 1_000_000, 3)
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Agrega o reemplaza un atributo."""
+        self.attributes[key] = value
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Span en la forma JSON de OTLP."""
+        otlp: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": f"SPAN_KIND_{self.kind}",
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano or self.start_time_unix_nano),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": f"STATUS_CODE_{self.status}"},
+        }
+        if self.parent_span_id is not None:
+            otlp["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            otlp["status"]["message"] = self.status_message
+        return otlp
+
+
+def _otlp_attribute(key: str, value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": value}}
+
+
+@dataclass(frozen=True, slots=True)
+class TraceParent:
+    """Contexto remoto leido de un header `traceparent`."""
+
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+    @classmethod
+    def parse(cls, header: str | None) -> TraceParent | None:
+        """Interpreta `00-<trace>-<span>-<flags>`; None si falta o es invalido."""
+        if not header:
+            return None
+        match = _TRACEPARENT.match(header.strip().lower())
+        if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+            return None
+        return cls(match.group(1), match.group(2), bool(int(match.group(3), 16) & 1))
+
+
+def format_traceparent(span: Span) -> str:
+    """Header `traceparent` para propagar el span hacia otro servicio."""
+    return f"00-{span.trace_id}-{span.span_id}-01"
+
+
+class TraceExporterPort(Protocol):
+    """Destino de trazas terminadas."""
+
+    def export(self, spans: Sequence[Span]) -> None:
+        """Recibe todos los spans de una traza."""
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a que lo exportado quede escrito; False si vence el timeout."""
+
+
+class InMemoryTraceCollector(TraceExporterPort):
+    """Ultimas N trazas en memoria (para `GET /admin/traces`)."""
+
+    def __init__(self, capacity: int = 200) -> None:
+        self._traces: deque[tuple[Span, ...]] = deque(maxlen=capacity)
+        self._lock = Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._traces.append(tuple(spans))
+
+    def snapshot(self) -> list[tuple[Span, ...]]:
+        """Trazas de la mas reciente a la mas vieja."""
+        with self._lock:
+            return list(reversed(self._traces))
+
+    def clear(self) -> None:
+        """Vacia el collector."""
+        with self._lock:
+            self._traces.clear()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        return True
+
+
+class JsonlFileTraceExporter(TraceExporterPort):
+    """Una linea OTLP/JSON (`resourceSpans`) por traza en un archivo local.
+
+    `export` solo encola la traza; un thread propio serializa y escribe, asi el
+    middleware async no bloquea el event loop con I/O de disco. Con la cola llena
+    la traza se descarta y se cuenta en `dropped`.
+    """
+
+    def __init__(self, path: Path, service_name: str, max_pending: int = 10_000) -> None:
+        self._path = path
+        self._service_name = service_name
+        self._queue: queue.Queue[tuple[Span, ...] | Event] = queue.Queue(maxsize=max_pending)
+        self.dropped = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = Thread(target=self._drain, name="trace-exporter", daemon=True)
+        self._writer.start()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        try:
+            self._queue.put_nowait(tuple(spans))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        written = Event()
+        try:
+            self._queue.put(written, timeout=timeout)
+        except queue.Full:
+            return False
+        return written.wait(timeout)
+
+    def _drain(self) -> None:
+        with self._path.open("a", encoding="utf-8") as handle:
+            while True:
+                item = self._queue.get()
+                if isinstance(item, Event):
+                    handle.flush()
+                    item.set()
+                    continue
+                try:
+                    handle.write(self._to_line(item))
+                except Exception:  # noqa: BLE001 - un span invalido no detiene el writer.
+                    logger.warning("trace_export_failed", exc_info=True)
+                if self._queue.empty():
+                    handle.flush()
+
+    def _to_line(self, spans: Sequence[Span]) -> str:
+        document = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", self._service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "distrito_chilaquil"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        return json.dumps(document, separators=(",", ":")) + "\n"
+
+
+class _TraceBuffer:
+    """Spans terminados de una traza en curso."""
+
+    __slots__ = ("_lock", "spans")
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+@dataclass(frozen=True, slots=True)
+class _ActiveSpan:
+    span: Span
+    buffer: _TraceBuffer
+
+
+_active_span: ContextVar[_ActiveSpan | None] = ContextVar("active_span", default=None)
+
+
+class Tracer:
+    """Crea trazas muestreadas y las entrega al exporter al cerrar el span raiz."""
+
+    def __init__(self, exporter: TraceExporterPort, sample_rate: float = 1.0) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate debe estar entre 0 y 1.")
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @contextmanager
+    def start_trace(
+        self,
+        name: str,
+        kind: SpanKind = "SERVER",
+        attributes: Mapping[str, AttributeValue] | None = None,
+        parent: TraceParent | None = None,
+    ) -> Iterator[Span | None]:
+        """Span raiz; respeta la decision de muestreo del `traceparent` remoto."""
+        sampled = parent.sampled if parent is not None else random.random() < self.sample_rate
+        if not sampled:
+            yield None
+            return
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent.span_id if parent is not None else None,
+            kind=kind,
+            start_time_unix_nano=time_ns(),
+            attributes=dict(attributes or {}),
+        )
+        buffer = _TraceBuffer()
+        token = _active_span.set(_ActiveSpan(span, buffer))
+        try:
+            yield span
+        except BaseException as exc:
+            _mark_error(span, exc)
+            raise
+        finally:
+            _active_span.reset(token)
+            span.end_time_unix_nano = time_ns()
+            buffer.add(span)
+            try:
+                self.exporter.export(buffer.spans)
+            except Exception:  # noqa: BLE001 - exportar trazas nunca debe romper el request.
+                logger.warning("trace_export_failed trace_id=%s", span.trace_id, exc_info=True)
+
+
+_tracer: Tracer | None = None
+
+
+def configure_tracer(tracer: Tracer | None) -> None:
+    """Fija (o quita con None) el tracer global del proceso."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Tracer global, o None si el tracing esta deshabilitado."""
+    return _tracer
+
+
+def current_span() -> Span | None:
+    """Span activo del contexto, si hay una traza muestreada en curso."""
+    active = _active_span.get()
+    return active.span if active is not None else None
+
+
+def _mark_error(span: Span, exc: BaseException) -> None:
+    span.status = "ERROR"
+    span.status_message = str(exc)[:200] or type(exc).__name__
+    span.attributes["exception.type"] = type(exc).__name__
+
+
+@contextmanager
+def start_span(
+    name: str,
+    kind: SpanKind = "INTERNAL",
+    attributes: Mapping[str, AttributeValue] | None = None,
+) -> Iterator[Span | None]:
+    """Span hijo del activo; no-op (yield None) si no hay traza muestreada."""
+    parent = _active_span.get()
+    if parent is None:
+        yield None
+        return
+    span = Span(
+        name=name,
+        trace_id=parent.span.trace_id,
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent.span.span_id,
+        kind=kind,
+        start_time_unix_nano=time_ns(),
+        attributes=dict(attributes or {}),
+    )
+    token = _active_span.set(_ActiveSpan(span, parent.buffer))
+    try:
+        yield span
+    except BaseException as exc:
+        _mark_error(span, exc)
+        raise
+    finally:
+        _active_span.reset(token)
+        span.end_time_unix_nano = time_ns()
+        parent.buffer.add(span)
+
+
+class _TracedProxy:
+    """Reenvia atributos a `target`; cada metodo publico corre dentro de un span."""
+
+    __slots__ = ("_class_name", "_namespace", "_target")
+
+    def __init__(self, target: Any) -> None:
+        cls = type(target)
+        self._target = target
+        self._class_name = cls.__name__
+        self._namespace = f"{cls.__module__}.{cls.__name__}"
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if name.startswith("_") or not callable(value):
+            return value
+        return self._wrap(value, name)
+
+    def _wrap(self, method: Callable[..., Any], name: str) -> Callable[..., Any]:
+        span_name = f"{self._class_name}.{name}"
+        attributes = {"code.namespace": self._namespace, "code.function": name}
+
+        @functools.wraps(method)
+        def traced_method(*args: Any, **kwargs: Any) -> Any:
+            if _active_span.get() is None:
+                return method(*args, **kwargs)
+            with start_span(span_name, attributes=attributes):
+                return method(*args, **kwargs)
+
+        return traced_method
+
+
+def traced[T](instance: T) -> T:
+    """Envuelve `instance` para abrir spans `Clase.metodo` en sus metodos publicos.
+
+    Sin tracer configurado devuelve la misma instancia: el costo es cero.
+    """
+    if _tracer is None:
+        return instance
+    return cast(T, _TracedProxy(instance))
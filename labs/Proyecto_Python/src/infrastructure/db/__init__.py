@@ -1,22 +1,71 @@
-"""Adaptadores de persistencia relacional."""
+"""Adaptadores de persistencia: SQLAlchemy (PostgreSQL/SQLite) y en memoria."""
 
 from .base import Base
+from .idempotency import (
+    IdempotencyRecord,
+    IdempotencyStore,
+    InMemoryIdempotencyStore,
+    SqlAlchemyIdempotencyStore,
+)
+from .in_memory import (
+    InMemoryCustomerRepository,
+    InMemoryInvoiceRepository,
+    InMemoryOrderRepository,
+    InMemoryOrderViewRepository,
+    InMemoryProductRepository,
+    InMemorySalesRollupRepository,
+    InMemoryStore,
+    InMemoryUnitOfWork,
+)
+from .instrumentation import (
+    QueryBudgetExceededError,
+    assert_response_query_budget,
+    instrument_engine,
+    query_budget,
+)
 from .repositories import (
     SqlAlchemyCustomerRepository,
     SqlAlchemyInvoiceRepository,
     SqlAlchemyOrderRepository,
+    SqlAlchemyOrderViewRepository,
     SqlAlchemyProductRepository,
+    SqlAlchemySalesRollupRepository,
+)
+from .session import (
+    build_async_engine,
+    build_session_factory,
+    create_sqlite_schema,
+    resolve_database_url,
 )
-from .session import build_async_engine, build_session_factory
 from .unit_of_work import SqlAlchemyUnitOfWork
 
 __all__ = [
     "Base",
+    "IdempotencyRecord",
+    "IdempotencyStore",
+    "InMemoryCustomerRepository",
+    "InMemoryIdempotencyStore",
+    "InMemoryInvoiceRepository",
+    "InMemoryOrderRepository",
+    "InMemoryOrderViewRepository",
+    "InMemoryProductRepository",
+    "InMemorySalesRollupRepository",
+    "InMemoryStore",
+    "InMemoryUnitOfWork",
+    "QueryBudgetExceededError",
     "SqlAlchemyCustomerRepository",
+    "SqlAlchemyIdempotencyStore",
     "SqlAlchemyInvoiceRepository",
     "SqlAlchemyOrderRepository",
+    "SqlAlchemyOrderViewRepository",
     "SqlAlchemyProductRepository",
+    "SqlAlchemySalesRollupRepository",
     "SqlAlchemyUnitOfWork",
+    "assert_response_query_budget",
     "build_async_engine",
     "build_session_factory",
+    "create_sqlite_schema",
+    "instrument_engine",
+    "query_budget",
+    "resolve_database_url",
 ]
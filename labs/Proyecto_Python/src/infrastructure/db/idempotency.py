@@ -0,0 +1,247 @@
+"""Almacen de respuestas por `Idempotency-Key` (tabla `idempotency_keys` o memoria).
+
+Flujo por request con llave:
+
+1. `reserve` inserta la llave "en curso" con una lease (`locked_until`). Si ya
+   existia (y no vencio) devuelve el registro: respuesta guardada para repetir,
+   o `status_code=None` si el primer intento sigue corriendo.
+2. Si el caso de uso falla, `release` borra la reserva para permitir reintentar.
+3. Si termina bien, `complete` guarda status y body.
+
+Cada paso corre en su propia transaccion corta, fuera de la UnitOfWork del caso
+de uso. Una reserva sin respuesta cuya lease vencio (el proceso murio a medias)
+la reclama el siguiente reintento con el mismo body.
+
+Las llaves vencidas se ignoran al reservar y se borran en lote cada
+`purge_interval_seconds`, aprovechando la siguiente reserva.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+from time import monotonic
+from typing import Protocol
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.expression import Executable
+
+from src.infrastructure.common.async_runner import run_sync
+
+from .models import IdempotencyKeyModel
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Llave ya usada; `status_code=None` significa que el request sigue en curso."""
+
+    request_hash: str
+    status_code: int | None = None
+    response_body: str | None = None
+
+
+class IdempotencyStore(Protocol):
+    """Contrato comun de los almacenes de llaves."""
+
+    def reserve(self, scope: str, key: str, request_hash: str) -> IdempotencyRecord | None:
+        """Reserva la llave; None si quedo reservada para este request."""
+
+    def complete(self, scope: str, key: str, status_code: int, response_body: str) -> None:
+        """Guarda la respuesta de una llave reservada."""
+
+    def release(self, scope: str, key: str) -> None:
+        """Borra una reserva cuyo request fallo."""
+
+
+class _PurgeSchedule:
+    """Decide cuando toca borrar llaves vencidas (a lo mas una vez por intervalo)."""
+
+    def __init__(self, interval_seconds: float) -> None:
+        self._interval = interval_seconds
+        self._next_at = monotonic()
+        self._lock = Lock()
+
+    def due(self) -> bool:
+        with self._lock:
+            now = monotonic()
+            if now < self._next_at:
+                return False
+            self._next_at = now + self._interval
+            return True
+
+
+class SqlAlchemyIdempotencyStore(IdempotencyStore):
+    """Llaves en la tabla `idempotency_keys` con sesiones propias."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl_seconds: float,
+        lease_seconds: float = 30.0,
+        purge_interval_seconds: float = 60.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._lease = timedelta(seconds=lease_seconds)
+        self._purge = _PurgeSchedule(purge_interval_seconds)
+
+    def reserve(self, scope: str, key: str, request_hash: str) -> IdempotencyRecord | None:
+        return run_sync(self._reserve(scope, key, request_hash))
+
+    def complete(self, scope: str, key: str, status_code: int, response_body: str) -> None:
+        statement = (
+            update(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.scope == scope, IdempotencyKeyModel.key == key)
+            .values(status_code=status_code, response_body=response_body, locked_until=None)
+        )
+        run_sync(self._execute(statement))
+
+    def release(self, scope: str, key: str) -> None:
+        statement = delete(IdempotencyKeyModel).where(
+            IdempotencyKeyModel.scope == scope,
+            IdempotencyKeyModel.key == key,
+            IdempotencyKeyModel.status_code.is_(None),
+        )
+        run_sync(self._execute(statement))
+
+    def purge_expired(self) -> int:
+        """Borra llaves vencidas; devuelve cuantas."""
+        return run_sync(self._purge_expired())
+
+    async def _reserve(self, scope: str, key: str, request_hash: str) -> IdempotencyRecord | None:
+        now = datetime.now(UTC)
+        if self._purge.due():
+            await self._purge_expired()
+        async with self._session_factory() as session:
+            try:
+                async with session.begin():
+                    # Una llave vencida se trata como nueva.
+                    await session.execute(
+                        delete(IdempotencyKeyModel).where(
+                            IdempotencyKeyModel.scope == scope,
+                            IdempotencyKeyModel.key == key,
+                            IdempotencyKeyModel.expires_at <= now,
+                        )
+                    )
+                    session.add(
+                        IdempotencyKeyModel(
+                            scope=scope,
+                            key=key,
+                            request_hash=request_hash,
+                            locked_until=now + self._lease,
+                            created_at=now,
+                            expires_at=now + self._ttl,
+                        )
+                    )
+                return None
+            except IntegrityError:
+                pass
+            if await self._reclaim(session, scope, key, request_hash, now):
+                return None
+            model = await session.get(IdempotencyKeyModel, (scope, key))
+            if model is None:
+                # Se borro entre el insert y la lectura (release de otro intento): sigue en curso.
+                return IdempotencyRecord(request_hash=request_hash)
+            return IdempotencyRecord(
+                request_hash=model.request_hash,
+                status_code=model.status_code,
+                response_body=model.response_body,
+            )
+
+    async def _reclaim(
+        self, session: AsyncSession, scope: str, key: str, request_hash: str, now: datetime
+    ) -> bool:
+        """Toma una reserva del mismo body sin respuesta y con la lease vencida."""
+        statement = (
+            update(IdempotencyKeyModel)
+            .where(
+                IdempotencyKeyModel.scope == scope,
+                IdempotencyKeyModel.key == key,
+                IdempotencyKeyModel.request_hash == request_hash,
+                IdempotencyKeyModel.status_code.is_(None),
+                or_(
+                    IdempotencyKeyModel.locked_until.is_(None),
+                    IdempotencyKeyModel.locked_until <= now,
+                ),
+            )
+            .values(locked_until=now + self._lease)
+        )
+        async with session.begin():
+            result = await session.execute(statement)
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def _execute(self, statement: Executable) -> None:
+        async with self._session_factory() as session, session.begin():
+            await session.execute(statement)
+
+    async def _purge_expired(self) -> int:
+        statement = delete(IdempotencyKeyModel).where(
+            IdempotencyKeyModel.expires_at <= datetime.now(UTC)
+        )
+        async with self._session_factory() as session, session.begin():
+            result = await session.execute(statement)
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+
+@dataclass(slots=True)
+class _MemoryEntry:
+    record: IdempotencyRecord
+    expires_at: float
+    locked_until: float
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Llaves en un dict del proceso (`PERSISTENCE_BACKEND=memory`)."""
+
+    def __init__(
+        self, ttl_seconds: float, lease_seconds: float = 30.0, purge_interval_seconds: float = 60.0
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._lease = lease_seconds
+        self._entries: dict[tuple[str, str], _MemoryEntry] = {}
+        self._lock = Lock()
+        self._purge = _PurgeSchedule(purge_interval_seconds)
+
+    def reserve(self, scope: str, key: str, request_hash: str) -> IdempotencyRecord | None:
+        if self._purge.due():
+            self.purge_expired()
+        now = monotonic()
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is not None and entry.expires_at > now:
+                record = entry.record
+                stale = record.status_code is None and entry.locked_until <= now
+                if not stale or record.request_hash != request_hash:
+                    return record
+                entry.locked_until = now + self._lease
+                return None
+            self._entries[(scope, key)] = _MemoryEntry(
+                IdempotencyRecord(request_hash=request_hash), now + self._ttl, now + self._lease
+            )
+            return None
+
+    def complete(self, scope: str, key: str, status_code: int, response_body: str) -> None:
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is not None:
+                entry.record = IdempotencyRecord(
+                    entry.record.request_hash, status_code, response_body
+                )
+
+    def release(self, scope: str, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is not None and entry.record.status_code is None:
+                del self._entries[(scope, key)]
+
+    def purge_expired(self) -> int:
+        """Borra llaves vencidas; devuelve cuantas."""
+        now = monotonic()
+        with self._lock:
+            expired = [slot for slot, entry in self._entries.items() if entry.expires_at <= now]
+            for slot in expired:
+                del self._entries[slot]
+        return len(expired)
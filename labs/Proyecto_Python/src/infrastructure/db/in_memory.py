@@ -0,0 +1,433 @@
+"""Repositorios y UnitOfWork en memoria (`PERSISTENCE_BACKEND=memory`).
+
+Sirven para micro-benchmarks de casos de uso y para levantar la API sin base de
+datos: el costo medido es solo Python (dominio, casos de uso, serializacion).
+
+Semantica transaccional parecida a la de SQL:
+
+- Cada request abre un `InMemoryUnitOfWork`; las escrituras quedan en un overlay
+  privado y solo ese UnitOfWork las ve hasta `commit()`.
+- `commit()` aplica el overlay y los deltas de rollups de forma atomica bajo el
+  lock del `InMemoryStore`; `rollback()` los descarta.
+- Email y SKU tienen indices unicos en el store; `commit()` los vuelve a validar
+  como lo haria la restriccion UNIQUE de la base.
+- Las entidades mutables (`Order`) se copian al escribir y al leer, asi un caso de
+  uso que muta la orden y luego hace rollback no altera lo confirmado.
+
+No hay aislamiento entre lecturas concurrentes (el ultimo commit gana), igual que
+READ COMMITTED sin locks de fila.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from threading import Lock
+from typing import Any
+from uuid import UUID
+
+from src.application.orders.dto import OrderDTO, OrderItemDTO
+from src.application.ports import (
+    BranchDaySales,
+    CustomerRepositoryPort,
+    InvoiceRecord,
+    InvoiceRepositoryPort,
+    OrderRepositoryPort,
+    OrderViewRepositoryPort,
+    ProductDaySales,
+    ProductRepositoryPort,
+    SalesRollupRepositoryPort,
+    UnitOfWorkPort,
+)
+from src.domain.customers.entities import Customer
+from src.domain.orders.entities import Order, OrderStatus
+from src.domain.products.entities import Product
+
+_ZERO = Decimal("0")
+
+BranchDayKey = tuple[str, date, OrderStatus]
+BranchDayTotals = tuple[int, Decimal, Decimal, Decimal, Decimal]
+ProductDayKey = tuple[UUID, date]
+ProductDayTotals = tuple[int, Decimal]
+
+
+def _copy_order(order: Order) -> Order:
+    """Copia con lista de items propia; `OrderItem` y `Customer` son inmutables."""
+    return replace(order, items=list(order.items))
+
+
+class InMemoryStore:
+    """Datos confirmados compartidos por todos los requests del proceso."""
+
+    def __init__(self) -> None:
+        self.customers: dict[UUID, Customer] = {}
+        self.products: dict[UUID, Product] = {}
+        self.customer_ids_by_email: dict[str, UUID] = {}
+        self.product_ids_by_sku: dict[str, UUID] = {}
+        self.orders: dict[UUID, Order] = {}
+        self.order_days: dict[UUID, date] = {}
+        self.invoices: dict[UUID, InvoiceRecord] = {}
+        self.branch_day_sales: dict[BranchDayKey, BranchDayTotals] = {}
+        self.product_day_sales: dict[ProductDayKey, ProductDayTotals] = {}
+        self.lock = Lock()
+
+
+class InMemoryUnitOfWork(UnitOfWorkPort):
+    """Overlay de escrituras por request sobre un `InMemoryStore`."""
+
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+        self.customers: dict[UUID, Customer] = {}
+        self.products: dict[UUID, Product] = {}
+        self.orders: dict[UUID, Order] = {}
+        self.order_days: dict[UUID, date] = {}
+        self.invoices: dict[UUID, InvoiceRecord] = {}
+        self.branch_deltas: list[tuple[BranchDayKey, BranchDayTotals]] = []
+        self.product_deltas: list[tuple[ProductDayKey, ProductDayTotals]] = []
+
+    @property
+    def store(self) -> InMemoryStore:
+        """Expone el store para construir repositorios en memoria."""
+        return self._store
+
+    def commit(self) -> None:
+        store = self._store
+        with store.lock:
+            self._check_unique(store)
+            store.customers.update(self.customers)
+            store.products.update(self.products)
+            for customer_id, customer in self.customers.items():
+                store.customer_ids_by_email[customer.email] = customer_id
+            for product_id, product in self.products.items():
+                store.product_ids_by_sku[product.sku] = product_id
+            store.orders.update(self.orders)
+            store.order_days.update(self.order_days)
+            store.invoices.update(self.invoices)
+            for branch_key, branch_delta in self.branch_deltas:
+                current = store.branch_day_sales.get(branch_key, (0, _ZERO, _ZERO, _ZERO, _ZERO))
+                store.branch_day_sales[branch_key] = (
+                    current[0] + branch_delta[0],
+                    current[1] + branch_delta[1],
+                    current[2] + branch_delta[2],
+                    current[3] + branch_delta[3],
+                    current[4] + branch_delta[4],
+                )
+            for product_key, product_delta in self.product_deltas:
+                quantity, subtotal = store.product_day_sales.get(product_key, (0, _ZERO))
+                store.product_day_sales[product_key] = (
+                    quantity + product_delta[0],
+                    subtotal + product_delta[1],
+                )
+        self.rollback()
+
+    def _check_unique(self, store: InMemoryStore) -> None:
+        """Valida ids, emails y SKUs contra lo confirmado por otros requests."""
+        for customer_id, customer in self.customers.items():
+            if customer_id in store.customers:
+                raise ValueError(f"Cliente duplicado: {customer_id}.")
+            if customer.email in store.customer_ids_by_email:
+                raise ValueError(f"Email de cliente duplicado: {customer.email}.")
+        for product_id, product in self.products.items():
+            if product_id in store.products:
+                raise ValueError(f"Producto duplicado: {product_id}.")
+            if product.sku in store.product_ids_by_sku:
+                raise ValueError(f"SKU duplicado: {product.sku}.")
+
+    def rollback(self) -> None:
+        self.customers.clear()
+        self.products.clear()
+        self.orders.clear()
+        self.order_days.clear()
+        self.invoices.clear()
+        self.branch_deltas.clear()
+        self.product_deltas.clear()
+
+    def close(self) -> None:
+        """Descarta escrituras no confirmadas (igual que cerrar una sesion)."""
+        self.rollback()
+
+
+def _merged_values(committed: dict[Any, Any], pending: dict[Any, Any]) -> Iterator[Any]:
+    """Valores confirmados mas pendientes, en orden de insercion (como `created_at`)."""
+    # `list(...)` copia de una vez: otro thread puede confirmar mientras se itera.
+    for key, value in list(committed.items()):
+        yield pending.get(key, value)
+    for key, value in pending.items():
+        if key not in committed:
+            yield value
+
+
+def _collection_version(items: list[Any], identity: Callable[[Any], UUID]) -> str:
+    """Conteo y ultimo id: equivalente en memoria a `count` y `max(created_at)`."""
+    return f"{len(items)}:{identity(items[-1]) if items else '-'}"
+
+
+class InMemoryCustomerRepository(CustomerRepositoryPort):
+    """Repositorio de clientes sobre el overlay del UnitOfWork."""
+
+    def __init__(self, unit_of_work: InMemoryUnitOfWork) -> None:
+        self._uow = unit_of_work
+        self._store = unit_of_work.store
+
+    def add(self, customer: Customer) -> None:
+        if self.get_by_id(customer.customer_id) is not None:
+            raise ValueError(f"Cliente duplicado: {customer.customer_id}.")
+        if self.get_by_email(customer.email) is not None:
+            raise ValueError(f"Email de cliente duplicado: {customer.email}.")
+        self._uow.customers[customer.customer_id] = customer
+
+    def get_by_id(self, customer_id: UUID) -> Customer | None:
+        return self._uow.customers.get(customer_id) or self._store.customers.get(customer_id)
+
+    def get_by_email(self, email: str) -> Customer | None:
+        normalized_email = email.strip().lower()
+        pending = next(
+            (
+                customer
+                for customer in self._uow.customers.values()
+                if customer.email == normalized_email
+            ),
+            None,
+        )
+        if pending is not None:
+            return pending
+        customer_id = self._store.customer_ids_by_email.get(normalized_email)
+        return self._store.customers.get(customer_id) if customer_id is not None else None
+
+    def list(self) -> list[Customer]:
+        return list(_merged_values(self._store.customers, self._uow.customers))
+
+    def list_version(self) -> str:
+        return _collection_version(self.list(), lambda customer: customer.customer_id)
+
+
+class InMemoryProductRepository(ProductRepositoryPort):
+    """Repositorio de productos sobre el overlay del UnitOfWork."""
+
+    def __init__(self, unit_of_work: InMemoryUnitOfWork) -> None:
+        self._uow = unit_of_work
+        self._store = unit_of_work.store
+
+    def add(self, product: Product) -> None:
+        if self.get_by_id(product.product_id) is not None:
+            raise ValueError(f"Producto duplicado: {product.product_id}.")
+        if self.get_by_sku(product.sku) is not None:
+            raise ValueError(f"SKU duplicado: {product.sku}.")
+        self._uow.products[product.product_id] = product
+
+    def get_by_id(self, product_id: UUID) -> Product | None:
+        return self._uow.products.get(product_id) or self._store.products.get(product_id)
+
+    def get_by_sku(self, sku: str) -> Product | None:
+        normalized_sku = sku.strip()
+        pending = next(
+            (product for product in self._uow.products.values() if product.sku == normalized_sku),
+            None,
+        )
+        if pending is not None:
+            return pending
+        product_id = self._store.product_ids_by_sku.get(normalized_sku)
+        return self._store.products.get(product_id) if product_id is not None else None
+
+    def list(self) -> list[Product]:
+        return list(_merged_values(self._store.products, self._uow.products))
+
+    def list_version(self) -> str:
+        return _collection_version(self.list(), lambda product: product.product_id)
+
+
+class InMemoryOrderRepository(OrderRepositoryPort):
+    """Repositorio de ordenes; guarda y entrega copias del agregado."""
+
+    def __init__(self, unit_of_work: InMemoryUnitOfWork) -> None:
+        self._uow = unit_of_work
+        self._store = unit_of_work.store
+
+    def add(self, order: Order) -> None:
+        if self._find(order.order_id) is not None:
+            raise ValueError(f"Orden duplicada: {order.order_id}.")
+        self._uow.orders[order.order_id] = _copy_order(order)
+        # Equivale al `created_at` del servidor: fija el dia de los rollups.
+        self._uow.order_days[order.order_id] = datetime.now(UTC).date()
+
+    def update(self, order: Order) -> None:
+        if self._find(order.order_id) is None:
+            raise LookupError(f"No existe orden para actualizar: {order.order_id}.")
+        self._uow.orders[order.order_id] = _copy_order(order)
+
+    def get_by_id(self, order_id: UUID) -> Order | None:
+        order = self._find(order_id)
+        return _copy_order(order) if order is not None else None
+
+    def list(self, status: OrderStatus | None = None) -> list[Order]:
+        return [
+            _copy_order(order)
+            for order in _merged_values(self._store.orders, self._uow.orders)
+            if status is None or order.status is status
+        ]
+
+    def get_version(self, order_id: UUID) -> str | None:
+        # Las transiciones de estado no tienen ciclos: el estado identifica la version.
+        order = self._find(order_id)
+        return order.status.value if order is not None else None
+
+    def _find(self, order_id: UUID) -> Order | None:
+        return self._uow.orders.get(order_id) or self._store.orders.get(order_id)
+
+
+def _to_order_view_dto(order: Order) -> OrderDTO:
+    """Proyeccion de una orden confirmada con la misma forma que `order_view`."""
+    return OrderDTO(
+        order_id=order.order_id,
+        customer_id=order.customer.customer_id,
+        customer_email=order.customer.email,
+        branch_id=order.branch_id,
+        status=order.status,
+        cancellation_reason=order.cancellation_reason,
+        items=tuple(
+            OrderItemDTO(
+                product_id=item.product_id,
+                product_name=item.product_name,
+                unit_price=item.unit_price,
+                quantity=item.quantity,
+                subtotal=item.subtotal,
+            )
+            for item in order.items
+        ),
+        shipping_cost=order.shipping_cost,
+        tax_rate=order.tax_rate,
+        subtotal=order.subtotal,
+        tax_total=order.tax_total,
+        total=order.total,
+    )
+
+
+class InMemoryOrderViewRepository(OrderViewRepositoryPort):
+    """Read model en memoria: proyecta las ordenes confirmadas al leer, sin lag."""
+
+    def __init__(self, store: InMemoryStore) -> None:
+        self._store = store
+
+    def get_by_id(self, order_id: UUID) -> OrderDTO | None:
+        order = self._store.orders.get(order_id)
+        return _to_order_view_dto(order) if order is not None else None
+
+    def list(self, status: OrderStatus | None = None) -> list[OrderDTO]:
+        return [
+            _to_order_view_dto(order)
+            for order in list(self._store.orders.values())
+            if status is None or order.status is status
+        ]
+
+
+class InMemoryInvoiceRepository(InvoiceRepositoryPort):
+    """Registros de facturas externas en memoria."""
+
+    def __init__(self, unit_of_work: InMemoryUnitOfWork) -> None:
+        self._uow = unit_of_work
+        self._store = unit_of_work.store
+
+    def add(self, record: InvoiceRecord) -> None:
+        if self.get_by_order_id(record.order_id) is not None:
+            raise ValueError(f"Factura duplicada para la orden: {record.order_id}.")
+        self._uow.invoices[record.order_id] = record
+
+    def get_by_order_id(self, order_id: UUID) -> InvoiceRecord | None:
+        return self._uow.invoices.get(order_id) or self._store.invoices.get(order_id)
+
+
+class InMemorySalesRollupRepository(SalesRollupRepositoryPort):
+    """Rollups de ventas como deltas que se suman al confirmar el UnitOfWork."""
+
+    def __init__(self, unit_of_work: InMemoryUnitOfWork) -> None:
+        self._uow = unit_of_work
+        self._store = unit_of_work.store
+
+    def record_order_created(self, order: Order) -> None:
+        day = self._order_day(order.order_id)
+        self._add_branch_deltas(order, day, [(order.status, 1)])
+        if order.status is not OrderStatus.CANCELLED:
+            self._add_product_deltas(order, day, sign=1)
+
+    def record_status_changed(self, order: Order, previous_status: OrderStatus) -> None:
+        if previous_status is order.status:
+            return
+        day = self._order_day(order.order_id)
+        self._add_branch_deltas(order, day, [(previous_status, -1), (order.status, 1)])
+        if order.status is OrderStatus.CANCELLED:
+            self._add_product_deltas(order, day, sign=-1)
+
+    def list_branch_day_sales(
+        self,
+        date_from: date,
+        date_to: date,
+        branch_id: str | None = None,
+        status: OrderStatus | None = None,
+    ) -> list[BranchDaySales]:
+        rows = [
+            BranchDaySales(
+                branch_id=row_branch,
+                day=day,
+                status=row_status,
+                order_count=totals[0],
+                subtotal=totals[1],
+                tax_total=totals[2],
+                shipping_cost=totals[3],
+                total=totals[4],
+            )
+            for (row_branch, day, row_status), totals in list(self._store.branch_day_sales.items())
+            if date_from <= day <= date_to
+            and totals[0] != 0
+            and (branch_id is None or row_branch == branch_id)
+            and (status is None or row_status is status)
+        ]
+        return sorted(rows, key=lambda row: (row.day, row.branch_id, row.status.value))
+
+    def list_product_day_sales(
+        self,
+        date_from: date,
+        date_to: date,
+        product_id: UUID | None = None,
+    ) -> list[ProductDaySales]:
+        rows = [
+            ProductDaySales(product_id=row_product, day=day, quantity=quantity, subtotal=subtotal)
+            for (row_product, day), (quantity, subtotal) in list(
+                self._store.product_day_sales.items()
+            )
+            if date_from <= day <= date_to
+            and quantity != 0
+            and (product_id is None or row_product == product_id)
+        ]
+        return sorted(rows, key=lambda row: (row.day, row.product_id))
+
+    def _order_day(self, order_id: UUID) -> date:
+        """Dia de alta de la orden (pendiente en este UnitOfWork o ya confirmada)."""
+        day = self._uow.order_days.get(order_id) or self._store.order_days.get(order_id)
+        if day is None:
+            raise LookupError(f"No existe orden para rollup: {order_id}.")
+        return day
+
+    def _add_branch_deltas(
+        self, order: Order, day: date, deltas: list[tuple[OrderStatus, int]]
+    ) -> None:
+        for status, sign in deltas:
+            self._uow.branch_deltas.append(
+                (
+                    (order.branch_id, day, status),
+                    (
+                        sign,
+                        order.subtotal * sign,
+                        order.tax_total * sign,
+                        order.shipping_cost * sign,
+                        order.total * sign,
+                    ),
+                )
+            )
+
+    def _add_product_deltas(self, order: Order, day: date, sign: int) -> None:
+        for item in order.items:
+            self._uow.product_deltas.append(
+                ((item.product_id, day), (item.quantity * sign, item.subtotal * sign))
+            )
@@ -0,0 +1,100 @@
+"""Conteo de queries SQL por request y presupuestos de queries.
+
+Los hooks `before_cursor_execute`/`after_cursor_execute` del engine suman cada
+query al `RequestMetrics` del request en curso. Con eso un N+1 (una query por
+linea de la orden, por ejemplo) se ve en el header `Server-Timing` y en el log
+`request_completed` antes de llegar a produccion.
+
+Para pruebas:
+
+    with query_budget(3):
+        use_case.execute(command)
+
+    assert_response_query_budget(response.headers, 3)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.common.request_metrics import (
+    RequestMetrics,
+    bind_request_metrics,
+    record_query,
+    reset_request_metrics,
+)
+
+_QUERY_START_KEY = "dc_query_start"
+_SERVER_TIMING_QUERIES = re.compile(r'(?:^|,)\s*db;[^,]*desc="queries=(\d+)"')
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Se ejecutaron mas queries que las permitidas."""
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Registra los hooks de conteo en el engine sincrono subyacente."""
+    sync_engine: Engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        connection: Any, _cursor: Any, _statement: Any, _parameters: Any, _context: Any, _many: Any
+    ) -> None:
+        # Pila por conexion: un executemany o una query anidada no pisa el inicio previo.
+        connection.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        connection: Any, _cursor: Any, _statement: Any, _parameters: Any, _context: Any, _many: Any
+    ) -> None:
+        starts = connection.info.get(_QUERY_START_KEY)
+        if starts:
+            record_query(perf_counter() - starts.pop())
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[RequestMetrics]:
+    """Cuenta queries del bloque y falla si superan `max_queries`.
+
+    Sirve para casos de uso y repositorios sin HTTP; el engine debe estar instrumentado
+    (`build_async_engine` ya lo hace).
+    """
+    metrics = RequestMetrics()
+    token = bind_request_metrics(metrics)
+    try:
+        yield metrics
+    finally:
+        reset_request_metrics(token)
+    if metrics.db_queries > max_queries:
+        raise QueryBudgetExceededError(
+            f"Se ejecutaron {metrics.db_queries} queries; presupuesto {max_queries}."
+        )
+
+
+def server_timing_queries(headers: Mapping[str, str]) -> int | None:
+    """Numero de queries del header `Server-Timing`, o None si no viene."""
+    raw = headers.get("server-timing") or headers.get("Server-Timing")
+    if raw is None:
+        return None
+    match = _SERVER_TIMING_QUERIES.search(raw)
+    return int(match.group(1)) if match else None
+
+
+def assert_response_query_budget(headers: Mapping[str, str], max_queries: int) -> int:
+    """Verifica el presupuesto de un endpoint con su `Server-Timing`; devuelve el conteo."""
+    queries = server_timing_queries(headers)
+    if queries is None:
+        raise QueryBudgetExceededError("La respuesta no trae conteo de queries en Server-Timing.")
+    if queries > max_queries:
+        raise QueryBudgetExceededError(
+            f"El endpoint ejecuto {queries} queries; presupuesto {max_queries}."
+        )
+    return queries
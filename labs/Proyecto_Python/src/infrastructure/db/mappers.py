@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
+from uuid import UUID
+
+from src.application.orders.dto import OrderDTO, OrderItemDTO
 from src.application.ports import InvoiceRecord
 from src.domain.customers.entities import Customer
 from src.domain.orders.entities import Order, OrderItem, OrderStatus
 from src.domain.products.entities import Product
 
-from .models import CustomerModel, InvoiceRecordModel, OrderItemModel, OrderModel, ProductModel
+from .models import (
+    CustomerModel,
+    InvoiceRecordModel,
+    OrderItemModel,
+    OrderModel,
+    OrderViewModel,
+    ProductModel,
+)
 
 
 def to_customer_model(customer: Customer) -> CustomerModel:
@@ -117,3 +128,30 @@ def to_invoice_record_domain(model: InvoiceRecordModel) -> InvoiceRecord:
         external_invoice_id=model.external_invoice_id,
         total_amount=model.total_amount,
     )
+
+
+def to_order_view_dto(model: OrderViewModel) -> OrderDTO:
+    """Convierte fila del read model a DTO sin reconstruir el agregado."""
+    return OrderDTO(
+        order_id=model.order_id,
+        customer_id=model.customer_id,
+        customer_email=model.customer_email,
+        branch_id=model.branch_id,
+        status=OrderStatus(model.status),
+        cancellation_reason=model.cancellation_reason,
+        items=tuple(
+            OrderItemDTO(
+                product_id=UUID(item["product_id"]),
+                product_name=item["product_name"],
+                unit_price=Decimal(item["unit_price"]),
+                quantity=int(item["quantity"]),
+                subtotal=Decimal(item["subtotal"]),
+            )
+            for item in model.items
+        ),
+        shipping_cost=model.shipping_cost,
+        tax_rate=model.tax_rate,
+        subtotal=model.subtotal,
+        tax_total=model.tax_total,
+        total=model.total,
+    )
@@ -0,0 +1,146 @@
+"""Reconstruccion de rollups y `order_view` despues de cargas masivas.
+
+Los casos de uso mantienen `sales_branch_day`, `sales_product_day` y (via eventos)
+`order_view`; las cargas masivas (`seed_from_csv`, `src.etl.load_postgres`)
+escriben directo en las tablas transaccionales y deben llamar a
+`rebuild_read_models` dentro de su misma transaccion.
+
+Los rollups se recalculan completos desde `orders` + `order_items` con el mismo
+redondeo del dominio (half-up a 2 decimales). En `order_view` solo se agregan
+las ordenes que faltan: las filas ya proyectadas son del consumidor.
+Pensado para cargas sin trafico de la API en paralelo.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import asyncpg  # type: ignore[import-untyped]
+
+# Totales por orden con la misma formula que `Order.subtotal/tax_total/total`.
+_ORDER_TOTALS_CTE = """
+WITH order_subtotals AS (
+    SELECT
+        o.order_id,
+        o.branch_id,
+        o.status,
+        (o.created_at AT TIME ZONE 'UTC')::date AS day,
+        o.shipping_cost,
+        ROUND(COALESCE(SUM(ROUND(i.unit_price * i.quantity, 2)), 0), 2) AS subtotal,
+        o.tax_rate
+    FROM orders AS o
+    LEFT JOIN order_items AS i ON i.order_id = o.order_id
+    GROUP BY o.order_id
+),
+order_totals AS (
+    SELECT *, ROUND(subtotal * tax_rate, 2) AS tax_total
+    FROM order_subtotals
+)
+"""
+
+_REBUILD_BRANCH_DAY = (
+    _ORDER_TOTALS_CTE
+    + """
+INSERT INTO sales_branch_day (
+    branch_id, day, status, order_count, subtotal, tax_total, shipping_cost, total
+)
+SELECT
+    branch_id,
+    day,
+    status,
+    COUNT(*),
+    SUM(subtotal),
+    SUM(tax_total),
+    SUM(shipping_cost),
+    SUM(subtotal + tax_total + shipping_cost)
+FROM order_totals
+GROUP BY branch_id, day, status
+"""
+)
+
+_REBUILD_PRODUCT_DAY = """
+INSERT INTO sales_product_day (product_id, day, quantity, subtotal)
+SELECT
+    i.product_id,
+    (o.created_at AT TIME ZONE 'UTC')::date,
+    SUM(i.quantity),
+    SUM(ROUND(i.unit_price * i.quantity, 2))
+FROM order_items AS i
+JOIN orders AS o ON o.order_id = i.order_id
+WHERE o.status <> 'CANCELLED'
+GROUP BY 1, 2
+"""
+
+# Mismo formato de `items` que el payload de `orders.created.v1`.
+_INSERT_MISSING_ORDER_VIEW = (
+    _ORDER_TOTALS_CTE
+    + """
+INSERT INTO order_view (
+    order_id, customer_id, customer_email, branch_id, status, cancellation_reason,
+    item_count, items, shipping_cost, tax_rate, subtotal, tax_total, total
+)
+SELECT
+    t.order_id,
+    o.customer_id,
+    c.email,
+    t.branch_id,
+    t.status,
+    o.cancellation_reason,
+    COUNT(i.line_number),
+    COALESCE(
+        json_agg(
+            json_build_object(
+                'product_id', i.product_id::text,
+                'product_name', i.product_name,
+                'unit_price', i.unit_price::text,
+                'quantity', i.quantity,
+                'subtotal', ROUND(i.unit_price * i.quantity, 2)::text
+            )
+            ORDER BY i.line_number
+        ) FILTER (WHERE i.line_number IS NOT NULL),
+        '[]'::json
+    ),
+    t.shipping_cost,
+    t.tax_rate,
+    t.subtotal,
+    t.tax_total,
+    t.subtotal + t.tax_total + t.shipping_cost
+FROM order_totals AS t
+JOIN orders AS o ON o.order_id = t.order_id
+JOIN customers AS c ON c.customer_id = o.customer_id
+LEFT JOIN order_items AS i ON i.order_id = t.order_id
+WHERE NOT EXISTS (SELECT 1 FROM order_view AS v WHERE v.order_id = t.order_id)
+GROUP BY
+    t.order_id, o.customer_id, c.email, t.branch_id, t.status, o.cancellation_reason,
+    t.shipping_cost, t.tax_rate, t.subtotal, t.tax_total
+ON CONFLICT (order_id) DO NOTHING
+"""
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ReadModelRebuildResult:
+    """Filas escritas por la reconstruccion."""
+
+    branch_day_rows: int
+    product_day_rows: int
+    order_view_inserted: int
+
+
+def _affected_rows(status: str) -> int:
+    """Conteo de un status de asyncpg como `INSERT 0 42`."""
+    return int(status.rsplit(" ", 1)[-1])
+
+
+async def rebuild_read_models(connection: asyncpg.Connection) -> ReadModelRebuildResult:
+    """Recalcula rollups y completa `order_view` en la transaccion abierta."""
+    await connection.execute("DELETE FROM sales_branch_day")
+    branch_status = await connection.execute(_REBUILD_BRANCH_DAY)
+    await connection.execute("DELETE FROM sales_product_day")
+    product_status = await connection.execute(_REBUILD_PRODUCT_DAY)
+    view_status = await connection.execute(_INSERT_MISSING_ORDER_VIEW)
+    return ReadModelRebuildResult(
+        branch_day_rows=_affected_rows(branch_status),
+        product_day_rows=_affected_rows(product_status),
+        order_view_inserted=_affected_rows(view_status),
+    )
@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.application.orders.dto import OrderDTO
 from src.application.ports import (
+    BranchDaySales,
     CustomerRepositoryPort,
     InvoiceRecord,
     InvoiceRepositoryPort,
     OrderRepositoryPort,
+    OrderViewRepositoryPort,
+    ProductDaySales,
     ProductRepositoryPort,
+    SalesRollupRepositoryPort,
 )
 from src.domain.customers.entities import Customer
 from src.domain.orders.entities import Order, OrderStatus
@@ -27,10 +35,36 @@ from .mappers import (
     to_invoice_record_model,
     to_order_domain,
     to_order_model,
+    to_order_view_dto,
     to_product_domain,
     to_product_model,
 )
-from .models import CustomerModel, InvoiceRecordModel, OrderItemModel, OrderModel, ProductModel
+from .models import (
+    CustomerModel,
+    InvoiceRecordModel,
+    OrderItemModel,
+    OrderModel,
+    OrderViewModel,
+    ProductModel,
+    SalesBranchDayModel,
+    SalesProductDayModel,
+)
+from .upserts import dialect_insert
+
+# Llave en `session.info`: dia de alta de las ordenes tocadas en la transaccion.
+_ORDER_DAYS_KEY = "order_days"
+
+
+def _utc_day(created_at: datetime) -> date:
+    """Dia UTC; SQLite devuelve datetimes sin zona y CURRENT_TIMESTAMP ya esta en UTC."""
+    if created_at.tzinfo is None:
+        return created_at.date()
+    return created_at.astimezone(UTC).date()
+
+
+def _remember_order_day(session: AsyncSession, order_id: UUID, created_at: datetime) -> None:
+    """Deja el dia de alta en la sesion para que los rollups no lo vuelvan a leer."""
+    session.info.setdefault(_ORDER_DAYS_KEY, {})[order_id] = _utc_day(created_at)
 
 
 class SqlAlchemyCustomerRepository(CustomerRepositoryPort):
@@ -73,6 +107,12 @@ class SqlAlchemyCustomerRepository(CustomerRepositoryPort):
         models = result.scalars().all()
         return [to_customer_domain(model) for model in models]
 
+    def list_version(self) -> str:
+        # Clientes no se editan ni borran: conteo y ultimo alta bastan como version.
+        statement = select(func.count(), func.max(CustomerModel.created_at))
+        count, last_created_at = run_sync(self._session.execute(statement)).one()
+        return f"{count}:{last_created_at}"
+
 
 class SqlAlchemyProductRepository(ProductRepositoryPort):
     """Repositorio concreto de productos."""
@@ -114,6 +154,11 @@ class SqlAlchemyProductRepository(ProductRepositoryPort):
         models = result.scalars().all()
         return [to_product_domain(model) for model in models]
 
+    def list_version(self) -> str:
+        statement = select(func.count(), func.max(ProductModel.created_at))
+        count, last_created_at = run_sync(self._session.execute(statement)).one()
+        return f"{count}:{last_created_at}"
+
 
 class SqlAlchemyOrderRepository(OrderRepositoryPort):
     """Repositorio concreto de ordenes."""
@@ -123,11 +168,13 @@ class SqlAlchemyOrderRepository(OrderRepositoryPort):
 
     def add(self, order: Order) -> None:
         model = to_order_model(order)
+        model.created_at = datetime.now(UTC)
         self._session.add(model)
         run_sync(self._session.flush())
+        _remember_order_day(self._session, order.order_id, model.created_at)
 
     def update(self, order: Order) -> None:
-        statement: Select[tuple[OrderModel]] = (
+        statement = (
             select(OrderModel)
             .options(selectinload(OrderModel.customer), selectinload(OrderModel.items))
             .where(OrderModel.order_id == order.order_id)
@@ -136,6 +183,7 @@ class SqlAlchemyOrderRepository(OrderRepositoryPort):
         existing = result.scalar_one_or_none()
         if existing is None:
             raise LookupError(f"No existe orden para actualizar: {order.order_id}.")
+        _remember_order_day(self._session, order.order_id, existing.created_at)
 
         existing.branch_id = order.branch_id
         existing.shipping_cost = order.shipping_cost
@@ -180,6 +228,39 @@ class SqlAlchemyOrderRepository(OrderRepositoryPort):
         models = result.scalars().all()
         return [to_order_domain(model) for model in models]
 
+    def get_version(self, order_id: UUID) -> str | None:
+        # `updated_at` de SQLite tiene resolucion de segundos; el estado (que nunca
+        # regresa a uno previo) distingue dos cambios en el mismo segundo.
+        statement = select(OrderModel.status, OrderModel.updated_at).where(
+            OrderModel.order_id == order_id
+        )
+        row = run_sync(self._session.execute(statement)).one_or_none()
+        if row is None:
+            return None
+        return f"{row.status}:{row.updated_at}"
+
+
+class SqlAlchemyOrderViewRepository(OrderViewRepositoryPort):
+    """Lectura del read model `order_view`: una fila por orden, sin joins."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def get_by_id(self, order_id: UUID) -> OrderDTO | None:
+        model = run_sync(self._session.get(OrderViewModel, order_id))
+        if model is None:
+            return None
+        return to_order_view_dto(model)
+
+    def list(self, status: OrderStatus | None = None) -> list[OrderDTO]:
+        statement = select(OrderViewModel)
+        if status is not None:
+            statement = statement.where(OrderViewModel.status == status.value)
+        result = run_sync(
+            self._session.execute(statement.order_by(OrderViewModel.projected_at.asc()))
+        )
+        return [to_order_view_dto(model) for model in result.scalars().all()]
+
 
 class SqlAlchemyInvoiceRepository(InvoiceRepositoryPort):
     """Repositorio concreto de registros de facturas externas."""
@@ -201,3 +282,158 @@ class SqlAlchemyInvoiceRepository(InvoiceRepositoryPort):
         if model is None:
             return None
         return to_invoice_record_domain(model)
+
+
+class SqlAlchemySalesRollupRepository(SalesRollupRepositoryPort):
+    """Rollups de ventas con upserts aditivos (`ON CONFLICT DO UPDATE SET x = x + ...`).
+
+    Los upserts son atomicos por fila, asi que requests concurrentes no pierden
+    incrementos aunque escriban el mismo bucket.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def record_order_created(self, order: Order) -> None:
+        day = self._order_day(order.order_id)
+        self._upsert_branch_day(order, day, [(order.status, 1)])
+        if order.status is not OrderStatus.CANCELLED:
+            self._upsert_product_day(order, day, sign=1)
+
+    def record_status_changed(self, order: Order, previous_status: OrderStatus) -> None:
+        if previous_status is order.status:
+            return
+        day = self._order_day(order.order_id)
+        self._upsert_branch_day(order, day, [(previous_status, -1), (order.status, 1)])
+        if order.status is OrderStatus.CANCELLED:
+            self._upsert_product_day(order, day, sign=-1)
+
+    def list_branch_day_sales(
+        self,
+        date_from: date,
+        date_to: date,
+        branch_id: str | None = None,
+        status: OrderStatus | None = None,
+    ) -> list[BranchDaySales]:
+        statement = select(SalesBranchDayModel).where(
+            SalesBranchDayModel.day.between(date_from, date_to),
+            SalesBranchDayModel.order_count != 0,
+        )
+        if branch_id is not None:
+            statement = statement.where(SalesBranchDayModel.branch_id == branch_id)
+        if status is not None:
+            statement = statement.where(SalesBranchDayModel.status == status.value)
+        statement = statement.order_by(
+            SalesBranchDayModel.day, SalesBranchDayModel.branch_id, SalesBranchDayModel.status
+        )
+        result = run_sync(self._session.execute(statement))
+        return [
+            BranchDaySales(
+                branch_id=model.branch_id,
+                day=model.day,
+                status=OrderStatus(model.status),
+                order_count=model.order_count,
+                subtotal=model.subtotal,
+                tax_total=model.tax_total,
+                shipping_cost=model.shipping_cost,
+                total=model.total,
+            )
+            for model in result.scalars().all()
+        ]
+
+    def list_product_day_sales(
+        self,
+        date_from: date,
+        date_to: date,
+        product_id: UUID | None = None,
+    ) -> list[ProductDaySales]:
+        statement = select(SalesProductDayModel).where(
+            SalesProductDayModel.day.between(date_from, date_to),
+            SalesProductDayModel.quantity != 0,
+        )
+        if product_id is not None:
+            statement = statement.where(SalesProductDayModel.product_id == product_id)
+        statement = statement.order_by(SalesProductDayModel.day, SalesProductDayModel.product_id)
+        result = run_sync(self._session.execute(statement))
+        return [
+            ProductDaySales(
+                product_id=model.product_id,
+                day=model.day,
+                quantity=model.quantity,
+                subtotal=model.subtotal,
+            )
+            for model in result.scalars().all()
+        ]
+
+    def _order_day(self, order_id: UUID) -> date:
+        """Dia UTC de alta que dejo el repositorio de ordenes; si falta, se consulta."""
+        day: date | None = self._session.info.get(_ORDER_DAYS_KEY, {}).get(order_id)
+        if day is not None:
+            return day
+        created_at = run_sync(
+            self._session.scalar(
+                select(OrderModel.created_at).where(OrderModel.order_id == order_id)
+            )
+        )
+        if created_at is None:
+            raise LookupError(f"No existe orden para rollup: {order_id}.")
+        return _utc_day(created_at)
+
+    def _upsert_branch_day(
+        self, order: Order, day: date, deltas: Sequence[tuple[OrderStatus, int]]
+    ) -> None:
+        """Suma (o resta con signo -1) la orden en cada bucket de estado."""
+        values = [
+            {
+                "branch_id": order.branch_id,
+                "day": day,
+                "status": status.value,
+                "order_count": sign,
+                "subtotal": order.subtotal * sign,
+                "tax_total": order.tax_total * sign,
+                "shipping_cost": order.shipping_cost * sign,
+                "total": order.total * sign,
+            }
+            for status, sign in deltas
+        ]
+        statement = dialect_insert(self._session, SalesBranchDayModel).values(values)
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=["branch_id", "day", "status"],
+            set_={
+                "order_count": SalesBranchDayModel.order_count + excluded.order_count,
+                "subtotal": SalesBranchDayModel.subtotal + excluded.subtotal,
+                "tax_total": SalesBranchDayModel.tax_total + excluded.tax_total,
+                "shipping_cost": SalesBranchDayModel.shipping_cost + excluded.shipping_cost,
+                "total": SalesBranchDayModel.total + excluded.total,
+            },
+        )
+        run_sync(self._session.execute(statement))
+
+    def _upsert_product_day(self, order: Order, day: date, sign: int) -> None:
+        """Suma (o resta) unidades e importe por producto de la orden."""
+        per_product: dict[UUID, tuple[int, Decimal]] = {}
+        for item in order.items:
+            quantity, subtotal = per_product.get(item.product_id, (0, Decimal("0")))
+            # Un mismo producto puede repetirse en varias lineas: un solo upsert por llave.
+            per_product[item.product_id] = (quantity + item.quantity, subtotal + item.subtotal)
+        statement = dialect_insert(self._session, SalesProductDayModel).values(
+            [
+                {
+                    "product_id": product_id,
+                    "day": day,
+                    "quantity": quantity * sign,
+                    "subtotal": subtotal * sign,
+                }
+                for product_id, (quantity, subtotal) in per_product.items()
+            ]
+        )
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=["product_id", "day"],
+            set_={
+                "quantity": SalesProductDayModel.quantity + excluded.quantity,
+                "subtotal": SalesProductDayModel.subtotal + excluded.subtotal,
+            },
+        )
+        run_sync(self._session.execute(statement))
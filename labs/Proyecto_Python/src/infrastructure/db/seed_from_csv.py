@@ -1,4 +1,7 @@
-"""Carga datos semilla CSV hacia PostgreSQL transaccional."""
+"""Carga datos semilla CSV hacia PostgreSQL transaccional.
+
+Al final reconstruye rollups y `order_view` en la misma transaccion.
+"""
 
 from __future__ import annotations
 
@@ -13,6 +16,8 @@ import asyncpg  # type: ignore[import-untyped]
 
 from src.infrastructure.settings import InfrastructureSettings
 
+from .read_models import rebuild_read_models
+
 
 @dataclass(frozen=True, slots=True)
 class CustomerSeedRow:
@@ -90,7 +95,7 @@ class SeedResult:
     inserted_invoices: int
 
 
-def _to_asyncpg_dsn(database_url: str) -> str:
+def to_asyncpg_dsn(database_url: str) -> str:
     """Convierte URL SQLAlchemy a formato que entiende asyncpg."""
     if database_url.startswith("postgresql+asyncpg://"):
         return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
@@ -338,7 +343,7 @@ async def _insert_invoices(connection: asyncpg.Connection, invoices: tuple[Invoi
 async def seed_database(database_url: str, seed_dir: Path) -> SeedResult:
     """Carga CSV seed en PostgreSQL dentro de una transaccion."""
     dataset = load_seed_dataset(seed_dir)
-    dsn = _to_asyncpg_dsn(database_url)
+    dsn = to_asyncpg_dsn(database_url)
     connection = await asyncpg.connect(dsn=dsn)
     try:
         async with connection.transaction():
@@ -348,6 +353,7 @@ async def seed_database(database_url: str, seed_dir: Path) -> SeedResult:
             inserted_orders = await _insert_orders(connection, dataset.orders)
             inserted_order_items = await _insert_order_items(connection, dataset.order_items)
             inserted_invoices = await _insert_invoices(connection, dataset.invoices)
+            await rebuild_read_models(connection)
     finally:
         await connection.close()
     return SeedResult(
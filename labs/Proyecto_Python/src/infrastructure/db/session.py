@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
+from typing import Any
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -11,14 +15,53 @@ from sqlalchemy.ext.asyncio import (
 
 from src.infrastructure.settings import InfrastructureSettings
 
+from . import models  # noqa: F401 - requerido para metadata.
+from .base import Base
+from .instrumentation import instrument_engine
+
+
+def resolve_database_url(settings: InfrastructureSettings) -> str:
+    """URL efectiva: `DATABASE_URL`, o `SQLITE_PATH` si `PERSISTENCE_BACKEND=sqlite`."""
+    if settings.persistence_backend == "sqlite":
+        return f"sqlite+aiosqlite:///{settings.sqlite_path}"
+    return settings.database_url
+
 
 def build_async_engine(settings: InfrastructureSettings) -> AsyncEngine:
-    """Construye engine async para PostgreSQL."""
-    return create_async_engine(
-        settings.database_url,
-        echo=settings.database_echo,
-        pool_pre_ping=True,
-    )
+    """Construye engine async para PostgreSQL (asyncpg) o SQLite (aiosqlite)."""
+    database_url = resolve_database_url(settings)
+    if not database_url.startswith("sqlite"):
+        engine = create_async_engine(
+            database_url,
+            echo=settings.database_echo,
+            pool_pre_ping=True,
+        )
+        instrument_engine(engine)
+        return engine
+
+    if find_spec("aiosqlite") is None:
+        raise RuntimeError(
+            "PERSISTENCE_BACKEND=sqlite requiere `aiosqlite` (poetry install --extras sqlite)."
+        )
+    engine = create_async_engine(database_url, echo=settings.database_echo)
+    instrument_engine(engine)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite(dbapi_connection: Any, _connection_record: Any) -> None:
+        # WAL deja leer mientras otra conexion escribe (sigue habiendo un solo escritor).
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    return engine
+
+
+async def create_sqlite_schema(engine: AsyncEngine) -> None:
+    """Crea tablas desde los modelos; las migraciones Alembic apuntan a PostgreSQL."""
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
 
 
 def build_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
@@ -0,0 +1,215 @@
+"""Log de queries lentas con captura opcional del plan (`SLOW_QUERY_LOG_ENABLED`).
+
+Cada statement que supera el umbral se guarda con parametros, ruta y request id
+en un anillo acotado en memoria (`GET /admin/slow-queries`). Una fraccion
+(`SLOW_QUERY_EXPLAIN_SAMPLE_RATE`) se re-ejecuta con EXPLAIN en una conexion
+aparte del pool para adjuntar el plan, sin pedir acceso de superusuario a la DB:
+
+- PostgreSQL: `EXPLAIN (ANALYZE, BUFFERS)` solo para SELECT/WITH; para escrituras
+  `EXPLAIN` sin ANALYZE, porque ANALYZE ejecuta el statement. Todo dentro de una
+  transaccion que siempre se revierte.
+- SQLite: `EXPLAIN QUERY PLAN`.
+
+El EXPLAIN corre aparte en el loop de `run_sync` con un contexto vacio: no
+retrasa el request ni suma a su conteo de queries. Solo hay uno en vuelo a la vez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import random
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.common.request_context import get_request_id, get_request_route
+from src.infrastructure.settings import InfrastructureSettings
+
+_QUERY_START_KEY = "dc_slow_query_start"
+_MAX_PARAMETERS_CHARS = 500
+_EXPLAIN_PREFIXES = ("EXPLAIN", "PRAGMA")
+
+logger = logging.getLogger("distrito_chilaquil.slow_queries")
+# El loop solo guarda referencias debiles a sus tareas; aqui se retienen hasta terminar.
+_explain_tasks: set[asyncio.Task[None]] = set()
+
+
+@dataclass(frozen=True, slots=True)
+class SlowQuery:
+    """Statement lento observado, con el plan si fue muestreado."""
+
+    statement: str
+    parameters: str
+    duration_ms: float
+    captured_at: datetime
+    route: str | None = None
+    request_id: str | None = None
+    executemany: bool = False
+    plan: str | None = None
+    plan_error: str | None = None
+
+
+class SlowQueryLog:
+    """Anillo acotado y seguro entre threads de queries lentas."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        capacity: int = 100,
+        explain_sample_rate: float = 0.0,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity debe ser mayor a 0.")
+        if not 0.0 <= explain_sample_rate <= 1.0:
+            raise ValueError("explain_sample_rate debe estar entre 0 y 1.")
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self._entries: deque[SlowQuery] = deque(maxlen=capacity)
+        self._lock = Lock()
+        self._explain_in_flight = False
+
+    def record(self, entry: SlowQuery) -> None:
+        """Guarda una entrada; la mas vieja sale si el anillo esta lleno."""
+        with self._lock:
+            self._entries.append(entry)
+
+    def snapshot(self) -> list[SlowQuery]:
+        """Entradas de la mas reciente a la mas vieja."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        """Vacia el anillo."""
+        with self._lock:
+            self._entries.clear()
+
+    def try_reserve_explain(self) -> bool:
+        """Decide si esta query se explica (muestreo y un EXPLAIN en vuelo)."""
+        if self.explain_sample_rate <= 0 or random.random() >= self.explain_sample_rate:
+            return False
+        with self._lock:
+            if self._explain_in_flight:
+                return False
+            self._explain_in_flight = True
+            return True
+
+    def release_explain(self) -> None:
+        """Libera el turno de EXPLAIN."""
+        with self._lock:
+            self._explain_in_flight = False
+
+
+def _format_parameters(parameters: Any) -> str:
+    text = repr(parameters)
+    if len(text) > _MAX_PARAMETERS_CHARS:
+        return text[:_MAX_PARAMETERS_CHARS] + "..."
+    return text
+
+
+def _explain_statement(dialect_name: str, statement: str) -> str | None:
+    """Statement EXPLAIN para el dialecto, o None si no aplica."""
+    if dialect_name == "sqlite":
+        return f"EXPLAIN QUERY PLAN {statement}"
+    if dialect_name == "postgresql":
+        is_read = statement.lstrip().upper().startswith(("SELECT", "WITH"))
+        prefix = "EXPLAIN (ANALYZE, BUFFERS)" if is_read else "EXPLAIN"
+        return f"{prefix} {statement}"
+    return None
+
+
+async def _explain(
+    engine: AsyncEngine, slow_log: SlowQueryLog, entry: SlowQuery, parameters: Any
+) -> None:
+    """Corre EXPLAIN en otra conexion y guarda la entrada con el plan."""
+    try:
+        explain_sql = _explain_statement(engine.dialect.name, entry.statement)
+        if explain_sql is None:
+            entry = replace(entry, plan_error=f"EXPLAIN no soportado en {engine.dialect.name}.")
+            return
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                result = await connection.exec_driver_sql(explain_sql, parameters)
+                rows = result.fetchall()
+            finally:
+                await transaction.rollback()
+        plan = "\n".join(" | ".join(str(value) for value in row) for row in rows)
+        entry = replace(entry, plan=plan)
+    except Exception as exc:  # noqa: BLE001 - el diagnostico nunca debe tumbar la app.
+        entry = replace(entry, plan_error=f"{type(exc).__name__}: {exc!s}")
+    finally:
+        slow_log.record(entry)
+        slow_log.release_explain()
+
+
+def install_slow_query_log(engine: AsyncEngine, slow_log: SlowQueryLog) -> None:
+    """Registra los hooks de deteccion en el engine."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        connection: Any, _cursor: Any, _statement: Any, _parameters: Any, _context: Any, _many: Any
+    ) -> None:
+        connection.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        connection: Any, _cursor: Any, statement: str, parameters: Any, _context: Any, many: bool
+    ) -> None:
+        starts = connection.info.get(_QUERY_START_KEY)
+        if not starts:
+            return
+        duration_ms = (perf_counter() - starts.pop()) * 1000
+        if duration_ms < slow_log.threshold_ms or statement.lstrip().upper().startswith(
+            _EXPLAIN_PREFIXES
+        ):
+            return
+        entry = SlowQuery(
+            statement=statement,
+            parameters=_format_parameters(parameters),
+            duration_ms=round(duration_ms, 2),
+            captured_at=datetime.now(UTC),
+            route=get_request_route(),
+            request_id=get_request_id(),
+            executemany=many,
+        )
+        logger.warning(
+            "slow_query duration_ms=%s route=%s request_id=%s statement=%s",
+            entry.duration_ms,
+            entry.route,
+            entry.request_id,
+            " ".join(statement.split())[:200],
+        )
+        if many or not slow_log.try_reserve_explain():
+            slow_log.record(entry)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            slow_log.release_explain()
+            slow_log.record(entry)
+            return
+        # Contexto vacio: el EXPLAIN no hereda metricas ni request id del request lento.
+        task = loop.create_task(
+            _explain(engine, slow_log, entry, parameters), context=contextvars.Context()
+        )
+        _explain_tasks.add(task)
+        task.add_done_callback(_explain_tasks.discard)
+
+
+def build_slow_query_log(settings: InfrastructureSettings) -> SlowQueryLog | None:
+    """Log de queries lentas segun settings, o None si esta deshabilitado."""
+    if not settings.slow_query_log_enabled:
+        return None
+    return SlowQueryLog(
+        threshold_ms=settings.slow_query_threshold_ms,
+        capacity=settings.slow_query_log_size,
+        explain_sample_rate=settings.slow_query_explain_sample_rate,
+    )
@@ -0,0 +1,18 @@
+"""INSERT con `ON CONFLICT` segun el dialecto de la sesion (PostgreSQL o SQLite)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(session: AsyncSession, model: type[Any]) -> Any:
+    """Devuelve `insert(model)` con soporte `on_conflict_do_*` para la sesion."""
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+    if dialect_name == "sqlite":
+        return sqlite.insert(model)
+    raise RuntimeError(f"ON CONFLICT no soportado para el dialecto {dialect_name}.")
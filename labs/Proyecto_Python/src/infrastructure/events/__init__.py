@@ -1,5 +1,23 @@
 """Adaptadores de eventos para infraestructura."""
 
+from .consumer import AIOKafkaEventSource, ConsumedEvent, EventSourcePort
+from .in_memory_broker import InMemoryBroker, InMemoryEventPublisher, InMemoryEventSource
 from .kafka_publisher import AIOKafkaEventPublisher
+from .order_view_projector import OrderViewConsumer, OrderViewProjector
+from .schema_registry import FileSchemaRegistry
+from .serialization import EventCodec, build_event_codec
 
-__all__ = ["AIOKafkaEventPublisher"]
+__all__ = [
+    "AIOKafkaEventPublisher",
+    "AIOKafkaEventSource",
+    "ConsumedEvent",
+    "EventCodec",
+    "EventSourcePort",
+    "FileSchemaRegistry",
+    "InMemoryBroker",
+    "InMemoryEventPublisher",
+    "InMemoryEventSource",
+    "OrderViewConsumer",
+    "OrderViewProjector",
+    "build_event_codec",
+]
@@ -0,0 +1,163 @@
+"""Contrato de consumo de eventos y adaptador aiokafka.
+
+Semantica at-least-once: el consumidor procesa un lote y despues llama `commit`.
+Si el proceso cae entre ambos pasos el lote se reentrega, por eso los
+proyectores deben ser idempotentes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from aiokafka import AIOKafkaConsumer, TopicPartition  # type: ignore[import-untyped]
+
+from src.infrastructure.events.metadata import EVENT_NAME_HEADER, header_value
+from src.infrastructure.events.serialization import EventCodec, EventHeaders, build_event_codec
+from src.infrastructure.settings import InfrastructureSettings
+
+
+@dataclass(frozen=True, slots=True)
+class ConsumedEvent:
+    """Evento decodificado junto con su posicion en el log."""
+
+    topic: str
+    partition: int
+    offset: int
+    event_name: str
+    payload: dict[str, Any]
+    key: bytes | None = None
+    headers: EventHeaders = ()
+
+
+def to_consumed_event(
+    codec: EventCodec,
+    topic: str,
+    partition: int,
+    offset: int,
+    key: bytes | None,
+    value: bytes,
+    headers: Sequence[tuple[str, bytes]],
+    event_names: frozenset[str] | None = None,
+) -> ConsumedEvent:
+    """Decodifica un mensaje; si `event-name` no esta en `event_names` no abre el cuerpo.
+
+    Los mensajes filtrados se devuelven con payload vacio para que su offset
+    tambien se confirme y el lag no se quede atorado.
+    """
+    header_tuple = tuple(headers)
+    name_from_header = header_value(header_tuple, EVENT_NAME_HEADER)
+    if (
+        event_names is not None
+        and name_from_header is not None
+        and name_from_header not in event_names
+    ):
+        return ConsumedEvent(
+            topic=topic,
+            partition=partition,
+            offset=offset,
+            event_name=name_from_header,
+            payload={},
+            key=key,
+            headers=header_tuple,
+        )
+    event_name, payload = codec.decode(value, header_tuple)
+    return ConsumedEvent(
+        topic=topic,
+        partition=partition,
+        offset=offset,
+        event_name=event_name,
+        payload=payload,
+        key=key,
+        headers=header_tuple,
+    )
+
+
+class EventSourcePort(Protocol):
+    """Contrato minimo de un consumidor de eventos con offsets confirmables."""
+
+    async def start(self) -> None:
+        """Abre conexiones y se suscribe."""
+
+    async def stop(self) -> None:
+        """Libera recursos."""
+
+    async def poll(self, max_records: int, timeout_seconds: float) -> list[ConsumedEvent]:
+        """Devuelve hasta `max_records` eventos nuevos; lista vacia si no hay."""
+
+    async def commit(self, events: Sequence[ConsumedEvent]) -> None:
+        """Confirma offsets hasta el ultimo evento de cada particion del lote."""
+
+    async def lag(self) -> int:
+        """Eventos publicados que el grupo aun no confirma."""
+
+
+class AIOKafkaEventSource(EventSourcePort):
+    """Consumidor de `kafka_topic_orders` con commit manual por lote."""
+
+    def __init__(
+        self,
+        settings: InfrastructureSettings,
+        group_id: str,
+        codec: EventCodec | None = None,
+        event_names: frozenset[str] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._codec = codec or build_event_codec(settings)
+        self._event_names = event_names
+        self._consumer = AIOKafkaConsumer(
+            settings.kafka_topic_orders,
+            bootstrap_servers=settings.kafka_bootstrap_servers,
+            client_id=settings.kafka_client_id,
+            group_id=group_id,
+            enable_auto_commit=False,
+            auto_offset_reset="earliest",
+        )
+
+    async def start(self) -> None:
+        await self._consumer.start()
+
+    async def stop(self) -> None:
+        await self._consumer.stop()
+
+    async def poll(self, max_records: int, timeout_seconds: float) -> list[ConsumedEvent]:
+        batches = await self._consumer.getmany(
+            timeout_ms=int(timeout_seconds * 1000), max_records=max_records
+        )
+        events: list[ConsumedEvent] = []
+        for topic_partition, messages in batches.items():
+            for message in messages:
+                events.append(
+                    to_consumed_event(
+                        self._codec,
+                        topic=topic_partition.topic,
+                        partition=topic_partition.partition,
+                        offset=message.offset,
+                        key=message.key,
+                        value=message.value,
+                        headers=message.headers,
+                        event_names=self._event_names,
+                    )
+                )
+        return events
+
+    async def commit(self, events: Sequence[ConsumedEvent]) -> None:
+        # Kafka confirma el siguiente offset a leer, no el ultimo procesado.
+        offsets: dict[TopicPartition, int] = {}
+        for event in events:
+            topic_partition = TopicPartition(event.topic, event.partition)
+            offsets[topic_partition] = max(offsets.get(topic_partition, 0), event.offset + 1)
+        if offsets:
+            await self._consumer.commit(offsets)
+
+    async def lag(self) -> int:
+        assignment = list(self._consumer.assignment())
+        if not assignment:
+            return 0
+        end_offsets = await self._consumer.end_offsets(assignment)
+        total = 0
+        for topic_partition in assignment:
+            committed = await self._consumer.committed(topic_partition)
+            total += max(end_offsets[topic_partition] - (committed or 0), 0)
+        return total
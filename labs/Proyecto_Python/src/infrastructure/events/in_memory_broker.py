@@ -0,0 +1,295 @@
+"""Broker en memoria para pruebas, benchmarks y corridas locales sin Kafka.
+
+Imita lo que importa del lado del cliente:
+
+- Topics con N particiones; cada particion es un log append-only.
+- Particionado por llave con murmur2 (mismo algoritmo que el particionador por
+  defecto de Kafka), asi una llave cae en la misma particion que en el cluster
+  con igual numero de particiones. Mensajes sin llave se reparten round-robin.
+- Offsets confirmados por (grupo, topic, particion) con semantica Kafka
+  (siguiente offset a leer).
+- Latencia inyectable en cada `publish` (base + jitter uniforme) para que las
+  pruebas de carga paguen un costo parecido al ack de un broker real.
+
+Es seguro entre threads: los routers publican desde el threadpool y los
+consumidores leen desde un event loop.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from src.application.ports import EventPublisherPort
+from src.infrastructure.common.request_metrics import timed
+from src.infrastructure.common.tracing import start_span
+from src.infrastructure.events.consumer import ConsumedEvent, EventSourcePort, to_consumed_event
+from src.infrastructure.events.metadata import PartitionKeyStrategy, build_outgoing_event
+from src.infrastructure.events.serialization import EventCodec, EventHeaders, build_event_codec
+from src.infrastructure.settings import InfrastructureSettings
+
+
+@dataclass(frozen=True, slots=True)
+class BrokerRecord:
+    """Mensaje almacenado en una particion."""
+
+    partition: int
+    offset: int
+    value: bytes
+    key: bytes | None = None
+    headers: EventHeaders = ()
+
+
+def murmur2(data: bytes) -> int:
+    """murmur2 de 32 bits con la semilla del cliente Java de Kafka."""
+    length = len(data)
+    m = 0x5BD1E995
+    h = (0x9747B28C ^ length) & 0xFFFFFFFF
+    length4 = length // 4
+    for index in range(length4):
+        i4 = index * 4
+        k = int.from_bytes(data[i4 : i4 + 4], "little")
+        k = (k * m) & 0xFFFFFFFF
+        k ^= k >> 24
+        k = (k * m) & 0xFFFFFFFF
+        h = (h * m) & 0xFFFFFFFF
+        h ^= k
+    remaining = length % 4
+    tail = length4 * 4
+    if remaining == 3:
+        h ^= data[tail + 2] << 16
+    if remaining >= 2:
+        h ^= data[tail + 1] << 8
+    if remaining >= 1:
+        h ^= data[tail]
+        h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 15
+    return h
+
+
+def partition_for_key(key: bytes, partitions: int) -> int:
+    """Particion de una llave igual que `DefaultPartitioner` (positivo % particiones)."""
+    return (murmur2(key) & 0x7FFFFFFF) % partitions
+
+
+class InMemoryBroker:
+    """Logs por (topic, particion) y offsets confirmados por grupo."""
+
+    def __init__(
+        self,
+        default_partitions: int = 1,
+        publish_latency_seconds: float = 0.0,
+        publish_jitter_seconds: float = 0.0,
+    ) -> None:
+        if default_partitions < 1:
+            raise ValueError("default_partitions debe ser mayor a 0.")
+        if publish_latency_seconds < 0 or publish_jitter_seconds < 0:
+            raise ValueError("La latencia inyectada no puede ser negativa.")
+        self._default_partitions = default_partitions
+        self._publish_latency_seconds = publish_latency_seconds
+        self._publish_jitter_seconds = publish_jitter_seconds
+        self._topics: dict[str, list[list[BrokerRecord]]] = {}
+        self._round_robin: dict[str, int] = {}
+        self._committed: dict[tuple[str, str, int], int] = {}
+        self._lock = Lock()
+
+    def create_topic(self, topic: str, partitions: int | None = None) -> None:
+        """Crea el topic si no existe; idempotente como `--if-not-exists`."""
+        with self._lock:
+            self._ensure_topic(topic, partitions)
+
+    def _ensure_topic(self, topic: str, partitions: int | None = None) -> list[list[BrokerRecord]]:
+        logs = self._topics.get(topic)
+        if logs is None:
+            logs = [[] for _ in range(partitions or self._default_partitions)]
+            self._topics[topic] = logs
+        return logs
+
+    def partitions(self, topic: str) -> int:
+        """Numero de particiones del topic (lo crea con el default si no existe)."""
+        with self._lock:
+            return len(self._ensure_topic(topic))
+
+    def simulate_publish_latency(self) -> None:
+        """Duerme la latencia configurada; se llama fuera del lock."""
+        delay = self._publish_latency_seconds
+        if self._publish_jitter_seconds:
+            delay += random.uniform(0, self._publish_jitter_seconds)
+        if delay > 0:
+            time.sleep(delay)
+
+    def append(
+        self, topic: str, value: bytes, key: bytes | None = None, headers: EventHeaders = ()
+    ) -> BrokerRecord:
+        """Agrega un mensaje a la particion de su llave y devuelve el registro."""
+        with self._lock:
+            logs = self._ensure_topic(topic)
+            if key is not None:
+                partition = partition_for_key(key, len(logs))
+            else:
+                partition = self._round_robin.get(topic, 0) % len(logs)
+                self._round_robin[topic] = partition + 1
+            log = logs[partition]
+            record = BrokerRecord(
+                partition=partition, offset=len(log), value=value, key=key, headers=headers
+            )
+            log.append(record)
+            return record
+
+    def read(
+        self, topic: str, partition: int, start_offset: int, max_records: int
+    ) -> list[BrokerRecord]:
+        """Lee hasta `max_records` mensajes de una particion desde `start_offset`."""
+        with self._lock:
+            log = self._ensure_topic(topic)[partition]
+            return log[start_offset : start_offset + max_records]
+
+    def end_offset(self, topic: str, partition: int) -> int:
+        """Offset del siguiente mensaje a escribir en la particion."""
+        with self._lock:
+            return len(self._ensure_topic(topic)[partition])
+
+    def committed(self, group_id: str, topic: str, partition: int) -> int:
+        """Siguiente offset a leer confirmado por el grupo en la particion."""
+        with self._lock:
+            return self._committed.get((group_id, topic, partition), 0)
+
+    def commit(self, group_id: str, topic: str, partition: int, next_offset: int) -> None:
+        """Confirma offsets del grupo; nunca retrocede."""
+        with self._lock:
+            key = (group_id, topic, partition)
+            self._committed[key] = max(self._committed.get(key, 0), next_offset)
+
+
+class InMemoryEventPublisher(EventPublisherPort):
+    """Publica en el broker en memoria con el mismo formato, llave y headers que Kafka."""
+
+    def __init__(
+        self,
+        broker: InMemoryBroker,
+        topic: str,
+        codec: EventCodec | None = None,
+        key_strategy: PartitionKeyStrategy = "order_id",
+    ) -> None:
+        self._broker = broker
+        self._topic = topic
+        self._codec = codec or build_event_codec(InfrastructureSettings())
+        self._key_strategy = key_strategy
+
+    def publish(self, event_name: str, payload: Mapping[str, Any]) -> None:
+        with start_span(
+            f"publish {event_name}",
+            kind="PRODUCER",
+            attributes={"messaging.system": "memory", "messaging.destination.name": self._topic},
+        ):
+            outgoing = build_outgoing_event(self._codec, event_name, payload, self._key_strategy)
+            # Se mide como `kafka` para que Server-Timing compare igual contra el broker real.
+            with timed("kafka"):
+                self._broker.simulate_publish_latency()
+                self._broker.append(self._topic, outgoing.value, outgoing.key, outgoing.headers)
+
+
+class InMemoryEventSource(EventSourcePort):
+    """Consumidor de un topic del broker en memoria para un grupo.
+
+    Sin `partitions` lee todas; con una lista lee solo esas, lo que permite simular
+    varias instancias del mismo grupo repartiendose particiones.
+    """
+
+    def __init__(
+        self,
+        broker: InMemoryBroker,
+        topic: str,
+        group_id: str,
+        codec: EventCodec | None = None,
+        event_names: frozenset[str] | None = None,
+        partitions: Sequence[int] | None = None,
+    ) -> None:
+        self._broker = broker
+        self._topic = topic
+        self._group_id = group_id
+        self._codec = codec or build_event_codec(InfrastructureSettings())
+        self._event_names = event_names
+        self._requested_partitions = tuple(partitions) if partitions is not None else None
+        self._positions: dict[int, int] | None = None
+        self._next_partition = 0
+
+    def _assignment(self) -> tuple[int, ...]:
+        if self._requested_partitions is not None:
+            return self._requested_partitions
+        return tuple(range(self._broker.partitions(self._topic)))
+
+    async def start(self) -> None:
+        self._positions = {
+            partition: self._broker.committed(self._group_id, self._topic, partition)
+            for partition in self._assignment()
+        }
+
+    async def stop(self) -> None:
+        self._positions = None
+
+    async def poll(self, max_records: int, timeout_seconds: float) -> list[ConsumedEvent]:
+        if self._positions is None:
+            raise RuntimeError("InMemoryEventSource.start() no fue llamado.")
+        partitions = list(self._positions)
+        events: list[ConsumedEvent] = []
+        # Se rota la particion inicial para que una particion llena no acapare los lotes.
+        for step in range(len(partitions)):
+            remaining = max_records - len(events)
+            if remaining <= 0:
+                break
+            partition = partitions[(self._next_partition + step) % len(partitions)]
+            records = self._broker.read(
+                self._topic, partition, self._positions[partition], remaining
+            )
+            if not records:
+                continue
+            self._positions[partition] = records[-1].offset + 1
+            events.extend(
+                to_consumed_event(
+                    self._codec,
+                    topic=self._topic,
+                    partition=record.partition,
+                    offset=record.offset,
+                    key=record.key,
+                    value=record.value,
+                    headers=record.headers,
+                    event_names=self._event_names,
+                )
+                for record in records
+            )
+        self._next_partition += 1
+        return events
+
+    async def commit(self, events: Sequence[ConsumedEvent]) -> None:
+        next_offsets: dict[int, int] = {}
+        for event in events:
+            next_offsets[event.partition] = max(
+                next_offsets.get(event.partition, 0), event.offset + 1
+            )
+        for partition, next_offset in next_offsets.items():
+            self._broker.commit(self._group_id, self._topic, partition, next_offset)
+
+    async def lag(self) -> int:
+        return sum(
+            self._broker.end_offset(self._topic, partition)
+            - self._broker.committed(self._group_id, self._topic, partition)
+            for partition in self._assignment()
+        )
+
+
+def build_in_memory_broker(settings: InfrastructureSettings) -> InMemoryBroker:
+    """Broker en memoria con particiones y latencia de settings (`EVENT_BROKER=memory`)."""
+    broker = InMemoryBroker(
+        default_partitions=settings.memory_broker_partitions,
+        publish_latency_seconds=settings.memory_broker_latency_ms / 1000,
+        publish_jitter_seconds=settings.memory_broker_jitter_ms / 1000,
+    )
+    broker.create_topic(settings.kafka_topic_orders)
+    return broker
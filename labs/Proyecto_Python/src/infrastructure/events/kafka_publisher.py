@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from typing import Any
 
@@ -10,36 +9,52 @@ from aiokafka import AIOKafkaProducer  # type: ignore[import-untyped]
 
 from src.application.ports import EventPublisherPort
 from src.infrastructure.common.async_runner import run_sync
+from src.infrastructure.common.request_metrics import timed
+from src.infrastructure.common.tracing import start_span
+from src.infrastructure.events.metadata import OutgoingEvent, build_outgoing_event
+from src.infrastructure.events.serialization import EventCodec, build_event_codec
 from src.infrastructure.settings import InfrastructureSettings
 
 
 class AIOKafkaEventPublisher(EventPublisherPort):
     """Implementacion base de publicacion en Kafka."""
 
-    def __init__(self, settings: InfrastructureSettings) -> None:
+    def __init__(self, settings: InfrastructureSettings, codec: EventCodec | None = None) -> None:
         self._settings = settings
+        self._codec = codec or build_event_codec(settings)
 
     def publish(self, event_name: str, payload: Mapping[str, Any]) -> None:
-        """Publica evento serializado en JSON.
+        """Publica evento serializado con el formato configurado (`EVENT_FORMAT`).
 
         Si Kafka esta deshabilitado por configuracion, no-op controlado.
         """
         if not self._settings.kafka_enabled:
             return
-        run_sync(self._publish_once(event_name, payload))
-
-    async def _publish_once(self, event_name: str, payload: Mapping[str, Any]) -> None:
+        topic = self._settings.kafka_topic_orders
+        with start_span(
+            f"publish {event_name}",
+            kind="PRODUCER",
+            attributes={"messaging.system": "kafka", "messaging.destination.name": topic},
+        ):
+            outgoing = build_outgoing_event(
+                self._codec, event_name, payload, self._settings.kafka_partition_key
+            )
+            with timed("kafka"):
+                run_sync(self._publish_once(outgoing))
+
+    async def _publish_once(self, outgoing: OutgoingEvent) -> None:
         producer = AIOKafkaProducer(
             bootstrap_servers=self._settings.kafka_bootstrap_servers,
             client_id=self._settings.kafka_client_id,
         )
         await producer.start()
         try:
-            message_payload = {
-                "event_name": event_name,
-                "payload": dict(payload),
-            }
-            encoded_payload = json.dumps(message_payload, ensure_ascii=True).encode("utf-8")
-            await producer.send_and_wait(self._settings.kafka_topic_orders, encoded_payload)
+            # La llave decide la particion: misma orden, misma particion.
+            await producer.send_and_wait(
+                self._settings.kafka_topic_orders,
+                outgoing.value,
+                key=outgoing.key,
+                headers=list(outgoing.headers),
+            )
         finally:
             await producer.stop()
@@ -0,0 +1,88 @@
+"""Llave de particion y headers de metadatos para eventos de ordenes.
+
+Kafka garantiza orden solo dentro de una particion, y la particion sale de la
+llave. Con llave `order_id` todos los eventos de una orden caen en la misma
+particion y los consumidores pueden escalar por particion sin reordenar una orden.
+La estrategia `branch_id` agrupa por sucursal (util si un consumidor agrega por
+sucursal), a costa de particiones menos parejas.
+
+Headers agregados a los del formato (`content-type`, `schema-version`):
+`event-name`, `request-id` y `occurred-at` (epoch en milisegundos, UTC).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from src.infrastructure.common.request_context import get_request_id
+from src.infrastructure.common.request_metrics import timed
+from src.infrastructure.events.serialization import EncodedEvent, EventCodec, EventHeaders
+
+EVENT_NAME_HEADER = "event-name"
+REQUEST_ID_HEADER = "request-id"
+OCCURRED_AT_HEADER = "occurred-at"
+
+PartitionKeyStrategy = Literal["order_id", "branch_id"]
+
+
+@dataclass(frozen=True, slots=True)
+class OutgoingEvent:
+    """Mensaje listo para enviar: llave, cuerpo y headers."""
+
+    key: bytes | None
+    value: bytes
+    headers: EventHeaders
+
+
+def partition_key(payload: Mapping[str, Any], strategy: PartitionKeyStrategy) -> bytes | None:
+    """Llave del mensaje; si falta el campo de la estrategia se usa `order_id`."""
+    value = payload.get(strategy) or payload.get("order_id")
+    return str(value).encode("utf-8") if value is not None else None
+
+
+def event_headers(
+    event_name: str,
+    encoded: EncodedEvent,
+    request_id: str | None,
+    occurred_at: datetime | None = None,
+) -> EventHeaders:
+    """Headers del formato mas metadatos para filtrar sin decodificar el cuerpo."""
+    timestamp = occurred_at or datetime.now(UTC)
+    headers: list[tuple[str, bytes]] = [
+        *encoded.headers,
+        (EVENT_NAME_HEADER, event_name.encode("utf-8")),
+        (OCCURRED_AT_HEADER, str(int(timestamp.timestamp() * 1000)).encode("ascii")),
+    ]
+    if request_id:
+        headers.append((REQUEST_ID_HEADER, request_id.encode("utf-8")))
+    return tuple(headers)
+
+
+def header_value(headers: Sequence[tuple[str, bytes]], name: str) -> str | None:
+    """Primer valor de un header como texto, o None si no viene."""
+    for key, value in headers:
+        if key == name:
+            return value.decode("utf-8")
+    return None
+
+
+def build_outgoing_event(
+    codec: EventCodec,
+    event_name: str,
+    payload: Mapping[str, Any],
+    key_strategy: PartitionKeyStrategy,
+) -> OutgoingEvent:
+    """Serializa y agrega llave + metadatos.
+
+    Se llama en el thread del request (antes de `run_sync`) para leer su request id.
+    """
+    with timed("serialization"):
+        encoded = codec.encode(event_name, payload)
+    return OutgoingEvent(
+        key=partition_key(payload, key_strategy),
+        value=encoded.value,
+        headers=event_headers(event_name, encoded, get_request_id()),
+    )
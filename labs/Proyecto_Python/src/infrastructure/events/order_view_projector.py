@@ -0,0 +1,280 @@
+"""Consumidor que proyecta eventos `orders.v1` al read model `order_view`.
+
+Cada lote se aplica en una sola transaccion y despues se confirman offsets
+(at-least-once). La proyeccion es idempotente:
+
+- `orders.created.v1`: INSERT ... ON CONFLICT DO NOTHING; una reentrega no pisa
+  un estado posterior.
+- `orders.status_changed.v1`: UPDATE por PK con el ultimo estado del lote para
+  cada orden; repetirlo deja la misma fila.
+
+Uso como worker:
+    poetry run python -m src.infrastructure.events.order_view_projector
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from threading import Lock
+from typing import Any, cast
+from uuid import UUID
+
+from sqlalchemy import Table, bindparam, func, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.db.models import OrderViewModel
+from src.infrastructure.db.session import build_async_engine, build_session_factory
+from src.infrastructure.db.upserts import dialect_insert
+from src.infrastructure.events.consumer import (
+    AIOKafkaEventSource,
+    ConsumedEvent,
+    EventSourcePort,
+)
+from src.infrastructure.events.in_memory_broker import InMemoryBroker, InMemoryEventSource
+from src.infrastructure.events.serialization import build_event_codec
+from src.infrastructure.settings import InfrastructureSettings
+
+ORDER_CREATED_EVENT = "orders.created.v1"
+ORDER_STATUS_CHANGED_EVENT = "orders.status_changed.v1"
+PROJECTED_EVENTS = frozenset({ORDER_CREATED_EVENT, ORDER_STATUS_CHANGED_EVENT})
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_POLL_TIMEOUT_SECONDS = 0.5
+
+logger = logging.getLogger("distrito_chilaquil.order_view")
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectionResult:
+    """Conteos de un lote aplicado."""
+
+    created: int
+    status_changes: int
+    ignored: int
+
+
+@dataclass(frozen=True, slots=True)
+class OrderViewConsumerStats:
+    """Foto del consumidor para health/metricas."""
+
+    running: bool
+    lag: int | None
+    batches: int
+    applied_events: int
+    ignored_events: int
+    last_batch_at: datetime | None
+    last_error: str | None
+
+
+def _view_row_from_created(payload: dict[str, Any]) -> dict[str, Any]:
+    """Fila de `order_view` desde el payload de `orders.created.v1`."""
+    items = list(payload["items"])
+    return {
+        "order_id": UUID(payload["order_id"]),
+        "customer_id": UUID(payload["customer_id"]),
+        "customer_email": payload["customer_email"],
+        "branch_id": payload["branch_id"],
+        "status": payload["status"],
+        "cancellation_reason": None,
+        "item_count": int(payload["item_count"]),
+        "items": items,
+        "shipping_cost": Decimal(payload["shipping_cost"]),
+        "tax_rate": Decimal(payload["tax_rate"]),
+        "subtotal": Decimal(payload["subtotal"]),
+        "tax_total": Decimal(payload["tax_total"]),
+        "total": Decimal(payload["total"]),
+    }
+
+
+class OrderViewProjector:
+    """Aplica lotes de eventos de ordenes sobre `order_view`."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def apply_batch(self, events: Sequence[ConsumedEvent]) -> ProjectionResult:
+        """Aplica un lote completo en una transaccion."""
+        created: dict[UUID, dict[str, Any]] = {}
+        status_changes: dict[UUID, dict[str, Any]] = {}
+        ignored = 0
+        for event in events:
+            if event.event_name == ORDER_CREATED_EVENT and "items" in event.payload:
+                row = _view_row_from_created(event.payload)
+                created.setdefault(row["order_id"], row)
+            elif event.event_name == ORDER_STATUS_CHANGED_EVENT:
+                order_id = UUID(event.payload["order_id"])
+                # Solo importa el ultimo estado de cada orden en el lote.
+                status_changes[order_id] = {
+                    "target_order_id": order_id,
+                    "status": event.payload["status"],
+                    "cancellation_reason": event.payload.get("cancellation_reason"),
+                }
+            else:
+                # Eventos de otros tipos o `created` previos al payload enriquecido.
+                ignored += 1
+
+        async with self._session_factory() as session, session.begin():
+            if created:
+                insert_statement = dialect_insert(session, OrderViewModel).values(
+                    list(created.values())
+                )
+                await session.execute(
+                    insert_statement.on_conflict_do_nothing(index_elements=["order_id"])
+                )
+            if status_changes:
+                # UPDATE Core en bloque (executemany): a diferencia del bulk ORM, una orden
+                # que aun no existe en la vista no falla el lote, simplemente no actualiza.
+                view_table = cast(Table, OrderViewModel.__table__)
+                update_statement = (
+                    update(view_table)
+                    .where(view_table.c.order_id == bindparam("target_order_id"))
+                    .values(projected_at=func.now())
+                )
+                await session.execute(update_statement, list(status_changes.values()))
+
+        return ProjectionResult(
+            created=len(created), status_changes=len(status_changes), ignored=ignored
+        )
+
+
+class OrderViewConsumer:
+    """Loop de consumo: poll -> apply_batch -> commit, con lag observable.
+
+    `snapshot()` es seguro desde cualquier thread: solo lee contadores cacheados
+    que el loop actualiza despues de cada poll.
+    """
+
+    def __init__(
+        self,
+        source: EventSourcePort,
+        projector: OrderViewProjector,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_timeout_seconds: float = DEFAULT_POLL_TIMEOUT_SECONDS,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser mayor a 0.")
+        self._source = source
+        self._projector = projector
+        self._batch_size = batch_size
+        self._poll_timeout_seconds = poll_timeout_seconds
+        self._stop_requested = False
+        self._lock = Lock()
+        self._running = False
+        self._lag: int | None = None
+        self._batches = 0
+        self._applied_events = 0
+        self._ignored_events = 0
+        self._last_batch_at: datetime | None = None
+        self._last_error: str | None = None
+
+    async def run_once(self) -> int:
+        """Procesa un lote (si hay) y devuelve cuantos eventos leyo."""
+        events = await self._source.poll(self._batch_size, self._poll_timeout_seconds)
+        if events:
+            result = await self._projector.apply_batch(events)
+            await self._source.commit(events)
+            with self._lock:
+                self._batches += 1
+                self._applied_events += result.created + result.status_changes
+                self._ignored_events += result.ignored
+                self._last_batch_at = datetime.now(UTC)
+        lag = await self._source.lag()
+        with self._lock:
+            self._lag = lag
+        return len(events)
+
+    async def run(self) -> None:
+        """Consume hasta `stop()`; un error de lote se registra y se reintenta."""
+        await self._source.start()
+        with self._lock:
+            self._running = True
+        try:
+            while not self._stop_requested:
+                try:
+                    consumed = await self.run_once()
+                except Exception as exc:  # noqa: BLE001 - el worker no debe morir por un lote.
+                    logger.exception("order_view_batch_failed")
+                    with self._lock:
+                        self._last_error = str(exc)
+                    await asyncio.sleep(self._poll_timeout_seconds)
+                    continue
+                if consumed == 0:
+                    # Fuentes en memoria regresan de inmediato; se evita un loop caliente.
+                    await asyncio.sleep(self._poll_timeout_seconds)
+        finally:
+            with self._lock:
+                self._running = False
+            await self._source.stop()
+
+    def stop(self) -> None:
+        """Pide detener el loop al terminar la iteracion actual."""
+        self._stop_requested = True
+
+    def snapshot(self) -> OrderViewConsumerStats:
+        """Estado actual del consumidor."""
+        with self._lock:
+            return OrderViewConsumerStats(
+                running=self._running,
+                lag=self._lag,
+                batches=self._batches,
+                applied_events=self._applied_events,
+                ignored_events=self._ignored_events,
+                last_batch_at=self._last_batch_at,
+                last_error=self._last_error,
+            )
+
+
+def build_order_view_consumer(
+    settings: InfrastructureSettings,
+    session_factory: async_sessionmaker[AsyncSession],
+    broker: InMemoryBroker | None = None,
+) -> OrderViewConsumer:
+    """Consumidor con la configuracion del servicio; con `broker` lee del broker en memoria."""
+    source: EventSourcePort
+    if broker is not None:
+        source = InMemoryEventSource(
+            broker,
+            topic=settings.kafka_topic_orders,
+            group_id=settings.order_view_consumer_group,
+            codec=build_event_codec(settings),
+            event_names=PROJECTED_EVENTS,
+        )
+    else:
+        source = AIOKafkaEventSource(
+            settings,
+            group_id=settings.order_view_consumer_group,
+            event_names=PROJECTED_EVENTS,
+        )
+    return OrderViewConsumer(
+        source=source,
+        projector=OrderViewProjector(session_factory),
+        batch_size=settings.order_view_batch_size,
+    )
+
+
+async def _run_worker(settings: InfrastructureSettings) -> None:
+    """Corre el consumidor como proceso dedicado hasta Ctrl+C."""
+    engine = build_async_engine(settings)
+    consumer = build_order_view_consumer(settings, build_session_factory(engine))
+    try:
+        await consumer.run()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """CLI del worker de proyeccion `order_view`."""
+    parser = argparse.ArgumentParser(description="Proyecta eventos orders.v1 a order_view.")
+    parser.parse_args()
+    settings = InfrastructureSettings.from_env()
+    logging.basicConfig(level=settings.log_level)
+    asyncio.run(_run_worker(settings))
+
+
+if __name__ == "__main__":
+    main()
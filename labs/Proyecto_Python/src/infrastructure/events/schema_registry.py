@@ -0,0 +1,126 @@
+"""Registro de schemas de eventos en archivos locales (sustituto de un schema registry).
+
+Layout: `<directorio>/<event_name>/<version>.json`. Cada archivo describe los
+campos del payload en orden de escritura:
+
+    {"event_name": "orders.status_changed.v1", "version": 1,
+     "fields": [{"name": "order_id", "type": "uuid"}, ...]}
+
+Tipos soportados: `uuid`, `string`, `int`, `bool`, `decimal` y `array`
+(con `fields` anidados). `nullable: true` permite `None`.
+
+Un archivo publicado no se edita: se agrega `<version + 1>.json`.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Literal
+
+DEFAULT_SCHEMA_DIR = Path(__file__).resolve().parent / "schemas"
+
+FieldType = Literal["uuid", "string", "int", "bool", "decimal", "array"]
+_FIELD_TYPES: frozenset[str] = frozenset({"uuid", "string", "int", "bool", "decimal", "array"})
+
+
+class UnknownEventSchemaError(LookupError):
+    """No hay schema registrado para el evento/version pedidos."""
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaField:
+    """Campo de un schema; `fields` solo aplica a `array`."""
+
+    name: str
+    type: FieldType
+    nullable: bool = False
+    fields: tuple[SchemaField, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class EventSchema:
+    """Schema versionado del payload de un evento."""
+
+    event_name: str
+    version: int
+    fields: tuple[SchemaField, ...]
+
+
+def _parse_fields(raw_fields: list[dict[str, Any]], source: Path) -> tuple[SchemaField, ...]:
+    """Convierte la lista JSON de campos validando tipos."""
+    fields: list[SchemaField] = []
+    for raw in raw_fields:
+        field_type = raw["type"]
+        if field_type not in _FIELD_TYPES:
+            raise ValueError(f"Tipo de campo no soportado '{field_type}' en {source}.")
+        nested = _parse_fields(raw.get("fields", []), source) if field_type == "array" else ()
+        fields.append(
+            SchemaField(
+                name=str(raw["name"]),
+                type=field_type,
+                nullable=bool(raw.get("nullable", False)),
+                fields=nested,
+            )
+        )
+    return tuple(fields)
+
+
+def load_schema(path: Path) -> EventSchema:
+    """Lee un archivo de schema."""
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    return EventSchema(
+        event_name=str(raw["event_name"]),
+        version=int(raw["version"]),
+        fields=_parse_fields(list(raw["fields"]), path),
+    )
+
+
+class FileSchemaRegistry:
+    """Schemas por (evento, version) leidos bajo demanda y cacheados en memoria."""
+
+    def __init__(self, directory: Path = DEFAULT_SCHEMA_DIR) -> None:
+        self._directory = directory
+        self._cache: dict[tuple[str, int], EventSchema] = {}
+        self._latest: dict[str, int | None] = {}
+        self._lock = Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def get(self, event_name: str, version: int) -> EventSchema:
+        """Schema exacto; falla con `UnknownEventSchemaError` si no existe."""
+        key = (event_name, version)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        path = self._directory / event_name / f"{version}.json"
+        if not path.exists():
+            raise UnknownEventSchemaError(f"No existe schema {event_name} v{version} en {path}.")
+        schema = load_schema(path)
+        if schema.event_name != event_name or schema.version != version:
+            raise ValueError(f"El archivo {path} no coincide con {event_name} v{version}.")
+        with self._lock:
+            self._cache[key] = schema
+        return schema
+
+    def latest(self, event_name: str) -> EventSchema | None:
+        """Ultima version registrada del evento, o None si no tiene schema."""
+        with self._lock:
+            known = event_name in self._latest
+            version = self._latest.get(event_name)
+        if not known:
+            event_dir = self._directory / event_name
+            versions = (
+                [int(path.stem) for path in event_dir.glob("*.json") if path.stem.isdigit()]
+                if event_dir.is_dir()
+                else []
+            )
+            version = max(versions) if versions else None
+            with self._lock:
+                self._latest[event_name] = version
+        return self.get(event_name, version) if version is not None else None
@@ -0,0 +1,392 @@
+"""Serializacion de eventos con formatos intercambiables y negociacion por headers.
+
+Cada mensaje lleva headers `content-type` y, en formatos con schema,
+`schema-version`. El consumidor elige el decodificador por `content-type`, asi
+productores con distintos formatos pueden convivir en el mismo topic durante un
+cambio. Mensajes sin headers (publicados antes de este cambio) se leen como JSON.
+
+Formatos:
+
+- `json`: sobre `{event_name, payload}` en JSON UTF-8 (formato historico).
+- `msgpack`: mismo sobre en MessagePack; requiere `msgpack` instalado.
+- `schema`: binario compacto guiado por `FileSchemaRegistry`: UUID en 16 bytes,
+  enteros y decimales como varints, sin nombres de campo en el mensaje.
+  Eventos sin schema registrado se publican en JSON.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Literal, Protocol
+from uuid import UUID
+
+from src.infrastructure.events.schema_registry import (
+    DEFAULT_SCHEMA_DIR,
+    EventSchema,
+    FileSchemaRegistry,
+    SchemaField,
+    UnknownEventSchemaError,
+)
+from src.infrastructure.settings import InfrastructureSettings
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - dependencia opcional del formato msgpack.
+    msgpack = None
+
+CONTENT_TYPE_HEADER = "content-type"
+SCHEMA_VERSION_HEADER = "schema-version"
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+SCHEMA_CONTENT_TYPE = "application/vnd.dc.event+binary"
+
+EventFormat = Literal["json", "msgpack", "schema"]
+EventHeaders = tuple[tuple[str, bytes], ...]
+
+_SCHEMA_MAGIC = 0xDC
+
+
+class EventDecodeError(ValueError):
+    """El mensaje no se pudo decodificar con el formato declarado."""
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedEvent:
+    """Bytes listos para el broker junto con sus headers."""
+
+    value: bytes
+    headers: EventHeaders
+
+
+class EventSerializer(Protocol):
+    """Contrato de un formato de eventos."""
+
+    @property
+    def content_type(self) -> str:
+        """Valor del header `content-type` que produce este formato."""
+
+    def encode(self, event_name: str, payload: Mapping[str, Any]) -> EncodedEvent:
+        """Serializa un evento."""
+
+    def decode(self, value: bytes, headers: Mapping[str, bytes]) -> tuple[str, dict[str, Any]]:
+        """Devuelve (event_name, payload)."""
+
+
+class JsonEventSerializer(EventSerializer):
+    """Sobre JSON historico."""
+
+    @property
+    def content_type(self) -> str:
+        return JSON_CONTENT_TYPE
+
+    def encode(self, event_name: str, payload: Mapping[str, Any]) -> EncodedEvent:
+        message_payload = {
+            "event_name": event_name,
+            "payload": dict(payload),
+        }
+        return EncodedEvent(
+            value=json.dumps(message_payload, ensure_ascii=True).encode("utf-8"),
+            headers=((CONTENT_TYPE_HEADER, JSON_CONTENT_TYPE.encode("ascii")),),
+        )
+
+    def decode(self, value: bytes, headers: Mapping[str, bytes]) -> tuple[str, dict[str, Any]]:
+        message = json.loads(value)
+        return str(message["event_name"]), dict(message["payload"])
+
+
+class MsgpackEventSerializer(EventSerializer):
+    """Mismo sobre que JSON, codificado en MessagePack."""
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise RuntimeError(
+                "El formato msgpack requiere `msgpack` instalado (poetry install --extras msgpack)."
+            )
+
+    @property
+    def content_type(self) -> str:
+        return MSGPACK_CONTENT_TYPE
+
+    def encode(self, event_name: str, payload: Mapping[str, Any]) -> EncodedEvent:
+        value = msgpack.packb({"event_name": event_name, "payload": dict(payload)})
+        return EncodedEvent(
+            value=value,
+            headers=((CONTENT_TYPE_HEADER, MSGPACK_CONTENT_TYPE.encode("ascii")),),
+        )
+
+    def decode(self, value: bytes, headers: Mapping[str, bytes]) -> tuple[str, dict[str, Any]]:
+        message = msgpack.unpackb(value)
+        return str(message["event_name"]), dict(message["payload"])
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """Entero sin signo en base 128 (LEB128)."""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_signed(buffer: bytearray, value: int) -> None:
+    """Entero con signo en zigzag: valores pequenos usan pocos bytes sin importar el signo."""
+    _write_varint(buffer, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+
+def _write_text(buffer: bytearray, value: str) -> None:
+    raw = value.encode("utf-8")
+    _write_varint(buffer, len(raw))
+    buffer += raw
+
+
+def _uuid_bytes(value: Any) -> bytes:
+    """UUID textual a 16 bytes sin construir `UUID` (mas barato en el camino caliente)."""
+    raw = bytes.fromhex(str(value).replace("-", ""))
+    if len(raw) != 16:
+        raise ValueError(f"UUID invalido: {value!r}.")
+    return raw
+
+
+def _uuid_text(raw: bytes) -> str:
+    """16 bytes a la forma canonica `8-4-4-4-12` (igual que `str(UUID)`)."""
+    text = raw.hex()
+    return f"{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}"
+
+
+def _decimal_parts(value: Any) -> tuple[int, int]:
+    """Decimal como (coeficiente, exponente); round-trip exacto de "5", "5.00" o "-0.16"."""
+    if isinstance(value, str) and "e" not in value and "E" not in value:
+        # Los payloads ya traen `str(Decimal)`: partir el texto evita un Decimal por campo.
+        whole, _, fraction = value.partition(".")
+        return int(whole + fraction), -len(fraction)
+    sign, digits, exponent = Decimal(str(value)).as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f"Decimal no finito: {value!r}.")
+    coefficient = int("".join(map(str, digits)) or "0")
+    return (-coefficient if sign else coefficient), exponent
+
+
+def _decimal_text(coefficient: int, exponent: int) -> str:
+    """Inverso de `_decimal_parts` en notacion plana."""
+    if exponent >= 0:
+        return str(Decimal(coefficient).scaleb(exponent)) if exponent else str(coefficient)
+    digits = str(abs(coefficient)).rjust(1 - exponent, "0")
+    sign = "-" if coefficient < 0 else ""
+    return f"{sign}{digits[:exponent]}.{digits[exponent:]}"
+
+
+class _Reader:
+    """Cursor sobre el mensaje binario."""
+
+    __slots__ = ("_data", "_position")
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._position = 0
+
+    def byte(self) -> int:
+        value = self._data[self._position]
+        self._position += 1
+        return value
+
+    def varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            value = self.byte()
+            result |= (value & 0x7F) << shift
+            if value < 0x80:
+                return result
+            shift += 7
+
+    def signed(self) -> int:
+        value = self.varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def raw(self, size: int) -> bytes:
+        end = self._position + size
+        if end > len(self._data):
+            raise EventDecodeError("Mensaje binario truncado.")
+        value = self._data[self._position : end]
+        self._position = end
+        return value
+
+    def text(self) -> str:
+        return self.raw(self.varint()).decode("utf-8")
+
+    def at_end(self) -> bool:
+        return self._position == len(self._data)
+
+
+def _encode_fields(
+    buffer: bytearray, fields: tuple[SchemaField, ...], record: Mapping[str, Any], path: str
+) -> None:
+    """Escribe los campos de un registro en el orden del schema."""
+    unknown = set(record) - {field.name for field in fields}
+    if unknown:
+        # Perder campos en silencio romperia a consumidores; se exige nueva version de schema.
+        raise ValueError(f"{path}: campos sin schema {sorted(unknown)}; registra nueva version.")
+    for field in fields:
+        if field.name not in record:
+            raise ValueError(f"{path}: falta el campo '{field.name}'.")
+        value = record[field.name]
+        if field.nullable:
+            buffer.append(0 if value is None else 1)
+            if value is None:
+                continue
+        elif value is None:
+            raise ValueError(f"{path}: '{field.name}' no admite null.")
+
+        if field.type == "uuid":
+            buffer += value.bytes if isinstance(value, UUID) else _uuid_bytes(value)
+        elif field.type == "string":
+            _write_text(buffer, str(value))
+        elif field.type == "int":
+            _write_signed(buffer, int(value))
+        elif field.type == "bool":
+            buffer.append(1 if value else 0)
+        elif field.type == "decimal":
+            coefficient, exponent = _decimal_parts(value)
+            _write_signed(buffer, coefficient)
+            _write_signed(buffer, exponent)
+        else:
+            _write_varint(buffer, len(value))
+            for position, item in enumerate(value):
+                _encode_fields(buffer, field.fields, item, f"{path}.{field.name}[{position}]")
+
+
+def _decode_fields(reader: _Reader, fields: tuple[SchemaField, ...]) -> dict[str, Any]:
+    """Lee un registro; tipos de salida iguales a los del payload JSON."""
+    record: dict[str, Any] = {}
+    for field in fields:
+        if field.nullable and reader.byte() == 0:
+            record[field.name] = None
+            continue
+        if field.type == "uuid":
+            record[field.name] = _uuid_text(reader.raw(16))
+        elif field.type == "string":
+            record[field.name] = reader.text()
+        elif field.type == "int":
+            record[field.name] = reader.signed()
+        elif field.type == "bool":
+            record[field.name] = reader.byte() == 1
+        elif field.type == "decimal":
+            coefficient = reader.signed()
+            record[field.name] = _decimal_text(coefficient, reader.signed())
+        else:
+            record[field.name] = [
+                _decode_fields(reader, field.fields) for _ in range(reader.varint())
+            ]
+    return record
+
+
+class SchemaEventSerializer(EventSerializer):
+    """Binario compacto guiado por schemas versionados.
+
+    Layout: `0xDC` + varint(version) + event_name + campos en orden del schema.
+    La version tambien viaja en el header `schema-version` para que un consumidor
+    descarte o difiera mensajes que no sabe leer sin abrir el cuerpo.
+    """
+
+    def __init__(
+        self,
+        registry: FileSchemaRegistry,
+        fallback: EventSerializer | None = None,
+    ) -> None:
+        self._registry = registry
+        self._fallback = fallback or JsonEventSerializer()
+
+    @property
+    def content_type(self) -> str:
+        return SCHEMA_CONTENT_TYPE
+
+    def encode(self, event_name: str, payload: Mapping[str, Any]) -> EncodedEvent:
+        schema = self._registry.latest(event_name)
+        if schema is None:
+            return self._fallback.encode(event_name, payload)
+        buffer = bytearray((_SCHEMA_MAGIC,))
+        _write_varint(buffer, schema.version)
+        _write_text(buffer, event_name)
+        _encode_fields(buffer, schema.fields, payload, event_name)
+        return EncodedEvent(
+            value=bytes(buffer),
+            headers=(
+                (CONTENT_TYPE_HEADER, SCHEMA_CONTENT_TYPE.encode("ascii")),
+                (SCHEMA_VERSION_HEADER, str(schema.version).encode("ascii")),
+            ),
+        )
+
+    def decode(self, value: bytes, headers: Mapping[str, bytes]) -> tuple[str, dict[str, Any]]:
+        reader = _Reader(value)
+        if reader.byte() != _SCHEMA_MAGIC:
+            raise EventDecodeError("El mensaje no esta en formato binario de eventos.")
+        version = reader.varint()
+        event_name = reader.text()
+        schema: EventSchema = self._registry.get(event_name, version)
+        payload = _decode_fields(reader, schema.fields)
+        if not reader.at_end():
+            raise EventDecodeError(f"Bytes sobrantes al decodificar {event_name} v{version}.")
+        return event_name, payload
+
+
+class EventCodec:
+    """Escribe con un formato y lee cualquiera de los registrados segun `content-type`."""
+
+    def __init__(self, writer: EventSerializer, readers: Sequence[EventSerializer] = ()) -> None:
+        self._writer = writer
+        self._readers: dict[str, EventSerializer] = {JSON_CONTENT_TYPE: JsonEventSerializer()}
+        for reader in (*readers, writer):
+            self._readers[reader.content_type] = reader
+
+    @property
+    def content_type(self) -> str:
+        return self._writer.content_type
+
+    def encode(self, event_name: str, payload: Mapping[str, Any]) -> EncodedEvent:
+        """Serializa con el formato de escritura."""
+        return self._writer.encode(event_name, payload)
+
+    def decode(
+        self, value: bytes, headers: Sequence[tuple[str, bytes]] | None = None
+    ) -> tuple[str, dict[str, Any]]:
+        """Decodifica segun headers; sin `content-type` asume el JSON historico."""
+        header_map = {key: header_value for key, header_value in headers or ()}
+        content_type = header_map.get(CONTENT_TYPE_HEADER, JSON_CONTENT_TYPE.encode("ascii"))
+        reader = self._readers.get(content_type.decode("ascii"))
+        if reader is None:
+            raise EventDecodeError(f"Formato de evento no soportado: {content_type!r}.")
+        try:
+            return reader.decode(value, header_map)
+        except UnknownEventSchemaError:
+            raise
+        except (KeyError, IndexError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise EventDecodeError(f"Evento malformado ({content_type!r}): {exc}") from exc
+
+
+def build_event_serializer(
+    event_format: EventFormat, schema_dir: Path = DEFAULT_SCHEMA_DIR
+) -> EventSerializer:
+    """Instancia el formato pedido."""
+    if event_format == "msgpack":
+        return MsgpackEventSerializer()
+    if event_format == "schema":
+        return SchemaEventSerializer(FileSchemaRegistry(schema_dir))
+    return JsonEventSerializer()
+
+
+def build_event_codec(settings: InfrastructureSettings) -> EventCodec:
+    """Codec del servicio: escribe en `event_format` y lee JSON, schema y msgpack si existe."""
+    schema_dir = (
+        Path(settings.event_schema_dir) if settings.event_schema_dir else DEFAULT_SCHEMA_DIR
+    )
+    readers: list[EventSerializer] = [SchemaEventSerializer(FileSchemaRegistry(schema_dir))]
+    if msgpack is not None:
+        readers.append(MsgpackEventSerializer())
+    return EventCodec(
+        writer=build_event_serializer(settings.event_format, schema_dir),
+        readers=readers,
+    )
@@ -0,0 +1,151 @@
+"""Benchmark de formatos de eventos: bytes por evento y costo de encode/decode.
+
+Uso:
+    poetry run python -m src.infrastructure.events.serialization_benchmark --events 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from decimal import Decimal
+from time import perf_counter
+from typing import Any
+from uuid import UUID
+
+from src.infrastructure.events.serialization import (
+    EventFormat,
+    EventSerializer,
+    build_event_serializer,
+)
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - formato opcional del benchmark.
+    msgpack = None
+
+ORDER_CREATED_EVENT = "orders.created.v1"
+ORDER_STATUS_CHANGED_EVENT = "orders.status_changed.v1"
+
+
+def _money(randomizer: random.Random, low: int, high: int) -> Decimal:
+    return Decimal(randomizer.randint(low * 100, high * 100)).scaleb(-2)
+
+
+def build_sample_events(
+    count: int, items_per_order: int, seed: int
+) -> list[tuple[str, dict[str, Any]]]:
+    """Mezcla 1:1 de creaciones y cambios de estado con la forma real de los payloads."""
+    randomizer = random.Random(seed)
+    events: list[tuple[str, dict[str, Any]]] = []
+    for index in range(count):
+        order_id = str(UUID(int=randomizer.getrandbits(128), version=4))
+        if index % 2:
+            events.append(
+                (
+                    ORDER_STATUS_CHANGED_EVENT,
+                    {
+                        "order_id": order_id,
+                        "status": "IN_PROGRESS",
+                        "cancellation_reason": None,
+                        "branch_id": f"SUC-{randomizer.randint(1, 12):02d}",
+                    },
+                )
+            )
+            continue
+        items: list[dict[str, Any]] = []
+        subtotal = Decimal("0")
+        for _ in range(items_per_order):
+            unit_price = _money(randomizer, 20, 250)
+            quantity = randomizer.randint(1, 4)
+            line_subtotal = unit_price * quantity
+            subtotal += line_subtotal
+            items.append(
+                {
+                    "product_id": str(UUID(int=randomizer.getrandbits(128), version=4)),
+                    "product_name": f"Chilaquiles {randomizer.randint(1, 40)}",
+                    "unit_price": str(unit_price),
+                    "quantity": quantity,
+                    "subtotal": str(line_subtotal),
+                }
+            )
+        tax_total = (subtotal * Decimal("0.16")).quantize(Decimal("0.01"))
+        shipping_cost = Decimal("35.00")
+        events.append(
+            (
+                ORDER_CREATED_EVENT,
+                {
+                    "order_id": order_id,
+                    "customer_id": str(UUID(int=randomizer.getrandbits(128), version=4)),
+                    "status": "PENDING",
+                    "total": str(subtotal + tax_total + shipping_cost),
+                    "item_count": len(items),
+                    "customer_email": f"cliente{index}@distrito.mx",
+                    "branch_id": f"SUC-{randomizer.randint(1, 12):02d}",
+                    "shipping_cost": str(shipping_cost),
+                    "tax_rate": "0.16",
+                    "subtotal": str(subtotal),
+                    "tax_total": str(tax_total),
+                    "items": items,
+                },
+            )
+        )
+    return events
+
+
+def measure_format(
+    serializer: EventSerializer, events: list[tuple[str, dict[str, Any]]]
+) -> dict[str, float]:
+    """Encode y decode de todos los eventos; verifica round-trip exacto."""
+    start_time = perf_counter()
+    encoded = [serializer.encode(event_name, payload) for event_name, payload in events]
+    encode_s = perf_counter() - start_time
+
+    start_time = perf_counter()
+    decoded = [serializer.decode(message.value, dict(message.headers)) for message in encoded]
+    decode_s = perf_counter() - start_time
+
+    if decoded != events:
+        raise AssertionError(f"{serializer.content_type}: round-trip distinto al original.")
+    total_bytes = sum(len(message.value) for message in encoded)
+    return {
+        "bytes_per_event": total_bytes / len(events),
+        "encode_us": encode_s / len(events) * 1_000_000,
+        "decode_us": decode_s / len(events) * 1_000_000,
+    }
+
+
+def run_benchmark(
+    events: int, items_per_order: int, seed: int = 7
+) -> dict[EventFormat, dict[str, float]]:
+    """Mide cada formato disponible con el mismo lote de eventos."""
+    sample = build_sample_events(events, items_per_order, seed)
+    formats: list[EventFormat] = ["json", "schema"]
+    if msgpack is not None:
+        formats.insert(1, "msgpack")
+    return {
+        event_format: measure_format(build_event_serializer(event_format), sample)
+        for event_format in formats
+    }
+
+
+def main() -> None:
+    """CLI del benchmark de serializacion."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs msgpack vs binario con schema.")
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--items-per-order", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run_benchmark(events=args.events, items_per_order=args.items_per_order)
+    baseline = results["json"]
+    for event_format, metrics in results.items():
+        print(
+            f"BENCH format={event_format} events={args.events} | "
+            f"bytes/event={metrics['bytes_per_event']:.1f} "
+            f"({metrics['bytes_per_event'] / baseline['bytes_per_event']:.0%} de json) | "
+            f"encode={metrics['encode_us']:.2f}us decode={metrics['decode_us']:.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
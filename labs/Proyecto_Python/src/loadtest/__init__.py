@@ -0,0 +1,7 @@
+"""Pruebas de carga HTTP de la API con un stack local sustituto.
+
+`stack` arma la app con un `ApiContainer` inyectado (SQLite async o PostgreSQL y
+broker de eventos en memoria); `runner` genera la carga y reporta percentiles.
+"""
+
+__all__ = ["runner", "stack"]
@@ -0,0 +1,475 @@
+"""Generador de carga HTTP: throughput, p50/p95/p99 y errores por ruta.
+
+Por defecto levanta la app en proceso (`httpx.ASGITransport`) con el stack de
+`src.loadtest.stack`; con `--base-url` golpea un servidor ya corriendo.
+La mezcla de operaciones se elige al azar con semilla fija para que dos
+corridas sean comparables. El reporte es JSON estable para guardarlo como
+baseline y compararlo despues.
+
+Cada corrida se compara contra `data/benchmark/api_baseline.json` (versionado,
+con el entorno en que se midio); si el entorno o la configuracion no coinciden
+se avisa, porque los numeros dejan de ser comparables.
+
+Uso:
+    poetry run python -m src.loadtest.runner --requests 5000 --concurrency 32
+    poetry run python -m src.loadtest.runner --persistence memory --no-compare
+    poetry run python -m src.loadtest.runner --output data/benchmark/api_baseline.json
+    poetry run python -m src.loadtest.runner --compare otro_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Literal
+
+import httpx
+
+from src.infrastructure.db.instrumentation import server_timing_queries
+from src.loadtest.stack import build_stack
+
+REPORT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_BASELINE = Path("data/benchmark/api_baseline.json")
+ENVIRONMENT_KEYS = ("python", "platform", "cpu_count", "target", "config")
+DEFAULT_MIX = {"create_order": 0.3, "get_order": 0.6, "list_orders": 0.1}
+ROUTES = {
+    "create_order": "POST /orders",
+    "get_order": "GET /orders/{order_id}",
+    "list_orders": "GET /orders",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LoadTestConfig:
+    """Parametros de una corrida."""
+
+    requests: int = 2_000
+    concurrency: int = 16
+    warmup_requests: int = 50
+    customers: int = 20
+    products: int = 50
+    mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    read_model: bool = False
+    seed: int = 7
+
+
+@dataclass(frozen=True, slots=True)
+class RouteStats:
+    """Metricas agregadas de una ruta."""
+
+    route: str
+    requests: int
+    errors: int
+    error_rate: float
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    max_db_queries: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    """Metrica que empeoro por encima del umbral contra el baseline."""
+
+    route: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Percentil por rango mas cercano sobre valores ya ordenados."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class _Workload:
+    """Estado compartido por los workers: ids sembrados y latencias por ruta."""
+
+    def __init__(self, client: httpx.AsyncClient, config: LoadTestConfig) -> None:
+        self._client = client
+        self._config = config
+        self._random = random.Random(config.seed)
+        self.customer_ids: list[str] = []
+        self.product_ids: list[str] = []
+        self.order_ids: list[str] = []
+        self.latencies: dict[str, list[float]] = {route: [] for route in ROUTES.values()}
+        self.errors: dict[str, int] = dict.fromkeys(ROUTES.values(), 0)
+        self.max_db_queries: dict[str, int] = {}
+        self.recording = False
+
+    async def seed(self) -> None:
+        """Crea clientes, productos y una orden por cliente antes de medir."""
+        run_tag = f"{self._random.getrandbits(32):08x}"
+        for index in range(self._config.customers):
+            response = await self._client.post(
+                "/customers",
+                json={
+                    "full_name": f"Cliente Carga {index}",
+                    "email": f"carga-{run_tag}-{index}@distrito.mx",
+                },
+            )
+            response.raise_for_status()
+            self.customer_ids.append(response.json()["customer_id"])
+        for index in range(self._config.products):
+            response = await self._client.post(
+                "/products",
+                json={
+                    "sku": f"LOAD-{run_tag}-{index:04d}",
+                    "name": f"Producto carga {index}",
+                    "unit_price": f"{self._random.randint(2_000, 25_000) / 100:.2f}",
+                },
+            )
+            response.raise_for_status()
+            self.product_ids.append(response.json()["product_id"])
+        for _ in self.customer_ids:
+            await self.create_order()
+
+    async def _timed(self, route: str, call: Callable[[], Awaitable[httpx.Response]]) -> None:
+        start_time = perf_counter()
+        try:
+            response = await call()
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            response = None
+            failed = True
+        elapsed_ms = (perf_counter() - start_time) * 1000
+        if self.recording:
+            self.latencies[route].append(elapsed_ms)
+            if failed:
+                self.errors[route] += 1
+            queries = server_timing_queries(response.headers) if response is not None else None
+            if queries is not None and not failed:
+                self.max_db_queries[route] = max(self.max_db_queries.get(route, 0), queries)
+        if route == ROUTES["create_order"] and response is not None and not failed:
+            self.order_ids.append(response.json()["order_id"])
+
+    async def create_order(self) -> None:
+        items = [
+            {"product_id": product_id, "quantity": self._random.randint(1, 3)}
+            for product_id in self._random.sample(self.product_ids, k=min(3, len(self.product_ids)))
+        ]
+        body = {
+            "customer_id": self._random.choice(self.customer_ids),
+            "branch_id": f"SUC-{self._random.randint(1, 12):02d}",
+            "shipping_cost": "35.00",
+            "items": items,
+        }
+        await self._timed(ROUTES["create_order"], lambda: self._client.post("/orders", json=body))
+
+    async def get_order(self) -> None:
+        order_id = self._random.choice(self.order_ids)
+        params = {"read_model": "true"} if self._config.read_model else None
+        await self._timed(
+            ROUTES["get_order"],
+            lambda: self._client.get(f"/orders/{order_id}", params=params),
+        )
+
+    async def list_orders(self) -> None:
+        params = {"status": "PENDING"}
+        if self._config.read_model:
+            params["read_model"] = "true"
+        await self._timed(ROUTES["list_orders"], lambda: self._client.get("/orders", params=params))
+
+    def next_operation(self) -> Callable[[], Awaitable[None]]:
+        names = list(self._config.mix)
+        weights = [self._config.mix[name] for name in names]
+        name = self._random.choices(names, weights=weights, k=1)[0]
+        operation: Callable[[], Awaitable[None]] = getattr(self, name)
+        return operation
+
+
+async def _drive(workload: _Workload, total: int, concurrency: int) -> float:
+    """Reparte `total` requests entre `concurrency` workers; devuelve segundos de pared."""
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await workload.next_operation()()
+
+    start_time = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return perf_counter() - start_time
+
+
+def _route_stats(workload: _Workload, wall_seconds: float) -> list[RouteStats]:
+    stats: list[RouteStats] = []
+    for route, values in workload.latencies.items():
+        if not values:
+            continue
+        ordered = sorted(values)
+        errors = workload.errors[route]
+        stats.append(
+            RouteStats(
+                route=route,
+                requests=len(ordered),
+                errors=errors,
+                error_rate=errors / len(ordered),
+                requests_per_second=len(ordered) / wall_seconds,
+                p50_ms=percentile(ordered, 50),
+                p95_ms=percentile(ordered, 95),
+                p99_ms=percentile(ordered, 99),
+                max_ms=ordered[-1],
+                max_db_queries=workload.max_db_queries.get(route),
+            )
+        )
+    all_values = sorted(value for values in workload.latencies.values() for value in values)
+    total_errors = sum(workload.errors.values())
+    stats.append(
+        RouteStats(
+            route="ALL",
+            requests=len(all_values),
+            errors=total_errors,
+            error_rate=total_errors / len(all_values) if all_values else 0.0,
+            requests_per_second=len(all_values) / wall_seconds,
+            p50_ms=percentile(all_values, 50),
+            p95_ms=percentile(all_values, 95),
+            p99_ms=percentile(all_values, 99),
+            max_ms=all_values[-1] if all_values else 0.0,
+        )
+    )
+    return stats
+
+
+async def run_load_test(client: httpx.AsyncClient, config: LoadTestConfig) -> dict[str, Any]:
+    """Siembra datos, calienta y mide; devuelve el bloque `results` del reporte."""
+    if config.concurrency < 1 or config.requests < 1:
+        raise ValueError("requests y concurrency deben ser mayores a 0.")
+    unknown = set(config.mix) - set(ROUTES)
+    if unknown:
+        raise ValueError(f"Operaciones desconocidas en la mezcla: {sorted(unknown)}.")
+
+    workload = _Workload(client, config)
+    await workload.seed()
+    await _drive(workload, config.warmup_requests, config.concurrency)
+    workload.recording = True
+    wall_seconds = await _drive(workload, config.requests, config.concurrency)
+    return {
+        "wall_seconds": wall_seconds,
+        "routes": [asdict(stats) for stats in _route_stats(workload, wall_seconds)],
+    }
+
+
+def _git_commit() -> str | None:
+    """Commit actual, si la prueba corre dentro de un repo git."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+async def _run(
+    config: LoadTestConfig,
+    base_url: str | None,
+    database_url: str | None,
+    publish_latency_ms: float,
+    persistence: Literal["sqlite", "memory"] = "sqlite",
+) -> dict[str, Any]:
+    """Corre contra `base_url` o contra la app en proceso."""
+    target: dict[str, Any]
+    if base_url is not None:
+        async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+            results = await run_load_test(client, config)
+        target = {"mode": "http", "base_url": base_url}
+    else:
+        # `build_stack` usa `run_sync`, que no se puede llamar desde un loop activo.
+        stack = await asyncio.to_thread(
+            build_stack, database_url, publish_latency_ms, persistence=persistence
+        )
+        try:
+            transport = httpx.ASGITransport(app=stack.app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://loadtest", timeout=30
+            ) as client:
+                results = await run_load_test(client, config)
+        finally:
+            await asyncio.to_thread(stack.close)
+        target = {
+            "mode": "asgi",
+            "database": stack.database_label,
+            "publish_latency_ms": publish_latency_ms,
+        }
+    return {
+        "version": REPORT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "target": target,
+        "config": asdict(config),
+        "results": results,
+    }
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Rutas cuyo p95/p99 subio, throughput bajo o tasa de error subio mas que `threshold`.
+
+    El maximo de queries por request no usa umbral: cualquier aumento es un N+1 probable.
+    """
+    previous_routes = {route["route"]: route for route in baseline["results"]["routes"]}
+    regressions: list[Regression] = []
+    for route in current["results"]["routes"]:
+        previous = previous_routes.get(route["route"])
+        if previous is None:
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            if previous[metric] and route[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    Regression(route["route"], metric, previous[metric], route[metric])
+                )
+        before_rps = previous["requests_per_second"]
+        if before_rps and route["requests_per_second"] < before_rps * (1 - threshold):
+            regressions.append(
+                Regression(
+                    route["route"],
+                    "requests_per_second",
+                    before_rps,
+                    route["requests_per_second"],
+                )
+            )
+        before_queries = previous.get("max_db_queries")
+        current_queries = route.get("max_db_queries")
+        if (
+            before_queries is not None
+            and current_queries is not None
+            and current_queries > before_queries
+        ):
+            regressions.append(
+                Regression(route["route"], "max_db_queries", before_queries, current_queries)
+            )
+        if route["error_rate"] > previous["error_rate"] + threshold / 10:
+            regressions.append(
+                Regression(
+                    route["route"], "error_rate", previous["error_rate"], route["error_rate"]
+                )
+            )
+    return regressions
+
+
+def environment_mismatches(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Claves de entorno/configuracion en que difieren dos reportes."""
+    return [key for key in ENVIRONMENT_KEYS if baseline.get(key) != current.get(key)]
+
+
+def _parse_mix(raw: str) -> dict[str, float]:
+    """`create_order=0.3,get_order=0.6,list_orders=0.1` a diccionario."""
+    mix: dict[str, float] = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def main() -> None:
+    """CLI de pruebas de carga."""
+    parser = argparse.ArgumentParser(description="Prueba de carga HTTP de la API.")
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--mix",
+        type=_parse_mix,
+        default=dict(DEFAULT_MIX),
+        help="Pesos por operacion, ej. create_order=0.3,get_order=0.6,list_orders=0.1",
+    )
+    parser.add_argument("--read-model", action="store_true", help="Lecturas desde order_view.")
+    parser.add_argument("--base-url", default=None, help="Servidor ya corriendo (modo HTTP).")
+    parser.add_argument(
+        "--database-url", default=None, help="URL async; por defecto SQLite temporal."
+    )
+    parser.add_argument(
+        "--persistence",
+        choices=("sqlite", "memory"),
+        default="sqlite",
+        help="Sin --database-url: SQLite temporal o repositorios en memoria.",
+    )
+    parser.add_argument("--publish-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, default=Path("data/benchmark/api_loadtest.json"))
+    parser.add_argument(
+        "--compare", type=Path, default=DEFAULT_BASELINE, help="Reporte baseline JSON."
+    )
+    parser.add_argument(
+        "--no-compare", dest="compare", action="store_const", const=None, help="Sin baseline."
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    config = LoadTestConfig(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        warmup_requests=args.warmup,
+        mix=args.mix,
+        read_model=args.read_model,
+        seed=args.seed,
+    )
+    # Se lee antes de escribir: `--output` puede apuntar al mismo archivo.
+    baseline = (
+        json.loads(args.compare.read_text(encoding="utf-8"))
+        if args.compare is not None and args.compare.exists()
+        else None
+    )
+    if args.compare is not None and baseline is None:
+        print(f"COMPARE skipped | baseline {args.compare} no existe")
+    report = asyncio.run(
+        _run(
+            config,
+            args.base_url,
+            args.database_url,
+            args.publish_latency_ms,
+            persistence=args.persistence,
+        )
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    for route in report["results"]["routes"]:
+        print(
+            f"LOAD route={route['route']} | requests={route['requests']} | "
+            f"rps={route['requests_per_second']:.1f} | p50={route['p50_ms']:.1f}ms "
+            f"p95={route['p95_ms']:.1f}ms p99={route['p99_ms']:.1f}ms | "
+            f"errors={route['errors']} ({route['error_rate']:.2%}) | "
+            f"max_queries={route['max_db_queries']}"
+        )
+
+    if baseline is not None:
+        for key in environment_mismatches(baseline, report):
+            print(f"WARNING baseline {key} distinto: {baseline.get(key)!r} -> {report.get(key)!r}")
+        regressions = compare_reports(baseline, report, threshold=args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION route={regression.route} | {regression.metric} "
+                f"{regression.baseline:.3f} -> {regression.current:.3f}"
+            )
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
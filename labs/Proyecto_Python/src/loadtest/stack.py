@@ -0,0 +1,119 @@
+"""Stack local para pruebas de carga: app FastAPI con contenedor inyectado.
+
+El lifespan respeta un `ApiContainer` ya presente en `app.state`, asi que aqui
+se arma el contenedor a mano con:
+
+- DB: `sqlite+aiosqlite` en archivo temporal (tablas via `create_all`), repositorios
+  en memoria (`persistence="memory"`, mide solo Python) o la URL de PostgreSQL
+  indicada (se asume migrada con Alembic). SQLite admite un solo escritor: con
+  mucha concurrencia de `POST /orders` aparecen 503 por lock; para cargas de
+  escritura conviene PostgreSQL o memoria.
+- Eventos: `InMemoryEventPublisher` sobre `InMemoryBroker`, con latencia de ack
+  opcional; el costo de serializar y publicar sigue en la medicion.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from fastapi import FastAPI
+
+from src.infrastructure.api.dependencies import ApiContainer
+from src.infrastructure.api.main import create_app
+from src.infrastructure.common.async_runner import run_sync
+from src.infrastructure.db.in_memory import InMemoryStore
+from src.infrastructure.db.session import (
+    build_async_engine,
+    build_session_factory,
+    create_sqlite_schema,
+)
+from src.infrastructure.events.in_memory_broker import (
+    InMemoryBroker,
+    InMemoryEventPublisher,
+    build_in_memory_broker,
+)
+from src.infrastructure.events.serialization import build_event_codec
+from src.infrastructure.settings import InfrastructureSettings
+
+
+@dataclass(frozen=True, slots=True)
+class LoadTestStack:
+    """App lista para recibir requests mas los recursos a liberar al final."""
+
+    app: FastAPI
+    container: ApiContainer
+    broker: InMemoryBroker
+    database_label: str
+    temp_database: Path | None = None
+
+    def close(self) -> None:
+        """Libera conexiones y borra la base temporal si se creo."""
+        run_sync(self.container.engine.dispose())
+        if self.temp_database is not None:
+            self.temp_database.unlink(missing_ok=True)
+
+
+def build_stack(
+    database_url: str | None = None,
+    publish_latency_ms: float = 0.0,
+    event_format: str = "json",
+    persistence: Literal["sqlite", "memory"] = "sqlite",
+) -> LoadTestStack:
+    """Construye la app con DB sustituta y broker en memoria.
+
+    Con `database_url` se usa esa base y `persistence` se ignora.
+    """
+    temp_database: Path | None = None
+    backend = "postgres" if database_url is not None else persistence
+    if backend == "sqlite":
+        descriptor, raw_path = tempfile.mkstemp(prefix="dc-loadtest-", suffix=".db")
+        os.close(descriptor)
+        temp_database = Path(raw_path)
+
+    settings = InfrastructureSettings.model_validate(
+        {
+            "database_url": database_url or InfrastructureSettings().database_url,
+            "persistence_backend": backend,
+            "sqlite_path": str(temp_database) if temp_database is not None else "",
+            "log_level": "WARNING",
+            "kafka_enabled": False,
+            "event_broker": "memory",
+            "event_format": event_format,
+            "memory_broker_latency_ms": publish_latency_ms,
+        }
+    )
+    engine = build_async_engine(settings)
+    broker = build_in_memory_broker(settings)
+    container = ApiContainer(
+        settings=settings,
+        engine=engine,
+        session_factory=build_session_factory(engine),
+        event_publisher=InMemoryEventPublisher(
+            broker,
+            topic=settings.kafka_topic_orders,
+            codec=build_event_codec(settings),
+            key_strategy=settings.kafka_partition_key,
+        ),
+        event_broker=broker,
+        memory_store=InMemoryStore() if backend == "memory" else None,
+    )
+    if backend == "sqlite":
+        run_sync(create_sqlite_schema(engine))
+
+    app = create_app(settings)
+    app.state.container = container
+    # El log por request es I/O sincrono y no debe entrar en la medicion; `configure_logging`
+    # no reconfigura si `main` ya lo hizo al importarse, por eso se ajusta el root aqui.
+    logging.getLogger().setLevel(logging.WARNING)
+    return LoadTestStack(
+        app=app,
+        container=container,
+        broker=broker,
+        database_label=backend,
+        temp_database=temp_database,
+    )
@@ -0,0 +1,38 @@
+"""Fixtures comunes: API con backend en memoria y broker en proceso."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from src.infrastructure.api.main import create_app
+from src.infrastructure.settings import InfrastructureSettings
+
+ClientFactory = Callable[..., TestClient]
+
+
+@pytest.fixture
+def make_client() -> Iterator[ClientFactory]:
+    """Crea TestClients con lifespan activo; los kwargs sobreescriben settings."""
+    clients: list[TestClient] = []
+
+    def factory(**overrides: Any) -> TestClient:
+        settings = InfrastructureSettings.model_validate(
+            {"persistence_backend": "memory", "event_broker": "memory", **overrides}
+        )
+        client = TestClient(create_app(settings))
+        client.__enter__()
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.__exit__(None, None, None)
+
+
+@pytest.fixture
+def client(make_client: ClientFactory) -> TestClient:
+    """API con backend en memoria y settings por defecto."""
+    return make_client()
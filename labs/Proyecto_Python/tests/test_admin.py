@@ -0,0 +1,35 @@
+"""Acceso a las rutas `/admin/*`."""
+
+from __future__ import annotations
+
+import pytest
+from tests.conftest import ClientFactory
+
+
+@pytest.mark.parametrize("path", ["/admin/profile?seconds=0.05", "/admin/slow-queries"])
+def test_admin_routes_are_hidden_without_admin_token(make_client: ClientFactory, path: str) -> None:
+    client = make_client()
+
+    response = client.get(path)
+
+    assert response.status_code == 404
+
+
+def test_admin_routes_reject_missing_or_wrong_token(make_client: ClientFactory) -> None:
+    client = make_client(admin_token="secreto")
+
+    assert client.get("/admin/slow-queries").status_code == 403
+    assert client.get("/admin/slow-queries", headers={"X-Admin-Token": "otro"}).status_code == 403
+
+
+def test_profile_runs_with_admin_token(make_client: ClientFactory) -> None:
+    client = make_client(admin_token="secreto")
+
+    response = client.get(
+        "/admin/profile",
+        params={"seconds": 0.05, "format": "json"},
+        headers={"X-Admin-Token": "secreto"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["samples"] > 0
@@ -0,0 +1,75 @@
+"""GET condicional: ETag fuerte, 304 con `If-None-Match` y cambio tras escrituras."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from src.infrastructure.api.conditional import build_etag, matches_if_none_match
+from tests.conftest import ClientFactory
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend_client(
+    request: pytest.FixtureRequest, make_client: ClientFactory, tmp_path: Path
+) -> TestClient:
+    if request.param == "sqlite":
+        return make_client(persistence_backend="sqlite", sqlite_path=str(tmp_path / "db.sqlite3"))
+    return make_client()
+
+
+def test_if_none_match_uses_weak_comparison() -> None:
+    etag = build_etag("v1")
+
+    assert matches_if_none_match(f'"otro", W/{etag}', etag)
+    assert matches_if_none_match("*", etag)
+    assert not matches_if_none_match(None, etag)
+    assert not matches_if_none_match(build_etag("v2"), etag)
+
+
+def test_customer_list_revalidates_until_a_new_customer(backend_client: TestClient) -> None:
+    backend_client.post("/customers", json={"full_name": "Ana Lopez", "email": "ana@example.com"})
+    first = backend_client.get("/customers")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    cached = backend_client.get("/customers", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    backend_client.post("/customers", json={"full_name": "Beto Ruiz", "email": "beto@example.com"})
+    refreshed = backend_client.get("/customers", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+    assert len(refreshed.json()) == 2
+
+
+def test_order_etag_changes_with_status(backend_client: TestClient) -> None:
+    customer = backend_client.post(
+        "/customers", json={"full_name": "Ana Lopez", "email": "ana@example.com"}
+    ).json()
+    product = backend_client.post(
+        "/products", json={"sku": "CHI-001", "name": "Chilaquiles", "unit_price": "95.00"}
+    ).json()
+    order = backend_client.post(
+        "/orders",
+        json={
+            "customer_id": customer["customer_id"],
+            "branch_id": "centro",
+            "items": [{"product_id": product["product_id"], "quantity": 1}],
+        },
+    ).json()
+    path = f"/orders/{order['order_id']}"
+    etag = backend_client.get(path).headers["ETag"]
+    assert backend_client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    backend_client.patch(
+        f"{path}/status",
+        json={"target_status": "CANCELLED", "cancellation_reason": "cliente"},
+    )
+
+    changed = backend_client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["status"] == "CANCELLED"
@@ -0,0 +1,102 @@
+"""Motor columnar del ETL contra el motor Decimal."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from src.etl import binary_format
+from src.etl.binary_format import SCHEMA_FILE, encode_rows, read_table, write_table
+from src.etl.extract import extract_binary_staging
+from src.etl.generate_seed import build_seed_payload, write_seed_files
+from src.etl.pipeline import run_pipeline
+
+pytest.importorskip("numpy")
+
+RECORDS = 50
+
+
+@pytest.fixture
+def seed_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "seed"
+    write_seed_files(build_seed_payload(record_count=RECORDS), directory)
+    return directory
+
+
+def test_columnar_binary_staging_matches_decimal_path(seed_dir: Path, tmp_path: Path) -> None:
+    decimal_dir, columnar_dir = tmp_path / "decimal", tmp_path / "columnar"
+
+    run_pipeline(seed_dir, decimal_dir, expected_count=RECORDS, staging_format="binary")
+    summary = run_pipeline(
+        seed_dir,
+        columnar_dir,
+        expected_count=RECORDS,
+        staging_format="binary",
+        validation_engine="columnar",
+    )
+
+    # Sin staging CSV ni warehouse no se construyen filas Decimal.
+    assert [timing.stage for timing in summary.stage_timings] == [
+        "extract",
+        "transform_columnar",
+        "validate",
+        "load_binary",
+    ]
+    expected, actual = extract_binary_staging(decimal_dir), extract_binary_staging(columnar_dir)
+    for entity, table in expected.items():
+        for spec in table.specs:
+            assert actual[entity].values(spec.name) == table.values(spec.name), (entity, spec)
+
+
+def test_columnar_engine_rejects_parallel_workers(seed_dir: Path, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="workers=1"):
+        run_pipeline(seed_dir, tmp_path / "out", validation_engine="columnar", workers=2)
+
+
+def _customer_columns(names: list[str]) -> dict[str, binary_format.Column]:
+    rows = [
+        SimpleNamespace(customer_id=uuid4(), full_name=name, email=f"{name}@example.com")
+        for name in names
+    ]
+    return encode_rows("customers", rows)
+
+
+def test_rewrite_removes_files_from_previous_compression(tmp_path: Path) -> None:
+    directory = tmp_path / "customers.cols"
+    write_table(directory, "customers", _customer_columns(["ana"]), {"full_name": "zlib"})
+    write_table(directory, "customers", _customer_columns(["beto", "caro"]), {"full_name": "none"})
+
+    names = sorted(path.name for path in directory.iterdir())
+    assert "full_name.data.npy.zlib" not in names
+    assert "full_name.data.npy" in names
+    assert not any(name.endswith(".tmp") for name in names)
+    assert read_table(directory).values("full_name") == ["beto", "caro"]
+
+
+def test_interrupted_rewrite_leaves_no_table(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    directory = tmp_path / "customers.cols"
+    write_table(directory, "customers", _customer_columns(["ana"]))
+    original = binary_format._save_array
+    calls = 0
+
+    def failing_save(
+        directory: Path, stem: str, array: Any, compression: binary_format.Compression
+    ) -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise OSError("disco lleno")
+        return original(directory, stem, array, compression)
+
+    monkeypatch.setattr(binary_format, "_save_array", failing_save)
+    with pytest.raises(OSError, match="disco lleno"):
+        write_table(directory, "customers", _customer_columns(["beto"]))
+
+    assert not (directory / SCHEMA_FILE).exists()
+    with pytest.raises(FileNotFoundError):
+        read_table(directory)
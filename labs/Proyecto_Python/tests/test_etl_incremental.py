@@ -0,0 +1,46 @@
+"""`run_pipeline(incremental=True)` delega en el ETL incremental."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from src.etl.generate_seed import build_seed_payload, write_seed_files
+from src.etl.incremental import read_manifest
+from src.etl.pipeline import run_pipeline
+
+RECORDS = 10
+
+
+@pytest.fixture
+def seed_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "seed"
+    write_seed_files(build_seed_payload(record_count=RECORDS), directory)
+    return directory
+
+
+def test_incremental_run_skips_unchanged_seed(seed_dir: Path, tmp_path: Path) -> None:
+    staging_dir = tmp_path / "staging"
+
+    first = run_pipeline(seed_dir, staging_dir, expected_count=RECORDS, incremental=True)
+    second = run_pipeline(seed_dir, staging_dir, expected_count=RECORDS, incremental=True)
+
+    assert first.incremental is not None
+    assert first.incremental.mode == "full"
+    assert [timing.stage for timing in first.stage_timings] == ["incremental_full"]
+    assert read_manifest(staging_dir) is not None
+    assert second.incremental is not None
+    assert second.incremental.mode == "unchanged"
+    assert second.stage_timings[0].rows == 0
+
+
+def test_incremental_rejects_unsupported_options(seed_dir: Path, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="staging_format='binary', warehouse_dir"):
+        run_pipeline(
+            seed_dir,
+            tmp_path / "staging",
+            expected_count=RECORDS,
+            staging_format="binary",
+            warehouse_dir=tmp_path / "warehouse",
+            incremental=True,
+        )
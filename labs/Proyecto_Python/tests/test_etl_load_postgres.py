@@ -0,0 +1,113 @@
+"""Registros de la carga COPY a PostgreSQL."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from src.etl import load_postgres
+from src.etl.extract import SeedBatch
+from src.etl.generate_seed import build_seed_payload
+from src.etl.load_postgres import POSTGRES_LOAD_LEVELS, load_to_postgres, to_records
+from src.etl.transform import OrderRow, transform_seed
+
+
+def _order(created_at: datetime | None) -> OrderRow:
+    return OrderRow(
+        order_id=uuid4(),
+        customer_id=uuid4(),
+        branch_id="SUC-01",
+        shipping_cost=Decimal("10.00"),
+        tax_rate=Decimal("0.1600"),
+        status="CREATED",
+        cancellation_reason=None,
+        created_at=created_at,
+    )
+
+
+def test_orders_copy_keeps_created_at_and_fills_missing_with_load_time() -> None:
+    table = next(
+        table for level in POSTGRES_LOAD_LEVELS for table in level if table.entity == "orders"
+    )
+    created_at = datetime(2026, 3, 1, 12, tzinfo=UTC)
+    loaded_at = datetime(2026, 10, 19, tzinfo=UTC)
+
+    records = list(to_records(table, [_order(created_at), _order(None)], loaded_at=loaded_at))
+
+    position = table.columns.index("created_at")
+    assert [record[position] for record in records] == [created_at, loaded_at]
+
+
+class _FakeConnection:
+    """Conexion asyncpg minima: falla el COPY de clientes y deja colgados los demas."""
+
+    def __init__(self, pool: _FakePool) -> None:
+        self._pool = pool
+
+    async def execute(self, statement: str) -> None:
+        self._pool.statements.append(statement)
+
+    async def copy_records_to_table(self, name: str, records: Any, columns: Any) -> None:
+        if name.startswith("_etl_copy_customers_"):
+            raise RuntimeError("copy fallido")
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            self._pool.cancelled += 1
+            raise
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        yield
+
+
+class _FakePool:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.cancelled = 0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[_FakeConnection]:
+        yield _FakeConnection(self)
+
+    async def close(self) -> None:
+        return None
+
+
+async def test_parallel_copy_cancels_pending_chunks_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload = build_seed_payload(record_count=10)
+    dataset = transform_seed(
+        batch=SeedBatch(
+            customers=payload.customers,
+            products=payload.products,
+            orders=payload.orders,
+            order_items=payload.order_items,
+            invoices=payload.invoices,
+        )
+    )
+    pool = _FakePool()
+
+    async def create_pool(**_kwargs: Any) -> _FakePool:
+        return pool
+
+    monkeypatch.setattr(load_postgres.asyncpg, "create_pool", create_pool)
+
+    with pytest.raises(RuntimeError, match="copy fallido"):
+        await asyncio.wait_for(
+            load_to_postgres(
+                dataset, "postgresql://fake", chunk_size=1, parallel=True, max_connections=4
+            ),
+            timeout=5,
+        )
+
+    assert pool.cancelled > 0
+    assert not any(statement.startswith("INSERT INTO") for statement in pool.statements)
+    assert sum(statement.startswith("DROP TABLE") for statement in pool.statements) == 5
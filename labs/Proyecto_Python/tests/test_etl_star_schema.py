@@ -0,0 +1,74 @@
+"""Modelo estrella: carga incremental por `order_id` y ordenes tardias."""
+
+from __future__ import annotations
+
+import csv
+from datetime import datetime
+from pathlib import Path
+
+from src.etl.extract import SeedBatch
+from src.etl.generate_seed import SEED_EPOCH, build_seed_payload
+from src.etl.pipeline import run_pipeline
+from src.etl.star_schema import FACT_TABLE, build_star_schema
+from src.etl.transform import TransformedSeed, transform_seed
+
+BUNDLED_SEED = Path(__file__).resolve().parents[1] / "data" / "seed"
+
+
+def _dataset(record_count: int, created_at: dict[int, datetime] | None = None) -> TransformedSeed:
+    payload = build_seed_payload(record_count=record_count)
+    for index, value in (created_at or {}).items():
+        payload.orders[index - 1]["created_at"] = value.isoformat()
+    return transform_seed(
+        SeedBatch(
+            customers=payload.customers,
+            products=payload.products,
+            orders=payload.orders,
+            order_items=payload.order_items,
+            invoices=payload.invoices,
+        )
+    )
+
+
+def test_rerun_with_same_orders_appends_nothing(tmp_path: Path) -> None:
+    dataset = _dataset(10)
+
+    first = build_star_schema(dataset, tmp_path)
+    fact_size = (tmp_path / f"{FACT_TABLE}.csv").stat().st_size
+    second = build_star_schema(dataset, tmp_path)
+
+    assert first.fact_rows_appended == 10
+    assert first.watermark is not None
+    assert first.watermark.order_id == dataset.orders[-1].order_id
+    assert second.fact_rows_appended == 0
+    assert second.watermark == first.watermark
+    assert (tmp_path / f"{FACT_TABLE}.csv").stat().st_size == fact_size
+
+
+def test_late_orders_are_appended_and_reported(tmp_path: Path) -> None:
+    first = build_star_schema(_dataset(10), tmp_path)
+
+    # La orden 12 llega con fecha anterior al watermark: se carga igual y se reporta.
+    summary = build_star_schema(_dataset(12, created_at={12: SEED_EPOCH}), tmp_path)
+    rerun = build_star_schema(_dataset(12, created_at={12: SEED_EPOCH}), tmp_path)
+
+    assert summary.fact_rows_appended == 2
+    assert summary.late_orders_loaded == 1
+    assert summary.watermark is not None
+    assert first.watermark is not None
+    assert summary.watermark.order_id == _dataset(11).orders[-1].order_id
+    assert summary.watermark.created_at > first.watermark.created_at
+    assert rerun.fact_rows_appended == 0
+    assert rerun.late_orders_loaded == 0
+    with (tmp_path / f"{FACT_TABLE}.csv").open(encoding="utf-8", newline="") as file:
+        order_ids = {row["order_id"] for row in csv.DictReader(file)}
+    assert order_ids == {str(order.order_id) for order in _dataset(12).orders}
+
+
+def test_bundled_seed_loads_fact_rows(tmp_path: Path) -> None:
+    summary = run_pipeline(BUNDLED_SEED, tmp_path / "staging", warehouse_dir=tmp_path / "warehouse")
+
+    assert summary.star_schema is not None
+    assert summary.star_schema.undated_orders_skipped == 0
+    assert summary.star_schema.fact_rows_appended == summary.records_per_entity
+    assert summary.star_schema.dimension_rows["dim_customer"] == 20
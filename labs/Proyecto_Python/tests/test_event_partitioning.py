@@ -0,0 +1,42 @@
+"""Particionado murmur2 del broker en memoria contra los vectores de Kafka."""
+
+from __future__ import annotations
+
+import pytest
+from src.infrastructure.events.in_memory_broker import InMemoryBroker, murmur2, partition_for_key
+
+# Valores de `UtilsTest.testMurmur2` de Kafka (int con signo de Java).
+KAFKA_MURMUR2_CASES = [
+    (b"21", -973932308),
+    (b"foobar", -790332482),
+    (b"a-little-bit-long-string", -985981536),
+    (b"a-little-bit-longer-string", -1486304829),
+    (b"lkjh234lh9fiuh90y23oiuhsafujhadof229phr9h19h89h8", -58897971),
+    (b"abc", 479470107),
+]
+
+
+@pytest.mark.parametrize(("key", "expected"), KAFKA_MURMUR2_CASES)
+def test_murmur2_matches_kafka_reference(key: bytes, expected: int) -> None:
+    assert murmur2(key) == expected & 0xFFFFFFFF
+
+
+def test_partition_for_key_uses_positive_hash() -> None:
+    assert partition_for_key(b"21", 6) == (-973932308 & 0x7FFFFFFF) % 6
+
+
+def test_same_key_always_lands_in_same_partition() -> None:
+    broker = InMemoryBroker(default_partitions=6)
+
+    records = [broker.append("orders", b"{}", key=b"order-42") for _ in range(5)]
+
+    assert {record.partition for record in records} == {partition_for_key(b"order-42", 6)}
+    assert [record.offset for record in records] == [0, 1, 2, 3, 4]
+
+
+def test_keyless_messages_go_round_robin() -> None:
+    broker = InMemoryBroker(default_partitions=3)
+
+    partitions = [broker.append("orders", b"{}").partition for _ in range(6)]
+
+    assert partitions == [0, 1, 2, 0, 1, 2]
@@ -0,0 +1,15 @@
+"""Readiness con backends en proceso."""
+
+from __future__ import annotations
+
+from tests.conftest import ClientFactory
+
+
+def test_ready_reports_kafka_disabled_with_memory_broker(make_client: ClientFactory) -> None:
+    client = make_client(kafka_enabled=True, kafka_bootstrap_servers="127.0.0.1:1")
+
+    body = client.get("/health/ready").json()
+
+    assert body["status"] == "ok"
+    assert body["checks"]["kafka"]["status"] == "disabled"
+    assert body["checks"]["database"]["status"] == "disabled"
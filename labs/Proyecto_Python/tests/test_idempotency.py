@@ -0,0 +1,93 @@
+"""`Idempotency-Key` en POST /orders y lease de las reservas en curso."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from time import sleep
+from typing import Any, cast
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.infrastructure.db.idempotency import IdempotencyStore, InMemoryIdempotencyStore
+from tests.conftest import ClientFactory
+
+
+def _order_payload(client: TestClient, quantity: int = 1) -> dict[str, Any]:
+    customer = client.post(
+        "/customers", json={"full_name": "Ana Lopez", "email": "ana@example.com"}
+    ).json()
+    product = client.post(
+        "/products", json={"sku": "CHI-001", "name": "Chilaquiles", "unit_price": "95.00"}
+    ).json()
+    return {
+        "customer_id": customer["customer_id"],
+        "branch_id": "centro",
+        "items": [{"product_id": product["product_id"], "quantity": quantity}],
+    }
+
+
+def test_retry_with_same_key_replays_the_first_response(client: TestClient) -> None:
+    payload = _order_payload(client)
+    headers = {"Idempotency-Key": "retry-1"}
+
+    first = client.post("/orders", json=payload, headers=headers)
+    second = client.post("/orders", json=payload, headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+    assert len(client.get("/orders").json()) == 1
+
+
+def test_same_key_with_different_body_is_rejected(client: TestClient) -> None:
+    payload = _order_payload(client)
+    headers = {"Idempotency-Key": "retry-2"}
+    client.post("/orders", json=payload, headers=headers)
+
+    changed = {**payload, "branch_id": "norte"}
+    response = client.post("/orders", json=changed, headers=headers)
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "idempotency_key_reused"
+
+
+def test_in_progress_key_returns_conflict_until_lease_expires() -> None:
+    store = InMemoryIdempotencyStore(ttl_seconds=60, lease_seconds=0.05)
+    assert store.reserve("orders", "k", "hash") is None
+
+    in_progress = store.reserve("orders", "k", "hash")
+    assert in_progress is not None and in_progress.status_code is None
+
+    sleep(0.06)
+    assert store.reserve("orders", "k", "other-hash") is not None
+    assert store.reserve("orders", "k", "hash") is None
+
+
+def test_completed_key_is_not_reclaimed_after_lease() -> None:
+    store = InMemoryIdempotencyStore(ttl_seconds=60, lease_seconds=0.01)
+    store.reserve("orders", "k", "hash")
+    store.complete("orders", "k", 201, "{}")
+
+    sleep(0.02)
+    record = store.reserve("orders", "k", "hash")
+
+    assert record is not None and record.status_code == 201
+
+
+def test_sql_store_reclaims_stale_reservation(make_client: ClientFactory, tmp_path: Path) -> None:
+    client = make_client(
+        persistence_backend="sqlite",
+        sqlite_path=str(tmp_path / "db.sqlite3"),
+        idempotency_lease_seconds=0.05,
+    )
+    store: IdempotencyStore = cast(FastAPI, client.app).state.container.idempotency_store
+    assert store.reserve("orders", "k", "hash") is None
+
+    in_progress = store.reserve("orders", "k", "hash")
+    assert in_progress is not None and in_progress.status_code is None
+
+    sleep(0.06)
+    assert store.reserve("orders", "k", "hash") is None
+    store.complete("orders", "k", 201, '{"ok": true}')
+    replay = store.reserve("orders", "k", "hash")
+    assert replay is not None and replay.response_body == '{"ok": true}'
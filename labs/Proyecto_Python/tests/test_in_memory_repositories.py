@@ -0,0 +1,68 @@
+"""Indices unicos de los repositorios en memoria."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from src.domain.customers.entities import Customer
+from src.domain.products.entities import Product
+from src.infrastructure.db.in_memory import (
+    InMemoryCustomerRepository,
+    InMemoryProductRepository,
+    InMemoryStore,
+    InMemoryUnitOfWork,
+)
+
+
+def _customer(email: str) -> Customer:
+    return Customer(customer_id=uuid4(), full_name="Ana Lopez", email=email)
+
+
+def _product(sku: str) -> Product:
+    return Product(product_id=uuid4(), sku=sku, name="Chilaquiles", unit_price=Decimal("95.00"))
+
+
+def test_get_by_email_uses_pending_and_committed_index() -> None:
+    store = InMemoryStore()
+    uow = InMemoryUnitOfWork(store)
+    customers = InMemoryCustomerRepository(uow)
+    customer = _customer("Ana@Example.com")
+
+    customers.add(customer)
+    assert customers.get_by_email(" ana@example.com ") == customer
+    uow.commit()
+
+    assert store.customer_ids_by_email == {"ana@example.com": customer.customer_id}
+    assert (
+        InMemoryCustomerRepository(InMemoryUnitOfWork(store)).get_by_email("ana@example.com")
+        == customer
+    )
+
+
+def test_commit_rejects_email_committed_by_another_unit_of_work() -> None:
+    store = InMemoryStore()
+    first, second = InMemoryUnitOfWork(store), InMemoryUnitOfWork(store)
+    InMemoryCustomerRepository(first).add(_customer("ana@example.com"))
+    InMemoryCustomerRepository(second).add(_customer("ana@example.com"))
+
+    first.commit()
+    with pytest.raises(ValueError, match="Email de cliente duplicado"):
+        second.commit()
+
+    assert len(store.customers) == 1
+
+
+def test_commit_rejects_sku_committed_by_another_unit_of_work() -> None:
+    store = InMemoryStore()
+    first, second = InMemoryUnitOfWork(store), InMemoryUnitOfWork(store)
+    InMemoryProductRepository(first).add(_product("CHI-001"))
+    InMemoryProductRepository(second).add(_product("CHI-001"))
+
+    first.commit()
+    with pytest.raises(ValueError, match="SKU duplicado"):
+        second.commit()
+
+    assert list(store.product_ids_by_sku) == ["CHI-001"]
+    assert InMemoryProductRepository(InMemoryUnitOfWork(store)).get_by_sku("CHI-001") is not None
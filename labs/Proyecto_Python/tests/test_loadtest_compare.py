@@ -0,0 +1,34 @@
+"""Comparacion de reportes de carga contra el baseline versionado."""
+
+from __future__ import annotations
+
+import copy
+import json
+
+from src.loadtest.runner import (
+    DEFAULT_BASELINE,
+    ENVIRONMENT_KEYS,
+    compare_reports,
+    environment_mismatches,
+)
+
+
+def test_committed_baseline_records_its_environment() -> None:
+    baseline = json.loads(DEFAULT_BASELINE.read_text(encoding="utf-8"))
+
+    assert all(baseline.get(key) is not None for key in ENVIRONMENT_KEYS)
+    assert baseline["results"]["routes"]
+
+
+def test_compare_flags_slower_route_and_other_environment() -> None:
+    baseline = json.loads(DEFAULT_BASELINE.read_text(encoding="utf-8"))
+    current = copy.deepcopy(baseline)
+    current["cpu_count"] = baseline["cpu_count"] + 1
+    current["results"]["routes"][0]["p95_ms"] *= 2
+
+    regressions = compare_reports(baseline, current)
+
+    assert environment_mismatches(baseline, current) == ["cpu_count"]
+    assert [(item.route, item.metric) for item in regressions] == [
+        (baseline["results"]["routes"][0]["route"], "p95_ms")
+    ]
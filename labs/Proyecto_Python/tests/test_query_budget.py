@@ -0,0 +1,99 @@
+"""Presupuestos de queries por endpoint (backend SQLite instrumentado)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.infrastructure.api.dependencies import ApiContainer
+from src.infrastructure.db.instrumentation import (
+    QueryBudgetExceededError,
+    assert_response_query_budget,
+    query_budget,
+)
+from src.infrastructure.db.repositories import SqlAlchemyOrderRepository
+from src.infrastructure.db.unit_of_work import SqlAlchemyUnitOfWork
+from tests.conftest import ClientFactory
+
+# Consultas fijas de POST /orders (cliente, orden, rollups...) mas una por linea
+# para resolver el producto.
+CREATE_ORDER_FIXED_QUERIES = 5
+
+
+@pytest.fixture
+def sqlite_client(make_client: ClientFactory, tmp_path: Path) -> TestClient:
+    return make_client(persistence_backend="sqlite", sqlite_path=str(tmp_path / "db.sqlite3"))
+
+
+def _seed(client: TestClient, products: int) -> tuple[str, list[str]]:
+    customer = client.post(
+        "/customers", json={"full_name": "Ana Lopez", "email": "ana@example.com"}
+    )
+    assert_response_query_budget(customer.headers, 2)
+    product_ids = []
+    for index in range(products):
+        product = client.post(
+            "/products",
+            json={"sku": f"CHI-{index:03d}", "name": "Chilaquiles", "unit_price": "95.00"},
+        )
+        assert_response_query_budget(product.headers, 2)
+        product_ids.append(product.json()["product_id"])
+    return customer.json()["customer_id"], product_ids
+
+
+def _create_order(client: TestClient, customer_id: str, product_ids: list[str]) -> dict[str, Any]:
+    response = client.post(
+        "/orders",
+        json={
+            "customer_id": customer_id,
+            "branch_id": "centro",
+            "items": [{"product_id": product_id, "quantity": 1} for product_id in product_ids],
+        },
+    )
+    assert response.status_code == 201
+    assert_response_query_budget(response.headers, CREATE_ORDER_FIXED_QUERIES + len(product_ids))
+    return dict(response.json())
+
+
+def test_order_reads_do_not_grow_with_lines_or_orders(sqlite_client: TestClient) -> None:
+    customer_id, product_ids = _seed(sqlite_client, products=5)
+    order = _create_order(sqlite_client, customer_id, product_ids)
+
+    detail = sqlite_client.get(f"/orders/{order['order_id']}")
+    assert len(detail.json()["items"]) == 5
+    assert_response_query_budget(detail.headers, 4)
+
+    for _ in range(3):
+        _create_order(sqlite_client, customer_id, product_ids[:2])
+    listing = sqlite_client.get("/orders")
+    assert len(listing.json()) == 4
+    assert_response_query_budget(listing.headers, 3)
+
+
+def test_catalog_listings_stay_within_budget(sqlite_client: TestClient) -> None:
+    _seed(sqlite_client, products=3)
+
+    assert_response_query_budget(sqlite_client.get("/products").headers, 2)
+    assert_response_query_budget(sqlite_client.get("/customers").headers, 2)
+
+
+def test_query_budget_counts_repository_queries(sqlite_client: TestClient) -> None:
+    customer_id, product_ids = _seed(sqlite_client, products=3)
+    order = _create_order(sqlite_client, customer_id, product_ids)
+    container = cast(ApiContainer, cast(FastAPI, sqlite_client.app).state.container)
+
+    unit = SqlAlchemyUnitOfWork(container.session_factory())
+    try:
+        with query_budget(3) as metrics:
+            loaded = SqlAlchemyOrderRepository(unit.session).get_by_id(UUID(order["order_id"]))
+        assert loaded is not None and len(loaded.items) == 3
+        assert metrics.db_queries > 0
+
+        with pytest.raises(QueryBudgetExceededError), query_budget(0):
+            SqlAlchemyOrderRepository(unit.session).list()
+    finally:
+        unit.close()
@@ -0,0 +1,53 @@
+"""Rollups de ventas mantenidos por los casos de uso (backend SQLite)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from fastapi.testclient import TestClient
+from tests.conftest import ClientFactory
+
+
+def _create_order(client: TestClient) -> dict[str, Any]:
+    customer = client.post(
+        "/customers", json={"full_name": "Ana Lopez", "email": "ana@example.com"}
+    ).json()
+    product = client.post(
+        "/products", json={"sku": "CHI-001", "name": "Chilaquiles", "unit_price": "95.00"}
+    ).json()
+    response = client.post(
+        "/orders",
+        json={
+            "customer_id": customer["customer_id"],
+            "branch_id": "centro",
+            "items": [{"product_id": product["product_id"], "quantity": 2}],
+            "shipping_cost": "10.00",
+        },
+    )
+    assert response.status_code == 201
+    return dict(response.json())
+
+
+def test_rollups_follow_order_day_and_status(make_client: ClientFactory, tmp_path: Path) -> None:
+    client = make_client(persistence_backend="sqlite", sqlite_path=str(tmp_path / "db.sqlite3"))
+    today = datetime.now(UTC).date().isoformat()
+    order = _create_order(client)
+
+    sales = client.get("/reports/sales", params={"date_from": today, "date_to": today}).json()
+    assert [(row["status"], row["order_count"]) for row in sales["rows"]] == [("PENDING", 1)]
+    assert sales["total"] == order["total"]
+
+    cancelled = client.patch(
+        f"/orders/{order['order_id']}/status",
+        json={"target_status": "CANCELLED", "cancellation_reason": "cliente"},
+    )
+    assert cancelled.status_code == 200
+
+    sales = client.get("/reports/sales", params={"date_from": today, "date_to": today}).json()
+    assert [(row["status"], row["order_count"]) for row in sales["rows"]] == [("CANCELLED", 1)]
+    products = client.get(
+        "/reports/sales/products", params={"date_from": today, "date_to": today}
+    ).json()
+    assert products["rows"] == []
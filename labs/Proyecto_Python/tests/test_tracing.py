@@ -0,0 +1,60 @@
+"""Spans de dependencias envueltas con `traced()` y export JSONL en segundo plano."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.infrastructure.common.tracing import (
+    JsonlFileTraceExporter,
+    Tracer,
+    configure_tracer,
+    start_span,
+    traced,
+)
+from tests.conftest import ClientFactory
+
+
+class _Greeter:
+    def greet(self, name: str) -> str:
+        return f"hola {name}"
+
+
+def test_traced_returns_same_instance_without_tracer() -> None:
+    configure_tracer(None)
+    greeter = _Greeter()
+
+    assert traced(greeter) is greeter
+
+
+def test_request_spans_include_use_case_repository_and_unit_of_work(
+    make_client: ClientFactory,
+) -> None:
+    client = make_client(tracing_enabled=True, admin_token="secreto")
+    client.post("/customers", json={"full_name": "Ana Lopez", "email": "ana@example.com"})
+
+    traces = client.get("/admin/traces", headers={"X-Admin-Token": "secreto"}).json()["traces"]
+    names = [span["name"] for span in traces[-1]["spans"]]
+
+    assert names[0] == "POST /customers"
+    assert "RegisterCustomerUseCase.execute" in names
+    assert "InMemoryCustomerRepository.add" in names
+    assert "InMemoryUnitOfWork.commit" in names
+
+
+def test_jsonl_exporter_writes_from_background_thread(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonlFileTraceExporter(path, "distrito-chilaquil")
+    tracer = Tracer(exporter)
+    configure_tracer(tracer)
+    try:
+        with tracer.start_trace("GET /health"), start_span("child"):
+            pass
+        assert exporter.flush()
+    finally:
+        configure_tracer(None)
+
+    (line,) = path.read_text(encoding="utf-8").splitlines()
+    spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [span["name"] for span in spans] == ["child", "GET /health"]
+    assert exporter.dropped == 0